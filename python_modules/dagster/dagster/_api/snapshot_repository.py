@@ -1,48 +1,147 @@
-from typing import TYPE_CHECKING, Mapping
+import threading
+from typing import TYPE_CHECKING, Dict, Mapping, Optional, Tuple
 
 import dagster._check as check
 from dagster._core.errors import DagsterUserCodeProcessError
 from dagster._core.host_representation.external_data import (
+    ExternalPipelineData,
     ExternalRepositoryData,
     ExternalRepositoryErrorData,
 )
+from dagster._grpc.utils import get_external_repository_data_content_hash
 from dagster._serdes import deserialize_as
+from dagster._utils.error import SerializableErrorInfo
 
 if TYPE_CHECKING:
-    from dagster._core.host_representation import RepositoryLocation
+    from dagster._core.host_representation import ExternalRepositoryOrigin, RepositoryLocation
     from dagster._grpc.client import DagsterGrpcClient
 
+# The most recently fetched ExternalRepositoryData for each repository origin and defer_snapshots
+# setting, along with the content hash of its serialized form and the owner that fetched it. When a
+# location is reloaded from a server whose repository has not changed, the server skips sending
+# the snapshot and the data held here is reused, passing to the new location. The data a location
+# owns is dropped when the location is cleaned up.
+MAX_CACHED_EXTERNAL_REPOSITORY_DATA = 32
+_external_repository_data_cache: Dict[
+    Tuple[str, bool], Tuple[str, ExternalRepositoryData, object]
+] = {}
+_external_repository_data_cache_lock = threading.Lock()
+
+
+def _get_cached_external_repository_data(
+    cache_key: Tuple[str, bool],
+) -> Optional[Tuple[str, ExternalRepositoryData, object]]:
+    with _external_repository_data_cache_lock:
+        return _external_repository_data_cache.get(cache_key)
+
+
+def _cache_external_repository_data(
+    cache_key: Tuple[str, bool],
+    content_hash: str,
+    external_repository_data: ExternalRepositoryData,
+    owner: object,
+) -> None:
+    with _external_repository_data_cache_lock:
+        _external_repository_data_cache.pop(cache_key, None)
+        _external_repository_data_cache[cache_key] = (
+            content_hash,
+            external_repository_data,
+            owner,
+        )
+        # evict the least recently fetched repositories
+        while len(_external_repository_data_cache) > MAX_CACHED_EXTERNAL_REPOSITORY_DATA:
+            del _external_repository_data_cache[next(iter(_external_repository_data_cache))]
+
+
+def evict_cached_external_repository_data(owner: object) -> None:
+    """Drops the cached ExternalRepositoryData that was last fetched by the given owner."""
+    with _external_repository_data_cache_lock:
+        for cache_key, (_, _, cached_owner) in list(_external_repository_data_cache.items()):
+            if cached_owner is owner:
+                del _external_repository_data_cache[cache_key]
+
 
 def sync_get_streaming_external_repositories_data_grpc(
-    api_client: "DagsterGrpcClient", repository_location: "RepositoryLocation"
+    api_client: "DagsterGrpcClient",
+    repository_location: "RepositoryLocation",
+    defer_snapshots: bool = False,
+    cache_owner: Optional[object] = None,
 ) -> Mapping[str, ExternalRepositoryData]:
+    """Fetches the ExternalRepositoryData for each repository in the location.
+
+    If cache_owner is set, the data is cached until evict_cached_external_repository_data is
+    called with the same owner, typically when the location is cleaned up, and reused if the
+    repository is unchanged when it is next fetched.
+    """
     from dagster._core.host_representation import ExternalRepositoryOrigin, RepositoryLocation
 
     check.inst_param(repository_location, "repository_location", RepositoryLocation)
+    check.bool_param(defer_snapshots, "defer_snapshots")
 
     repo_datas = {}
     for repository_name in repository_location.repository_names:  # type: ignore
+        external_repository_origin = ExternalRepositoryOrigin(
+            repository_location.origin,
+            repository_name,
+        )
+        cache_key = (external_repository_origin.get_id(), defer_snapshots)
+        cached = (
+            _get_cached_external_repository_data(cache_key) if cache_owner is not None else None
+        )
+
         external_repository_chunks = list(
-            api_client.streaming_external_repository(
-                external_repository_origin=ExternalRepositoryOrigin(
-                    repository_location.origin,
-                    repository_name,
-                )
+            api_client.streaming_external_repository_if_modified(
+                external_repository_origin=external_repository_origin,
+                content_hash=cached[0] if cached else "",
+                defer_snapshots=defer_snapshots,
             )
         )
 
+        if cached and not external_repository_chunks:
+            # unchanged since it was last fetched, possibly by the location this one replaces
+            content_hash, result, _ = cached
+            _cache_external_repository_data(cache_key, content_hash, result, cache_owner)
+            repo_datas[repository_name] = result
+            continue
+
+        serialized_external_repository_data = "".join(
+            [chunk["serialized_external_repository_chunk"] for chunk in external_repository_chunks]
+        )
         result = deserialize_as(
-            "".join(
-                [
-                    chunk["serialized_external_repository_chunk"]
-                    for chunk in external_repository_chunks
-                ]
-            ),
+            serialized_external_repository_data,
             (ExternalRepositoryData, ExternalRepositoryErrorData),
         )
 
         if isinstance(result, ExternalRepositoryErrorData):
             raise DagsterUserCodeProcessError.from_error_info(result.error)
 
+        if cache_owner is not None:
+            _cache_external_repository_data(
+                cache_key,
+                get_external_repository_data_content_hash(serialized_external_repository_data),
+                result,
+                cache_owner,
+            )
         repo_datas[repository_name] = result
     return repo_datas
+
+
+def sync_get_external_job_data_grpc(
+    api_client: "DagsterGrpcClient",
+    external_repository_origin: "ExternalRepositoryOrigin",
+    job_name: str,
+) -> ExternalPipelineData:
+    from dagster._core.host_representation import ExternalRepositoryOrigin
+
+    check.inst_param(
+        external_repository_origin, "external_repository_origin", ExternalRepositoryOrigin
+    )
+    check.str_param(job_name, "job_name")
+
+    result = api_client.external_job(external_repository_origin, job_name)
+    if result.serialized_error:
+        raise DagsterUserCodeProcessError.from_error_info(
+            deserialize_as(result.serialized_error, SerializableErrorInfo)
+        )
+
+    return deserialize_as(result.serialized_job_data, ExternalPipelineData)
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Iterator, Optional, Sequence, Union
 
 import dagster._check as check
 from dagster._core.definitions.sensor_definition import SensorExecutionData
@@ -6,10 +6,11 @@
 from dagster._core.host_representation.external_data import ExternalSensorExecutionErrorData
 from dagster._core.host_representation.handle import RepositoryHandle
 from dagster._grpc.client import DEFAULT_GRPC_TIMEOUT
-from dagster._grpc.types import SensorExecutionArgs
+from dagster._grpc.types import SensorExecutionArgs, SensorExecutionBatchArgs
 from dagster._serdes import deserialize_as
 
 if TYPE_CHECKING:
+    from dagster._core.host_representation.repository_location import SensorExecutionRequest
     from dagster._core.instance import DagsterInstance
     from dagster._grpc.client import DagsterGrpcClient
 
@@ -78,3 +79,37 @@ def sync_get_external_sensor_execution_data_grpc(
         raise DagsterUserCodeProcessError.from_error_info(result.error)
 
     return result
+
+
+def sync_get_external_sensor_execution_data_batch_grpc(
+    api_client: "DagsterGrpcClient",
+    instance: "DagsterInstance",
+    sensor_execution_requests: Sequence["SensorExecutionRequest"],
+    timeout: Optional[int] = DEFAULT_GRPC_TIMEOUT,
+) -> Iterator[Union[SensorExecutionData, ExternalSensorExecutionErrorData]]:
+    """Evaluates several sensors in one request, yielding the result of each sensor in the order of
+    sensor_execution_requests as soon as it is received.
+    """
+    check.sequence_param(sensor_execution_requests, "sensor_execution_requests")
+
+    instance_ref = instance.get_ref()
+    batch_args = SensorExecutionBatchArgs(
+        sensor_execution_args=[
+            SensorExecutionArgs(
+                repository_origin=request.repository_handle.get_external_origin(),
+                instance_ref=instance_ref,
+                sensor_name=request.name,
+                last_completion_time=request.last_completion_time,
+                last_run_key=request.last_run_key,
+                cursor=request.cursor,
+            )
+            for request in sensor_execution_requests
+        ]
+    )
+
+    for serialized_result in api_client.external_sensor_execution_batch(
+        sensor_execution_batch_args=batch_args, timeout=timeout
+    ):
+        yield deserialize_as(
+            serialized_result, (SensorExecutionData, ExternalSensorExecutionErrorData)
+        )
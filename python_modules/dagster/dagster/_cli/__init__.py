@@ -1,34 +1,45 @@
+import importlib
+from typing import List, Mapping, Optional, Tuple
+
 import click
 
 from ..version import __version__
-from .api import api_cli
-from .asset import asset_cli
-from .debug import debug_cli
-from .dev import dev_command
-from .instance import instance_cli
-from .job import job_cli
-from .project import project_cli
-from .run import run_cli
-from .schedule import schedule_cli
-from .sensor import sensor_cli
 
+# Subcommands are imported when they are invoked (or listed), so that running one command, e.g. the
+# `dagster api` commands used by run and step workers, does not import the modules of all of them.
+_COMMANDS: Mapping[str, Tuple[str, str]] = {
+    "api": ("dagster._cli.api", "api_cli"),
+    "job": ("dagster._cli.job", "job_cli"),
+    "run": ("dagster._cli.run", "run_cli"),
+    "instance": ("dagster._cli.instance", "instance_cli"),
+    "schedule": ("dagster._cli.schedule", "schedule_cli"),
+    "sensor": ("dagster._cli.sensor", "sensor_cli"),
+    "asset": ("dagster._cli.asset", "asset_cli"),
+    "debug": ("dagster._cli.debug", "debug_cli"),
+    "project": ("dagster._cli.project", "project_cli"),
+    "dev": ("dagster._cli.dev", "dev_command"),
+}
+
+
+class LazyCommandGroup(click.Group):
+    def __init__(self, *args, lazy_commands: Mapping[str, Tuple[str, str]], **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lazy_commands = lazy_commands
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return [*self._lazy_commands.keys(), *super().list_commands(ctx)]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name in self._lazy_commands:
+            module_name, attr = self._lazy_commands[cmd_name]
+            return getattr(importlib.import_module(module_name), attr)
+        return super().get_command(ctx, cmd_name)
 
-def create_dagster_cli():
-    commands = {
-        "api": api_cli,
-        "job": job_cli,
-        "run": run_cli,
-        "instance": instance_cli,
-        "schedule": schedule_cli,
-        "sensor": sensor_cli,
-        "asset": asset_cli,
-        "debug": debug_cli,
-        "project": project_cli,
-        "dev": dev_command,
-    }
 
+def create_dagster_cli():
     @click.group(
-        commands=commands,
+        cls=LazyCommandGroup,
+        lazy_commands=_COMMANDS,
         context_settings={"max_content_width": 120, "help_option_names": ["-h", "--help"]},
     )
     @click.version_option(__version__, "--version", "-v")
@@ -12,8 +12,7 @@
 from dagster._serdes.ipc import interrupt_ipc_subprocess, open_ipc_subprocess
 from dagster._utils.log import configure_loggers
 
-from .job import apply_click_params
-from .utils import get_instance_for_service
+from .utils import apply_click_params, get_instance_for_service
 from .workspace.cli_target import (
     get_workspace_load_target,
     python_file_option,
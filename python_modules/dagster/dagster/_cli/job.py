@@ -54,7 +54,10 @@
 from dagster._utils.yaml_utils import dump_run_config_yaml, load_yaml_from_glob_list
 
 from .config_scaffolder import scaffold_pipeline_config
-from .utils import get_instance_for_service
+from .utils import (
+    apply_click_params as apply_click_params,  # previously defined in this module
+    get_instance_for_service,
+)
 
 
 @click.group(name="job")
@@ -64,12 +67,6 @@ def job_cli():
     """
 
 
-def apply_click_params(command, *click_params):
-    for click_param in click_params:
-        command = click_param(command)
-    return command
-
-
 @job_cli.command(
     name="list",
     help="List the jobs in a repository. {warning}".format(warning=WORKSPACE_TARGET_WARNING),
@@ -9,6 +9,12 @@
 from dagster._core.instance.config import is_dagster_home_set
 
 
+def apply_click_params(command, *click_params):
+    for click_param in click_params:
+        command = click_param(command)
+    return command
+
+
 @contextmanager
 def get_instance_for_service(
     service_name, instance_ref: Optional[InstanceRef] = None, logger_fn=click.echo
@@ -19,6 +19,7 @@
 from typing_extensions import TypeAlias
 
 import dagster._check as check
+from dagster._cli.utils import apply_click_params
 from dagster._core.code_pointer import CodePointer
 from dagster._core.definitions.reconstruct import repository_def_from_target_def
 from dagster._core.definitions.repository_definition import RepositoryDefinition
@@ -450,33 +451,23 @@ def wrap(f):
 
 
 def python_job_target_argument(f):
-    from dagster._cli.job import apply_click_params
-
     return apply_click_params(f, *python_job_target_click_options())
 
 
 def workspace_target_argument(f):
-    from dagster._cli.job import apply_click_params
-
     return apply_click_params(f, *workspace_target_click_options())
 
 
 def job_workspace_target_argument(f):
-    from dagster._cli.job import apply_click_params
-
     return apply_click_params(f, *workspace_target_click_options())
 
 
 def grpc_server_origin_target_argument(f):
-    from dagster._cli.job import apply_click_params
-
     options = grpc_server_target_click_options()
     return apply_click_params(f, *options)
 
 
 def python_origin_target_argument(f):
-    from dagster._cli.job import apply_click_params
-
     options = python_target_click_options(allow_multiple_python_targets=False)
     return apply_click_params(f, *options)
 
@@ -502,14 +493,10 @@ def repository_click_options():
 
 
 def repository_target_argument(f):
-    from dagster._cli.job import apply_click_params
-
     return apply_click_params(workspace_target_argument(f), *repository_click_options())
 
 
 def job_repository_target_argument(f):
-    from dagster._cli.job import apply_click_params
-
     return apply_click_params(job_workspace_target_argument(f), *repository_click_options())
 
 
@@ -523,8 +510,6 @@ def job_option():
 
 
 def job_target_argument(f):
-    from dagster._cli.job import apply_click_params
-
     return apply_click_params(job_repository_target_argument(f), job_option())
 
 
@@ -0,0 +1,270 @@
+"""
+Compiles config types into trees of closures that validate a config value, resolve its defaults,
+and post-process it in a single pass, without the per-node dispatch and context bookkeeping of the
+evaluator in validate.py and post_process.py.
+
+Compiled processors only handle the success path. Whenever a value would fail validation or
+post-processing, the processor raises, and the caller falls back to the evaluator, which produces
+the errors. A compiled processor may reject a value the evaluator would accept (costing only a
+second evaluation), but must never accept a value the evaluator would reject, and must return
+the same value as the evaluator for every value it accepts.
+"""
+
+from typing import Any, Callable, Dict, FrozenSet, List, Mapping, Optional, Tuple
+
+from dagster._utils import frozendict, frozenlist
+
+from .config_type import ConfigScalarKind, ConfigType, ConfigTypeKind
+from .field import Field
+
+CompiledConfigProcessor = Callable[[Any], Any]
+
+
+class ConfigCompilationFailure(Exception):
+    """Raised by a compiled processor when a value needs to be evaluated by the evaluator."""
+
+
+def _fail() -> Any:
+    raise ConfigCompilationFailure()
+
+
+def compile_config_processor(config_type: ConfigType) -> CompiledConfigProcessor:
+    """Compiles a config type into a processor. Use ConfigType.get_compiled_processor, which caches
+    the processor on the config type. Processors are cached per instance rather than by type key,
+    since types with the same key (e.g. enums with the same name) can post-process differently.
+    """
+    return _compile(config_type, {})
+
+
+def _compile(
+    config_type: ConfigType, compiled: Dict[int, CompiledConfigProcessor]
+) -> CompiledConfigProcessor:
+    # config type instances are commonly shared within a schema, so compile each only once
+    if id(config_type) in compiled:
+        return compiled[id(config_type)]
+
+    processor = _with_post_process(config_type, _compile_kind(config_type, compiled))
+    compiled[id(config_type)] = processor
+    return processor
+
+
+def _with_post_process(
+    config_type: ConfigType, processor: CompiledConfigProcessor
+) -> CompiledConfigProcessor:
+    if type(config_type).post_process is ConfigType.post_process:
+        return processor
+
+    post_process = config_type.post_process
+    return lambda value: post_process(processor(value))
+
+
+def _compile_kind(
+    config_type: ConfigType, compiled: Dict[int, CompiledConfigProcessor]
+) -> CompiledConfigProcessor:
+    kind = config_type.kind
+
+    if kind == ConfigTypeKind.ANY:
+        return lambda value: value
+    elif kind == ConfigTypeKind.NONEABLE:
+        return _compile_noneable(config_type, compiled)
+    elif kind == ConfigTypeKind.SCALAR:
+        return _compile_scalar(config_type)
+    elif kind == ConfigTypeKind.ENUM:
+        return _compile_enum(config_type)
+    elif kind == ConfigTypeKind.SELECTOR:
+        return _compile_selector(config_type, compiled)
+    elif ConfigTypeKind.is_shape(kind):
+        return _compile_shape(config_type, compiled)
+    elif kind == ConfigTypeKind.ARRAY:
+        return _compile_array(config_type, compiled)
+    elif kind == ConfigTypeKind.MAP:
+        return _compile_map(config_type, compiled)
+    elif kind == ConfigTypeKind.SCALAR_UNION:
+        return _compile_scalar_union(config_type, compiled)
+    else:
+        # leave unknown kinds to the evaluator
+        return lambda value: _fail()
+
+
+def _compile_noneable(
+    config_type: ConfigType, compiled: Dict[int, CompiledConfigProcessor]
+) -> CompiledConfigProcessor:
+    inner = _compile(config_type.inner_type, compiled)  # type: ignore
+
+    return lambda value: None if value is None else inner(value)
+
+
+def _compile_scalar(config_type: ConfigType) -> CompiledConfigProcessor:
+    scalar_kind = config_type.scalar_kind  # type: ignore
+
+    if scalar_kind == ConfigScalarKind.INT:
+        is_valid = lambda value: not isinstance(value, bool) and isinstance(value, int)
+    elif scalar_kind == ConfigScalarKind.STRING:
+        is_valid = lambda value: isinstance(value, str)
+    elif scalar_kind == ConfigScalarKind.BOOL:
+        is_valid = lambda value: isinstance(value, bool)
+    elif scalar_kind == ConfigScalarKind.FLOAT:
+        is_valid = lambda value: isinstance(value, (int, float))
+    elif scalar_kind is None:
+        is_valid = lambda value: value is not None
+    else:
+        is_valid = lambda value: False
+
+    return lambda value: value if is_valid(value) else _fail()
+
+
+def _compile_enum(config_type: ConfigType) -> CompiledConfigProcessor:
+    config_values: FrozenSet[str] = frozenset(
+        enum_value.config_value for enum_value in config_type.enum_values  # type: ignore
+    )
+
+    return lambda value: value if isinstance(value, str) and value in config_values else _fail()
+
+
+def _compile_selector(
+    config_type: ConfigType, compiled: Dict[int, CompiledConfigProcessor]
+) -> CompiledConfigProcessor:
+    fields: Mapping[str, Field] = config_type.fields  # type: ignore
+    field_processors = {
+        name: _compile(field.config_type, compiled) for name, field in fields.items()
+    }
+    fields_with_fields = {
+        name for name, field in fields.items() if ConfigTypeKind.has_fields(field.config_type.kind)
+    }
+
+    # a selector without a value selects its only field, if that field is optional
+    empty_selection: Optional[Tuple[str, Any]] = None
+    if len(fields) == 1:
+        name, field = next(iter(fields.items()))
+        if not field.is_required:
+            empty_selection = (name, field.default_value if field.default_provided else None)
+
+    def _process_selector(value: Any) -> Any:
+        if value is None:
+            return _fail()
+
+        if value == {}:
+            if empty_selection is None:
+                return _fail()
+            name, field_value = empty_selection
+        elif not isinstance(value, dict) or len(value) != 1:
+            return _fail()
+        else:
+            name, field_value = next(iter(value.items()))
+            if name not in field_processors:
+                return _fail()
+
+        if field_value is None and name in fields_with_fields:
+            field_value = {}
+        return frozendict({name: field_processors[name](field_value)})
+
+    return _process_selector
+
+
+def _compile_shape(
+    config_type: ConfigType, compiled: Dict[int, CompiledConfigProcessor]
+) -> CompiledConfigProcessor:
+    fields: Mapping[str, Field] = config_type.fields  # type: ignore
+    is_permissive = config_type.kind == ConfigTypeKind.PERMISSIVE_SHAPE
+    field_aliases: Mapping[str, str] = getattr(config_type, "field_aliases", None) or {}
+
+    field_specs: List[Tuple[str, Optional[str], CompiledConfigProcessor, Field]] = [
+        (name, field_aliases.get(name), _compile(field.config_type, compiled), field)
+        for name, field in fields.items()
+    ]
+    defined_field_names = set(fields.keys()).union(field_aliases.values())
+    alias_names = set(field_aliases.values())
+
+    def _process_shape(value: Any) -> Any:
+        if not isinstance(value, dict):
+            return _fail()
+
+        if is_permissive:
+            # aliases are resolved differently by validation and post-processing of permissive
+            # shapes, so leave them to the evaluator
+            if alias_names and not alias_names.isdisjoint(value.keys()):
+                return _fail()
+        else:
+            for incoming_field_name in value:
+                if incoming_field_name not in defined_field_names:
+                    return _fail()
+
+        processed = {}
+        for name, alias, processor, field in field_specs:
+            if name in value:
+                if alias is not None and alias in value:
+                    return _fail()
+                processed[name] = processor(value[name])
+            elif alias is not None and alias in value:
+                processed[name] = processor(value[alias])
+            elif field.default_provided:
+                processed[name] = processor(field.default_value)
+            elif field.is_required:
+                return _fail()
+
+        if is_permissive:
+            for incoming_field_name, incoming_value in value.items():
+                if incoming_field_name not in fields:
+                    processed[incoming_field_name] = incoming_value
+
+        return frozendict(processed)
+
+    return _process_shape
+
+
+def _compile_array(
+    config_type: ConfigType, compiled: Dict[int, CompiledConfigProcessor]
+) -> CompiledConfigProcessor:
+    inner_type: ConfigType = config_type.inner_type  # type: ignore
+    inner = _compile(inner_type, compiled)
+    allows_none = inner_type.kind == ConfigTypeKind.NONEABLE
+
+    def _process_array(value: Any) -> Any:
+        if not isinstance(value, list):
+            return _fail()
+        if not value:
+            return []
+        if not allows_none and any(item is None for item in value):
+            return _fail()
+        return frozenlist([inner(item) for item in value])
+
+    return _process_array
+
+
+def _compile_map(
+    config_type: ConfigType, compiled: Dict[int, CompiledConfigProcessor]
+) -> CompiledConfigProcessor:
+    inner_type: ConfigType = config_type.inner_type  # type: ignore
+    key_processor = _compile(config_type.key_type, compiled)  # type: ignore
+    inner = _compile(inner_type, compiled)
+    allows_none = inner_type.kind == ConfigTypeKind.NONEABLE
+
+    def _process_map(value: Any) -> Any:
+        if not isinstance(value, dict):
+            return _fail()
+        for key in value:
+            # keys are validated, but not post-processed
+            key_processor(key)
+        if not value:
+            return {}
+        if not allows_none and any(item is None for item in value.values()):
+            return _fail()
+        return frozendict({key: inner(item) for key, item in value.items()})
+
+    return _process_map
+
+
+def _compile_scalar_union(
+    config_type: ConfigType, compiled: Dict[int, CompiledConfigProcessor]
+) -> CompiledConfigProcessor:
+    scalar = _compile(config_type.scalar_type, compiled)  # type: ignore
+    non_scalar = _compile(config_type.non_scalar_type, compiled)  # type: ignore
+
+    def _process_scalar_union(value: Any) -> Any:
+        if value is None:
+            return _fail()
+        if isinstance(value, (dict, list)):
+            return non_scalar(value)
+        return scalar(value)
+
+    return _process_scalar_union
@@ -81,6 +81,9 @@ def __init__(
         # memoized snap representation
         self._snap: Optional["ConfigTypeSnap"] = None
 
+        # memoized compiled processor, see compiled.py
+        self._compiled_processor: Optional[typing.Callable[[typing.Any], typing.Any]] = None
+
     @property
     def description(self) -> Optional[str]:
         return self._description
@@ -108,6 +111,14 @@ def get_snapshot(self) -> "ConfigTypeSnap":
 
         return self._snap
 
+    def get_compiled_processor(self) -> typing.Callable[[typing.Any], typing.Any]:
+        from .compiled import compile_config_processor
+
+        if self._compiled_processor is None:
+            self._compiled_processor = compile_config_processor(self)
+
+        return self._compiled_processor
+
     def type_iterator(self) -> Iterator["ConfigType"]:
         yield self
 
@@ -425,6 +425,15 @@ def process_config(
 ) -> EvaluateValueResult[Mapping[str, object]]:
     config_type = resolve_to_config_type(config_type)
     config_type = check.inst(cast(ConfigType, config_type), ConfigType)
+
+    # Most config is valid, so first try the compiled processor, which validates and processes in a
+    # single pass. It raises on anything it can't process, in which case the evaluator below runs
+    # and reports any errors.
+    try:
+        return EvaluateValueResult.for_value(config_type.get_compiled_processor()(config_dict))
+    except Exception:
+        pass
+
     validate_evr = validate_config(config_type, config_dict)
     if not validate_evr.success:
         return validate_evr
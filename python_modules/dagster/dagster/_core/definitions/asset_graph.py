@@ -5,6 +5,7 @@
     AbstractSet,
     Callable,
     Dict,
+    Hashable,
     Iterable,
     Iterator,
     Mapping,
@@ -12,6 +13,7 @@
     Optional,
     Sequence,
     Set,
+    TypeVar,
     Union,
     cast,
 )
@@ -28,10 +30,14 @@
 from .events import AssetKey, AssetKeyPartitionKey
 from .freshness_policy import FreshnessPolicy
 from .partition import PartitionsDefinition
+from .partition_key_range import PartitionKeyRange
 from .partition_mapping import PartitionMapping, infer_partition_mapping
 from .source_asset import SourceAsset
+from .time_window_partition_mapping import TimeWindowPartitionMapping
 from .time_window_partitions import TimeWindowPartitionsDefinition
 
+T = TypeVar("T")
+
 
 class AssetGraph:
     def __init__(
@@ -199,6 +205,21 @@ def get_child_partition_keys_of_parent(
             Sequence[str]: A list of the corresponding downstream partitions in child_asset_key that
                 partition_key maps to.
         """
+        return self._memoize_partition_mapping(
+            dynamic_partitions_store,
+            ("child_partition_keys", parent_asset_key, child_asset_key, parent_partition_key),
+            lambda: self._get_child_partition_keys_of_parent(
+                dynamic_partitions_store, parent_partition_key, parent_asset_key, child_asset_key
+            ),
+        )
+
+    def _get_child_partition_keys_of_parent(
+        self,
+        dynamic_partitions_store: DynamicPartitionsStore,
+        parent_partition_key: Optional[str],
+        parent_asset_key: AssetKey,
+        child_asset_key: AssetKey,
+    ) -> Sequence[str]:
         child_partitions_def = self.get_partitions_def(child_asset_key)
         parent_partitions_def = self.get_partitions_def(parent_asset_key)
 
@@ -273,6 +294,21 @@ def get_parent_partition_keys_for_child(
         """
         partition_key = check.opt_str_param(partition_key, "partition_key")
 
+        return self._memoize_partition_mapping(
+            dynamic_partitions_store,
+            ("parent_partition_keys", parent_asset_key, child_asset_key, partition_key),
+            lambda: self._get_parent_partition_keys_for_child(
+                partition_key, parent_asset_key, child_asset_key, dynamic_partitions_store
+            ),
+        )
+
+    def _get_parent_partition_keys_for_child(
+        self,
+        partition_key: Optional[str],
+        parent_asset_key: AssetKey,
+        child_asset_key: AssetKey,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore],
+    ) -> Sequence[str]:
         child_partitions_def = self.get_partitions_def(child_asset_key)
         parent_partitions_def = self.get_partitions_def(parent_asset_key)
 
@@ -293,6 +329,167 @@ def get_parent_partition_keys_for_child(
         )
         return list(parent_partition_key_subset.get_partition_keys())
 
+    def get_child_partition_key_ranges_of_parent(
+        self,
+        dynamic_partitions_store: DynamicPartitionsStore,
+        parent_partition_key_range: PartitionKeyRange,
+        parent_asset_key: AssetKey,
+        child_asset_key: AssetKey,
+    ) -> Sequence[PartitionKeyRange]:
+        """
+        Converts a range of partition keys from one asset to the corresponding ranges of partition
+        keys in a downstream asset. When both assets are partitioned by time windows and mapped with
+        a TimeWindowPartitionMapping, the range is mapped as a whole, rather than partition by
+        partition.
+
+        Args:
+            parent_partition_key_range (PartitionKeyRange): The range of partition keys to convert.
+            parent_asset_key (AssetKey): The asset key of the upstream asset, which the provided
+                partition key range belongs to.
+            child_asset_key (AssetKey): The asset key of the downstream asset. The provided
+                partition key range will be mapped to partitions within this asset.
+
+        Returns:
+            Sequence[PartitionKeyRange]: The corresponding ranges of partition keys in
+                child_asset_key.
+        """
+        return self._memoize_partition_mapping(
+            dynamic_partitions_store,
+            (
+                "child_partition_key_ranges",
+                parent_asset_key,
+                child_asset_key,
+                parent_partition_key_range,
+            ),
+            lambda: self._map_partition_key_range(
+                dynamic_partitions_store,
+                parent_partition_key_range,
+                parent_asset_key,
+                child_asset_key,
+                to_child=True,
+            ),
+        )
+
+    def get_parent_partition_key_ranges_for_child(
+        self,
+        dynamic_partitions_store: DynamicPartitionsStore,
+        partition_key_range: PartitionKeyRange,
+        parent_asset_key: AssetKey,
+        child_asset_key: AssetKey,
+    ) -> Sequence[PartitionKeyRange]:
+        """
+        Converts a range of partition keys from one asset to the corresponding ranges of partition
+        keys in one of its parent assets. When both assets are partitioned by time windows and
+        mapped with a TimeWindowPartitionMapping, the range is mapped as a whole, rather than
+        partition by partition.
+
+        Args:
+            partition_key_range (PartitionKeyRange): The range of partition keys to convert.
+            parent_asset_key (AssetKey): The asset key of the parent asset. The provided partition
+                key range will be mapped to partitions within this asset.
+            child_asset_key (AssetKey): The asset key of the child asset, which the provided
+                partition key range belongs to.
+
+        Returns:
+            Sequence[PartitionKeyRange]: The corresponding ranges of partition keys in
+                parent_asset_key.
+        """
+        return self._memoize_partition_mapping(
+            dynamic_partitions_store,
+            ("parent_partition_key_ranges", parent_asset_key, child_asset_key, partition_key_range),
+            lambda: self._map_partition_key_range(
+                dynamic_partitions_store,
+                partition_key_range,
+                parent_asset_key,
+                child_asset_key,
+                to_child=False,
+            ),
+        )
+
+    def _map_partition_key_range(
+        self,
+        dynamic_partitions_store: DynamicPartitionsStore,
+        partition_key_range: PartitionKeyRange,
+        parent_asset_key: AssetKey,
+        child_asset_key: AssetKey,
+        to_child: bool,
+    ) -> Sequence[PartitionKeyRange]:
+        child_partitions_def = self.get_partitions_def(child_asset_key)
+        parent_partitions_def = self.get_partitions_def(parent_asset_key)
+        if child_partitions_def is None or parent_partitions_def is None:
+            raise DagsterInvalidInvocationError(
+                f"Asset keys {parent_asset_key} and {child_asset_key} must both be partitioned to"
+                " map partition key ranges between them."
+            )
+
+        partition_mapping = self.get_partition_mapping(child_asset_key, parent_asset_key)
+        if (
+            isinstance(partition_mapping, TimeWindowPartitionMapping)
+            and isinstance(child_partitions_def, TimeWindowPartitionsDefinition)
+            and isinstance(parent_partitions_def, TimeWindowPartitionsDefinition)
+        ):
+            if to_child:
+                return [
+                    partition_mapping.get_downstream_partitions_for_partition_range(
+                        partition_key_range,
+                        downstream_partitions_def=child_partitions_def,
+                        upstream_partitions_def=parent_partitions_def,
+                    )
+                ]
+            return [
+                partition_mapping.get_upstream_partitions_for_partition_range(
+                    partition_key_range,
+                    downstream_partitions_def=child_partitions_def,
+                    upstream_partitions_def=parent_partitions_def,
+                )
+            ]
+
+        from_partitions_def = parent_partitions_def if to_child else child_partitions_def
+        from_partitions_subset = from_partitions_def.empty_subset().with_partition_keys(
+            from_partitions_def.get_partition_keys_in_range(
+                partition_key_range, dynamic_partitions_store=dynamic_partitions_store
+            )
+        )
+        if to_child:
+            to_partitions_subset = partition_mapping.get_downstream_partitions_for_partitions(
+                from_partitions_subset,
+                downstream_partitions_def=child_partitions_def,
+                dynamic_partitions_store=dynamic_partitions_store,
+            )
+        else:
+            to_partitions_subset = partition_mapping.get_upstream_partitions_for_partitions(
+                from_partitions_subset,
+                upstream_partitions_def=parent_partitions_def,
+                dynamic_partitions_store=dynamic_partitions_store,
+            )
+        return to_partitions_subset.get_partition_key_ranges(
+            dynamic_partitions_store=dynamic_partitions_store
+        )
+
+    def _memoize_partition_mapping(
+        self,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore],
+        key: Hashable,
+        fn: Callable[[], T],
+    ) -> T:
+        """Memoizes the result of mapping partitions between two assets for the lifetime of a
+        CachingInstanceQueryer.
+
+        Mapped partitions can depend on the current time and on the dynamic partitions in the
+        instance, which a CachingInstanceQueryer already treats as fixed for its lifetime. The asset
+        reconciliation sensor and the backfill daemon create one for each iteration, so each
+        iteration maps the partitions of every asset pair at most once.
+        """
+        from dagster._utils.caching_instance_queryer import CachingInstanceQueryer
+
+        if not isinstance(dynamic_partitions_store, CachingInstanceQueryer):
+            return fn()
+
+        cache = dynamic_partitions_store.partition_mapping_cache.setdefault(self, {})
+        if key not in cache:
+            cache[key] = fn()
+        return cache[key]
+
     def is_source(self, asset_key: AssetKey) -> bool:
         return asset_key in self.source_asset_keys or asset_key not in self.all_asset_keys
 
@@ -747,10 +747,20 @@ def reconcile(
     asset_graph = repository_def.asset_graph
 
     # fetch some data in advance to batch together some queries
+    prefetch_asset_keys = list(asset_selection.upstream(depth=1).resolve(asset_graph))
     instance_queryer.prefetch_for_keys(
-        list(asset_selection.upstream(depth=1).resolve(asset_graph)),
+        prefetch_asset_keys,
         after_cursor=cursor.latest_storage_id,
     )
+    # the materialized partitions of time-partitioned assets are read from the asset status cache
+    # when calculating data times
+    instance_queryer.prefetch_asset_status_cache_values(
+        {
+            asset_key: asset_graph.get_partitions_def(asset_key)
+            for asset_key in prefetch_asset_keys
+            if isinstance(asset_graph.get_partitions_def(asset_key), TimeWindowPartitionsDefinition)
+        }
+    )
 
     (
         asset_partitions_to_reconcile_for_freshness,
@@ -338,6 +338,7 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
         retries=RetryMode.from_config(check.dict_elem(config, "retries")),  # type: ignore
         start_method=start_method,
         explicit_forkserver_preload=check.opt_list_elem(start_cfg, "preload_modules", of_type=str),
+        pool_config=check.opt_dict_elem(config, "pool"),
     )
 
 
@@ -391,6 +392,32 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
             ),
         ),
         "retries": get_retries_config(),
+        "pool": Field(
+            {
+                "max_steps_per_worker": Field(
+                    Int,
+                    default_value=100,
+                    description=(
+                        "The number of steps a worker process executes before it is replaced by"
+                        " a new worker."
+                    ),
+                ),
+                "max_worker_memory_mb": Field(
+                    Int,
+                    is_required=False,
+                    description=(
+                        "Replace a worker process once its peak resident memory exceeds this"
+                        " many megabytes. Not supported on Windows."
+                    ),
+                ),
+            },
+            is_required=False,
+            description=(
+                "Execute steps in a pool of long-lived worker processes instead of starting a new"
+                " process for each step. Each worker loads the job once and then executes steps"
+                " one at a time. A worker is replaced after an interrupt or an unexpected error."
+            ),
+        ),
     },
     description="Execute each step in an individual process.",
 )
@@ -419,6 +446,17 @@ def multiprocess_executor(init_context):
     concurrently. By default, or if you set ``max_concurrent`` to be 0, this is the return value of
     :py:func:`python:multiprocessing.cpu_count`.
 
+    Jobs with many short steps can set ``pool`` to reuse a set of long-lived worker processes,
+    each of which loads the job once, rather than starting and loading a new process per step:
+
+    .. code-block:: yaml
+
+        execution:
+          config:
+            multiprocess:
+              pool:
+                max_steps_per_worker: 50
+
     Execution priority can be configured using the ``dagster/priority`` tag via solid/op metadata,
     where the higher the number the higher the priority. 0 is the default and both positive
     and negative numbers can be used.
@@ -1,7 +1,9 @@
+import base64
 import copy
 import hashlib
 import inspect
 import json
+import zlib
 from abc import ABC, abstractmethod
 from datetime import datetime, time, timedelta
 from enum import Enum
@@ -1303,16 +1305,44 @@ def __len__(self) -> int:
     def __contains__(self, value) -> bool:
         raise NotImplementedError()
 
+    def __or__(self, other: "PartitionsSubset") -> "PartitionsSubset":
+        return self.with_partition_keys(other.get_partition_keys())
+
+    def __and__(self, other: "PartitionsSubset") -> "PartitionsSubset":
+        return self.partitions_def.empty_subset().with_partition_keys(
+            key for key in self.get_partition_keys() if key in other
+        )
+
+    def __sub__(self, other: "PartitionsSubset") -> "PartitionsSubset":
+        return self.partitions_def.empty_subset().with_partition_keys(
+            key for key in self.get_partition_keys() if key not in other
+        )
+
+
+def _compress_partition_keys(partition_keys: Iterable[str]) -> str:
+    # Keys of large partition sets tend to share long prefixes (e.g. one key per customer or file),
+    # which compress well once they are sorted next to each other
+    serialized_keys = json.dumps(sorted(partition_keys)).encode("utf-8")
+    return base64.b64encode(zlib.compress(serialized_keys)).decode("ascii")
+
+
+def _decompress_partition_keys(compressed: str) -> Set[str]:
+    return set(json.loads(zlib.decompress(base64.b64decode(compressed)).decode("utf-8")))
+
 
 class DefaultPartitionsSubset(PartitionsSubset):
     # Every time we change the serialization format, we should increment the version number.
     # This will ensure that we can gracefully degrade when deserializing old data.
-    SERIALIZATION_VERSION = 1
+    SERIALIZATION_VERSION = 2
+
+    # Version 1 stored the keys as a JSON list, and can still be read
+    LEGACY_SERIALIZATION_VERSION = 1
 
     def __init__(self, partitions_def: PartitionsDefinition, subset: Optional[Set[str]] = None):
         check.opt_set_param(subset, "subset")
         self._partitions_def = partitions_def
         self._subset = subset or set()
+        self._serialized: Optional[str] = None
 
     def get_partition_keys_not_in_subset(
         self,
@@ -1363,10 +1393,36 @@ def with_partition_keys(self, partition_keys: Iterable[str]) -> "DefaultPartitio
             self._subset | set(partition_keys),
         )
 
+    def _with_subset(self, subset: Set[str]) -> "PartitionsSubset":
+        return self._partitions_def.empty_subset().with_partition_keys(subset)
+
+    def __or__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if isinstance(other, DefaultPartitionsSubset):
+            return self.with_partition_keys(other._subset)
+        return super().__or__(other)
+
+    def __and__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if isinstance(other, DefaultPartitionsSubset):
+            return self._with_subset(self._subset & other._subset)
+        return super().__and__(other)
+
+    def __sub__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if isinstance(other, DefaultPartitionsSubset):
+            return self._with_subset(self._subset - other._subset)
+        return super().__sub__(other)
+
     def serialize(self) -> str:
         # Serialize version number, so attempting to deserialize old versions can be handled gracefully.
         # Any time the serialization format changes, we should increment the version number.
-        return json.dumps({"version": self.SERIALIZATION_VERSION, "subset": list(self._subset)})
+        # Subsets are immutable, so the serialized value is computed at most once.
+        if self._serialized is None:
+            self._serialized = json.dumps(
+                {
+                    "version": self.SERIALIZATION_VERSION,
+                    "subset": _compress_partition_keys(self._subset),
+                }
+            )
+        return self._serialized
 
     @classmethod
     def from_serialized(
@@ -1379,12 +1435,18 @@ def from_serialized(
             # backwards compatibility
             return cls(subset=set(data), partitions_def=partitions_def)
         else:
-            if data.get("version") != cls.SERIALIZATION_VERSION:
+            version = data.get("version")
+            if version == cls.LEGACY_SERIALIZATION_VERSION:
+                return cls(subset=set(data.get("subset")), partitions_def=partitions_def)
+            if version != cls.SERIALIZATION_VERSION:
                 raise DagsterInvalidDeserializationVersionError(
-                    f"Attempted to deserialize partition subset with version {data.get('version')},"
+                    f"Attempted to deserialize partition subset with version {version},"
                     f" but only version {cls.SERIALIZATION_VERSION} is supported."
                 )
-            return cls(subset=set(data.get("subset")), partitions_def=partitions_def)
+            return cls(
+                subset=_decompress_partition_keys(data.get("subset")),
+                partitions_def=partitions_def,
+            )
 
     @property
     def partitions_def(self) -> PartitionsDefinition:
@@ -1275,6 +1275,13 @@ def __init__(
     def repository_load_data(self) -> Optional[RepositoryLoadData]:
         return self._repository_load_data
 
+    @property
+    def has_static_definitions(self) -> bool:
+        """Whether the definitions in the repository are fixed once it has been loaded, rather than
+        provided by a user-supplied RepositoryData that may return different definitions over time.
+        """
+        return isinstance(self._repository_data, CachingRepositoryData)
+
     @public
     @property
     def name(self) -> str:
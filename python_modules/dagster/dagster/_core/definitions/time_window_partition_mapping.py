@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import NamedTuple, Optional, cast
+from typing import NamedTuple, Optional, Sequence, Tuple, cast
 
 import dagster._check as check
 from dagster._annotations import PublicAttr
@@ -11,7 +11,7 @@
     TimeWindowPartitionsDefinition,
     TimeWindowPartitionsSubset,
 )
-from dagster._core.errors import DagsterInvalidDefinitionError
+from dagster._core.errors import DagsterInvalidDefinitionError, DagsterInvalidInvocationError
 from dagster._core.instance import DynamicPartitionsStore
 from dagster._serdes import whitelist_for_serdes
 
@@ -92,7 +92,19 @@ def get_upstream_partitions_for_partition_range(
         downstream_partitions_def: Optional[PartitionsDefinition],
         upstream_partitions_def: PartitionsDefinition,
     ) -> PartitionKeyRange:
-        raise NotImplementedError()
+        if downstream_partition_key_range is None:
+            return PartitionKeyRange(
+                check.not_none(upstream_partitions_def.get_first_partition_key()),
+                check.not_none(upstream_partitions_def.get_last_partition_key()),
+            )
+
+        return self._map_partition_key_range(
+            check.not_none(downstream_partitions_def),
+            upstream_partitions_def,
+            downstream_partition_key_range,
+            self.start_offset,
+            self.end_offset,
+        )
 
     def get_upstream_partitions_for_partitions(
         self,
@@ -117,7 +129,13 @@ def get_downstream_partitions_for_partition_range(
         downstream_partitions_def: Optional[PartitionsDefinition],
         upstream_partitions_def: PartitionsDefinition,
     ) -> PartitionKeyRange:
-        raise NotImplementedError()
+        return self._map_partition_key_range(
+            upstream_partitions_def,
+            check.not_none(downstream_partitions_def),
+            upstream_partition_key_range,
+            -self.start_offset,
+            -self.end_offset,
+        )
 
     def get_downstream_partitions_for_partitions(
         self,
@@ -139,6 +157,37 @@ def get_downstream_partitions_for_partitions(
             -self.end_offset,
         )
 
+    def _map_partition_key_range(
+        self,
+        from_partitions_def: PartitionsDefinition,
+        to_partitions_def: PartitionsDefinition,
+        from_partition_key_range: PartitionKeyRange,
+        start_offset: int,
+        end_offset: int,
+    ) -> PartitionKeyRange:
+        """Maps a range of partitions as a single time window, rather than partition by partition.
+        A contiguous time window always maps to a contiguous time window.
+        """
+        from_partitions_def, to_partitions_def = self._check_partitions_defs(
+            from_partitions_def, to_partitions_def, start_offset, end_offset
+        )
+        if to_partitions_def == from_partitions_def and start_offset == 0 and end_offset == 0:
+            return from_partition_key_range
+
+        from_time_window = TimeWindow(
+            from_partitions_def.start_time_for_partition_key(from_partition_key_range.start),
+            from_partitions_def.end_time_for_partition_key(from_partition_key_range.end),
+        )
+        to_time_windows = self._map_time_windows(
+            from_partitions_def, to_partitions_def, [from_time_window], start_offset, end_offset
+        )
+        if not to_time_windows:
+            raise DagsterInvalidInvocationError(
+                f"Partition key range {from_partition_key_range} does not map to any partitions"
+            )
+
+        return to_partitions_def.get_partition_key_range_for_time_window(to_time_windows[0])
+
     def _map_partitions(
         self,
         from_partitions_def: PartitionsDefinition,
@@ -147,6 +196,38 @@ def _map_partitions(
         start_offset: int,
         end_offset: int,
     ) -> PartitionsSubset:
+        from_partitions_def, to_partitions_def = self._check_partitions_defs(
+            from_partitions_def, to_partitions_def, start_offset, end_offset
+        )
+
+        # skip fancy mapping logic in the simple case
+        if to_partitions_def == from_partitions_def and start_offset == 0 and end_offset == 0:
+            return from_partitions_subset
+
+        time_windows = self._map_time_windows(
+            from_partitions_def,
+            to_partitions_def,
+            from_partitions_subset.included_time_windows,
+            start_offset,
+            end_offset,
+        )
+
+        return TimeWindowPartitionsSubset(
+            to_partitions_def,
+            num_partitions=sum(
+                len(to_partitions_def.get_partition_keys_in_time_window(time_window))
+                for time_window in time_windows
+            ),
+            included_time_windows=time_windows,
+        )
+
+    def _check_partitions_defs(
+        self,
+        from_partitions_def: PartitionsDefinition,
+        to_partitions_def: PartitionsDefinition,
+        start_offset: int,
+        end_offset: int,
+    ) -> Tuple[TimeWindowPartitionsDefinition, TimeWindowPartitionsDefinition]:
         if not isinstance(from_partitions_def, TimeWindowPartitionsDefinition) or not isinstance(
             to_partitions_def, TimeWindowPartitionsDefinition
         ):
@@ -164,12 +245,18 @@ def _map_partitions(
         if to_partitions_def.timezone != from_partitions_def.timezone:
             raise DagsterInvalidDefinitionError("Timezones don't match")
 
-        # skip fancy mapping logic in the simple case
-        if to_partitions_def == from_partitions_def and start_offset == 0 and end_offset == 0:
-            return from_partitions_subset
+        return from_partitions_def, to_partitions_def
 
+    def _map_time_windows(
+        self,
+        from_partitions_def: TimeWindowPartitionsDefinition,
+        to_partitions_def: TimeWindowPartitionsDefinition,
+        from_time_windows: Sequence[TimeWindow],
+        start_offset: int,
+        end_offset: int,
+    ) -> Sequence[TimeWindow]:
         time_windows = []
-        for from_partition_time_window in from_partitions_subset.included_time_windows:
+        for from_partition_time_window in from_time_windows:
             from_start_dt, from_end_dt = from_partition_time_window
             offsetted_start_dt = _offsetted_datetime(
                 from_partitions_def, from_start_dt, start_offset
@@ -205,14 +292,7 @@ def _map_partitions(
 
                 time_windows.append(TimeWindow(window_start, window_end))
 
-        return TimeWindowPartitionsSubset(
-            to_partitions_def,
-            num_partitions=sum(
-                len(to_partitions_def.get_partition_keys_in_time_window(time_window))
-                for time_window in time_windows
-            ),
-            included_time_windows=time_windows,
-        )
+        return time_windows
 
 
 def _offsetted_datetime(
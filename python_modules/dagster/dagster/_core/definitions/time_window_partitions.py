@@ -1,7 +1,12 @@
+import bisect
 import hashlib
+import heapq
 import json
+import math
 import re
-from datetime import datetime
+import time
+from datetime import date, datetime
+from functools import lru_cache
 from typing import (
     AbstractSet,
     Any,
@@ -18,6 +23,7 @@
 )
 
 import pendulum
+import pytz
 
 import dagster._check as check
 from dagster._annotations import PublicAttr, public
@@ -50,6 +56,179 @@ class TimeWindow(NamedTuple):
     end: PublicAttr[datetime]
 
 
+# UTC offsets are probed once a day, more often than any timezone has changed its offset, from
+# the epoch until a couple of years from now, after which the rules of timezones repeat every year
+_UTC_OFFSET_PROBE_INTERVAL_SECONDS = 24 * 60 * 60
+_UTC_OFFSET_PROBE_HORIZON_SECONDS = 2 * 366 * 24 * 60 * 60
+
+
+@lru_cache(maxsize=None)
+def _get_last_partial_hour_utc_offset_change(timezone: str) -> Optional[float]:
+    """The timestamp of the last probe that found that the UTC offset of the timezone changed by
+    a fraction of an hour since the previous probe, or None if it only ever changed by whole
+    hours.
+    """
+    tz = pytz.timezone(timezone)
+    end_timestamp = time.time() + _UTC_OFFSET_PROBE_HORIZON_SECONDS
+    last_partial_hour_change = None
+    timestamp = 0.0
+    prev_offset = datetime.fromtimestamp(timestamp, tz).utcoffset()
+    while timestamp < end_timestamp:
+        timestamp += _UTC_OFFSET_PROBE_INTERVAL_SECONDS
+        offset = datetime.fromtimestamp(timestamp, tz).utcoffset()
+        if (offset - prev_offset).total_seconds() % 3600 != 0:
+            last_partial_hour_change = timestamp
+        prev_offset = offset
+    return last_partial_hour_change
+
+
+def _has_whole_hour_utc_offset_changes(timezone: str, after_timestamp: float) -> bool:
+    # Ticks are only moved by DST transitions in the same way as cron_string_iterator when the
+    # UTC offset of the timezone changes by whole hours (e.g. not Australia/Lord_Howe). Offsets
+    # are only probed after the epoch, so earlier timestamps are treated as if they could change
+    # by a fraction of an hour.
+    if after_timestamp < 0:
+        return False
+    try:
+        last_partial_hour_change = _get_last_partial_hour_utc_offset_change(timezone)
+    except (pytz.UnknownTimeZoneError, OverflowError, OSError, ValueError):
+        return False
+    return last_partial_hour_change is None or last_partial_hour_change <= after_timestamp
+
+
+# Cron schedules with a fixed interval between ticks: "minute hour day_of_month * day_of_week"
+FIXED_INTERVAL_CRON_REGEX = re.compile(r"(\d+) (\d+|\*) (\d+|\*) \* (\d+|\*)")
+
+
+class FixedIntervalTicks:
+    """Closed-form index arithmetic over the ticks of an hourly, daily, weekly, or monthly cron
+    schedule, consistent with the ticks produced by cron_string_iterator.
+
+    Tick 0 is the first tick at or after the start of a partitions definition, and tick n is the
+    start of the partition with index n. Ticks with negative indexes precede the start.
+    """
+
+    def __init__(self, schedule_type: ScheduleType, first_tick: datetime, timezone: str):
+        self._schedule_type = schedule_type
+        self._timezone = timezone
+        self._first_timestamp = first_tick.timestamp()
+        self._first_date = date(first_tick.year, first_tick.month, first_tick.day)
+        self._hour = first_tick.hour
+        self._minute = first_tick.minute
+
+    @staticmethod
+    def from_cron_schedule(
+        cron_schedule: str, timezone: str, first_tick: datetime
+    ) -> Optional["FixedIntervalTicks"]:
+        match = FIXED_INTERVAL_CRON_REGEX.fullmatch(cron_schedule)
+        if match is None or not _has_whole_hour_utc_offset_changes(
+            timezone, first_tick.timestamp()
+        ):
+            return None
+
+        minute, hour, day_of_month, day_of_week = match.groups()
+        if hour == "*":
+            if day_of_month != "*" or day_of_week != "*":
+                return None
+            return FixedIntervalTicks(ScheduleType.HOURLY, first_tick, timezone)
+
+        if day_of_month == "*" and day_of_week == "*":
+            schedule_type = ScheduleType.DAILY
+        elif day_of_month == "*":
+            schedule_type = ScheduleType.WEEKLY
+        elif day_of_week == "*" and int(day_of_month) <= 28:
+            # cron_string_iterator clamps later days to the end of shorter months, after which
+            # the day of the month drifts, so only earlier days map to a fixed interval
+            schedule_type = ScheduleType.MONTHLY
+        else:
+            return None
+
+        if first_tick.hour != int(hour) or first_tick.minute != int(minute):
+            # cron_string_iterator keeps the time of day of a first tick that was moved by a DST
+            # transition, rather than returning to the time of day of the cron schedule
+            return None
+
+        return FixedIntervalTicks(schedule_type, first_tick, timezone)
+
+    def _date_for_index(self, index: int) -> date:
+        if self._schedule_type == ScheduleType.DAILY:
+            return date.fromordinal(self._first_date.toordinal() + index)
+        elif self._schedule_type == ScheduleType.WEEKLY:
+            return date.fromordinal(self._first_date.toordinal() + 7 * index)
+        else:
+            years, month_idx = divmod(self._first_date.month - 1 + index, 12)
+            return date(self._first_date.year + years, month_idx + 1, self._first_date.day)
+
+    def _index_for_date(self, local_date: date) -> int:
+        if self._schedule_type == ScheduleType.DAILY:
+            return local_date.toordinal() - self._first_date.toordinal()
+        elif self._schedule_type == ScheduleType.WEEKLY:
+            return (local_date.toordinal() - self._first_date.toordinal()) // 7
+        else:
+            return (local_date.year - self._first_date.year) * 12 + (
+                local_date.month - self._first_date.month
+            )
+
+    def tick(self, index: int) -> datetime:
+        if self._schedule_type == ScheduleType.HOURLY:
+            # cron_string_iterator adds hours in absolute time, so DST transitions do not affect
+            # the interval between hourly ticks
+            return pendulum.from_timestamp(self._first_timestamp + index * 3600, tz=self._timezone)
+
+        tick_date = self._date_for_index(index)
+        tick = pendulum.datetime(
+            tick_date.year,
+            tick_date.month,
+            tick_date.day,
+            self._hour,
+            self._minute,
+            tz=self._timezone,
+        )
+        if tick.hour != self._hour:
+            # the time does not exist because of a DST transition, so like cron_string_iterator,
+            # use the start of the hour after the transition instead
+            tick = tick.replace(minute=0)
+        return tick
+
+    def index_at_or_before(self, timestamp: float) -> int:
+        """The index of the last tick at or before the given timestamp."""
+        if self._schedule_type == ScheduleType.HOURLY:
+            return math.floor((timestamp - self._first_timestamp) / 3600)
+
+        local_time = pendulum.from_timestamp(timestamp, tz=self._timezone)
+        index = self._index_for_date(date(local_time.year, local_time.month, local_time.day))
+        # the estimate from the local date can be off by one around the time of day of the ticks
+        while self.tick(index).timestamp() > timestamp:
+            index -= 1
+        while self.tick(index + 1).timestamp() <= timestamp:
+            index += 1
+        return index
+
+    def index_at_or_after(self, timestamp: float) -> int:
+        """The index of the first tick at or after the given timestamp."""
+        index = self.index_at_or_before(timestamp)
+        return index if self.tick(index).timestamp() == timestamp else index + 1
+
+    def time_window(self, index: int) -> TimeWindow:
+        return TimeWindow(self.tick(index), self.tick(index + 1))
+
+
+@lru_cache(maxsize=128)
+def get_fixed_interval_ticks(
+    cron_schedule: str, timezone: str, start_timestamp: float
+) -> Optional[FixedIntervalTicks]:
+    iterator = cron_string_iterator(
+        start_timestamp=start_timestamp,
+        cron_string=cron_schedule,
+        execution_timezone=timezone,
+    )
+    first_tick = next(iterator)
+    while first_tick.timestamp() < start_timestamp:
+        first_tick = next(iterator)
+
+    return FixedIntervalTicks.from_cron_schedule(cron_schedule, timezone, first_tick)
+
+
 class TimeWindowPartitionsDefinition(
     PartitionsDefinition[TimeWindow],  # pylint: disable=unsubscriptable-object
     NamedTuple(
@@ -148,6 +327,14 @@ def get_num_partitions(
         # string format datetimes.
         current_timestamp = self.get_current_timestamp(current_time=current_time)
 
+        fixed_interval_ticks = self._get_fixed_interval_ticks()
+        if fixed_interval_ticks is not None:
+            # the partition with index n ends at tick n + 1
+            num_ended_partitions = max(
+                fixed_interval_ticks.index_at_or_before(current_timestamp), 0
+            )
+            return num_ended_partitions + self.end_offset
+
         partitions_past_current_time = 0
 
         num_partitions = 0
@@ -175,6 +362,14 @@ def get_partition_keys_between_indexes(
         # Start index is inclusive, end index is exclusive.
         # Method added for performance reasons, to only string format
         # partition keys included within the indices.
+        fixed_interval_ticks = self._get_fixed_interval_ticks()
+        if fixed_interval_ticks is not None:
+            num_partitions = self.get_num_partitions(current_time=current_time)
+            return [
+                fixed_interval_ticks.tick(idx).strftime(self.fmt)
+                for idx in range(max(start_idx, 0), min(end_idx, num_partitions))
+            ]
+
         current_timestamp = self.get_current_timestamp(current_time=current_time)
 
         partitions_past_current_time = 0
@@ -262,7 +457,24 @@ def time_window_for_partition_key(self, partition_key: str) -> TimeWindow:
         partition_key_dt = pendulum.instance(
             datetime.strptime(partition_key, self.fmt), tz=self.timezone
         )
-        return next(iter(self._iterate_time_windows(partition_key_dt)))
+        return self._first_time_window_at_or_after(partition_key_dt)
+
+    def _get_fixed_interval_ticks(self) -> Optional[FixedIntervalTicks]:
+        return get_fixed_interval_ticks(self.cron_schedule, self.timezone, self.start_timestamp)
+
+    def _first_time_window_at_or_after(self, dt: datetime) -> TimeWindow:
+        fixed_interval_ticks = self._get_fixed_interval_ticks()
+        # ticks before the start of the partitions definition may have been moved by timezone
+        # changes that are not accounted for
+        if fixed_interval_ticks is not None and dt.timestamp() >= self.start_timestamp:
+            return fixed_interval_ticks.time_window(
+                fixed_interval_ticks.index_at_or_after(dt.timestamp())
+            )
+        return next(iter(self._iterate_time_windows(dt)))
+
+    @property
+    def start_timestamp(self) -> float:
+        return pendulum.instance(self.start, tz=self.timezone).timestamp()
 
     def time_windows_for_partition_keys(
         self,
@@ -272,6 +484,23 @@ def time_windows_for_partition_keys(
             return []
 
         sorted_pks = sorted(partition_keys, key=lambda pk: datetime.strptime(pk, self.fmt))
+
+        fixed_interval_ticks = self._get_fixed_interval_ticks()
+        if fixed_interval_ticks is not None:
+            if self.get_first_partition_window() is None:
+                check.failed("No partitions in the PartitionsDefinition")
+
+            num_partitions = self.get_num_partitions()
+            time_windows = []
+            for partition_key in sorted_pks:
+                partition_key_dt = pendulum.instance(
+                    datetime.strptime(partition_key, self.fmt), tz=self.timezone
+                )
+                idx = fixed_interval_ticks.index_at_or_after(partition_key_dt.timestamp())
+                if 0 <= idx < num_partitions:
+                    time_windows.append(fixed_interval_ticks.time_window(idx))
+            return time_windows
+
         cur_windows_iterator = iter(
             self._iterate_time_windows(
                 pendulum.instance(datetime.strptime(sorted_pks[0], self.fmt), tz=self.timezone)
@@ -314,7 +543,7 @@ def start_time_for_partition_key(self, partition_key: str) -> datetime:
         )
         # the datetime format might not include granular components, so we need to recover them
         # we make the assumption that the parsed partition key is <= the start datetime
-        return next(iter(self._iterate_time_windows(partition_key_dt))).start
+        return self._first_time_window_at_or_after(partition_key_dt).start
 
     def get_next_partition_key(
         self, partition_key: str, current_time: Optional[datetime] = None
@@ -384,6 +613,13 @@ def get_last_partition_window(
             else pendulum.now(self.timezone)
         )
 
+        fixed_interval_ticks = self._get_fixed_interval_ticks()
+        if fixed_interval_ticks is not None:
+            num_partitions = self.get_num_partitions(current_time)
+            return (
+                fixed_interval_ticks.time_window(num_partitions - 1) if num_partitions > 0 else None
+            )
+
         if self.end_offset == 0:
             return next(iter(self._reverse_iterate_time_windows(current_time)))  # type: ignore
         else:
@@ -614,6 +850,16 @@ def get_partition_key_for_timestamp(self, timestamp: float, end_closed: bool = F
             timestamp (float): Timestamp from the unix epoch, UTC.
             end_closed (bool): Whether the interval is closed at the end or at the beginning.
         """
+        fixed_interval_ticks = self._get_fixed_interval_ticks()
+        if fixed_interval_ticks is not None:
+            idx = fixed_interval_ticks.index_at_or_before(timestamp)
+            if end_closed and fixed_interval_ticks.tick(idx).timestamp() == timestamp:
+                idx -= 1
+            # ticks before the start of the partitions definition may have been moved by timezone
+            # changes that are not accounted for
+            if idx >= 0:
+                return fixed_interval_ticks.tick(idx).strftime(self.fmt)
+
         iterator = cron_string_iterator(
             timestamp, self.cron_schedule, self.timezone, start_offset=-1
         )
@@ -1177,7 +1423,76 @@ def inner(fn: Callable[[datetime, datetime], Mapping[str, Any]]) -> PartitionedC
     return inner
 
 
+# A half-open range of partition indexes, or of timestamps for partitions definitions whose ticks
+# are not at fixed intervals. Subsets keep these in sorted order, without overlapping or touching
+# ranges.
+PartitionRange = Tuple[float, float]
+
+
+def _merge_partition_ranges(partition_ranges: Iterable[PartitionRange]) -> List[PartitionRange]:
+    """Coalesces sorted ranges that overlap or touch."""
+    result: List[PartitionRange] = []
+    for start, end in partition_ranges:
+        if result and start <= result[-1][1]:
+            if end > result[-1][1]:
+                result[-1] = (result[-1][0], end)
+        else:
+            result.append((start, end))
+    return result
+
+
+def _union_partition_ranges(
+    left: Sequence[PartitionRange], right: Sequence[PartitionRange]
+) -> List[PartitionRange]:
+    return _merge_partition_ranges(heapq.merge(left, right))
+
+
+def _intersect_partition_ranges(
+    left: Sequence[PartitionRange], right: Sequence[PartitionRange]
+) -> List[PartitionRange]:
+    result: List[PartitionRange] = []
+    i = j = 0
+    while i < len(left) and j < len(right):
+        start = max(left[i][0], right[j][0])
+        end = min(left[i][1], right[j][1])
+        if start < end:
+            result.append((start, end))
+        if left[i][1] < right[j][1]:
+            i += 1
+        else:
+            j += 1
+    return result
+
+
+def _subtract_partition_ranges(
+    left: Sequence[PartitionRange], right: Sequence[PartitionRange]
+) -> List[PartitionRange]:
+    result: List[PartitionRange] = []
+    j = 0
+    for start, end in left:
+        while j < len(right) and right[j][1] <= start:
+            j += 1
+        # ranges in right can overlap more than one range in left, so only j is carried over
+        k = j
+        while k < len(right) and right[k][0] < end:
+            if right[k][0] > start:
+                result.append((start, right[k][0]))
+            start = max(start, right[k][1])
+            k += 1
+        if start < end:
+            result.append((start, end))
+    return result
+
+
 class TimeWindowPartitionsSubset(PartitionsSubset):
+    """A subset of the partitions of a TimeWindowPartitionsDefinition.
+
+    The subset is either a set of partition keys, or a sorted list of time windows. Set operations
+    between subsets are sorted merges of the ranges of partition indexes that the time windows
+    cover, so they do not depend on the number of partitions in either subset, and partition keys
+    are only generated when they are requested.
+    """
+
     # Every time we change the serialization format, we should increment the version number.
     # This will ensure that we can gracefully degrade when deserializing old data.
     SERIALIZATION_VERSION = 1
@@ -1206,79 +1521,178 @@ def __init__(
         self._included_partition_keys = check.opt_nullable_set_param(
             included_partition_keys, "included_partition_keys", of_type=str
         )
+        self._partition_ranges: Optional[List[PartitionRange]] = None
 
     @property
     def included_time_windows(self) -> Sequence[TimeWindow]:
         if self._included_time_windows is None:
-            result_time_windows, _ = self._add_partitions_to_time_windows(
-                initial_windows=[],
-                partition_keys=list(check.not_none(self._included_partition_keys)),
+            self._included_time_windows = self._time_windows_for_partition_ranges(
+                self.partition_ranges
             )
-            self._included_time_windows = result_time_windows
         return self._included_time_windows
 
-    def _get_partition_time_windows_not_in_subset(
-        self,
-        current_time: Optional[datetime] = None,
+    @property
+    def partition_ranges(self) -> Sequence[PartitionRange]:
+        if self._partition_ranges is None:
+            if self._included_time_windows is None:
+                self._partition_ranges, _ = self._partition_ranges_for_partition_keys(
+                    check.not_none(self._included_partition_keys)
+                )
+            else:
+                self._partition_ranges = self._partition_ranges_for_time_windows(
+                    self._included_time_windows
+                )
+        return self._partition_ranges
+
+    def _get_fixed_interval_ticks(self) -> Optional[FixedIntervalTicks]:
+        return self._partitions_def._get_fixed_interval_ticks()  # pylint: disable=protected-access
+
+    def _partition_ranges_for_time_windows(
+        self, time_windows: Sequence[TimeWindow]
+    ) -> List[PartitionRange]:
+        fixed_interval_ticks = self._get_fixed_interval_ticks()
+        if fixed_interval_ticks is None:
+            partition_ranges = [
+                (window.start.timestamp(), window.end.timestamp()) for window in time_windows
+            ]
+        else:
+            partition_ranges = [
+                (
+                    fixed_interval_ticks.index_at_or_after(window.start.timestamp()),
+                    fixed_interval_ticks.index_at_or_after(window.end.timestamp()),
+                )
+                for window in time_windows
+            ]
+        return _merge_partition_ranges(sorted(partition_ranges))
+
+    def _time_windows_for_partition_ranges(
+        self, partition_ranges: Sequence[PartitionRange]
     ) -> Sequence[TimeWindow]:
+        fixed_interval_ticks = self._get_fixed_interval_ticks()
+        if fixed_interval_ticks is None:
+            timezone = self._partitions_def.timezone
+            return [
+                TimeWindow(
+                    pendulum.from_timestamp(start, tz=timezone),
+                    pendulum.from_timestamp(end, tz=timezone),
+                )
+                for start, end in partition_ranges
+            ]
+        return [
+            TimeWindow(fixed_interval_ticks.tick(int(start)), fixed_interval_ticks.tick(int(end)))
+            for start, end in partition_ranges
+        ]
+
+    def _partition_ranges_for_partition_keys(
+        self, partition_keys: Iterable[str]
+    ) -> Tuple[List[PartitionRange], int]:
+        """Returns the minimized ranges that contain the given partition keys, and the number of
+        distinct partitions in them.
         """
-        Returns a list of partition time windows that are not in the subset.
-        Each time window is a single partition.
-        """
+        partitions_def = self._partitions_def
+        fixed_interval_ticks = self._get_fixed_interval_ticks()
+        if fixed_interval_ticks is None:
+            time_windows = partitions_def.time_windows_for_partition_keys(list(set(partition_keys)))
+            return (
+                _merge_partition_ranges(
+                    sorted((window.start.timestamp(), window.end.timestamp()))
+                    for window in time_windows
+                ),
+                len(time_windows),
+            )
+
+        num_partitions = partitions_def.get_num_partitions()
+        indexes = set()
+        for partition_key in partition_keys:
+            index = self._partition_index_for_partition_key(fixed_interval_ticks, partition_key)
+            if 0 <= index < num_partitions:
+                indexes.add(index)
+        return (
+            _merge_partition_ranges((index, index + 1) for index in sorted(indexes)),
+            len(indexes),
+        )
+
+    def _partition_index_for_partition_key(
+        self, fixed_interval_ticks: FixedIntervalTicks, partition_key: str
+    ) -> int:
+        partition_key_dt = pendulum.instance(
+            datetime.strptime(partition_key, self._partitions_def.fmt),
+            tz=self._partitions_def.timezone,
+        )
+        return fixed_interval_ticks.index_at_or_after(partition_key_dt.timestamp())
+
+    def _num_partitions_in_ranges(self, partition_ranges: Sequence[PartitionRange]) -> int:
+        if self._get_fixed_interval_ticks() is None:
+            return sum(
+                len(self._partitions_def.get_partition_keys_in_time_window(window))
+                for window in self._time_windows_for_partition_ranges(partition_ranges)
+            )
+        return int(sum(end - start for start, end in partition_ranges))
+
+    def _partition_keys_in_ranges(self, partition_ranges: Sequence[PartitionRange]) -> List[str]:
+        fixed_interval_ticks = self._get_fixed_interval_ticks()
+        if fixed_interval_ticks is None:
+            return [
+                partition_key
+                for window in self._time_windows_for_partition_ranges(partition_ranges)
+                for partition_key in self._partitions_def.get_partition_keys_in_time_window(window)
+            ]
+        fmt = self._partitions_def.fmt
+        return [
+            fixed_interval_ticks.tick(index).strftime(fmt)
+            for start, end in partition_ranges
+            for index in range(int(start), int(end))
+        ]
+
+    def _with_partition_ranges(
+        self, partition_ranges: List[PartitionRange], num_partitions: int
+    ) -> "TimeWindowPartitionsSubset":
+        subset = TimeWindowPartitionsSubset(
+            self._partitions_def,
+            num_partitions=num_partitions,
+            included_time_windows=self._time_windows_for_partition_ranges(partition_ranges),
+        )
+        subset._partition_ranges = partition_ranges
+        return subset
+
+    def _get_partition_ranges_not_in_subset(
+        self, current_time: Optional[datetime] = None
+    ) -> List[PartitionRange]:
         first_tw = self._partitions_def.get_first_partition_window()
         last_tw = self._partitions_def.get_last_partition_window(current_time=current_time)
 
         if not first_tw or not last_tw:
             check.failed("No partitions found")
 
-        if len(self.included_time_windows) == 0:
-            return [TimeWindow(first_tw.start, last_tw.end)]
-
-        time_windows = []
-        if first_tw.start < self.included_time_windows[0].start:
-            time_windows.append(TimeWindow(first_tw.start, self.included_time_windows[0].start))
-
-        for i in range(len(self.included_time_windows) - 1):
-            if self.included_time_windows[i].start >= last_tw.end:
-                break
-            if self.included_time_windows[i].end < last_tw.end:
-                if self.included_time_windows[i + 1].start <= last_tw.end:
-                    time_windows.append(
-                        TimeWindow(
-                            self.included_time_windows[i].end,
-                            self.included_time_windows[i + 1].start,
-                        )
-                    )
-                else:
-                    time_windows.append(
-                        TimeWindow(
-                            self.included_time_windows[i].end,
-                            last_tw.end,
-                        )
-                    )
-
-        if last_tw.end > self.included_time_windows[-1].end:
-            time_windows.append(TimeWindow(self.included_time_windows[-1].end, last_tw.end))
+        return _subtract_partition_ranges(
+            self._partition_ranges_for_time_windows([TimeWindow(first_tw.start, last_tw.end)]),
+            self.partition_ranges,
+        )
 
-        return time_windows
+    def _get_partition_time_windows_not_in_subset(
+        self,
+        current_time: Optional[datetime] = None,
+    ) -> Sequence[TimeWindow]:
+        """
+        Returns a list of the time windows of the partitions that are not in the subset, with
+        consecutive partitions merged into a single time window.
+        """
+        return self._time_windows_for_partition_ranges(
+            self._get_partition_ranges_not_in_subset(current_time)
+        )
 
     def get_partition_keys_not_in_subset(
         self,
         current_time: Optional[datetime] = None,
         dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
     ) -> Iterable[str]:
-        partition_keys: List[str] = []
-        for tw in self._get_partition_time_windows_not_in_subset(current_time):
-            partition_keys.extend(self._partitions_def.get_partition_keys_in_time_window(tw))
-        return partition_keys
+        return self._partition_keys_in_ranges(
+            self._get_partition_ranges_not_in_subset(current_time)
+        )
 
     def get_partition_keys(self, current_time: Optional[datetime] = None) -> Iterable[str]:
         if self._included_partition_keys is None:
-            return [
-                pk
-                for time_window in self.included_time_windows
-                for pk in self._partitions_def.get_partition_keys_in_time_window(time_window)
-            ]
+            return self._partition_keys_in_ranges(self.partition_ranges)
         return list(self._included_partition_keys) if self._included_partition_keys else []
 
     def get_partition_key_ranges(
@@ -1291,58 +1705,6 @@ def get_partition_key_ranges(
             for window in self.included_time_windows
         ]
 
-    def _add_partitions_to_time_windows(
-        self, initial_windows: Sequence[TimeWindow], partition_keys: Sequence[str]
-    ) -> Tuple[Sequence[TimeWindow], int]:
-        """Merges a set of partition keys into an existing set of time windows, returning the
-        minimized set of time windows and the number of partitions added.
-        """
-        result_windows = [*initial_windows]
-        time_windows = self._partitions_def.time_windows_for_partition_keys(
-            list(partition_keys),
-        )
-        num_added_partitions = 0
-        for window in sorted(time_windows):
-            # go in reverse order because it's more common to add partitions at the end than the
-            # beginning
-            for i in reversed(range(len(result_windows))):
-                included_window = result_windows[i]
-                lt_end_of_range = window.start < included_window.end
-                gte_start_of_range = window.start >= included_window.start
-
-                if lt_end_of_range and gte_start_of_range:
-                    break
-
-                if not lt_end_of_range:
-                    merge_with_range = included_window.end == window.start
-                    merge_with_later_range = i + 1 < len(result_windows) and (
-                        window.end == result_windows[i + 1].start
-                    )
-
-                    if merge_with_range and merge_with_later_range:
-                        result_windows[i] = TimeWindow(
-                            included_window.start, result_windows[i + 1].end
-                        )
-                        del result_windows[i + 1]
-                    elif merge_with_range:
-                        result_windows[i] = TimeWindow(included_window.start, window.end)
-                    elif merge_with_later_range:
-                        result_windows[i + 1] = TimeWindow(window.start, result_windows[i + 1].end)
-                    else:
-                        result_windows.insert(i + 1, window)
-
-                    num_added_partitions += 1
-                    break
-            else:
-                if result_windows and window.start == result_windows[0].start:
-                    result_windows[0] = TimeWindow(window.start, included_window.end)  # type: ignore
-                else:
-                    result_windows.insert(0, window)
-
-                num_added_partitions += 1
-
-        return result_windows, num_added_partitions
-
     def with_partition_keys(self, partition_keys: Iterable[str]) -> "TimeWindowPartitionsSubset":
         # if we are representing things as a static set of keys, continue doing so
         if self._included_partition_keys is not None:
@@ -1353,14 +1715,74 @@ def with_partition_keys(self, partition_keys: Iterable[str]) -> "TimeWindowParti
                 included_partition_keys=new_partitions,
             )
 
-        result_windows, added_partitions = self._add_partitions_to_time_windows(
-            self.included_time_windows, list(partition_keys)
+        added_ranges, num_added_partitions = self._partition_ranges_for_partition_keys(
+            partition_keys
         )
+        return self._union(added_ranges, num_added_partitions)
 
-        return TimeWindowPartitionsSubset(
-            self._partitions_def,
-            num_partitions=self._num_partitions + added_partitions,
-            included_time_windows=result_windows,
+    def _union(
+        self, other_ranges: Sequence[PartitionRange], num_other_partitions: int
+    ) -> "TimeWindowPartitionsSubset":
+        num_overlapping_partitions = self._num_partitions_in_ranges(
+            _intersect_partition_ranges(self.partition_ranges, other_ranges)
+        )
+        return self._with_partition_ranges(
+            _union_partition_ranges(self.partition_ranges, other_ranges),
+            num_partitions=self._num_partitions + num_other_partitions - num_overlapping_partitions,
+        )
+
+    def _is_combinable_with(self, other: PartitionsSubset) -> bool:
+        return (
+            isinstance(other, TimeWindowPartitionsSubset)
+            and self._partitions_def == other._partitions_def
+        )
+
+    def __or__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if not self._is_combinable_with(other):
+            return super().__or__(other)
+        other = cast(TimeWindowPartitionsSubset, other)
+
+        if self._included_partition_keys is not None and other._included_partition_keys is not None:
+            return self.with_partition_keys(other._included_partition_keys)
+
+        return self._union(other.partition_ranges, len(other))
+
+    def __and__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if not self._is_combinable_with(other):
+            return super().__and__(other)
+        other = cast(TimeWindowPartitionsSubset, other)
+
+        if self._included_partition_keys is not None and other._included_partition_keys is not None:
+            partition_keys = self._included_partition_keys & other._included_partition_keys
+            return TimeWindowPartitionsSubset(
+                self._partitions_def,
+                num_partitions=len(partition_keys),
+                included_partition_keys=partition_keys,
+            )
+
+        partition_ranges = _intersect_partition_ranges(
+            self.partition_ranges, other.partition_ranges
+        )
+        return self._with_partition_ranges(
+            partition_ranges, num_partitions=self._num_partitions_in_ranges(partition_ranges)
+        )
+
+    def __sub__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if not self._is_combinable_with(other):
+            return super().__sub__(other)
+        other = cast(TimeWindowPartitionsSubset, other)
+
+        if self._included_partition_keys is not None and other._included_partition_keys is not None:
+            partition_keys = self._included_partition_keys - other._included_partition_keys
+            return TimeWindowPartitionsSubset(
+                self._partitions_def,
+                num_partitions=len(partition_keys),
+                included_partition_keys=partition_keys,
+            )
+
+        partition_ranges = _subtract_partition_ranges(self.partition_ranges, other.partition_ranges)
+        return self._with_partition_ranges(
+            partition_ranges, num_partitions=self._num_partitions_in_ranges(partition_ranges)
         )
 
     @classmethod
@@ -1442,10 +1864,14 @@ def __contains__(self, partition_key: str) -> bool:
         if self._included_partition_keys is not None:
             return partition_key in self._included_partition_keys
 
-        time_window = self._partitions_def.time_window_for_partition_key(partition_key)
+        fixed_interval_ticks = self._get_fixed_interval_ticks()
+        if fixed_interval_ticks is None:
+            position: float = self._partitions_def.time_window_for_partition_key(
+                partition_key
+            ).start.timestamp()
+        else:
+            position = self._partition_index_for_partition_key(fixed_interval_ticks, partition_key)
 
-        return any(
-            time_window.start >= included_time_window.start
-            and time_window.start < included_time_window.end
-            for included_time_window in self.included_time_windows
-        )
+        # the last range that starts at or before the partition
+        i = bisect.bisect_right(self.partition_ranges, (position, math.inf)) - 1
+        return i >= 0 and position < self.partition_ranges[i][1]
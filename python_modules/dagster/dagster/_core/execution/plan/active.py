@@ -1,5 +1,20 @@
+import heapq
 import time
-from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Set, cast
+from collections import defaultdict
+from typing import (
+    AbstractSet,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    cast,
+)
 
 import dagster._check as check
 from dagster._core.errors import (
@@ -60,7 +75,19 @@ def __init__(
         self._step_outputs: Set[StepOutputHandle] = set(self._plan.known_state.ready_outputs)
 
         # All steps to be executed start out here in _pending
-        self._pending: Dict[str, Set[str]] = dict(self._plan.get_executable_step_deps())
+        self._pending: Dict[str, Set[str]] = {}
+
+        # Pending steps are tracked by how many of their upstream steps have yet to complete, so
+        # that completing a step only has to visit its downstream steps. Steps move to
+        # _ready_to_update once they have no remaining upstream steps, or once any upstream step
+        # has failed, and are only then considered by _update.
+        self._step_deps: Dict[str, AbstractSet[str]] = {}
+        self._remaining_dep_counts: Dict[str, int] = {}
+        self._pending_downstream: Dict[str, Set[str]] = defaultdict(set)
+        self._ready_to_update: Set[str] = set()
+        # insertion order into _pending, used to keep scheduling deterministic
+        self._pending_order: Dict[str, int] = {}
+        self._order_counter: int = 0
 
         # track mapping keys from DynamicOutputs, step_key, output_name -> list of keys
         # to _gathering while in flight
@@ -75,7 +102,9 @@ def __init__(
         self._skipped_deps: Dict[str, Sequence[str]] = {}
 
         # steps move in to these buckets as a result of _update calls
-        self._executable: List[str] = []
+        # _executable is a heap ordered by the sort key, and then by the order steps became
+        # executable
+        self._executable: List[Tuple[float, int, str]] = []
         self._pending_skip: List[str] = []
         self._pending_retry: List[str] = []
         self._pending_abandon: List[str] = []
@@ -95,6 +124,9 @@ def __init__(
 
         self._interrupted: bool = False
 
+        for step_key, deps in self._plan.get_executable_step_deps().items():
+            self._add_pending(step_key, deps)
+
         # Start the show by loading _executable with the set of _pending steps that have no deps
         self._update()
 
@@ -111,7 +143,10 @@ def __exit__(self, exc_type, exc_value, traceback):
 
         if not self.is_complete:
             pending_action = (
-                self._executable + self._pending_abandon + self._pending_retry + self._pending_skip
+                [step_key for _, _, step_key in sorted(self._executable)]
+                + self._pending_abandon
+                + self._pending_retry
+                + self._pending_skip
             )
             state_str = "{pending_str}{in_flight_str}{action_str}{retry_str}".format(
                 in_flight_str="\nSteps still in flight: {}".format(self._in_flight)
@@ -151,6 +186,43 @@ def __exit__(self, exc_type, exc_value, traceback):
                     " performing step execution.".format(step_list=self._unknown_state)
                 )
 
+    def _add_pending(self, step_key: str, deps: AbstractSet[str]) -> None:
+        self._pending[step_key] = set(deps)
+        self._step_deps[step_key] = deps
+        self._pending_order[step_key] = self._order_counter
+        self._order_counter += 1
+
+        successful_or_skipped_steps = self._success | self._skipped
+        remaining_deps = [dep for dep in deps if dep not in successful_or_skipped_steps]
+        self._remaining_dep_counts[step_key] = len(remaining_deps)
+        for dep in remaining_deps:
+            self._pending_downstream[dep].add(step_key)
+
+        if not remaining_deps or any(
+            dep in self._failed or dep in self._abandoned for dep in remaining_deps
+        ):
+            self._ready_to_update.add(step_key)
+
+    def _handle_dep_complete(self, step_key: str, succeeded: bool) -> None:
+        """Updates the steps downstream of a step that has reached a terminal state."""
+        for downstream_key in self._pending_downstream.pop(step_key, set()):
+            if downstream_key not in self._pending:
+                continue
+
+            if succeeded:
+                self._remaining_dep_counts[downstream_key] -= 1
+                if self._remaining_dep_counts[downstream_key] == 0:
+                    self._ready_to_update.add(downstream_key)
+            else:
+                self._ready_to_update.add(downstream_key)
+
+    def _add_executable(self, step_key: str) -> None:
+        heapq.heappush(
+            self._executable,
+            (self._sort_key_fn(self.get_step_by_key(step_key)), self._order_counter, step_key),
+        )
+        self._order_counter += 1
+
     def _update(self) -> None:
         """Moves steps from _pending to _executable / _pending_skip / _pending_retry
         as a function of what has been _completed.
@@ -159,23 +231,25 @@ def _update(self) -> None:
         new_steps_to_skip = []
         new_steps_to_abandon = []
 
-        successful_or_skipped_steps = self._success | self._skipped
-        failed_or_abandoned_steps = self._failed | self._abandoned
-
         if self._new_dynamic_mappings:
             new_step_deps = self._plan.resolve(self._completed_dynamic_outputs)
             for step_key, deps in new_step_deps.items():
-                self._pending[step_key] = deps
+                self._add_pending(step_key, deps)
 
             self._new_dynamic_mappings = False
 
-        for step_key, requirements in self._pending.items():
+        ready_step_keys = sorted(self._ready_to_update, key=self._pending_order.__getitem__)
+        self._ready_to_update.clear()
+
+        for step_key in ready_step_keys:
+            requirements = self._pending[step_key]
+
             # If any upstream deps failed - this is not executable
-            if requirements.intersection(failed_or_abandoned_steps):
+            if any(dep in self._failed or dep in self._abandoned for dep in requirements):
                 new_steps_to_abandon.append(step_key)
 
             # If all the upstream steps of a step are complete or skipped
-            elif requirements.issubset(successful_or_skipped_steps):
+            elif self._remaining_dep_counts[step_key] == 0:
                 step = self.get_step_by_key(step_key)
 
                 # The base case is downstream step won't skip
@@ -206,16 +280,16 @@ def _update(self) -> None:
                     new_steps_to_execute.append(step_key)
 
         for key in new_steps_to_execute:
-            self._executable.append(key)
-            del self._pending[key]
+            self._add_executable(key)
+            self._remove_pending(key)
 
         for key in new_steps_to_skip:
             self._pending_skip.append(key)
-            del self._pending[key]
+            self._remove_pending(key)
 
         for key in new_steps_to_abandon:
             self._pending_abandon.append(key)
-            del self._pending[key]
+            self._remove_pending(key)
 
         ready_to_retry = []
         tick_time = time.time()
@@ -224,9 +298,14 @@ def _update(self) -> None:
                 ready_to_retry.append(key)
 
         for key in ready_to_retry:
-            self._executable.append(key)
+            self._add_executable(key)
             del self._waiting_to_retry[key]
 
+    def _remove_pending(self, step_key: str) -> None:
+        del self._pending[step_key]
+        del self._remaining_dep_counts[step_key]
+        del self._pending_order[step_key]
+
     def sleep_til_ready(self) -> None:
         now = time.time()
         sleep_amt = min([ready_at - now for ready_at in self._waiting_to_retry.values()])
@@ -264,11 +343,6 @@ def get_steps_to_execute(
 
         self._update()
 
-        steps = sorted(
-            [self.get_step_by_key(key) for key in self._executable],
-            key=self._sort_key_fn,
-        )
-
         tag_concurrency_limits_counter = None
         if self._tag_concurrency_limits:
             in_flight_steps = [self.get_step_by_key(key) for key in self._in_flight]
@@ -278,8 +352,9 @@ def get_steps_to_execute(
             )
 
         batch: List[ExecutionStep] = []
+        blocked: List[Tuple[float, int, str]] = []
 
-        for step in steps:
+        while self._executable:
             if limit is not None and len(batch) >= limit:
                 break
 
@@ -289,17 +364,23 @@ def get_steps_to_execute(
             ):
                 break
 
+            entry = heapq.heappop(self._executable)
+            step = self.get_step_by_key(entry[2])
+
             if tag_concurrency_limits_counter:
                 if tag_concurrency_limits_counter.is_blocked(step):
+                    blocked.append(entry)
                     continue
 
                 tag_concurrency_limits_counter.update_counters_with_launched_item(step)
 
             batch.append(step)
 
+        for entry in blocked:
+            heapq.heappush(self._executable, entry)
+
         for step in batch:
             self._in_flight.add(step.key)
-            self._executable.remove(step.key)
             self._prep_for_dynamic_outputs(step)
 
         return batch
@@ -377,20 +458,24 @@ def plan_events_iterator(self, pipeline_context) -> Iterator[DagsterEvent]:
     def mark_failed(self, step_key: str) -> None:
         self._failed.add(step_key)
         self._mark_complete(step_key)
+        self._handle_dep_complete(step_key, succeeded=False)
 
     def mark_success(self, step_key: str) -> None:
         self._success.add(step_key)
         self._mark_complete(step_key)
+        self._handle_dep_complete(step_key, succeeded=True)
         self._resolve_any_dynamic_outputs(step_key)
 
     def mark_skipped(self, step_key: str) -> None:
         self._skipped.add(step_key)
         self._mark_complete(step_key)
+        self._handle_dep_complete(step_key, succeeded=True)
         self._resolve_any_dynamic_outputs(step_key)
 
     def mark_abandoned(self, step_key: str) -> None:
         self._abandoned.add(step_key)
         self._mark_complete(step_key)
+        self._handle_dep_complete(step_key, succeeded=False)
 
     def mark_interrupted(self) -> None:
         self._interrupted = True
@@ -410,7 +495,7 @@ def mark_up_for_retry(self, step_key: str, at_time: Optional[float] = None) -> N
             if at_time:
                 self._waiting_to_retry[step_key] = at_time
             else:
-                self._pending[step_key] = self._plan.get_executable_step_deps()[step_key]
+                self._add_pending(step_key, self._step_deps[step_key])
 
         elif self._retry_mode.deferred:
             # do not attempt to execute again
@@ -420,6 +505,9 @@ def mark_up_for_retry(self, step_key: str, at_time: Optional[float] = None) -> N
 
         self._mark_complete(step_key)
 
+        if self._retry_mode.deferred:
+            self._handle_dep_complete(step_key, succeeded=False)
+
     def _mark_complete(self, step_key: str) -> None:
         check.invariant(
             step_key in self._in_flight,
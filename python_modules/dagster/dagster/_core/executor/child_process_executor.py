@@ -2,17 +2,28 @@
 
 
 import os
-import queue
 import sys
 from abc import ABC, abstractmethod
-from multiprocessing import Queue
+from contextlib import contextmanager
+from multiprocessing.connection import Connection
 from multiprocessing.context import BaseContext as MultiprocessingBaseContext
-from typing import TYPE_CHECKING, Iterator, NamedTuple, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Union,
+)
 
 from typing_extensions import Literal
 
 import dagster._check as check
 from dagster._core.errors import DagsterExecutionInterruptedError
+from dagster._utils import start_termination_thread
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 from dagster._utils.interrupts import capture_interrupts
 
@@ -43,6 +54,12 @@ class ChildProcessSystemErrorEvent(
     pass
 
 
+class ChildProcessRecycleEvent(
+    NamedTuple("ChildProcessRecycleEvent", [("pid", int)]), ChildProcessEvent
+):
+    """Sent by a pool worker before the completion event of the last command it will execute."""
+
+
 class ChildProcessCommand(ABC):  # pylint: disable=no-init
     """Inherit from this class in order to use this library.
 
@@ -65,31 +82,33 @@ def __init__(self, exit_code=None):
         super().__init__()
 
 
-def _execute_command_in_child_process(event_queue: Queue, command: ChildProcessCommand):
+def _execute_command_in_child_process(event_conn: Connection, command: ChildProcessCommand):
     """Wraps the execution of a ChildProcessCommand.
 
-    Handles errors and communicates across a queue with the parent process.
+    Handles errors and communicates across a pipe with the parent process.
     """
     check.inst_param(command, "command", ChildProcessCommand)
 
     with capture_interrupts():
         pid = os.getpid()
-        event_queue.put(ChildProcessStartEvent(pid=pid))
+        event_conn.send(ChildProcessStartEvent(pid=pid))
         try:
             for step_event in command.execute():
-                event_queue.put(step_event)
-            event_queue.put(ChildProcessDoneEvent(pid=pid))
+                event_conn.send(step_event)
+            event_conn.send(ChildProcessDoneEvent(pid=pid))
 
         except (
             Exception,
             KeyboardInterrupt,
             DagsterExecutionInterruptedError,
         ):
-            event_queue.put(
+            event_conn.send(
                 ChildProcessSystemErrorEvent(
                     pid=pid, error_info=serializable_error_info_from_exc_info(sys.exc_info())
                 )
             )
+        finally:
+            event_conn.close()
 
 
 TICK = 20.0 * 1.0 / 1000.0
@@ -100,32 +119,39 @@ def _execute_command_in_child_process(event_queue: Queue, command: ChildProcessC
 
 
 def _poll_for_event(
-    process, event_queue
+    process, event_conn: Connection, timeout: float
 ) -> Optional[Union["DagsterEvent", Literal["PROCESS_DEAD_AND_QUEUE_EMPTY"]]]:
     try:
-        return event_queue.get(block=True, timeout=TICK)
-    except queue.Empty:
+        if event_conn.poll(timeout):
+            return event_conn.recv()
+
         if not process.is_alive():
-            # There is a possibility that after the last queue.get the
+            # There is a possibility that after the last poll the
             # process created another event and then died. In that case
-            # we want to continue draining the queue.
-            try:
-                return event_queue.get(block=False)
-            except queue.Empty:
-                # If the queue empty we know that there are no more events
-                # and that the process has died.
-                return PROCESS_DEAD_AND_QUEUE_EMPTY
+            # we want to continue draining the pipe.
+            if event_conn.poll():
+                return event_conn.recv()
+            # If the pipe is empty we know that there are no more events
+            # and that the process has died.
+            return PROCESS_DEAD_AND_QUEUE_EMPTY
+    except EOFError:
+        # every writer has closed the pipe, so the process is done sending events and is exiting
+        process.join()
+        return PROCESS_DEAD_AND_QUEUE_EMPTY
     return None
 
 
 def execute_child_process_command(
-    multiprocessing_ctx: MultiprocessingBaseContext, command: ChildProcessCommand
+    multiprocessing_ctx: MultiprocessingBaseContext,
+    command: ChildProcessCommand,
+    timeout: float = TICK,
+    waitables: Optional[List[Any]] = None,
 ) -> Iterator[Optional["DagsterEvent"]]:
     """Execute a ChildProcessCommand in a new process.
 
     This function starts a new process whose execution target is a ChildProcessCommand wrapped by
-    _execute_command_in_child_process; polls the queue for events yielded by the child process
-    until the process dies and the queue is empty.
+    _execute_command_in_child_process; polls the pipe for events yielded by the child process
+    until the process dies and the pipe is empty.
 
     This function yields a complex set of objects to enable having multiple child process
     executions in flight:
@@ -143,23 +169,32 @@ def execute_child_process_command(
     Args:
         multiprocessing_ctx: The multiprocessing context to execute in (spawn, forkserver, fork)
         command (ChildProcessCommand): The command to execute in the child process.
+        timeout (float): How long to block waiting for an event before yielding None.
+        waitables (Optional[List[Any]]): If provided, populated once the child process has
+            started with the objects that become ready when the child process has an event or
+            has exited, for use with `multiprocessing.connection.wait`.
 
     Warning: if the child process is in an infinite loop, this will
     also infinitely loop.
     """
     check.inst_param(command, "command", ChildProcessCommand)
 
-    event_queue = multiprocessing_ctx.Queue()
+    event_conn, child_event_conn = multiprocessing_ctx.Pipe(duplex=False)
     try:
         process = multiprocessing_ctx.Process(  # type: ignore
-            target=_execute_command_in_child_process, args=(event_queue, command)
+            target=_execute_command_in_child_process, args=(child_event_conn, command)
         )
         process.start()
+        # the child process holds its own handle to the write end of the pipe
+        child_event_conn.close()
+
+        if waitables is not None:
+            waitables.extend([event_conn, process.sentinel])
 
         completed_properly = False
 
         while not completed_properly:
-            event = _poll_for_event(process, event_queue)
+            event = _poll_for_event(process, event_conn, timeout)
 
             if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
                 break
@@ -175,4 +210,271 @@ def execute_child_process_command(
 
         process.join()
     finally:
-        event_queue.close()
+        child_event_conn.close()
+        event_conn.close()
+
+
+def _get_max_rss_bytes() -> Optional[int]:
+    try:
+        import resource
+    except ImportError:
+        # not available on windows
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # reported in bytes on macos and in kilobytes on linux
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def _execute_commands_in_worker_process(
+    conn: Connection,
+    term_event: Any,
+    max_commands: Optional[int],
+    max_memory_bytes: Optional[int],
+    initializer: Optional[Callable[..., Any]],
+    initargs: Sequence[Any],
+):
+    """Executes the ChildProcessCommands received over a pipe one at a time, until the parent
+    process sends None or the worker needs to be recycled.
+
+    The events for each command are sent back over the same pipe, following the same protocol as
+    _execute_command_in_child_process.
+    """
+    with capture_interrupts():
+        start_termination_thread(term_event)
+        pid = os.getpid()
+
+        init_error = None
+        if initializer is not None:
+            try:
+                initializer(*initargs)
+            except Exception:
+                init_error = serializable_error_info_from_exc_info(sys.exc_info())
+
+        num_commands = 0
+        try:
+            while True:
+                try:
+                    command = conn.recv()
+                except EOFError:
+                    # the parent process has gone away
+                    return
+
+                if command is None:
+                    return
+
+                num_commands += 1
+                conn.send(ChildProcessStartEvent(pid=pid))
+
+                if init_error:
+                    conn.send(ChildProcessRecycleEvent(pid=pid))
+                    conn.send(ChildProcessSystemErrorEvent(pid=pid, error_info=init_error))
+                    return
+
+                try:
+                    for step_event in command.execute():
+                        conn.send(step_event)
+                except (
+                    Exception,
+                    KeyboardInterrupt,
+                    DagsterExecutionInterruptedError,
+                ):
+                    # the worker can not be trusted with further commands after a system error
+                    error_info = serializable_error_info_from_exc_info(sys.exc_info())
+                    conn.send(ChildProcessRecycleEvent(pid=pid))
+                    conn.send(ChildProcessSystemErrorEvent(pid=pid, error_info=error_info))
+                    return
+
+                max_rss_bytes = _get_max_rss_bytes() if max_memory_bytes is not None else None
+                should_recycle = (
+                    # the termination thread has already fired, so further commands could not be
+                    # interrupted
+                    term_event.is_set()
+                    or (max_commands is not None and num_commands >= max_commands)
+                    or (
+                        max_memory_bytes is not None
+                        and max_rss_bytes is not None
+                        and max_rss_bytes >= max_memory_bytes
+                    )
+                )
+
+                if should_recycle:
+                    conn.send(ChildProcessRecycleEvent(pid=pid))
+                conn.send(ChildProcessDoneEvent(pid=pid))
+                if should_recycle:
+                    return
+        finally:
+            conn.close()
+
+
+class ChildProcessWorker:
+    """A long-lived process in a ChildProcessWorkerPool.
+
+    conn (Connection): duplex pipe used to send commands to the worker and receive their events
+    term_event (multiprocessing.Event): set to interrupt the command that the worker is executing
+    is_executing (bool): whether the worker was sent a command that it has not completed
+    is_recycling (bool): whether the worker must not be sent any more commands
+    """
+
+    def __init__(self, process, conn: Connection, term_event: Any):
+        self.process = process
+        self.conn = conn
+        self.term_event = term_event
+        self.is_executing = False
+        self.is_recycling = False
+
+
+class ChildProcessWorkerPool:
+    """A pool of long-lived worker processes that execute ChildProcessCommands one at a time.
+
+    Workers are started on demand and reused for later commands, so that expensive per-process
+    setup (e.g. loading user code, done by `initializer`) is paid once per worker rather than once
+    per command. A worker is replaced after `max_commands_per_worker` commands, once its peak
+    resident memory reaches `max_worker_memory_bytes`, after it has been interrupted, or after a
+    command raises a system error.
+    """
+
+    def __init__(
+        self,
+        multiprocessing_ctx: MultiprocessingBaseContext,
+        max_commands_per_worker: Optional[int] = None,
+        max_worker_memory_bytes: Optional[int] = None,
+        initializer: Optional[Callable[..., Any]] = None,
+        initargs: Sequence[Any] = (),
+    ):
+        self._multiprocessing_ctx = multiprocessing_ctx
+        self._max_commands_per_worker = check.opt_int_param(
+            max_commands_per_worker, "max_commands_per_worker"
+        )
+        self._max_worker_memory_bytes = check.opt_int_param(
+            max_worker_memory_bytes, "max_worker_memory_bytes"
+        )
+        self._initializer = check.opt_callable_param(initializer, "initializer")
+        self._initargs = check.sequence_param(initargs, "initargs")
+        self._workers: List[ChildProcessWorker] = []
+        self._idle_workers: List[ChildProcessWorker] = []
+
+    def __enter__(self) -> "ChildProcessWorkerPool":
+        return self
+
+    def __exit__(self, _exception_type, _exception_value, _traceback):
+        self.shutdown()
+
+    def _start_worker(self) -> ChildProcessWorker:
+        conn, worker_conn = self._multiprocessing_ctx.Pipe(duplex=True)
+        term_event = self._multiprocessing_ctx.Event()
+        process = self._multiprocessing_ctx.Process(  # type: ignore
+            target=_execute_commands_in_worker_process,
+            args=(
+                worker_conn,
+                term_event,
+                self._max_commands_per_worker,
+                self._max_worker_memory_bytes,
+                self._initializer,
+                self._initargs,
+            ),
+        )
+        process.start()
+        # the worker process holds its own handle to its end of the pipe
+        worker_conn.close()
+
+        worker = ChildProcessWorker(process, conn, term_event)
+        self._workers.append(worker)
+        return worker
+
+    def _discard_worker(self, worker: ChildProcessWorker):
+        worker.conn.close()
+        if worker.is_executing:
+            # the command was abandoned before it completed, so it can not be completed now
+            worker.process.terminate()
+        # a recycling worker exits right after sending its last event
+        worker.process.join()
+        self._workers.remove(worker)
+
+    @contextmanager
+    def worker(self) -> Iterator[ChildProcessWorker]:
+        """Check out an idle worker, starting a new one if there are none, for the duration of a
+        single command.
+        """
+        worker = None
+        while self._idle_workers:
+            candidate = self._idle_workers.pop()
+            if candidate.process.is_alive():
+                worker = candidate
+                break
+            self._discard_worker(candidate)
+
+        if worker is None:
+            worker = self._start_worker()
+
+        try:
+            yield worker
+        finally:
+            if worker.is_recycling or not worker.process.is_alive():
+                self._discard_worker(worker)
+            else:
+                self._idle_workers.append(worker)
+
+    def shutdown(self):
+        for worker in self._idle_workers:
+            try:
+                worker.conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+
+        for worker in list(self._workers):
+            if worker.is_executing or worker not in self._idle_workers:
+                # still executing a command, which can not be completed at this point
+                worker.process.terminate()
+            worker.process.join()
+            worker.conn.close()
+
+        self._workers = []
+        self._idle_workers = []
+
+
+def execute_child_process_command_in_worker(
+    worker: ChildProcessWorker,
+    command: ChildProcessCommand,
+    timeout: float = TICK,
+    waitables: Optional[List[Any]] = None,
+) -> Iterator[Optional["DagsterEvent"]]:
+    """Execute a ChildProcessCommand in a worker checked out from a ChildProcessWorkerPool.
+
+    Yields the same objects as execute_child_process_command, and raises
+    ChildProcessCrashException if the worker dies before completing the command.
+    """
+    check.inst_param(worker, "worker", ChildProcessWorker)
+    check.inst_param(command, "command", ChildProcessCommand)
+
+    if waitables is not None:
+        waitables.extend([worker.conn, worker.process.sentinel])
+
+    worker.conn.send(command)
+    worker.is_executing = True
+
+    completed_properly = False
+
+    try:
+        while not completed_properly:
+            event = _poll_for_event(worker.process, worker.conn, timeout)
+
+            if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
+                break
+
+            if isinstance(event, ChildProcessRecycleEvent):
+                worker.is_recycling = True
+
+            if isinstance(event, (ChildProcessDoneEvent, ChildProcessSystemErrorEvent)):
+                completed_properly = True
+                worker.is_executing = False
+
+            yield event
+    finally:
+        if not completed_properly:
+            # the worker crashed, or the caller stopped consuming events mid-command (e.g. by
+            # closing this generator), in which case its pipe still holds events of this command
+            worker.is_recycling = True
+
+    if not completed_properly:
+        raise ChildProcessCrashException(exit_code=worker.process.exitcode)
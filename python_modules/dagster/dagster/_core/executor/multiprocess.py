@@ -1,8 +1,10 @@
 import multiprocessing
+import multiprocessing.connection
 import os
 import sys
+from contextlib import ExitStack
 from multiprocessing.context import BaseContext as MultiprocessingBaseContext
-from typing import Any, Dict, Iterator, List, Optional, Sequence
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence
 
 from dagster import (
     MetadataEntry,
@@ -36,11 +38,17 @@
     ChildProcessCrashException,
     ChildProcessEvent,
     ChildProcessSystemErrorEvent,
+    ChildProcessWorkerPool,
     execute_child_process_command,
+    execute_child_process_command_in_worker,
 )
 
 DELEGATE_MARKER = "multiprocess_subprocess_init"
 
+WAIT_TIMEOUT = 1.0
+"""The maximum time to block waiting on child processes before checking for interrupts and
+steps that are ready to retry."""
+
 
 class MultiprocessExecutorChildProcessCommand(ChildProcessCommand):
     def __init__(
@@ -68,7 +76,9 @@ def __init__(
     def execute(self) -> Iterator[DagsterEvent]:
         pipeline = self.recon_pipeline
         with DagsterInstance.from_ref(self.instance_ref) as instance:
-            start_termination_thread(self.term_event)
+            # pool workers listen for their own termination event for their entire lifetime
+            if self.term_event is not None:
+                start_termination_thread(self.term_event)
             execution_plan = create_execution_plan(
                 pipeline=pipeline,
                 run_config=self.run_config,
@@ -100,6 +110,13 @@ def execute(self) -> Iterator[DagsterEvent]:
             )
 
 
+def _preload_pipeline(recon_pipeline: ReconstructablePipeline) -> None:
+    # ReconstructablePipeline caches its definition, so the steps executed by a pool worker reuse
+    # the definition loaded when the worker started, as long as they are executed against a
+    # reconstructable equal to this one
+    recon_pipeline.get_definition()
+
+
 class MultiprocessExecutor(Executor):
     def __init__(
         self,
@@ -108,6 +125,7 @@ def __init__(
         tag_concurrency_limits: Optional[List[Dict[str, Any]]] = None,
         start_method: Optional[str] = None,
         explicit_forkserver_preload: Optional[Sequence[str]] = None,
+        pool_config: Optional[Mapping[str, Any]] = None,
     ):
         self._retries = check.inst_param(retries, "retries", RetryMode)
         if not max_concurrent:
@@ -135,6 +153,8 @@ def __init__(
             )
         self._start_method = start_method
         self._explicit_forkserver_preload = explicit_forkserver_preload
+        self._pool_config = check.opt_mapping_param(pool_config, "pool_config")
+        self._use_pool = pool_config is not None
 
     @property
     def retries(self) -> RetryMode:
@@ -147,6 +167,10 @@ def execute(
         check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
 
         pipeline = plan_context.reconstructable_pipeline
+        if execution_plan.repository_load_data is not None:
+            # steps build their plan with the repository load data of this plan, so use the
+            # same reconstructable here so that pool workers preload the definition steps use
+            pipeline = pipeline.with_repository_load_data(execution_plan.repository_load_data)
 
         multiproc_ctx = multiprocessing.get_context(self._start_method)
         if self._start_method == "forkserver":
@@ -183,7 +207,24 @@ def execute(
             ),
         )
 
-        with time_execution_scope() as timer_result:
+        with time_execution_scope() as timer_result, ExitStack() as stack:
+            pool = None
+            if self._use_pool:
+                max_worker_memory_mb = self._pool_config.get("max_worker_memory_mb")
+                pool = stack.enter_context(
+                    ChildProcessWorkerPool(
+                        multiproc_ctx,
+                        max_commands_per_worker=self._pool_config.get("max_steps_per_worker"),
+                        max_worker_memory_bytes=(
+                            max_worker_memory_mb * 1024 * 1024
+                            if max_worker_memory_mb is not None
+                            else None
+                        ),
+                        initializer=_preload_pipeline,
+                        initargs=(pipeline,),
+                    )
+                )
+
             with ActiveExecution(
                 execution_plan,
                 retry_mode=self.retries,
@@ -193,6 +234,7 @@ def execute(
                 active_iters: Dict[str, Iterator[Optional[DagsterEvent]]] = {}
                 errors: Dict[int, SerializableErrorInfo] = {}
                 term_events: Dict[str, Any] = {}
+                waitables: Dict[str, List[Any]] = {}
                 stopping: bool = False
 
                 while (not stopping and not active_execution.is_complete) or active_iters:
@@ -210,6 +252,7 @@ def execute(
                         for key, event in term_events.items():
                             event.set()
 
+                    made_progress = False
                     while not stopping:
                         steps = active_execution.get_steps_to_execute(
                             limit=(limit - len(active_iters)),
@@ -218,22 +261,41 @@ def execute(
                         if not steps:
                             break
 
+                        made_progress = True
                         for step in steps:
                             step_context = plan_context.for_step(step)
-                            term_events[step.key] = multiproc_ctx.Event()
-                            active_iters[step.key] = execute_step_out_of_process(
-                                multiproc_ctx,
-                                pipeline,
-                                step_context,
-                                step,
-                                errors,
-                                term_events,
-                                self.retries,
-                                active_execution.get_known_state(),
-                                execution_plan.repository_load_data,
-                            )
-
-                    # process active iterators
+                            waitables[step.key] = []
+                            if pool is not None:
+                                # the term event of the worker executing the step is registered
+                                # once the step iterator checks out a worker
+                                active_iters[step.key] = execute_step_in_worker_pool(
+                                    pool,
+                                    pipeline,
+                                    step_context,
+                                    step,
+                                    errors,
+                                    term_events,
+                                    self.retries,
+                                    active_execution.get_known_state(),
+                                    execution_plan.repository_load_data,
+                                    waitables[step.key],
+                                )
+                            else:
+                                term_events[step.key] = multiproc_ctx.Event()
+                                active_iters[step.key] = execute_step_out_of_process(
+                                    multiproc_ctx,
+                                    pipeline,
+                                    step_context,
+                                    step,
+                                    errors,
+                                    term_events,
+                                    self.retries,
+                                    active_execution.get_known_state(),
+                                    execution_plan.repository_load_data,
+                                    waitables[step.key],
+                                )
+
+                    # process active iterators, without blocking on any single child process
                     empty_iters = []
                     for key, step_iter in active_iters.items():
                         try:
@@ -241,6 +303,7 @@ def execute(
                             if event_or_none is None:
                                 continue
                             else:
+                                made_progress = True
                                 yield event_or_none
                                 active_execution.handle_event(event_or_none)
 
@@ -275,13 +338,26 @@ def execute(
 
                     # clear and mark complete finished iterators
                     for key in empty_iters:
+                        made_progress = True
                         del active_iters[key]
-                        del term_events[key]
+                        term_events.pop(key, None)
+                        del waitables[key]
                         active_execution.verify_complete(plan_context, key)
 
                     # process skipped and abandoned steps
                     yield from active_execution.plan_events_iterator(plan_context)
 
+                    # block until a child process has an event or exits, rather than spinning
+                    if (
+                        not made_progress
+                        and active_iters
+                        and all(waitables[key] for key in active_iters)
+                    ):
+                        multiprocessing.connection.wait(
+                            [waitable for key in active_iters for waitable in waitables[key]],
+                            timeout=WAIT_TIMEOUT,
+                        )
+
                 errs = {pid: err for pid, err in errors.items() if err}
 
                 # After termination starts, raise an interrupted exception once all subprocesses
@@ -335,6 +411,7 @@ def execute_step_out_of_process(
     retries: RetryMode,
     known_state: KnownExecutionState,
     repository_load_data: Optional[RepositoryLoadData],
+    waitables: Optional[List[Any]] = None,
 ) -> Iterator[Optional[DagsterEvent]]:
     command = MultiprocessExecutorChildProcessCommand(
         run_config=step_context.run_config,
@@ -354,7 +431,9 @@ def execute_step_out_of_process(
         metadata_entries=[],
     )
 
-    for ret in execute_child_process_command(multiproc_ctx, command):
+    for ret in execute_child_process_command(
+        multiproc_ctx, command, timeout=0, waitables=waitables
+    ):
         if ret is None or isinstance(ret, DagsterEvent):
             yield ret
         elif isinstance(ret, ChildProcessEvent):
@@ -362,3 +441,48 @@ def execute_step_out_of_process(
                 errors[ret.pid] = ret.error_info
         else:
             check.failed("Unexpected return value from child process {}".format(type(ret)))
+
+
+def execute_step_in_worker_pool(
+    pool: ChildProcessWorkerPool,
+    pipeline: ReconstructablePipeline,
+    step_context: IStepContext,
+    step: ExecutionStep,
+    errors: Dict[int, SerializableErrorInfo],
+    term_events: Dict[str, Any],
+    retries: RetryMode,
+    known_state: KnownExecutionState,
+    repository_load_data: Optional[RepositoryLoadData],
+    waitables: Optional[List[Any]] = None,
+) -> Iterator[Optional[DagsterEvent]]:
+    command = MultiprocessExecutorChildProcessCommand(
+        run_config=step_context.run_config,
+        pipeline_run=step_context.pipeline_run,
+        step_key=step.key,
+        instance_ref=step_context.instance.get_ref(),
+        term_event=None,
+        recon_pipeline=pipeline,
+        retry_mode=retries,
+        known_state=known_state,
+        repository_load_data=repository_load_data,
+    )
+
+    with pool.worker() as worker:
+        term_events[step.key] = worker.term_event
+
+        yield DagsterEvent.step_worker_starting(
+            step_context,
+            'Executing "{}" in worker process (pid: {}).'.format(step.key, worker.process.pid),
+            metadata_entries=[],
+        )
+
+        for ret in execute_child_process_command_in_worker(
+            worker, command, timeout=0, waitables=waitables
+        ):
+            if ret is None or isinstance(ret, DagsterEvent):
+                yield ret
+            elif isinstance(ret, ChildProcessEvent):
+                if isinstance(ret, ChildProcessSystemErrorEvent):
+                    errors[ret.pid] = ret.error_info
+            else:
+                check.failed("Unexpected return value from child process {}".format(type(ret)))
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import weakref
+from collections import OrderedDict
 from datetime import datetime
 from threading import RLock
 from typing import (
@@ -70,11 +72,21 @@
     from dagster._core.scheduler.instigation import InstigatorState
 
 
+# Default number of jobs whose snapshots an ExternalRepository loaded with deferred snapshots keeps
+# resident at once
+DEFAULT_MAX_CACHED_EXTERNAL_JOBS = 128
+
+
 class ExternalRepository:
     """
     ExternalRepository is a object that represents a loaded repository definition that
     is resident in another process or container. Host processes such as dagit use
     objects such as these to interact with user-defined artifacts.
+
+    When loaded with deferred snapshots, each job's snapshot is only fetched (via ref_to_data_fn)
+    when it is first accessed, and at most max_cached_jobs jobs are kept resident. Jobs evicted
+    from that cache are only held weakly, so their snapshots are freed as soon as nothing else
+    references them.
     """
 
     def __init__(
@@ -82,6 +94,7 @@ def __init__(
         external_repository_data: ExternalRepositoryData,
         repository_handle: RepositoryHandle,
         ref_to_data_fn: Optional[Callable[[ExternalJobRef], ExternalPipelineData]] = None,
+        max_cached_jobs: int = DEFAULT_MAX_CACHED_EXTERNAL_JOBS,
     ):
         self.external_repository_data = check.inst_param(
             external_repository_data, "external_repository_data", ExternalRepositoryData
@@ -118,7 +131,13 @@ def __init__(
 
         # memoize job instances to share instances
         self._memo_lock: RLock = RLock()
-        self._cached_jobs: Dict[str, ExternalPipeline] = {}
+        self._cached_jobs: "OrderedDict[str, ExternalPipeline]" = OrderedDict()
+        self._max_cached_jobs = check.int_param(max_cached_jobs, "max_cached_jobs")
+        check.invariant(self._max_cached_jobs > 0, "max_cached_jobs must be positive")
+        # jobs evicted from _cached_jobs that may still be in use elsewhere
+        self._evicted_jobs: "weakref.WeakValueDictionary[str, ExternalPipeline]" = (
+            weakref.WeakValueDictionary()
+        )
 
     @property
     def name(self) -> str:
@@ -205,7 +224,12 @@ def get_full_external_job(self, job_name: str) -> ExternalPipeline:
             self.has_external_job(job_name), f'No external job named "{job_name}" found'
         )
         with self._memo_lock:
-            if job_name not in self._cached_jobs:
+            if job_name in self._cached_jobs:
+                self._cached_jobs.move_to_end(job_name)
+                return self._cached_jobs[job_name]
+
+            external_pipeline = self._evicted_jobs.pop(job_name, None)
+            if external_pipeline is None:
                 job_item = self._job_map[job_name]
                 if self._deferred_snapshots:
                     if not isinstance(job_item, ExternalJobRef):
@@ -218,14 +242,36 @@ def get_full_external_job(self, job_name: str) -> ExternalPipeline:
                     external_data = job_item
                     external_ref = None
 
-                self._cached_jobs[job_name] = ExternalPipeline(
+                external_pipeline = ExternalPipeline(
                     external_pipeline_data=external_data,
                     repository_handle=self.handle,
                     external_job_ref=external_ref,
                     ref_to_data_fn=self._ref_to_data_fn,
                 )
 
-            return self._cached_jobs[job_name]
+            self._cached_jobs[job_name] = external_pipeline
+
+            # Snapshots for every job are already resident when they are not deferred, so only
+            # bound the cache when they are fetched on demand.
+            if self._deferred_snapshots:
+                while len(self._cached_jobs) > self._max_cached_jobs:
+                    evicted_name, evicted_job = self._cached_jobs.popitem(last=False)
+                    self._evicted_jobs[evicted_name] = evicted_job
+
+            return external_pipeline
+
+    def clear_cached_jobs(self) -> None:
+        """Drop all memoized jobs, releasing any fetched snapshots that are not referenced
+        elsewhere. Useful for reclaiming memory when the host process is under memory pressure.
+        """
+        with self._memo_lock:
+            for job_name, external_pipeline in self._cached_jobs.items():
+                self._evicted_jobs[job_name] = external_pipeline
+            self._cached_jobs.clear()
+
+    @property
+    def deferred_snapshots(self) -> bool:
+        return self._deferred_snapshots
 
     def get_all_external_jobs(self) -> Sequence[ExternalPipeline]:
         return [self.get_full_external_job(pn) for pn in self._job_map]
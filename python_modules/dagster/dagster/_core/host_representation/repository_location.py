@@ -3,7 +3,20 @@
 import threading
 from abc import abstractmethod
 from contextlib import AbstractContextManager
-from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Sequence, Tuple, Union, cast
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 
 import dagster._check as check
 from dagster._api.get_server_id import sync_get_server_id
@@ -17,7 +30,11 @@
     sync_get_external_partition_tags_grpc,
 )
 from dagster._api.snapshot_pipeline import sync_get_external_pipeline_subset_grpc
-from dagster._api.snapshot_repository import sync_get_streaming_external_repositories_data_grpc
+from dagster._api.snapshot_repository import (
+    evict_cached_external_repository_data,
+    sync_get_external_job_data_grpc,
+    sync_get_streaming_external_repositories_data_grpc,
+)
 from dagster._api.snapshot_schedule import sync_get_external_schedule_execution_data_grpc
 from dagster._core.code_pointer import CodePointer
 from dagster._core.definitions.reconstruct import ReconstructablePipeline
@@ -34,13 +51,16 @@
     ExternalRepository,
 )
 from dagster._core.host_representation.external_data import (
+    ExternalJobRef,
     ExternalPartitionNamesData,
+    ExternalPipelineData,
     ExternalScheduleExecutionErrorData,
     ExternalSensorExecutionErrorData,
 )
 from dagster._core.host_representation.grpc_server_registry import GrpcServerRegistry
 from dagster._core.host_representation.handle import JobHandle, RepositoryHandle
 from dagster._core.host_representation.origin import (
+    ExternalRepositoryOrigin,
     GrpcServerRepositoryLocationOrigin,
     InProcessRepositoryLocationOrigin,
     RepositoryLocationOrigin,
@@ -73,6 +93,16 @@
     )
 
 
+class SensorExecutionRequest(NamedTuple):
+    """The arguments for evaluating a single sensor as part of a batch of sensor evaluations."""
+
+    repository_handle: RepositoryHandle
+    name: str
+    last_completion_time: Optional[float]
+    last_run_key: Optional[str]
+    cursor: Optional[str]
+
+
 class RepositoryLocation(AbstractContextManager):
     """
     A RepositoryLocation represents a target containing user code which has a set of Dagster
@@ -214,6 +244,17 @@ def get_external_sensor_execution_data(
     ) -> "SensorExecutionData":
         pass
 
+    @abstractmethod
+    def get_external_sensor_execution_data_batch(
+        self,
+        instance: DagsterInstance,
+        sensor_execution_requests: Sequence[SensorExecutionRequest],
+    ) -> Iterator[Union["SensorExecutionData", ExternalSensorExecutionErrorData]]:
+        """Evaluates each of the given sensors, yielding one result per request in order. Unlike
+        get_external_sensor_execution_data, errors raised while evaluating a sensor are yielded as
+        ExternalSensorExecutionErrorData so that one failing sensor does not fail the whole batch.
+        """
+
     @abstractmethod
     def get_external_notebook_data(self, notebook_path: str) -> bytes:
         pass
@@ -514,6 +555,25 @@ def get_external_sensor_execution_data(
 
         return result
 
+    def get_external_sensor_execution_data_batch(
+        self,
+        instance: DagsterInstance,
+        sensor_execution_requests: Sequence[SensorExecutionRequest],
+    ) -> Iterator[Union["SensorExecutionData", ExternalSensorExecutionErrorData]]:
+        check.sequence_param(
+            sensor_execution_requests, "sensor_execution_requests", of_type=SensorExecutionRequest
+        )
+        instance_ref = instance.get_ref()
+        for request in sensor_execution_requests:
+            yield get_external_sensor_execution(
+                self._get_repo_def(request.repository_handle.repository_name),
+                instance_ref,
+                request.name,
+                request.last_completion_time,
+                request.last_run_key,
+                request.cursor,
+            )
+
     def get_external_partition_set_execution_param_data(
         self,
         repository_handle: RepositoryHandle,
@@ -549,8 +609,10 @@ def __init__(
         watch_server: Optional[bool] = True,
         grpc_server_registry: Optional[GrpcServerRegistry] = None,
         grpc_metadata: Optional[Sequence[Tuple[str, str]]] = None,
+        defer_snapshots: Optional[bool] = None,
     ):
         from dagster._grpc.client import DagsterGrpcClient, client_heartbeat_thread
+        from dagster._grpc.utils import defer_job_snapshots, max_cached_external_jobs
 
         self._origin = check.inst_param(origin, "origin", RepositoryLocationOrigin)
 
@@ -574,9 +636,18 @@ def __init__(
 
         self._heartbeat = check.bool_param(heartbeat, "heartbeat")
         self._watch_server = check.bool_param(watch_server, "watch_server")
+        # when set, job snapshots are fetched one at a time as they are accessed rather than all
+        # being loaded up front with the rest of the repository
+        self._defer_snapshots = (
+            check.bool_param(defer_snapshots, "defer_snapshots")
+            if defer_snapshots is not None
+            else defer_job_snapshots()
+        )
 
         self.server_id = None
         self._external_repositories_data = None
+        # identifies the snapshots this location caches, so that they can be dropped on cleanup
+        self._external_repository_data_cache_owner = object()
 
         self._executable_path = None
         self._container_image = None
@@ -629,6 +700,8 @@ def __init__(
             self._external_repositories_data = sync_get_streaming_external_repositories_data_grpc(
                 self.client,
                 self,
+                defer_snapshots=self._defer_snapshots,
+                cache_owner=self._external_repository_data_cache_owner,
             )
 
             self.external_repositories = {
@@ -638,6 +711,12 @@ def __init__(
                         repository_name=repo_name,
                         repository_location=self,
                     ),
+                    ref_to_data_fn=(
+                        partial(self._get_external_job_data_from_ref, repo_name)
+                        if self._defer_snapshots
+                        else None
+                    ),
+                    max_cached_jobs=max_cached_external_jobs(),
                 )
                 for repo_name, repo_data in self._external_repositories_data.items()
             }
@@ -645,6 +724,15 @@ def __init__(
             self.cleanup()
             raise
 
+    def _get_external_job_data_from_ref(
+        self, repository_name: str, job_ref: ExternalJobRef
+    ) -> ExternalPipelineData:
+        return sync_get_external_job_data_grpc(
+            self.client,
+            ExternalRepositoryOrigin(self.origin, repository_name),
+            job_ref.name,
+        )
+
     @property
     def origin(self) -> RepositoryLocationOrigin:
         return self._origin
@@ -703,6 +791,15 @@ def cleanup(self) -> None:
             self._heartbeat_thread.join()
             self._heartbeat_thread = None
 
+        cache_owner = getattr(self, "_external_repository_data_cache_owner", None)
+        if cache_owner is not None:
+            evict_cached_external_repository_data(cache_owner)
+
+        # the client may not have been created if the location failed to initialize
+        client = getattr(self, "client", None)
+        if client:
+            client.close()
+
     @property
     def is_reload_supported(self) -> bool:
         return True
@@ -860,6 +957,27 @@ def get_external_sensor_execution_data(
             cursor,
         )
 
+    def get_external_sensor_execution_data_batch(
+        self,
+        instance: DagsterInstance,
+        sensor_execution_requests: Sequence[SensorExecutionRequest],
+    ) -> Iterator[Union["SensorExecutionData", ExternalSensorExecutionErrorData]]:
+        from dagster._api.snapshot_sensor import (
+            sync_get_external_sensor_execution_data_batch_grpc,
+        )
+        from dagster._grpc.client import DEFAULT_GRPC_TIMEOUT
+
+        check.sequence_param(
+            sensor_execution_requests, "sensor_execution_requests", of_type=SensorExecutionRequest
+        )
+        # each sensor in the batch gets the same time budget as a single evaluation would
+        return sync_get_external_sensor_execution_data_batch_grpc(
+            self.client,
+            instance,
+            sensor_execution_requests,
+            timeout=DEFAULT_GRPC_TIMEOUT * max(len(sensor_execution_requests), 1),
+        )
+
     def get_external_partition_set_execution_param_data(
         self,
         repository_handle: RepositoryHandle,
@@ -4,11 +4,13 @@
 import logging.config
 import os
 import sys
+import threading
 import time
 import warnings
 import weakref
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from contextlib import ExitStack
+from datetime import datetime
 from enum import Enum
 from tempfile import TemporaryDirectory
 from typing import (
@@ -57,6 +59,7 @@
     JobBucket,
     PipelineRunStatsSnapshot,
     RunPartitionData,
+    RunQueueEntry,
     RunRecord,
     RunsFilter,
     TagBucket,
@@ -86,6 +89,13 @@
 AIRFLOW_EXECUTION_DATE_STR = "airflow_execution_date"
 IS_AIRFLOW_INGEST_PIPELINE_STR = "is_airflow_ingest_pipeline"
 
+DEFAULT_EVENT_LOG_BUFFER_MAX_EVENTS = 1000
+DEFAULT_EVENT_LOG_BUFFER_MAX_INTERVAL_SECONDS = 1.0
+
+# number of snapshot ids known to be in run storage that are remembered by each instance, so that
+# creating many runs of the same job does not query run storage for its snapshots every time
+PERSISTED_SNAPSHOT_ID_CACHE_SIZE = 1024
+
 if TYPE_CHECKING:
     from dagster._core.debug import DebugRunPayload
     from dagster._core.definitions.run_request import InstigatorType
@@ -125,6 +135,28 @@
     from dagster._daemon.types import DaemonHeartbeat, DaemonStatus
 
 
+def _is_event_log_buffer_flush_event(event: EventLogEntry) -> bool:
+    from dagster._core.events import ASSET_EVENTS, DagsterEventType
+
+    if not event.is_dagster_event:
+        return False
+
+    dagster_event = event.get_dagster_event()
+    return (
+        dagster_event.is_pipeline_event
+        or dagster_event.event_type in ASSET_EVENTS
+        or dagster_event.event_type
+        in {
+            DagsterEventType.STEP_START,
+            DagsterEventType.STEP_SUCCESS,
+            DagsterEventType.STEP_FAILURE,
+            DagsterEventType.STEP_SKIPPED,
+            DagsterEventType.STEP_UP_FOR_RETRY,
+            DagsterEventType.STEP_RESTARTED,
+        }
+    )
+
+
 def _check_run_equality(
     pipeline_run: DagsterRun, candidate_run: DagsterRun
 ) -> Mapping[str, Tuple[Any, Any]]:
@@ -372,6 +404,14 @@ def __init__(
 
         self._subscribers: Dict[str, List[Callable]] = defaultdict(list)
 
+        self._event_buffer: List[EventLogEntry] = []
+        self._event_buffer_started_at: Optional[float] = None
+        self._event_buffer_flush_timer: Optional[threading.Timer] = None
+        self._event_buffer_lock = threading.Lock()
+
+        self._persisted_snapshot_ids: "OrderedDict[Tuple[str, str], None]" = OrderedDict()
+        self._persisted_snapshot_ids_lock = threading.Lock()
+
         run_monitoring_enabled = self.run_monitoring_settings.get("enabled", False)
         if run_monitoring_enabled and not self.run_launcher.supports_check_run_worker_health:
             run_monitoring_enabled = False
@@ -740,6 +780,24 @@ def code_server_process_startup_timeout(self) -> int:
             "local_startup_timeout", DEFAULT_LOCAL_CODE_SERVER_STARTUP_TIMEOUT
         )
 
+    @property
+    def event_log_buffer_settings(self) -> Mapping:
+        return self.get_settings("event_log_buffer")
+
+    @property
+    def event_log_buffer_enabled(self) -> bool:
+        return self.event_log_buffer_settings.get("enabled", False)
+
+    @property
+    def event_log_buffer_max_events(self) -> int:
+        return self.event_log_buffer_settings.get("max_events", DEFAULT_EVENT_LOG_BUFFER_MAX_EVENTS)
+
+    @property
+    def event_log_buffer_max_interval_seconds(self) -> float:
+        return self.event_log_buffer_settings.get(
+            "max_interval_seconds", DEFAULT_EVENT_LOG_BUFFER_MAX_INTERVAL_SECONDS
+        )
+
     @property
     def run_monitoring_max_resume_run_attempts(self) -> int:
         default_max_resume_run_attempts = 3 if self.run_launcher.supports_resume_run else 0
@@ -817,6 +875,7 @@ def reindex(self, print_fn=lambda _: None):
         print_fn("Done.")
 
     def dispose(self):
+        self.flush_buffered_events()
         self._run_storage.dispose()
         self.run_coordinator.dispose()
         if self._run_launcher:
@@ -1061,7 +1120,7 @@ def _ensure_persisted_pipeline_snapshot(self, pipeline_snapshot, parent_pipeline
         check.opt_inst_param(parent_pipeline_snapshot, "parent_pipeline_snapshot", PipelineSnapshot)
 
         if pipeline_snapshot.lineage_snapshot:
-            if not self._run_storage.has_pipeline_snapshot(
+            if not self._has_pipeline_snapshot(
                 pipeline_snapshot.lineage_snapshot.parent_snapshot_id
             ):
                 check.invariant(
@@ -1077,16 +1136,54 @@ def _ensure_persisted_pipeline_snapshot(self, pipeline_snapshot, parent_pipeline
                     pipeline_snapshot.lineage_snapshot.parent_snapshot_id
                     == returned_pipeline_snapshot_id
                 )
+                self._cache_persisted_snapshot_id("pipeline", returned_pipeline_snapshot_id)
 
         pipeline_snapshot_id = create_pipeline_snapshot_id(pipeline_snapshot)
-        if not self._run_storage.has_pipeline_snapshot(pipeline_snapshot_id):
+        if not self._has_pipeline_snapshot(pipeline_snapshot_id):
             returned_pipeline_snapshot_id = self._run_storage.add_pipeline_snapshot(
                 pipeline_snapshot
             )
             check.invariant(pipeline_snapshot_id == returned_pipeline_snapshot_id)
+            self._cache_persisted_snapshot_id("pipeline", pipeline_snapshot_id)
 
         return pipeline_snapshot_id
 
+    def _has_pipeline_snapshot(self, pipeline_snapshot_id: str) -> bool:
+        if self._is_persisted_snapshot_id_cached("pipeline", pipeline_snapshot_id):
+            return True
+
+        if self._run_storage.has_pipeline_snapshot(pipeline_snapshot_id):
+            self._cache_persisted_snapshot_id("pipeline", pipeline_snapshot_id)
+            return True
+
+        return False
+
+    def _has_execution_plan_snapshot(self, execution_plan_snapshot_id: str) -> bool:
+        if self._is_persisted_snapshot_id_cached("execution_plan", execution_plan_snapshot_id):
+            return True
+
+        if self._run_storage.has_execution_plan_snapshot(execution_plan_snapshot_id):
+            self._cache_persisted_snapshot_id("execution_plan", execution_plan_snapshot_id)
+            return True
+
+        return False
+
+    def _is_persisted_snapshot_id_cached(self, snapshot_type: str, snapshot_id: str) -> bool:
+        key = (snapshot_type, snapshot_id)
+        with self._persisted_snapshot_ids_lock:
+            if key not in self._persisted_snapshot_ids:
+                return False
+            self._persisted_snapshot_ids.move_to_end(key)
+            return True
+
+    def _cache_persisted_snapshot_id(self, snapshot_type: str, snapshot_id: str) -> None:
+        key = (snapshot_type, snapshot_id)
+        with self._persisted_snapshot_ids_lock:
+            self._persisted_snapshot_ids[key] = None
+            self._persisted_snapshot_ids.move_to_end(key)
+            while len(self._persisted_snapshot_ids) > PERSISTED_SNAPSHOT_ID_CACHE_SIZE:
+                self._persisted_snapshot_ids.popitem(last=False)
+
     def _ensure_persisted_execution_plan_snapshot(
         self, execution_plan_snapshot, pipeline_snapshot_id, step_keys_to_execute
     ):
@@ -1113,12 +1210,13 @@ def _ensure_persisted_execution_plan_snapshot(
 
         execution_plan_snapshot_id = create_execution_plan_snapshot_id(execution_plan_snapshot)
 
-        if not self._run_storage.has_execution_plan_snapshot(execution_plan_snapshot_id):
+        if not self._has_execution_plan_snapshot(execution_plan_snapshot_id):
             returned_execution_plan_snapshot_id = self._run_storage.add_execution_plan_snapshot(
                 execution_plan_snapshot
             )
 
             check.invariant(execution_plan_snapshot_id == returned_execution_plan_snapshot_id)
+            self._cache_persisted_snapshot_id("execution_plan", execution_plan_snapshot_id)
 
         return execution_plan_snapshot_id
 
@@ -1528,6 +1626,16 @@ def get_run_records(
             filters, limit, order_by, ascending, cursor, bucket_by
         )
 
+    @traced
+    def get_run_queue_entries(
+        self,
+        statuses: Optional[Sequence[DagsterRunStatus]] = None,
+        updated_after: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Sequence[RunQueueEntry]:
+        return self._run_storage.get_run_queue_entries(statuses, updated_after, limit, cursor)
+
     @property
     def supports_bucket_queries(self):
         return self._run_storage.supports_bucket_queries
@@ -1540,6 +1648,8 @@ def get_run_partition_data(self, runs_filter: RunsFilter) -> Sequence[RunPartiti
     def wipe(self):
         self._run_storage.wipe()
         self._event_storage.wipe()
+        with self._persisted_snapshot_ids_lock:
+            self._persisted_snapshot_ids.clear()
 
     @public
     @traced
@@ -1597,6 +1707,12 @@ def update_asset_cached_status_data(
     ) -> None:
         self._event_storage.update_asset_cached_status_data(asset_key, cache_values)
 
+    @traced
+    def update_asset_cached_status_data_by_asset_key(
+        self, cache_values_by_asset_key: Mapping[AssetKey, "AssetStatusCacheValue"]
+    ) -> None:
+        self._event_storage.update_asset_cached_status_data_by_asset_key(cache_values_by_asset_key)
+
     @traced
     def all_asset_keys(self):
         return self._event_storage.all_asset_keys()
@@ -1691,6 +1807,26 @@ def get_materialization_count_by_partition(
     ) -> Mapping[AssetKey, Mapping[str, int]]:
         return self._event_storage.get_materialization_count_by_partition(asset_keys, after_cursor)
 
+    @traced
+    def get_materialization_partitions(
+        self,
+        asset_key: AssetKey,
+        after_cursor: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> Sequence[Tuple[int, Optional[str]]]:
+        return self._event_storage.get_materialization_partitions(asset_key, after_cursor, limit)
+
+    @traced
+    def get_materialization_partitions_for_asset_keys(
+        self,
+        asset_keys: Sequence[AssetKey],
+        after_cursor: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> Sequence[Tuple[AssetKey, int, Optional[str]]]:
+        return self._event_storage.get_materialization_partitions_for_asset_keys(
+            asset_keys, after_cursor, limit
+        )
+
     @traced
     def get_dynamic_partitions(self, partitions_def_name: str) -> Sequence[str]:
         check.str_param(partitions_def_name, "partitions_def_name")
@@ -1766,16 +1902,72 @@ def get_handlers(self):
     def store_event(self, event):
         self._event_storage.store_event(event)
 
-    def handle_new_event(self, event):
-        run_id = event.run_id
+    def handle_new_event(self, event: EventLogEntry) -> None:
+        """Store a new event and notify any subscribers.
 
-        self._event_storage.store_event(event)
+        If the ``event_log_buffer`` setting is enabled, events are buffered and written to event
+        log storage in batches. The buffer is flushed when an event that marks a run or step
+        boundary (or an asset event) arrives, when it holds ``max_events`` events, or once the
+        oldest buffered event is ``max_interval_seconds`` old, even if no other event arrives.
+        """
+        if not self.event_log_buffer_enabled:
+            self._store_and_dispatch_events([event])
+            return
+
+        with self._event_buffer_lock:
+            self._event_buffer.append(event)
+            if self._event_buffer_started_at is None:
+                self._event_buffer_started_at = time.time()
+                # flush from a background thread if no later event arrives to flush the buffer, so
+                # that a quiet step does not hold back its events
+                self._event_buffer_flush_timer = threading.Timer(
+                    self.event_log_buffer_max_interval_seconds, self._flush_expired_event_buffer
+                )
+                self._event_buffer_flush_timer.daemon = True
+                self._event_buffer_flush_timer.start()
+
+            if (
+                _is_event_log_buffer_flush_event(event)
+                or len(self._event_buffer) >= self.event_log_buffer_max_events
+                or time.time() - self._event_buffer_started_at
+                >= self.event_log_buffer_max_interval_seconds
+            ):
+                self._flush_event_buffer()
+
+    def flush_buffered_events(self) -> None:
+        """Write any events held in the event log buffer to event log storage."""
+        with self._event_buffer_lock:
+            self._flush_event_buffer()
+
+    def _flush_expired_event_buffer(self) -> None:
+        with self._event_buffer_lock:
+            # the buffer may have been flushed, and new events buffered with a new timer, since
+            # this timer started
+            if threading.current_thread() is self._event_buffer_flush_timer:
+                self._flush_event_buffer()
+
+    def _flush_event_buffer(self) -> None:
+        events = self._event_buffer
+        self._event_buffer = []
+        self._event_buffer_started_at = None
+        if self._event_buffer_flush_timer:
+            self._event_buffer_flush_timer.cancel()
+            self._event_buffer_flush_timer = None
+        if events:
+            self._store_and_dispatch_events(events)
+
+    def _store_and_dispatch_events(self, events: Sequence[EventLogEntry]) -> None:
+        if len(events) == 1:
+            self._event_storage.store_event(events[0])
+        else:
+            self._event_storage.store_events(events)
 
-        if event.is_dagster_event and event.dagster_event.is_pipeline_event:
-            self._run_storage.handle_run_event(run_id, event.dagster_event)
+        for event in events:
+            if event.is_dagster_event and event.get_dagster_event().is_pipeline_event:
+                self._run_storage.handle_run_event(event.run_id, event.get_dagster_event())
 
-        for sub in self._subscribers[run_id]:
-            sub(event)
+            for sub in self._subscribers[event.run_id]:
+                sub(event)
 
     def add_event_listener(self, run_id, cb):
         self._subscribers[run_id].append(cb)
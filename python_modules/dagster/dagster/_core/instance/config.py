@@ -232,6 +232,22 @@ def sensors_daemon_config() -> Field:
         {
             "use_threads": Field(Bool, is_required=False, default_value=False),
             "num_workers": Field(int, is_required=False),
+            "batch_size": Field(
+                int,
+                is_required=False,
+                description=(
+                    "Number of sensors from the same code location to evaluate in a single request"
+                    " to that location."
+                ),
+            ),
+            "max_concurrent_batches_per_location": Field(
+                int,
+                is_required=False,
+                description=(
+                    "When using threads, the maximum number of sensor batches that can be"
+                    " evaluated concurrently against a single code location."
+                ),
+            ),
         },
         is_required=False,
     )
@@ -297,6 +313,14 @@ def dagster_instance_config_schema() -> Mapping[str, Field]:
         "code_servers": Field(
             {"local_startup_timeout": Field(int, is_required=False)}, is_required=False
         ),
+        "event_log_buffer": Field(
+            {
+                "enabled": Field(Bool, is_required=False, default_value=False),
+                "max_events": Field(int, is_required=False),
+                "max_interval_seconds": Field(float, is_required=False),
+            },
+            is_required=False,
+        ),
         "secrets": secrets_loader_config_schema(),
         "retention": retention_config_schema(),
         "sensors": sensors_daemon_config(),
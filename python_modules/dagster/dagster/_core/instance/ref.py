@@ -421,6 +421,7 @@ def from_dir(
             "run_monitoring",
             "run_retries",
             "code_servers",
+            "event_log_buffer",
             "retention",
             "sensors",
             "schedules",
@@ -20,6 +20,7 @@
     UnresolvedMappedExecutionStep,
 )
 from dagster._serdes import DefaultNamedTupleSerializer, create_snapshot_id, whitelist_for_serdes
+from dagster._utils.cached_method import cached_method
 from dagster._utils.error import SerializableErrorInfo
 
 # Can be incremented on breaking changes to the snapshot (since it is used to reconstruct
@@ -30,7 +31,7 @@
 
 def create_execution_plan_snapshot_id(execution_plan_snapshot) -> str:
     check.inst_param(execution_plan_snapshot, "execution_plan_snapshot", ExecutionPlanSnapshot)
-    return create_snapshot_id(execution_plan_snapshot)
+    return execution_plan_snapshot.get_snapshot_id()
 
 
 class ExecutionPlanSnapshotSerializer(DefaultNamedTupleSerializer):
@@ -95,6 +96,11 @@ def __new__(
             ),
         )
 
+    @cached_method
+    def get_snapshot_id(self) -> str:
+        # hashing serializes the whole snapshot, so only do it once per snapshot object
+        return create_snapshot_id(self)
+
     @property
     def step_deps(self):
         # Construct dependency dictionary (downstream to upstreams)
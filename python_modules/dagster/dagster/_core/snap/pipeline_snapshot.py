@@ -36,6 +36,7 @@
     unpack_inner_value,
     whitelist_for_serdes,
 )
+from dagster._utils.cached_method import cached_method
 
 from .config_types import build_config_schema_snapshot
 from .dagster_types import DagsterTypeNamespaceSnapshot, build_dagster_type_namespace_snapshot
@@ -54,7 +55,7 @@
 
 def create_pipeline_snapshot_id(snapshot: "PipelineSnapshot") -> str:
     check.inst_param(snapshot, "snapshot", PipelineSnapshot)
-    return create_snapshot_id(snapshot)
+    return snapshot.get_snapshot_id()
 
 
 class PipelineSnapshotSerializer(DefaultNamedTupleSerializer):
@@ -190,6 +191,11 @@ def __new__(
             metadata=check.opt_sequence_param(metadata, "metadata"),
         )
 
+    @cached_method
+    def get_snapshot_id(self) -> str:
+        # hashing serializes the whole snapshot, so only do it once per snapshot object
+        return create_snapshot_id(self)
+
     @classmethod
     def from_pipeline_def(cls, pipeline_def: PipelineDefinition) -> "PipelineSnapshot":
         check.inst_param(pipeline_def, "pipeline_def", PipelineDefinition)
@@ -3,9 +3,9 @@
 import threading
 import time
 from abc import abstractmethod
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from contextlib import contextmanager
-from typing import IO, Generator, Optional, Sequence, Union
+from typing import IO, Generator, Hashable, Optional, Sequence, Tuple, Union
 
 from dagster import _check as check
 from dagster._core.storage.captured_log_manager import (
@@ -29,6 +29,52 @@
 
 SUBSCRIPTION_POLLING_INTERVAL = 5
 
+# size of the chunks that logs are read from cloud storage in, when ranged reads are supported
+LOG_CHUNK_SIZE = 1048576  # 1 MB
+DEFAULT_LOG_CHUNK_CACHE_SIZE = 64 * LOG_CHUNK_SIZE
+
+
+class LogChunkCache:
+    """A thread-safe LRU cache of log chunks downloaded from cloud storage, bounded by the total
+    size of the cached chunks.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_LOG_CHUNK_CACHE_SIZE):
+        self._max_bytes = check.int_param(max_bytes, "max_bytes")
+        self._chunks: "OrderedDict[Hashable, bytes]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        with self._lock:
+            chunk = self._chunks.get(key)
+            if chunk is not None:
+                self._chunks.move_to_end(key)
+            return chunk
+
+    def put(self, key: Hashable, chunk: bytes) -> None:
+        if len(chunk) > self._max_bytes:
+            return
+
+        with self._lock:
+            existing = self._chunks.pop(key, None)
+            if existing is not None:
+                self._size -= len(existing)
+            self._chunks[key] = chunk
+            self._size += len(chunk)
+            while self._size > self._max_bytes:
+                _, evicted = self._chunks.popitem(last=False)
+                self._size -= len(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._chunks.clear()
+            self._size = 0
+
+    @property
+    def size(self) -> int:
+        return self._size
+
 
 class CloudStorageComputeLogManager(CapturedLogManager, ComputeLogManager):
     """Abstract class that uses the local compute log manager to capture logs and stores them in
@@ -92,6 +138,32 @@ def download_from_cloud_storage(
         Downloads the logs for a given log key from cloud storage to local storage.
         """
 
+    @property
+    def supports_ranged_reads(self) -> bool:
+        """
+        Whether `read_cloud_storage_range` is implemented. If it is, logs that are not on local
+        disk are read from cloud storage in chunks, which are cached in memory, instead of being
+        downloaded in full.
+        """
+        return False
+
+    def read_cloud_storage_range(
+        self, log_key: Sequence[str], io_type: ComputeIOType, start: int, end: int, partial=False
+    ) -> bytes:
+        """
+        Returns the bytes of the logs for a given log key from `start` up to (but not including)
+        `end`. Fewer bytes are returned if the logs end before `end`, and no bytes are returned if
+        they end before `start`.
+        """
+        raise NotImplementedError()
+
+    @property
+    def log_chunk_cache(self) -> LogChunkCache:
+        # created lazily, since subclasses don't call a base constructor
+        if not hasattr(self, "_log_chunk_cache"):
+            self._log_chunk_cache = LogChunkCache()
+        return self._log_chunk_cache
+
     @contextmanager
     def capture_logs(self, log_key: Sequence[str]) -> Generator[CapturedLogContext, None, None]:
         with self._poll_for_local_upload(log_key):
@@ -123,6 +195,14 @@ def log_data_for_type(self, log_key, io_type, offset, max_bytes):
                 log_key, IO_TYPE_EXTENSION[io_type]
             )
             return self.local_manager.read_path(local_path, offset=offset, max_bytes=max_bytes)
+        if self.supports_ranged_reads:
+            if self.cloud_storage_has_logs(log_key, io_type):
+                return self._read_cloud_storage_chunks(log_key, io_type, offset, max_bytes)
+            if self.cloud_storage_has_logs(log_key, io_type, partial=True):
+                return self._read_cloud_storage_chunks(
+                    log_key, io_type, offset, max_bytes, partial=True
+                )
+            return None, offset
         if self.cloud_storage_has_logs(log_key, io_type):
             self.download_from_cloud_storage(log_key, io_type)
             local_path = self.local_manager.get_captured_local_path(
@@ -138,6 +218,44 @@ def log_data_for_type(self, log_key, io_type, offset, max_bytes):
 
         return None, offset
 
+    def _read_cloud_storage_chunks(
+        self,
+        log_key: Sequence[str],
+        io_type: ComputeIOType,
+        offset: int,
+        max_bytes: Optional[int],
+        partial: bool = False,
+    ) -> Tuple[bytes, int]:
+        # Logs are only ever appended to, so a full chunk never changes once it has been read, even
+        # from partially uploaded logs. The last chunk may still grow, so it is only cached once
+        # it is full.
+        end = offset + max_bytes if max_bytes is not None else None
+        data = bytearray()
+        chunk_index = offset // LOG_CHUNK_SIZE
+        while end is None or chunk_index * LOG_CHUNK_SIZE < end:
+            cache_key = (tuple(log_key), io_type, partial, chunk_index)
+            chunk = self.log_chunk_cache.get(cache_key)
+            if chunk is None:
+                chunk = self.read_cloud_storage_range(
+                    log_key,
+                    io_type,
+                    start=chunk_index * LOG_CHUNK_SIZE,
+                    end=(chunk_index + 1) * LOG_CHUNK_SIZE,
+                    partial=partial,
+                )
+                if len(chunk) == LOG_CHUNK_SIZE:
+                    self.log_chunk_cache.put(cache_key, chunk)
+
+            chunk_start = chunk_index * LOG_CHUNK_SIZE
+            data += chunk[
+                max(offset - chunk_start, 0) : (end - chunk_start) if end is not None else None
+            ]
+            if len(chunk) < LOG_CHUNK_SIZE:
+                break
+            chunk_index += 1
+
+        return bytes(data), offset + len(data)
+
     def get_log_data(
         self,
         log_key: Sequence[str],
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
     Any,
     Dict,
@@ -17,7 +18,10 @@
 from dagster._check import CheckError
 from dagster._core.definitions.metadata import RawMetadataValue
 from dagster._core.definitions.partition import StaticPartitionsDefinition
-from dagster._core.definitions.time_window_partitions import TimeWindow
+from dagster._core.definitions.time_window_partitions import (
+    TimeWindow,
+    TimeWindowPartitionsDefinition,
+)
 from dagster._core.errors import DagsterInvalidDefinitionError
 from dagster._core.execution.context.input import InputContext
 from dagster._core.execution.context.output import OutputContext
@@ -50,6 +54,14 @@ def handle_output(
     def load_input(self, context: InputContext, table_slice: TableSlice) -> T:
         """Loads the contents of the given table in the given schema."""
 
+    def concat(self, context: InputContext, objs: Sequence[T]) -> T:
+        """Combines objects loaded from consecutive slices of the same table into a single object.
+        Type handlers must implement this to support loading partitions in chunks.
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support loading partitions in chunks."
+        )
+
     @property
     @abstractmethod
     def supported_types(self) -> Sequence[Type]:
@@ -69,6 +81,16 @@ def get_select_statement(table_slice: TableSlice) -> str:
 
 
 class DbIOManager(IOManager):
+    """
+    Args:
+        max_partitions_per_load (Optional[int]): If set, inputs spanning more time window
+            partitions than this are loaded as multiple table slices of at most this many
+            partitions each, which the type handler then concatenates.
+        max_concurrent_loads (int): The number of table slices that can be loaded at the same time
+            when an input is loaded in chunks. Type handlers must be safe to call from multiple
+            threads if this is greater than 1.
+    """
+
     def __init__(
         self,
         *,
@@ -77,6 +99,8 @@ def __init__(
         database: str,
         schema: Optional[str] = None,
         io_manager_name: Optional[str] = None,
+        max_partitions_per_load: Optional[int] = None,
+        max_concurrent_loads: int = 1,
     ):
         self._handlers_by_type: Dict[Optional[Type], DbTypeHandler] = {}
         self._io_manager_name = io_manager_name or self.__class__.__name__
@@ -95,6 +119,15 @@ def __init__(
         self._db_client = db_client
         self._database = database
         self._schema = schema
+        self._max_partitions_per_load = check.opt_int_param(
+            max_partitions_per_load, "max_partitions_per_load"
+        )
+        check.invariant(
+            self._max_partitions_per_load is None or self._max_partitions_per_load > 0,
+            "max_partitions_per_load must be positive",
+        )
+        self._max_concurrent_loads = check.int_param(max_concurrent_loads, "max_concurrent_loads")
+        check.invariant(self._max_concurrent_loads > 0, "max_concurrent_loads must be positive")
 
     def handle_output(self, context: OutputContext, obj: object) -> None:
         table_slice = self._get_table_slice(context, context)
@@ -127,9 +160,69 @@ def load_input(self, context: InputContext) -> object:
         obj_type = context.dagster_type.typing_type
         self._check_supported_type(obj_type)
 
-        return self._handlers_by_type[obj_type].load_input(
-            context, self._get_table_slice(context, cast(OutputContext, context.upstream_output))
+        handler = self._handlers_by_type[obj_type]
+        table_slice = self._get_table_slice(context, cast(OutputContext, context.upstream_output))
+        table_slices = self._split_table_slice(context, table_slice)
+        if len(table_slices) == 1:
+            return handler.load_input(context, table_slice)
+
+        context.log.debug(
+            f"Loading {table_slice.schema}.{table_slice.table} in {len(table_slices)} slices"
+        )
+        if self._max_concurrent_loads > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(self._max_concurrent_loads, len(table_slices)),
+                thread_name_prefix="db_io_manager",
+            ) as executor:
+                objs = list(
+                    executor.map(lambda chunk: handler.load_input(context, chunk), table_slices)
+                )
+        else:
+            objs = [handler.load_input(context, chunk) for chunk in table_slices]
+
+        return handler.concat(context, objs)
+
+    def _split_table_slice(
+        self, context: InputContext, table_slice: TableSlice
+    ) -> Sequence[TableSlice]:
+        """
+        Splits a table slice that covers a range of time window partitions into table slices that
+        each cover at most max_partitions_per_load of the input's partitions.
+        """
+        if (
+            self._max_partitions_per_load is None
+            or table_slice.partition is None
+            or not isinstance(table_slice.partition.partition, TimeWindow)
+            or not isinstance(context.asset_partitions_def, TimeWindowPartitionsDefinition)
+        ):
+            return [table_slice]
+
+        time_window = cast(TimeWindow, table_slice.partition.partition)
+        partitions_def = context.asset_partitions_def
+        partition_keys = context.asset_partition_keys
+        if len(partition_keys) <= self._max_partitions_per_load:
+            return [table_slice]
+
+        # chunks are split at the start of every max_partitions_per_load-th partition, with the
+        # first and last chunks extended to the bounds of the original slice, so the chunks
+        # cover exactly the same rows as the original slice
+        partition_starts = sorted(
+            partitions_def.time_window_for_partition_key(partition_key).start
+            for partition_key in partition_keys
         )
+        boundaries = [
+            time_window.start,
+            *partition_starts[self._max_partitions_per_load :: self._max_partitions_per_load],
+            time_window.end,
+        ]
+        table_slices = []
+        for start, end in zip(boundaries, boundaries[1:]):
+            table_slices.append(
+                table_slice._replace(
+                    partition=table_slice.partition._replace(partition=TimeWindow(start, end))
+                )
+            )
+        return table_slices
 
     def _get_table_slice(
         self, context: Union[OutputContext, InputContext], output_context: OutputContext
@@ -10,6 +10,7 @@
     Optional,
     Sequence,
     Set,
+    Tuple,
     Union,
 )
 
@@ -212,6 +213,18 @@ def store_event(self, event: EventLogEntry):
             event (EventLogEntry): The event to store.
         """
 
+    def store_events(self, events: Sequence[EventLogEntry]) -> None:
+        """Store a batch of events, in order.
+
+        The base implementation stores each event individually. Storages that can write a batch
+        more efficiently (e.g. in a single transaction) should override this method.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        for event in events:
+            self.store_event(event)
+
     @abstractmethod
     def delete_events(self, run_id: str):
         """Remove events for a given run id."""
@@ -367,6 +380,68 @@ def get_materialization_count_by_partition(
     ) -> Mapping[AssetKey, Mapping[str, int]]:
         pass
 
+    def get_materialization_partitions(
+        self,
+        asset_key: AssetKey,
+        after_cursor: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> Sequence[Tuple[int, Optional[str]]]:
+        """Returns the (storage_id, partition) of each materialization of the given asset after
+        the cursor, in ascending storage id order. The partition is None for unpartitioned
+        materializations.
+
+        Storages that index the partition of each event should override this to avoid loading and
+        deserializing the full event records.
+        """
+        records = self.get_event_records(
+            EventRecordsFilter(
+                event_type=DagsterEventType.ASSET_MATERIALIZATION,
+                asset_key=asset_key,
+                after_cursor=after_cursor,
+            ),
+            limit=limit,
+            ascending=True,
+        )
+        return [
+            (
+                record.storage_id,
+                record.event_log_entry.dagster_event.partition
+                if record.event_log_entry.dagster_event
+                else None,
+            )
+            for record in records
+        ]
+
+    def get_materialization_partitions_for_asset_keys(
+        self,
+        asset_keys: Sequence[AssetKey],
+        after_cursor: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> Sequence[Tuple[AssetKey, int, Optional[str]]]:
+        """Returns the (asset_key, storage_id, partition) of each materialization of any of the
+        given assets after the cursor, in ascending storage id order.
+        """
+        materialization_partitions = sorted(
+            (
+                (asset_key, storage_id, partition)
+                for asset_key in asset_keys
+                for storage_id, partition in self.get_materialization_partitions(
+                    asset_key, after_cursor=after_cursor, limit=limit
+                )
+            ),
+            key=lambda materialization_partition: materialization_partition[1],
+        )
+        return materialization_partitions[:limit] if limit else materialization_partitions
+
+    def update_asset_cached_status_data_by_asset_key(
+        self, cache_values_by_asset_key: Mapping[AssetKey, "AssetStatusCacheValue"]
+    ) -> None:
+        """Updates the cached status data of many assets. Storages that support transactions should
+        override this to write all of the updates at once.
+        """
+        for asset_key, cache_values in cache_values_by_asset_key.items():
+            self.update_asset_cached_status_data(asset_key, cache_values)
+
     @abstractmethod
     def get_dynamic_partitions(self, partitions_def_name: str) -> Sequence[str]:
         """Get the list of partition keys for a dynamic partitions definition."""
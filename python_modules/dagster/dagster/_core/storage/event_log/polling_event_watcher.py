@@ -1,13 +1,29 @@
+import asyncio
+import logging
 import threading
-from typing import Callable, List, MutableMapping, NamedTuple, Optional
+import time
+from collections import defaultdict
+from typing import (
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 import dagster._check as check
 from dagster._core.events.log import EventLogEntry
-from dagster._core.storage.event_log.base import EventLogCursor
+from dagster._core.storage.event_log.base import EventLogCursor, EventLogRecord
 
 from .sql_event_log import SqlEventLogStorage
 
 POLLING_CADENCE = 0.1  # 100 ms
+MAX_POLLING_CADENCE = 1.0  # idle runs back off to polling every second
+POLLING_RECORD_LIMIT = 1000
 
 
 class CallbackAfterCursor(NamedTuple):
@@ -22,14 +38,47 @@ class CallbackAfterCursor(NamedTuple):
     callback: Callable[[EventLogEntry, str], None]
 
 
+class WatchedRun:
+    """Polling state for a single watched run_id.
+
+    storage_id (Optional[int]): the greatest storage id that has been dispatched to the callbacks,
+        or None if the run has not been polled yet
+    interval (float): the current polling interval for the run, which grows while the run is idle
+    next_poll_time (float): the time at which the run should next be polled
+    """
+
+    def __init__(self):
+        self.callbacks: List[CallbackAfterCursor] = []
+        self.storage_id: Optional[int] = None
+        self.interval = POLLING_CADENCE
+        self.next_poll_time = time.time()
+
+    def reset_interval(self):
+        self.interval = POLLING_CADENCE
+        self.next_poll_time = time.time()
+
+    def initial_storage_id(self) -> Optional[int]:
+        # Only fetch the records that at least one of the callbacks is waiting for
+        if any(callback.cursor is None for callback in self.callbacks):
+            return None
+        return min(
+            EventLogCursor.parse(check.not_none(callback.cursor)).storage_id()
+            for callback in self.callbacks
+        )
+
+
 class SqlPollingEventWatcher:
-    """Event Log Watcher that uses a multithreaded polling approach to retrieving new events for run_ids
-    This class' job is to manage a collection of threads that each poll the event log for a given run_id
-    Uses one thread (SqlPollingRunIdEventWatcherThread) per watched run_id.
+    """Event Log Watcher that uses a single polling thread to retrieve new events for all watched
+    run_ids.
+
+    On each tick, the runs that are due to be polled are queried together, each after its own
+    cursor (`(run_id IN (...) AND id > cursor) OR ...`, grouping the runs that share a cursor), and
+    the results are fanned out to the callbacks registered for each run. Runs that produce no new events are polled progressively less often,
+    up to every MAX_POLLING_CADENCE seconds; a new event or a new callback resets a run to polling
+    every POLLING_CADENCE seconds.
 
     LOCKING INFO:
-        ORDER: _dict_lock -> run_id_thread.callback_fn_list_lock
-        INVARIANTS: _dict_lock protects _run_id_to_watcher_dict
+        INVARIANTS: _lock protects _watched_runs and the WatchedRun state it holds
     """
 
     def __init__(self, event_log_storage: SqlEventLogStorage):
@@ -37,15 +86,18 @@ def __init__(self, event_log_storage: SqlEventLogStorage):
             event_log_storage, "event_log_storage", SqlEventLogStorage
         )
 
-        # INVARIANT: dict_lock protects _run_id_to_watcher_dict
-        self._dict_lock: threading.Lock = threading.Lock()
-        self._run_id_to_watcher_dict: MutableMapping[str, SqlPollingRunIdEventWatcherThread] = {}
+        # INVARIANT: _lock protects _watched_runs
+        self._lock: threading.Lock = threading.Lock()
+        self._watched_runs: Dict[str, WatchedRun] = {}
+        self._wakeup = threading.Event()
+        self._should_thread_exit = threading.Event()
+        self._watcher_thread: Optional[threading.Thread] = None
         self._disposed = False
 
     def has_run_id(self, run_id: str) -> bool:
         run_id = check.str_param(run_id, "run_id")
-        with self._dict_lock:
-            _has_run_id = run_id in self._run_id_to_watcher_dict
+        with self._lock:
+            _has_run_id = run_id in self._watched_runs
         return _has_run_id
 
     def watch_run(
@@ -54,23 +106,59 @@ def watch_run(
         run_id = check.str_param(run_id, "run_id")
         cursor = check.opt_str_param(cursor, "cursor")
         callback = check.callable_param(callback, "callback")
-        with self._dict_lock:
-            if run_id not in self._run_id_to_watcher_dict:
-                self._run_id_to_watcher_dict[run_id] = SqlPollingRunIdEventWatcherThread(
-                    self._event_log_storage, run_id
+        with self._lock:
+            if run_id not in self._watched_runs:
+                self._watched_runs[run_id] = WatchedRun()
+            watched_run = self._watched_runs[run_id]
+            watched_run.callbacks.append(CallbackAfterCursor(cursor, callback))
+            watched_run.reset_interval()
+
+            if not self._watcher_thread:
+                self._watcher_thread = threading.Thread(
+                    target=self._watch, name="sql-polling-event-watch"
                 )
-                self._run_id_to_watcher_dict[run_id].daemon = True
-                self._run_id_to_watcher_dict[run_id].start()
-            self._run_id_to_watcher_dict[run_id].add_callback(cursor, callback)
+                self._watcher_thread.daemon = True
+                self._watcher_thread.start()
+
+        self._wakeup.set()
 
     def unwatch_run(self, run_id: str, handler: Callable[[EventLogEntry, str], None]):
         run_id = check.str_param(run_id, "run_id")
         handler = check.callable_param(handler, "handler")
-        with self._dict_lock:
-            if run_id in self._run_id_to_watcher_dict:
-                self._run_id_to_watcher_dict[run_id].remove_callback(handler)
-                if self._run_id_to_watcher_dict[run_id].should_thread_exit.is_set():
-                    del self._run_id_to_watcher_dict[run_id]
+        with self._lock:
+            if run_id in self._watched_runs:
+                watched_run = self._watched_runs[run_id]
+                watched_run.callbacks = [
+                    callback_with_cursor
+                    for callback_with_cursor in watched_run.callbacks
+                    if callback_with_cursor.callback != handler
+                ]
+                if not watched_run.callbacks:
+                    del self._watched_runs[run_id]
+
+    async def watch_run_async(
+        self, run_id: str, cursor: Optional[str] = None
+    ) -> AsyncIterator[Tuple[EventLogEntry, str]]:
+        """Asynchronously iterate over the new events for a run, as (event, cursor) pairs.
+
+        Intended for asyncio consumers such as GraphQL subscriptions. The run is unwatched when the
+        iterator is closed.
+        """
+        run_id = check.str_param(run_id, "run_id")
+        cursor = check.opt_str_param(cursor, "cursor")
+
+        loop = asyncio.get_running_loop()
+        queue: "asyncio.Queue[Tuple[EventLogEntry, str]]" = asyncio.Queue()
+
+        def _callback(event: EventLogEntry, event_cursor: str):
+            loop.call_soon_threadsafe(queue.put_nowait, (event, event_cursor))
+
+        self.watch_run(run_id, cursor, _callback)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self.unwatch_run(run_id, _callback)
 
     def __del__(self):
         self.close()
@@ -78,95 +166,148 @@ def __del__(self):
     def close(self):
         if not self._disposed:
             self._disposed = True
-            with self._dict_lock:
-                for watcher_thread in self._run_id_to_watcher_dict.values():
-                    if not watcher_thread.should_thread_exit.is_set():
-                        watcher_thread.should_thread_exit.set()
-                for run_id in self._run_id_to_watcher_dict:
-                    self._run_id_to_watcher_dict[run_id].join()
-                del self._run_id_to_watcher_dict
+            self._should_thread_exit.set()
+            self._wakeup.set()
+            if self._watcher_thread and self._watcher_thread.is_alive():
+                self._watcher_thread.join()
+            self._watcher_thread = None
+            with self._lock:
+                self._watched_runs = {}
 
+    def _watch(self):
+        """Polling loop to update Observers with EventLogEntrys from the Event Log DB.
 
-class SqlPollingRunIdEventWatcherThread(threading.Thread):
-    """subclass of Thread that watches a given run_id for new Events by polling every POLLING_CADENCE.
+        Polls the runs that are due, then sleeps until the next run is due or until a new callback
+        is added.
+        """
+        while not self._should_thread_exit.is_set():
+            self._poll_due_runs()
 
-    Holds a list of callbacks (_callback_fn_list) each passed in by an `Observer`. Note that
-        the callbacks have a cursor associated; this means that the callbacks should be
-        only executed on EventLogEntrys with an associated id >= callback.cursor
-    Exits when `self.should_thread_exit` is set.
+            self._wakeup.wait(self._seconds_until_next_poll())
+            self._wakeup.clear()
 
-    LOCKING INFO:
-        INVARIANTS: _callback_fn_list_lock protects _callback_fn_list
+    def _seconds_until_next_poll(self) -> Optional[float]:
+        with self._lock:
+            if not self._watched_runs:
+                return None
+            next_poll_time = min(
+                watched_run.next_poll_time for watched_run in self._watched_runs.values()
+            )
+        return max(0.0, next_poll_time - time.time())
 
-    """
+    def _poll_due_runs(self):
+        now = time.time()
+        with self._lock:
+            due_runs = {
+                run_id: (watched_run.storage_id, watched_run.initial_storage_id())
+                for run_id, watched_run in self._watched_runs.items()
+                if watched_run.next_poll_time <= now
+            }
 
-    def __init__(self, event_log_storage: SqlEventLogStorage, run_id: str):
-        super(SqlPollingRunIdEventWatcherThread, self).__init__()
-        self._event_log_storage = check.inst_param(
-            event_log_storage, "event_log_storage", SqlEventLogStorage
-        )
-        self._run_id = check.str_param(run_id, "run_id")
-        self._callback_fn_list_lock: threading.Lock = threading.Lock()
-        self._callback_fn_list: List[CallbackAfterCursor] = []
-        self._should_thread_exit = threading.Event()
-        self.name = f"mysql-event-watch-run-id-{self._run_id}"
+        if not due_runs:
+            return
 
-    @property
-    def should_thread_exit(self) -> threading.Event:
-        return self._should_thread_exit
+        try:
+            records_by_run_id = self._fetch_records(due_runs)
+        except Exception:
+            logging.exception("Exception while polling for new events.")
+            self._back_off(list(due_runs.keys()))
+            return
 
-    def add_callback(self, cursor: Optional[str], callback: Callable[[EventLogEntry, str], None]):
-        """Observer has started watching this run.
-            Add a callback to execute on new EventLogEntrys after the given cursor.
+        self._dispatch(list(due_runs.keys()), records_by_run_id)
 
-        Args:
-            cursor (Optional[str]): event log cursor for the callback to execute
-            callback (Callable[[EventLogEntry, str], None]): callback to update the Dagster UI
-        """
-        cursor = check.opt_str_param(cursor, "cursor")
-        callback = check.callable_param(callback, "callback")
-        with self._callback_fn_list_lock:
-            self._callback_fn_list.append(CallbackAfterCursor(cursor, callback))
+    def _fetch_records(
+        self, due_runs: Mapping[str, Tuple[Optional[int], Optional[int]]]
+    ) -> Mapping[str, Sequence[EventLogRecord]]:
+        records_by_run_id: Dict[str, List[EventLogRecord]] = defaultdict(list)
+        is_run_sharded = self._event_log_storage.is_run_sharded
 
-    def remove_callback(self, callback: Callable[[EventLogEntry, str], None]):
-        """Observer has stopped watching this run;
-            Remove a callback from the list of callbacks to execute on new EventLogEntrys.
+        # Runs being polled for the first time are caught up individually, so that their history
+        # does not widen the shared query for the runs that are already up to date.  Run-sharded
+        # storages cannot query across runs, so every run is polled individually.
+        for run_id, (storage_id, initial_storage_id) in due_runs.items():
+            if storage_id is not None and not is_run_sharded:
+                continue
+            after_storage_id = storage_id if storage_id is not None else initial_storage_id
+            cursor = (
+                EventLogCursor.from_storage_id(after_storage_id).to_string()
+                if after_storage_id is not None
+                else None
+            )
+            connection = self._event_log_storage.get_records_for_run(run_id, cursor=cursor)
+            records_by_run_id[run_id].extend(connection.records)
 
-            Also kill thread if no callbacks remaining (i.e. no Observers are watching this run_id)
+        after_storage_ids = {
+            run_id: storage_id
+            for run_id, (storage_id, _) in due_runs.items()
+            if storage_id is not None and not is_run_sharded
+        }
+        while after_storage_ids:
+            # each run is queried after its own cursor, so that runs that have no events yet do
+            # not make the query scan the history of the others
+            records = self._event_log_storage.get_records_for_runs(
+                after_storage_ids, limit=POLLING_RECORD_LIMIT
+            )
+            for record in records:
+                records_by_run_id[record.event_log_entry.run_id].append(record)
 
-        Args:
-            callback (Callable[[EventLogEntry, str], None]): callback to remove from list of callbacks
-        """
-        callback = check.callable_param(callback, "callback")
-        with self._callback_fn_list_lock:
-            self._callback_fn_list = [
-                callback_with_cursor
-                for callback_with_cursor in self._callback_fn_list
-                if callback_with_cursor.callback != callback
-            ]
-            if not self._callback_fn_list:
-                self._should_thread_exit.set()
-
-    def run(self):
-        """Polling function to update Observers with EventLogEntrys from Event Log DB.
-        Wakes every POLLING_CADENCE &
-            1. executes a SELECT query to get new EventLogEntrys
-            2. fires each callback (taking into account the callback.cursor) on the new EventLogEntrys
-        Uses max_index_so_far as a cursor in the DB to make sure that only new records are retrieved.
-        """
-        cursor = None
-        while not self._should_thread_exit.wait(POLLING_CADENCE):
-            conn = self._event_log_storage.get_records_for_run(self._run_id, cursor=cursor)
-            cursor = conn.cursor if conn.cursor else cursor
-            for event_record in conn.records:
-                with self._callback_fn_list_lock:
-                    for callback_with_cursor in self._callback_fn_list:
-                        if (
-                            callback_with_cursor.cursor is None
-                            or EventLogCursor.parse(callback_with_cursor.cursor).storage_id()
-                            < event_record.storage_id
-                        ):
+            if len(records) < POLLING_RECORD_LIMIT:
+                break
+
+            last_storage_id = records[-1].storage_id
+            after_storage_ids = {
+                run_id: max(storage_id, last_storage_id)
+                for run_id, storage_id in after_storage_ids.items()
+            }
+
+        return records_by_run_id
+
+    def _back_off(self, run_ids: Sequence[str]):
+        with self._lock:
+            for run_id in run_ids:
+                watched_run = self._watched_runs.get(run_id)
+                if watched_run:
+                    watched_run.interval = min(watched_run.interval * 2, MAX_POLLING_CADENCE)
+                    watched_run.next_poll_time = time.time() + watched_run.interval
+
+    def _dispatch(
+        self, run_ids: Sequence[str], records_by_run_id: Mapping[str, Sequence[EventLogRecord]]
+    ):
+        for run_id in run_ids:
+            records = records_by_run_id.get(run_id, [])
+            with self._lock:
+                watched_run = self._watched_runs.get(run_id)
+                if not watched_run:
+                    # the run was unwatched while it was being polled
+                    continue
+
+                callbacks = list(watched_run.callbacks)
+                if records:
+                    watched_run.storage_id = records[-1].storage_id
+                    watched_run.interval = POLLING_CADENCE
+                else:
+                    if watched_run.storage_id is None:
+                        initial_storage_id = watched_run.initial_storage_id()
+                        # rely on the fact that all storage ids will be positive integers
+                        watched_run.storage_id = (
+                            initial_storage_id if initial_storage_id is not None else -1
+                        )
+                    watched_run.interval = min(watched_run.interval * 2, MAX_POLLING_CADENCE)
+                watched_run.next_poll_time = time.time() + watched_run.interval
+
+            for record in records:
+                for callback_with_cursor in callbacks:
+                    if (
+                        callback_with_cursor.cursor is None
+                        or EventLogCursor.parse(callback_with_cursor.cursor).storage_id()
+                        < record.storage_id
+                    ):
+                        try:
                             callback_with_cursor.callback(
-                                event_record.event_log_entry,
-                                str(EventLogCursor.from_storage_id(event_record.storage_id)),
+                                record.event_log_entry,
+                                str(EventLogCursor.from_storage_id(record.storage_id)),
+                            )
+                        except Exception:
+                            logging.exception(
+                                "Exception in callback for event watch on run %s.", run_id
                             )
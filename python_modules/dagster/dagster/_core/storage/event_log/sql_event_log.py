@@ -12,6 +12,7 @@
     Optional,
     Sequence,
     Set,
+    Tuple,
     Union,
     cast,
 )
@@ -92,6 +93,13 @@ def run_connection(self, run_id: Optional[str]) -> SqlDbConnection:
     def index_connection(self) -> SqlDbConnection:
         """Context manager yielding a connection to access cross-run indexed tables."""
 
+    def batch_index_connection(self) -> SqlDbConnection:
+        """Context manager yielding an index connection on which a transaction can be begun, used
+        to write a batch of events atomically. Storages whose engines autocommit every statement
+        should override this to yield a connection that does not.
+        """
+        return self.index_connection()
+
     @abstractmethod
     def upgrade(self) -> None:
         """This method should perform any schema migrations necessary to bring an
@@ -109,6 +117,15 @@ def prepare_insert_event(self, event):
         the `dagster-postgres` implementation which overrides the generic SQL implementation of
         `store_event`.
         """
+        # https://stackoverflow.com/a/54386260/324449
+        return SqlEventLogStorageTable.insert().values(  # pylint: disable=no-value-for-parameter
+            **self._get_event_insert_values(event)
+        )
+
+    def _get_event_insert_values(self, event: EventLogEntry) -> Dict[str, Any]:
+        """Returns the row values for an event log entry, shared by the single-event insert
+        statement and the multi-row inserts issued by `store_events`.
+        """
         dagster_event_type = None
         asset_key_str = None
         partition = None
@@ -122,8 +139,7 @@ def prepare_insert_event(self, event):
             if event.dagster_event.partition:
                 partition = event.dagster_event.partition
 
-        # https://stackoverflow.com/a/54386260/324449
-        return SqlEventLogStorageTable.insert().values(  # pylint: disable=no-value-for-parameter
+        return dict(
             run_id=event.run_id,
             event=serialize_dagster_namedtuple(event),
             dagster_event_type=dagster_event_type,
@@ -314,42 +330,53 @@ def store_asset_event_tags(self, event: EventLogEntry, event_id: int) -> None:
         check.inst_param(event, "event", EventLogEntry)
         check.int_param(event_id, "event_id")
 
-        if (
-            event.dagster_event
-            and event.dagster_event.asset_key
-            and event.dagster_event.is_step_materialization
-            and isinstance(
-                event.dagster_event.step_materialization_data.materialization, AssetMaterialization
-            )
-            and event.dagster_event.step_materialization_data.materialization.tags
-        ):
+        if self._has_asset_event_tags(event):
             if not self.has_table(AssetEventTagsTable.name):
                 # If tags table does not exist, silently exit. This is to support OSS
                 # users who have not yet run the migration to create the table.
                 # On read, we will throw an error if the table does not exist.
                 return
 
-            check.inst_param(event.dagster_event.asset_key, "asset_key", AssetKey)
-            asset_key_str = event.dagster_event.asset_key.to_string()
-
-            tags = event.dagster_event.step_materialization_data.materialization.tags
             with self.index_connection() as conn:
                 conn.execute(
                     AssetEventTagsTable.insert(),
-                    [
-                        dict(
-                            event_id=event_id,
-                            asset_key=asset_key_str,
-                            key=key,
-                            value=value,
-                            # Postgres requires a datetime that is in UTC but has no timezone info
-                            # set in order to be stored correctly
-                            event_timestamp=datetime.utcfromtimestamp(event.timestamp),
-                        )
-                        for key, value in tags.items()
-                    ],
+                    self._get_asset_event_tag_rows(event, event_id),
                 )
 
+    def _has_asset_event_tags(self, event: EventLogEntry) -> bool:
+        return bool(
+            event.dagster_event
+            and event.dagster_event.asset_key
+            and event.dagster_event.is_step_materialization
+            and isinstance(
+                event.dagster_event.step_materialization_data.materialization, AssetMaterialization
+            )
+            and event.dagster_event.step_materialization_data.materialization.tags
+        )
+
+    def _get_asset_event_tag_rows(
+        self, event: EventLogEntry, event_id: int
+    ) -> Sequence[Mapping[str, Any]]:
+        if not self._has_asset_event_tags(event):
+            return []
+
+        dagster_event = check.not_none(event.dagster_event)
+        check.inst_param(dagster_event.asset_key, "asset_key", AssetKey)
+        asset_key_str = check.not_none(dagster_event.asset_key).to_string()
+        tags = check.not_none(dagster_event.step_materialization_data.materialization.tags)
+        return [
+            dict(
+                event_id=event_id,
+                asset_key=asset_key_str,
+                key=key,
+                value=value,
+                # Postgres requires a datetime that is in UTC but has no timezone info
+                # set in order to be stored correctly
+                event_timestamp=datetime.utcfromtimestamp(event.timestamp),
+            )
+            for key, value in tags.items()
+        ]
+
     def store_event(self, event):
         """Store an event corresponding to a pipeline run.
 
@@ -380,6 +407,136 @@ def store_event(self, event):
 
             self.store_asset_event_tags(event, event_id)
 
+    def store_events(self, events: Sequence[EventLogEntry]) -> None:
+        """Store a batch of events corresponding to one or more pipeline runs.
+
+        The event rows, asset key updates, and asset event tags for the whole batch are written in
+        a single transaction, using multi-row inserts wherever the storage id of the inserted row
+        is not needed.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store, in order.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+        if not events:
+            return
+
+        if self.is_run_sharded:
+            # event rows and cross-run asset rows live in separate databases, so they cannot be
+            # written in the same transaction
+            super().store_events(events)
+            return
+
+        has_asset_events = any(_is_asset_event_with_key(event) for event in events)
+        has_asset_key_index_cols = has_asset_events and self.has_asset_key_index_cols()
+        has_asset_event_tags_table = has_asset_events and self.has_table(AssetEventTagsTable.name)
+
+        try:
+            # non-sharded storages keep the run-level and cross-run tables in the same database, so
+            # the whole batch can be written through the index connection
+            with self.batch_index_connection() as conn:
+                with conn.begin():
+                    event_ids = self._insert_event_batch(conn, events)
+                    self._store_asset_event_batch(
+                        conn,
+                        events,
+                        event_ids,
+                        has_asset_key_index_cols=has_asset_key_index_cols,
+                        has_asset_event_tags_table=has_asset_event_tags_table,
+                    )
+        except db_exc.IntegrityError:
+            # a concurrent writer inserted one of the batch's asset keys first. The transaction has
+            # been rolled back, none of the batch was written, so fall back to storing the events
+            # one at a time.
+            super().store_events(events)
+
+    def _insert_event_batch(
+        self, conn: SqlDbConnection, events: Sequence[EventLogEntry]
+    ) -> Sequence[Optional[int]]:
+        """Inserts the event log rows for a batch of events, returning the storage id of every
+        asset event in the batch (and None for all other events).
+
+        Consecutive events whose storage ids are not needed are written with a single multi-row
+        insert; asset events are inserted individually so that their storage ids are known.
+        """
+        event_ids: List[Optional[int]] = []
+        pending_rows: List[Mapping[str, Any]] = []
+        for event in events:
+            if not _is_asset_event_with_key(event):
+                pending_rows.append(self._get_event_insert_values(event))
+                event_ids.append(None)
+                continue
+
+            if pending_rows:
+                conn.execute(SqlEventLogStorageTable.insert(), pending_rows)
+                pending_rows = []
+
+            result = conn.execute(self.prepare_insert_event(event))
+            event_id = result.inserted_primary_key[0]
+            if event_id is None:
+                raise DagsterInvariantViolationError(
+                    "Cannot store asset event tags for null event id."
+                )
+            event_ids.append(event_id)
+
+        if pending_rows:
+            conn.execute(SqlEventLogStorageTable.insert(), pending_rows)
+
+        return event_ids
+
+    def _store_asset_event_batch(
+        self,
+        conn: SqlDbConnection,
+        events: Sequence[EventLogEntry],
+        event_ids: Sequence[Optional[int]],
+        has_asset_key_index_cols: bool,
+        has_asset_event_tags_table: bool,
+    ) -> None:
+        # Asset entry values for repeated events on the same asset key are merged in event order,
+        # which is equivalent to applying each event's update in turn.
+        asset_entry_values: Dict[str, Dict[str, Any]] = {}
+        tag_rows: List[Mapping[str, Any]] = []
+        for event, event_id in zip(events, event_ids):
+            if event_id is None:
+                continue
+
+            asset_key_str = check.not_none(event.get_dagster_event().asset_key).to_string()
+            asset_entry_values.setdefault(asset_key_str, {}).update(
+                self._get_asset_entry_values(event, event_id, has_asset_key_index_cols)
+            )
+            if has_asset_event_tags_table:
+                tag_rows.extend(self._get_asset_event_tag_rows(event, event_id))
+
+        if asset_entry_values:
+            self._upsert_asset_entries(conn, asset_entry_values)
+
+        if tag_rows:
+            conn.execute(AssetEventTagsTable.insert(), tag_rows)
+
+    def _upsert_asset_entries(
+        self, conn: SqlDbConnection, asset_entry_values: Mapping[str, Mapping[str, Any]]
+    ) -> None:
+        """Inserts or updates the asset key rows for a batch of asset events.  Storages with
+        dialect-specific upsert support should override this method.
+        """
+        existing_asset_keys = {
+            row[0]
+            for row in conn.execute(
+                db.select([AssetKeyTable.c.asset_key]).where(
+                    AssetKeyTable.c.asset_key.in_(list(asset_entry_values.keys()))
+                )
+            ).fetchall()
+        }
+        for asset_key_str, values in asset_entry_values.items():
+            if asset_key_str not in existing_asset_keys:
+                conn.execute(AssetKeyTable.insert().values(asset_key=asset_key_str, **values))
+            elif values:
+                conn.execute(
+                    AssetKeyTable.update()
+                    .values(**values)
+                    .where(AssetKeyTable.c.asset_key == asset_key_str)
+                )
+
     def get_records_for_run(
         self,
         run_id,
@@ -465,6 +622,72 @@ def get_records_for_run(
             has_more=bool(limit and len(results) == limit),
         )
 
+    def get_records_for_runs(
+        self,
+        after_storage_ids: Mapping[str, int],
+        limit: Optional[int] = None,
+    ) -> Sequence[EventLogRecord]:
+        """Get the event log records for a set of runs, in ascending storage id order.  Allows
+        watchers to poll many runs with a single query.  Only supported for non sharded sql
+        storage.
+
+        Args:
+            after_storage_ids (Mapping[str, int]): The ids of the runs for which to fetch logs,
+                mapped to the storage id after which to fetch the records of each run.
+            limit (Optional[int]): the maximum number of records to fetch
+        """
+        check.mapping_param(after_storage_ids, "after_storage_ids", key_type=str, value_type=int)
+        check.opt_int_param(limit, "limit")
+        check.invariant(
+            not self.is_run_sharded, "Cannot fetch records for multiple runs from a sharded storage"
+        )
+
+        if not after_storage_ids:
+            return []
+
+        # runs that share a cursor are queried with a single condition, so that the query stays
+        # small when many runs are caught up to the same point
+        run_ids_by_storage_id: Dict[int, List[str]] = defaultdict(list)
+        for run_id, after_storage_id in after_storage_ids.items():
+            run_ids_by_storage_id[after_storage_id].append(run_id)
+
+        query = (
+            db.select(
+                [
+                    SqlEventLogStorageTable.c.id,
+                    SqlEventLogStorageTable.c.run_id,
+                    SqlEventLogStorageTable.c.event,
+                ]
+            )
+            .where(
+                db.or_(
+                    *[
+                        db.and_(
+                            SqlEventLogStorageTable.c.run_id.in_(run_ids),
+                            SqlEventLogStorageTable.c.id > after_storage_id,
+                        )
+                        for after_storage_id, run_ids in run_ids_by_storage_id.items()
+                    ]
+                )
+            )
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+        if limit:
+            query = query.limit(limit)
+
+        with self.index_connection() as conn:
+            results = conn.execute(query).fetchall()
+
+        records = []
+        for record_id, run_id, json_str in results:
+            try:
+                event_log_entry = deserialize_as(json_str, EventLogEntry)
+            except (seven.JSONDecodeError, DeserializationError) as err:
+                raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+            records.append(EventLogRecord(storage_id=record_id, event_log_entry=event_log_entry))
+
+        return records
+
     def get_stats_for_run(self, run_id):
         check.str_param(run_id, "run_id")
 
@@ -1302,6 +1525,26 @@ def update_asset_cached_status_data(
                     .values(cached_status_data=serialize_dagster_namedtuple(cache_values))
                 )
 
+    def update_asset_cached_status_data_by_asset_key(
+        self, cache_values_by_asset_key: Mapping[AssetKey, "AssetStatusCacheValue"]
+    ) -> None:
+        if not cache_values_by_asset_key or not self.can_cache_asset_status_data():
+            return
+
+        with self.index_connection() as conn:
+            with conn.begin():
+                for asset_key, cache_values in cache_values_by_asset_key.items():
+                    conn.execute(
+                        AssetKeyTable.update()  # pylint: disable=no-value-for-parameter
+                        .where(
+                            db.or_(
+                                AssetKeyTable.c.asset_key == asset_key.to_string(),
+                                AssetKeyTable.c.asset_key == asset_key.to_string(legacy=True),
+                            )
+                        )
+                        .values(cached_status_data=serialize_dagster_namedtuple(cache_values))
+                    )
+
     def _fetch_backcompat_materialization_times(self, asset_keys):
         # fetches the latest materialization timestamp for the given asset_keys.  Uses the (slower)
         # raw event log table.
@@ -1669,6 +1912,71 @@ def get_materialization_count_by_partition(
 
         return materialization_count_by_partition
 
+    def get_materialization_partitions(
+        self,
+        asset_key: AssetKey,
+        after_cursor: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> Sequence[Tuple[int, Optional[str]]]:
+        check.inst_param(asset_key, "asset_key", AssetKey)
+
+        return [
+            (storage_id, partition)
+            for _, storage_id, partition in self.get_materialization_partitions_for_asset_keys(
+                [asset_key], after_cursor=after_cursor, limit=limit
+            )
+        ]
+
+    def get_materialization_partitions_for_asset_keys(
+        self,
+        asset_keys: Sequence[AssetKey],
+        after_cursor: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> Sequence[Tuple[AssetKey, int, Optional[str]]]:
+        check.sequence_param(asset_keys, "asset_keys", of_type=AssetKey)
+        check.opt_int_param(after_cursor, "after_cursor")
+        check.opt_int_param(limit, "limit")
+
+        if not asset_keys:
+            return []
+
+        asset_key_by_db_string: Dict[str, AssetKey] = {}
+        for asset_key in asset_keys:
+            asset_key_by_db_string[asset_key.to_string()] = asset_key
+            asset_key_by_db_string[asset_key.to_string(legacy=True)] = asset_key
+
+        # only select indexed columns, so that event bodies are never loaded or deserialized
+        query = (
+            db.select(
+                [
+                    SqlEventLogStorageTable.c.asset_key,
+                    SqlEventLogStorageTable.c.id,
+                    SqlEventLogStorageTable.c.partition,
+                ]
+            )
+            .where(
+                db.and_(
+                    SqlEventLogStorageTable.c.asset_key.in_(list(asset_key_by_db_string.keys())),
+                    SqlEventLogStorageTable.c.dagster_event_type
+                    == DagsterEventType.ASSET_MATERIALIZATION.value,
+                )
+            )
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+
+        assets_details = self._get_assets_details(asset_keys)
+        query = self._add_assets_wipe_filter_to_query(query, assets_details, asset_keys)
+
+        if after_cursor:
+            query = query.where(SqlEventLogStorageTable.c.id > after_cursor)
+        if limit:
+            query = query.limit(limit)
+
+        with self.index_connection() as conn:
+            results = conn.execute(query).fetchall()
+
+        return [(asset_key_by_db_string[row[0]], row[1], row[2]) for row in results]
+
     def _check_partitions_table(self):
         # Guards against cases where the user is not running the latest migration for
         # partitions storage. Should be updated when the partitions storage schema changes.
@@ -1738,6 +2046,14 @@ def delete_dynamic_partition(self, partitions_def_name: str, partition_key: str)
             )
 
 
+def _is_asset_event_with_key(event: EventLogEntry) -> bool:
+    return bool(
+        event.is_dagster_event
+        and event.dagster_event_type in ASSET_EVENTS
+        and event.get_dagster_event().asset_key
+    )
+
+
 def _get_from_row(row, column):
     """Utility function for extracting a column from a sqlalchemy row proxy, since '_asdict' is not
     supported in sqlalchemy 1.3.
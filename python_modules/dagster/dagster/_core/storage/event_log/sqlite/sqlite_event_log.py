@@ -6,7 +6,7 @@
 import time
 from collections import defaultdict
 from contextlib import contextmanager
-from typing import Any, Iterable, Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence
 
 import sqlalchemy as db
 from sqlalchemy.pool import NullPool
@@ -37,7 +37,7 @@
 )
 from dagster._utils import mkdir_p
 
-from ..schema import SqlEventLogStorageMetadata, SqlEventLogStorageTable
+from ..schema import AssetEventTagsTable, SqlEventLogStorageMetadata, SqlEventLogStorageTable
 from ..sql_event_log import RunShardedEventsCursor, SqlEventLogStorage
 
 INDEX_SHARD_NAME = "index"
@@ -259,6 +259,60 @@ def store_event(self, event):
 
             self.store_asset_event_tags(event, event_id)
 
+    def store_events(self, events: Sequence[EventLogEntry]) -> None:
+        """
+        Overridden method to write each run's events to its run shard in a single transaction, and
+        to mirror the batch's asset events in the central assets.db shard in a second transaction.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store, in order.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+        if not events:
+            return
+
+        events_by_run_id: Dict[str, List[EventLogEntry]] = defaultdict(list)
+        for event in events:
+            events_by_run_id[event.run_id].append(event)
+
+        for run_id, run_events in events_by_run_id.items():
+            with self.run_connection(run_id) as conn:
+                with conn.begin():
+                    conn.execute(
+                        SqlEventLogStorageTable.insert(),
+                        [self._get_event_insert_values(event) for event in run_events],
+                    )
+
+        asset_events = [
+            event for event in events if event.is_dagster_event and event.dagster_event.asset_key
+        ]
+        if not asset_events:
+            return
+
+        for event in asset_events:
+            check.invariant(
+                event.dagster_event_type in ASSET_EVENTS,
+                (
+                    "Can only store asset materializations, materialization_planned, and"
+                    " observations in index database"
+                ),
+            )
+
+        has_asset_key_index_cols = self.has_asset_key_index_cols()
+        has_asset_event_tags_table = self.has_table(AssetEventTagsTable.name)
+
+        # mirror the asset events in the cross-run index database
+        with self.index_connection() as conn:
+            with conn.begin():
+                event_ids = self._insert_event_batch(conn, asset_events)
+                self._store_asset_event_batch(
+                    conn,
+                    asset_events,
+                    event_ids,
+                    has_asset_key_index_cols=has_asset_key_index_cols,
+                    has_asset_event_tags_table=has_asset_event_tags_table,
+                )
+
     def get_event_records(
         self,
         event_records_filter: EventRecordsFilter,
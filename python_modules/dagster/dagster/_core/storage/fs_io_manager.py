@@ -1,6 +1,11 @@
+import io
+import mmap
 import os
 import pickle
-from typing import Any
+import struct
+import uuid
+from pathlib import Path
+from typing import IO, Any, List, Sequence
 
 from upath import UPath
 
@@ -18,7 +23,19 @@
 
 
 @io_manager(
-    config_schema={"base_dir": Field(StringSource, is_required=False)},
+    config_schema={
+        "base_dir": Field(StringSource, is_required=False),
+        "memory_map": Field(
+            bool,
+            is_required=False,
+            default_value=False,
+            description=(
+                "Whether to store large buffers, such as the data of NumPy arrays, pandas "
+                "DataFrames, and Arrow tables, outside of the pickled object, so that they can be "
+                "memory-mapped when loaded from a local filesystem instead of being copied."
+            ),
+        ),
+    },
     description="Built-in filesystem IO manager that stores and retrieves values using pickling.",
 )
 def fs_io_manager(init_context):
@@ -43,6 +60,16 @@ def fs_io_manager(init_context):
     `AssetKey(["one", "two", "three"])` would be stored in a file called "three" in a directory
     with path "/my/base/path/one/two/".
 
+    If the "memory_map" configuration value is set, values are pickled with protocol 5, and buffers
+    that support out-of-band pickling (like those backing NumPy arrays, pandas DataFrames, and Arrow
+    tables) are written after the pickled object instead of inside it. When such a file is loaded
+    from a local filesystem, the buffers are memory-mapped rather than read and copied, so
+    downstream steps on the same host can share large inputs without deserializing them. Values
+    loaded this way are backed by copy-on-write memory, so modifying them does not modify the
+    stored file. Conversely, a new materialization replaces the stored file with a new file rather
+    than overwriting it, so values that were already loaded keep the contents they were loaded
+    with.
+
     Example usage:
 
 
@@ -122,7 +149,102 @@ def job():
         "base_dir", init_context.instance.storage_directory()
     )
 
-    return PickledObjectFilesystemIOManager(base_dir=base_dir)
+    return PickledObjectFilesystemIOManager(
+        base_dir=base_dir, memory_map=init_context.resource_config["memory_map"]
+    )
+
+
+# Files written with out-of-band buffers start with this header, which can't begin a pickle
+_OUT_OF_BAND_MAGIC = b"DGSTROOB"
+# number of buffers, then the offset and length of the pickled object
+_OUT_OF_BAND_HEADER = struct.Struct("<QQQ")
+# offset and length of each buffer
+_OUT_OF_BAND_BUFFER_ENTRY = struct.Struct("<QQ")
+# buffers are aligned so that memory-mapped arrays are aligned for any dtype
+_OUT_OF_BAND_ALIGNMENT = 64
+
+
+def _align(offset: int) -> int:
+    return -(-offset // _OUT_OF_BAND_ALIGNMENT) * _OUT_OF_BAND_ALIGNMENT
+
+
+def _dump_with_out_of_band_buffers(obj: Any, file: IO[bytes]) -> None:
+    buffers: List[memoryview] = []
+
+    def _buffer_callback(buffer: "pickle.PickleBuffer") -> bool:
+        try:
+            buffers.append(buffer.raw())
+        except BufferError:
+            # non-contiguous buffers are serialized in-band
+            return True
+        return False
+
+    data = pickle.dumps(obj, protocol=5, buffer_callback=_buffer_callback)
+
+    data_offset = (
+        len(_OUT_OF_BAND_MAGIC)
+        + _OUT_OF_BAND_HEADER.size
+        + _OUT_OF_BAND_BUFFER_ENTRY.size * len(buffers)
+    )
+    buffer_entries = []
+    offset = data_offset + len(data)
+    for buffer in buffers:
+        offset = _align(offset)
+        buffer_entries.append((offset, buffer.nbytes))
+        offset += buffer.nbytes
+
+    file.write(_OUT_OF_BAND_MAGIC)
+    file.write(_OUT_OF_BAND_HEADER.pack(len(buffers), data_offset, len(data)))
+    for entry in buffer_entries:
+        file.write(_OUT_OF_BAND_BUFFER_ENTRY.pack(*entry))
+    file.write(data)
+    position = data_offset + len(data)
+    for (buffer_offset, _), buffer in zip(buffer_entries, buffers):
+        file.write(b"\0" * (buffer_offset - position))
+        file.write(buffer)
+        position = buffer_offset + buffer.nbytes
+
+
+def _replace_with_out_of_band_buffers(obj: Any, path: Path) -> None:
+    # Values loaded from the file may still map it, and writing to a mapped file changes them, or
+    # kills the process when they are read past the new end of the file. Write a new file and
+    # rename it over the path instead, so that existing mappings keep the old file.
+    temp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        with open(temp_path, "wb") as file:
+            _dump_with_out_of_band_buffers(obj, file)
+        os.replace(temp_path, path)
+    except BaseException:
+        if temp_path.exists():
+            temp_path.unlink()
+        raise
+
+
+def _load_with_out_of_band_buffers(file: IO[bytes]) -> Any:
+    try:
+        fileno = file.fileno()
+    except (AttributeError, io.UnsupportedOperation):
+        fileno = None
+
+    if fileno is not None:
+        # ACCESS_COPY maps the file copy-on-write, so loaded values are writable without changing
+        # the file. The mapping stays open for as long as any loaded buffer references it.
+        contents = memoryview(mmap.mmap(fileno, 0, access=mmap.ACCESS_COPY))
+    else:
+        # remote filesystems can't be memory-mapped
+        contents = memoryview(bytearray(file.read()))
+
+    num_buffers, data_offset, data_length = _OUT_OF_BAND_HEADER.unpack_from(
+        contents, len(_OUT_OF_BAND_MAGIC)
+    )
+    buffers: Sequence[memoryview] = [
+        contents[buffer_offset : buffer_offset + buffer_length]
+        for buffer_offset, buffer_length in _OUT_OF_BAND_BUFFER_ENTRY.iter_unpack(
+            contents[len(_OUT_OF_BAND_MAGIC) + _OUT_OF_BAND_HEADER.size : data_offset]
+        )
+    ]
+    check.invariant(len(buffers) == num_buffers, "Corrupt out-of-band pickle header")
+    return pickle.loads(contents[data_offset : data_offset + data_length], buffers=buffers)
 
 
 class PickledObjectFilesystemIOManager(UPathIOManager):
@@ -133,20 +255,35 @@ class PickledObjectFilesystemIOManager(UPathIOManager):
     Args:
         base_dir (Optional[str]): base directory where all the step outputs which use this object
             manager will be stored in.
+        memory_map (bool): whether to store out-of-band buffers separately from the pickled
+            object, so that they are memory-mapped when loaded from a local filesystem. Files
+            written in either mode can be loaded regardless of this setting.
         **kwargs: additional keyword arguments for `universal_pathlib.UPath`.
     """
 
     extension: str = ""  # TODO: maybe change this to .pickle? Leaving blank for compatibility.
 
-    def __init__(self, base_dir=None, **kwargs):
+    def __init__(self, base_dir=None, memory_map: bool = False, **kwargs):
         self.base_dir = check.opt_str_param(base_dir, "base_dir")
+        self.memory_map = check.bool_param(memory_map, "memory_map")
+        if self.memory_map and pickle.HIGHEST_PROTOCOL < 5:
+            raise DagsterInvariantViolationError(
+                "memory_map requires pickle protocol 5, which is available in Python 3.8 and later."
+            )
 
         super().__init__(base_path=UPath(base_dir, **kwargs))
 
     def dump_to_path(self, context: OutputContext, obj: Any, path: UPath):
         try:
-            with path.open("wb") as file:
-                pickle.dump(obj, file, PICKLE_PROTOCOL)
+            if self.memory_map and isinstance(path, Path):
+                # files on local filesystems are memory-mapped when loaded
+                _replace_with_out_of_band_buffers(obj, path)
+            else:
+                with path.open("wb") as file:
+                    if self.memory_map:
+                        _dump_with_out_of_band_buffers(obj, file)
+                    else:
+                        pickle.dump(obj, file, PICKLE_PROTOCOL)
         except (AttributeError, RecursionError, ImportError, pickle.PicklingError) as e:
             executor = context.step_context.pipeline_def.mode_definitions[0].executor_defs[0]
 
@@ -170,6 +307,10 @@ def dump_to_path(self, context: OutputContext, obj: Any, path: UPath):
 
     def load_from_path(self, context: InputContext, path: UPath) -> Any:
         with path.open("rb") as file:
+            if file.read(len(_OUT_OF_BAND_MAGIC)) == _OUT_OF_BAND_MAGIC:
+                file.seek(0)
+                return _load_with_out_of_band_buffers(file)
+            file.seek(0)
             return pickle.load(file)
 
 
@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import (
     TYPE_CHECKING,
     Callable,
@@ -44,9 +45,11 @@
     from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
     from dagster._core.storage.pipeline_run import (
         DagsterRun,
+        DagsterRunStatus,
         JobBucket,
         PipelineRunStatsSnapshot,
         RunPartitionData,
+        RunQueueEntry,
         RunRecord,
         RunsFilter,
         TagBucket,
@@ -227,6 +230,17 @@ def get_run_records(
             filters, limit, order_by, ascending, cursor, bucket_by
         )
 
+    def get_run_queue_entries(
+        self,
+        statuses: Optional[Sequence["DagsterRunStatus"]] = None,
+        updated_after: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Sequence["RunQueueEntry"]:
+        return self._storage.run_storage.get_run_queue_entries(
+            statuses, updated_after, limit, cursor
+        )
+
     def get_run_tags(self) -> Sequence[Tuple[str, Set[str]]]:
         return self._storage.run_storage.get_run_tags()
 
@@ -477,6 +491,26 @@ def get_materialization_count_by_partition(
             asset_keys, after_cursor
         )
 
+    def get_materialization_partitions(
+        self,
+        asset_key: "AssetKey",
+        after_cursor: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> Sequence[Tuple[int, Optional[str]]]:
+        return self._storage.event_log_storage.get_materialization_partitions(
+            asset_key, after_cursor, limit
+        )
+
+    def get_materialization_partitions_for_asset_keys(
+        self,
+        asset_keys: Sequence["AssetKey"],
+        after_cursor: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> Sequence[Tuple["AssetKey", int, Optional[str]]]:
+        return self._storage.event_log_storage.get_materialization_partitions_for_asset_keys(
+            asset_keys, after_cursor, limit
+        )
+
     def get_dynamic_partitions(self, partitions_def_name: str) -> Sequence[str]:
         return self._storage.event_log_storage.get_dynamic_partitions(partitions_def_name)
 
@@ -517,6 +551,13 @@ def update_asset_cached_status_data(
             asset_key=asset_key, cache_values=cache_values
         )
 
+    def update_asset_cached_status_data_by_asset_key(
+        self, cache_values_by_asset_key: Mapping["AssetKey", "AssetStatusCacheValue"]
+    ) -> None:
+        self._storage.event_log_storage.update_asset_cached_status_data_by_asset_key(
+            cache_values_by_asset_key
+        )
+
     def get_records_for_run(
         self,
         run_id,
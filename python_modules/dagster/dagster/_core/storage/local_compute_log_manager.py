@@ -2,11 +2,12 @@
 import os
 import shutil
 import sys
+import threading
 from collections import defaultdict
 from contextlib import contextmanager
 from typing import IO, Generator, Optional, Sequence, Tuple, Union
 
-from watchdog.events import PatternMatchingEventHandler
+from watchdog.events import FileSystemEventHandler
 from watchdog.observers.polling import PollingObserver
 
 from dagster import (
@@ -304,11 +305,24 @@ def dispose(self):
 
 
 class LocalComputeLogSubscriptionManager:
+    """Notifies subscriptions to logs on the local filesystem of updates. A single filesystem
+    observer and event handler are shared by all watched log keys, with each directory containing
+    watched logs only being scheduled on the observer once.
+
+    The observer dispatches events to the event handler while holding its own lock, so the event
+    handler only takes the lock on subscriptions, and the lock on watches is held while calling
+    the observer.
+    """
+
     def __init__(self, manager):
         self._manager = manager
         self._subscriptions = defaultdict(list)
         self._watchers = {}
+        self._observed_watches = {}
         self._observer = None
+        self._event_handler = LocalComputeLogFilesystemEventHandler(self)
+        self._lock = threading.RLock()
+        self._subscriptions_lock = threading.Lock()
 
     def add_subscription(
         self, subscription: Union[ComputeLogSubscription, CapturedLogSubscription]
@@ -323,7 +337,8 @@ def add_subscription(
         else:
             log_key = self._log_key(subscription)
             watch_key = self._watch_key(log_key)
-            self._subscriptions[watch_key].append(subscription)
+            with self._subscriptions_lock:
+                self._subscriptions[watch_key].append(subscription)
             self.watch(subscription)
 
     def is_complete(self, subscription: Union[ComputeLogSubscription, CapturedLogSubscription]):
@@ -341,9 +356,14 @@ def remove_subscription(self, subscription):
         )
         log_key = self._log_key(subscription)
         watch_key = self._watch_key(log_key)
-        if subscription in self._subscriptions[watch_key]:
+        with self._subscriptions_lock:
+            if subscription not in self._subscriptions[watch_key]:
+                return
             self._subscriptions[watch_key].remove(subscription)
-            subscription.complete()
+            if not self._subscriptions[watch_key]:
+                del self._subscriptions[watch_key]
+        self.unwatch(log_key)
+        subscription.complete()
 
     def _log_key(self, subscription):
         check.inst_param(
@@ -359,15 +379,14 @@ def _watch_key(self, log_key: Sequence[str]) -> str:
 
     def remove_all_subscriptions(self, log_key):
         watch_key = self._watch_key(log_key)
-        for subscription in self._subscriptions.pop(watch_key, []):
+        with self._subscriptions_lock:
+            subscriptions = self._subscriptions.pop(watch_key, [])
+        for subscription in subscriptions:
             subscription.complete()
 
     def watch(self, subscription):
         log_key = self._log_key(subscription)
         watch_key = self._watch_key(log_key)
-        if watch_key in self._watchers:
-            return
-
         update_paths = [
             self._manager.get_captured_local_path(log_key, IO_TYPE_EXTENSION[ComputeIOType.STDOUT]),
             self._manager.get_captured_local_path(log_key, IO_TYPE_EXTENSION[ComputeIOType.STDERR]),
@@ -383,27 +402,52 @@ def watch(self, subscription):
             self._manager.get_captured_local_path(log_key, ComputeIOType.STDERR),
         )
 
-        if not self._observer:
-            self._observer = PollingObserver(self._manager.polling_timeout)
-            self._observer.start()
+        with self._lock:
+            if watch_key in self._watchers:
+                return
 
-        ensure_dir(directory)
+            if not self._observer:
+                self._observer = PollingObserver(self._manager.polling_timeout)
+                self._observer.start()
 
-        self._watchers[watch_key] = self._observer.schedule(
-            LocalComputeLogFilesystemEventHandler(self, log_key, update_paths, complete_paths),
-            str(directory),
-        )
+            ensure_dir(directory)
+
+            self._event_handler.add_log_key(log_key, update_paths, complete_paths)
+            self._watchers[watch_key] = directory
+
+            # scheduling a directory that is already scheduled is a no-op
+            self._observed_watches[directory] = self._observer.schedule(
+                self._event_handler, str(directory)
+            )
 
     def notify_subscriptions(self, log_key):
         watch_key = self._watch_key(log_key)
-        for subscription in self._subscriptions[watch_key]:
+        with self._subscriptions_lock:
+            subscriptions = list(self._subscriptions.get(watch_key, []))
+        for subscription in subscriptions:
             subscription.fetch()
 
-    def unwatch(self, log_key, handler):
+    def unwatch(self, log_key):
+        """Stops watching a log key, unless it has gained new subscriptions since the last one
+        was removed.
+        """
         watch_key = self._watch_key(log_key)
-        if watch_key in self._watchers:
-            self._observer.remove_handler_for_watch(handler, self._watchers[watch_key])
-        del self._watchers[watch_key]
+        with self._lock:
+            with self._subscriptions_lock:
+                if self._subscriptions.get(watch_key):
+                    return
+
+            directory = self._watchers.pop(watch_key, None)
+            if directory is None:
+                return
+
+            self._event_handler.remove_log_key(log_key)
+
+            # stop observing the directory once no other watched logs are in it
+            if directory not in self._watchers.values():
+                observed_watch = self._observed_watches.pop(directory, None)
+                if observed_watch is not None:
+                    self._observer.unschedule(observed_watch)
 
     def dispose(self):
         if self._observer:
@@ -411,20 +455,44 @@ def dispose(self):
             self._observer.join(15)
 
 
-class LocalComputeLogFilesystemEventHandler(PatternMatchingEventHandler):
-    def __init__(self, manager, log_key, update_paths, complete_paths):
+class LocalComputeLogFilesystemEventHandler(FileSystemEventHandler):
+    """Dispatches filesystem events for all watched logs to the subscription manager, by looking
+    up the log key for the path of each event.
+    """
+
+    def __init__(self, manager):
         self.manager = manager
-        self.log_key = log_key
-        self.update_paths = update_paths
-        self.complete_paths = complete_paths
-        patterns = update_paths + complete_paths
-        super(LocalComputeLogFilesystemEventHandler, self).__init__(patterns=patterns)
+        self._log_keys_by_update_path = {}
+        self._log_keys_by_complete_path = {}
+        super(LocalComputeLogFilesystemEventHandler, self).__init__()
+
+    def add_log_key(self, log_key, update_paths, complete_paths):
+        for path in update_paths:
+            self._log_keys_by_update_path[path] = log_key
+        for path in complete_paths:
+            self._log_keys_by_complete_path[path] = log_key
+
+    def remove_log_key(self, log_key):
+        self._log_keys_by_update_path = {
+            path: key for path, key in self._log_keys_by_update_path.items() if key != log_key
+        }
+        self._log_keys_by_complete_path = {
+            path: key for path, key in self._log_keys_by_complete_path.items() if key != log_key
+        }
 
     def on_created(self, event):
-        if event.src_path in self.complete_paths:
-            self.manager.remove_all_subscriptions(self.log_key)
-            self.manager.unwatch(self.log_key, self)
+        log_key = self._log_keys_by_complete_path.get(event.src_path)
+        if log_key is not None:
+            self.manager.remove_all_subscriptions(log_key)
+            # the observer holds its lock while dispatching this event, and watches are updated
+            # while holding our lock and waiting for the observer's, so unwatch on another thread
+            threading.Thread(target=self.manager.unwatch, args=(log_key,), daemon=True).start()
+            return
+
+        # the directory may already be observed for other logs when a log file is created in it
+        self.on_modified(event)
 
     def on_modified(self, event):
-        if event.src_path in self.update_paths:
-            self.manager.notify_subscriptions(self.log_key)
+        log_key = self._log_keys_by_update_path.get(event.src_path)
+        if log_key is not None:
+            self.manager.notify_subscriptions(log_key)
@@ -1,4 +1,4 @@
-from typing import List, NamedTuple, Optional, Sequence, Set, cast
+from typing import Dict, List, Mapping, NamedTuple, Optional, Sequence, Set, Tuple, cast
 
 from dagster import (
     AssetKey,
@@ -31,6 +31,11 @@
     StaticPartitionsDefinition,
 }
 
+# Number of materializations fetched per query when scanning the event log for partitions
+MATERIALIZATION_PARTITIONS_PAGE_SIZE = 10000
+# Number of assets whose materializations are scanned together when refreshing many assets at once
+MATERIALIZATION_PARTITIONS_ASSET_BATCH_SIZE = 100
+
 
 @whitelist_for_serdes
 class AssetStatusCacheValue(
@@ -160,6 +165,36 @@ def get_validated_partition_keys(
     return validated_partitions
 
 
+def _get_materialized_partitions_after_cursor(
+    instance: DagsterInstance,
+    asset_key: AssetKey,
+    after_cursor: Optional[int],
+) -> Tuple[Optional[int], Set[str]]:
+    """
+    Pages through the materializations of the asset after the cursor, returning the latest
+    storage id seen (None if there were no materializations) and the set of partitions that were
+    materialized. Only the storage id and partition of each materialization is fetched, so the
+    event bodies are never loaded.
+    """
+    latest_storage_id = None
+    materialized_partitions: Set[str] = set()
+    cursor = after_cursor
+    while True:
+        materialization_partitions = instance.get_materialization_partitions(
+            asset_key, after_cursor=cursor, limit=MATERIALIZATION_PARTITIONS_PAGE_SIZE
+        )
+        for _, partition in materialization_partitions:
+            if partition:
+                materialized_partitions.add(partition)
+
+        if materialization_partitions:
+            latest_storage_id = materialization_partitions[-1][0]
+            cursor = latest_storage_id
+
+        if len(materialization_partitions) < MATERIALIZATION_PARTITIONS_PAGE_SIZE:
+            return latest_storage_id, materialized_partitions
+
+
 def _build_status_cache(
     instance: DagsterInstance,
     asset_key: AssetKey,
@@ -175,23 +210,17 @@ def _build_status_cache(
     ):
         return AssetStatusCacheValue(latest_storage_id=latest_storage_id)
 
-    materialized_keys: Sequence[str]
-    if isinstance(partitions_def, MultiPartitionsDefinition):
-        materialized_keys = get_materialized_multipartitions(instance, asset_key, partitions_def)
-    else:
-        materialized_keys = [
-            key
-            for key, count in instance.get_materialization_count_by_partition([asset_key])
-            .get(asset_key, {})
-            .items()
-            if count > 0
-        ]
+    scanned_storage_id, materialized_keys = _get_materialized_partitions_after_cursor(
+        instance, asset_key, after_cursor=None
+    )
+    # materializations may have landed since latest_storage_id was read
+    latest_storage_id = max(latest_storage_id, scanned_storage_id or 0)
 
     serialized_materialized_partition_subset = partitions_def.empty_subset()
 
     serialized_materialized_partition_subset = (
         serialized_materialized_partition_subset.with_partition_keys(
-            get_validated_partition_keys(instance, partitions_def, set(materialized_keys))
+            get_validated_partition_keys(instance, partitions_def, materialized_keys)
         )
     )
 
@@ -212,18 +241,13 @@ def _get_updated_status_cache(
     This method accepts the current asset status cache value, and fetches unevaluated
     records from the event log. It then updates the cache value with the new materializations.
     """
-    unevaluated_event_records = instance.get_event_records(
-        event_records_filter=EventRecordsFilter(
-            event_type=DagsterEventType.ASSET_MATERIALIZATION,
-            asset_key=asset_key,
-            after_cursor=current_status_cache_value.latest_storage_id,
-        )
+    latest_storage_id, newly_materialized_partitions = _get_materialized_partitions_after_cursor(
+        instance, asset_key, after_cursor=current_status_cache_value.latest_storage_id
     )
 
-    if not unevaluated_event_records:
+    if latest_storage_id is None:
         return current_status_cache_value
 
-    latest_storage_id = max([record.storage_id for record in unevaluated_event_records])
     if not partitions_def or not any(
         isinstance(partitions_def, partition_type) for partition_type in CACHEABLE_PARTITION_TYPES
     ):
@@ -241,18 +265,6 @@ def _get_updated_status_cache(
         and current_status_cache_value.serialized_materialized_partition_subset
         else partitions_def.empty_subset()
     )
-    newly_materialized_partitions = set()
-
-    for unevaluated_materializations in unevaluated_event_records:
-        if not (
-            unevaluated_materializations.event_log_entry.dagster_event
-            and unevaluated_materializations.event_log_entry.dagster_event.is_step_materialization
-        ):
-            check.failed("Expected materialization event")
-        if unevaluated_materializations.event_log_entry.dagster_event.partition:
-            newly_materialized_partitions.add(
-                unevaluated_materializations.event_log_entry.dagster_event.partition
-            )
 
     materialized_subset = materialized_subset.with_partition_keys(
         get_validated_partition_keys(instance, partitions_def, newly_materialized_partitions)
@@ -324,3 +336,136 @@ def get_and_update_asset_status_cache_value(
         instance.update_asset_cached_status_data(asset_key, updated_cache_value)
 
     return updated_cache_value
+
+
+def _get_materialized_partitions_by_asset_key(
+    instance: DagsterInstance,
+    after_cursor_by_asset_key: Mapping[AssetKey, Optional[int]],
+) -> Mapping[AssetKey, Tuple[Optional[int], Set[str]]]:
+    """
+    Like _get_materialized_partitions_after_cursor, but for many assets, each with its own cursor.
+    Assets with similar cursors are scanned together in batches, each batch paging through the
+    materializations of all of its assets after the earliest cursor in the batch.
+    """
+    result: Dict[AssetKey, Tuple[Optional[int], Set[str]]] = {}
+    sorted_asset_keys = sorted(
+        after_cursor_by_asset_key.keys(),
+        key=lambda asset_key: after_cursor_by_asset_key[asset_key] or 0,
+    )
+    for i in range(0, len(sorted_asset_keys), MATERIALIZATION_PARTITIONS_ASSET_BATCH_SIZE):
+        asset_keys = sorted_asset_keys[i : i + MATERIALIZATION_PARTITIONS_ASSET_BATCH_SIZE]
+        latest_storage_ids: Dict[AssetKey, Optional[int]] = {}
+        materialized_partitions: Dict[AssetKey, Set[str]] = {
+            asset_key: set() for asset_key in asset_keys
+        }
+
+        cursor = after_cursor_by_asset_key[asset_keys[0]]
+        while True:
+            materialization_partitions = instance.get_materialization_partitions_for_asset_keys(
+                asset_keys, after_cursor=cursor, limit=MATERIALIZATION_PARTITIONS_PAGE_SIZE
+            )
+            for asset_key, storage_id, partition in materialization_partitions:
+                asset_cursor = after_cursor_by_asset_key[asset_key]
+                if asset_cursor is not None and storage_id <= asset_cursor:
+                    continue
+
+                latest_storage_ids[asset_key] = storage_id
+                if partition:
+                    materialized_partitions[asset_key].add(partition)
+
+            if materialization_partitions:
+                cursor = materialization_partitions[-1][1]
+
+            if len(materialization_partitions) < MATERIALIZATION_PARTITIONS_PAGE_SIZE:
+                break
+
+        for asset_key in asset_keys:
+            result[asset_key] = (
+                latest_storage_ids.get(asset_key),
+                materialized_partitions[asset_key],
+            )
+
+    return result
+
+
+def get_and_update_asset_status_cache_values(
+    instance: DagsterInstance,
+    partitions_defs_by_asset_key: Mapping[AssetKey, Optional[PartitionsDefinition]],
+) -> Mapping[AssetKey, Optional[AssetStatusCacheValue]]:
+    """
+    Batched version of get_and_update_asset_status_cache_value. Fetches the stored cache values
+    of all the assets in one query, scans their new materializations in a few grouped queries,
+    and writes back all of the changed cache values in a single transaction.
+    """
+    asset_entries = {
+        asset_record.asset_entry.asset_key: asset_record.asset_entry
+        for asset_record in instance.get_asset_records(list(partitions_defs_by_asset_key.keys()))
+    }
+
+    cache_values: Dict[AssetKey, Optional[AssetStatusCacheValue]] = {}
+    updated_cache_values: Dict[AssetKey, AssetStatusCacheValue] = {}
+    # cached values that can be updated incrementally, keyed by the assets that need a scan
+    current_cache_values: Dict[AssetKey, Optional[AssetStatusCacheValue]] = {}
+    latest_storage_ids: Dict[AssetKey, int] = {}
+
+    for asset_key, partitions_def in partitions_defs_by_asset_key.items():
+        asset_entry = asset_entries.get(asset_key)
+        if asset_entry is None or asset_entry.last_materialization_record is None:
+            cache_values[asset_key] = None
+            continue
+
+        cached_status = asset_entry.cached_status
+        if cached_status and cached_status.partitions_def_id != (
+            partitions_def.serializable_unique_identifier if partitions_def else None
+        ):
+            cached_status = None
+
+        latest_storage_id = asset_entry.last_materialization_record.storage_id
+        if cached_status and cached_status.latest_storage_id >= latest_storage_id:
+            # nothing has been materialized since the cache was last updated
+            cache_values[asset_key] = cached_status
+        elif not partitions_def or not any(
+            isinstance(partitions_def, partition_type)
+            for partition_type in CACHEABLE_PARTITION_TYPES
+        ):
+            cache_values[asset_key] = AssetStatusCacheValue(latest_storage_id=latest_storage_id)
+            updated_cache_values[asset_key] = cache_values[asset_key]
+        else:
+            current_cache_values[asset_key] = cached_status
+            latest_storage_ids[asset_key] = latest_storage_id
+
+    materialized_partitions_by_asset_key = _get_materialized_partitions_by_asset_key(
+        instance,
+        {
+            asset_key: cached_status.latest_storage_id if cached_status else None
+            for asset_key, cached_status in current_cache_values.items()
+        },
+    )
+    for asset_key, cached_status in current_cache_values.items():
+        partitions_def = check.not_none(partitions_defs_by_asset_key[asset_key])
+        scanned_storage_id, materialized_partitions = materialized_partitions_by_asset_key[
+            asset_key
+        ]
+
+        materialized_subset: PartitionsSubset = (
+            partitions_def.deserialize_subset(
+                cached_status.serialized_materialized_partition_subset
+            )
+            if cached_status and cached_status.serialized_materialized_partition_subset
+            else partitions_def.empty_subset()
+        )
+        materialized_subset = materialized_subset.with_partition_keys(
+            get_validated_partition_keys(instance, partitions_def, materialized_partitions)
+        )
+        cache_values[asset_key] = AssetStatusCacheValue(
+            # materializations may have landed since the asset records were read
+            latest_storage_id=max(latest_storage_ids[asset_key], scanned_storage_id or 0),
+            partitions_def_id=partitions_def.serializable_unique_identifier,
+            serialized_materialized_partition_subset=materialized_subset.serialize(),
+        )
+        updated_cache_values[asset_key] = cache_values[asset_key]
+
+    if updated_cache_values:
+        instance.update_asset_cached_status_data_by_asset_key(updated_cache_values)
+
+    return cache_values
@@ -38,6 +38,7 @@
 from .tags import (
     BACKFILL_ID_TAG,
     PARTITION_SET_TAG,
+    PRIORITY_TAG,
     REPOSITORY_LABEL_TAG,
     RESUME_RETRY_TAG,
     SCHEDULE_NAME_TAG,
@@ -725,6 +726,57 @@ def dagster_run(self) -> DagsterRun:
         return self.pipeline_run
 
 
+class RunQueueEntry(
+    NamedTuple(
+        "_RunQueueEntry",
+        [
+            ("storage_id", int),
+            ("run_id", str),
+            ("status", DagsterRunStatus),
+            ("tags", Mapping[str, str]),
+            ("location_name", Optional[str]),
+            ("update_timestamp", datetime),
+        ],
+    )
+):
+    """Lightweight representation of a run, as used to select runs from the run queue. Unlike
+    :py:class:`RunRecord`, it is built without deserializing the run body.
+
+    Users should not invoke this class directly.
+    """
+
+    def __new__(
+        cls,
+        storage_id: int,
+        run_id: str,
+        status: DagsterRunStatus,
+        tags: Mapping[str, str],
+        location_name: Optional[str],
+        update_timestamp: datetime,
+    ):
+        return super(RunQueueEntry, cls).__new__(
+            cls,
+            storage_id=check.int_param(storage_id, "storage_id"),
+            run_id=check.str_param(run_id, "run_id"),
+            status=check.inst_param(status, "status", DagsterRunStatus),
+            tags=check.mapping_param(tags, "tags", key_type=str, value_type=str),
+            location_name=check.opt_str_param(location_name, "location_name"),
+            update_timestamp=check.inst_param(update_timestamp, "update_timestamp", datetime),
+        )
+
+    @property
+    def priority(self) -> int:
+        return RunQueueEntry.parse_priority(self.tags.get(PRIORITY_TAG, "0"))
+
+    @staticmethod
+    def parse_priority(value: str) -> int:
+        """Parses the value of a priority tag, treating invalid values as the default priority."""
+        try:
+            return int(value)
+        except ValueError:
+            return 0
+
+
 @whitelist_for_serdes
 class RunPartitionData(
     NamedTuple(
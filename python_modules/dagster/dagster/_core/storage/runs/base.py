@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import TYPE_CHECKING, Callable, Iterable, Mapping, Optional, Sequence, Set, Tuple, Union
 
 from typing_extensions import TypedDict
@@ -9,8 +10,10 @@
 from dagster._core.snap import ExecutionPlanSnapshot, PipelineSnapshot
 from dagster._core.storage.pipeline_run import (
     DagsterRun,
+    DagsterRunStatus,
     JobBucket,
     RunPartitionData,
+    RunQueueEntry,
     RunRecord,
     RunsFilter,
     TagBucket,
@@ -170,6 +173,54 @@ def get_run_records(
             List[RunRecord]: List of run records stored in the run storage.
         """
 
+    def get_run_queue_entries(
+        self,
+        statuses: Optional[Sequence[DagsterRunStatus]] = None,
+        updated_after: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Sequence[RunQueueEntry]:
+        """Return lightweight run queue entries for the runs matching the given statuses, ordered
+        by priority (highest first) and then by submission order.
+
+        Args:
+            statuses (Optional[Sequence[DagsterRunStatus]]): Only return runs with these statuses.
+            updated_after (Optional[datetime]): Only return runs updated after this time.
+            limit (Optional[int]): Number of results to get. Defaults to infinite.
+            cursor (Optional[str]): Run id of the last entry of the previous page.
+
+        Returns:
+            List[RunQueueEntry]: List of run queue entries.
+        """
+        records = list(
+            self.get_run_records(
+                filters=RunsFilter(statuses=statuses, updated_after=updated_after), ascending=True
+            )
+        )
+        if cursor and not any(record.dagster_run.run_id == cursor for record in records):
+            # the cursor run may no longer match the filters (e.g. a queued run that was canceled
+            # since the previous page was read), but it still marks where the next page starts
+            records.extend(self.get_run_records(filters=RunsFilter(run_ids=[cursor])))
+        return page_run_queue_entries(
+            [
+                RunQueueEntry(
+                    storage_id=record.storage_id,
+                    run_id=record.dagster_run.run_id,
+                    status=record.dagster_run.status,
+                    tags=record.dagster_run.tags,
+                    location_name=(
+                        record.dagster_run.external_pipeline_origin.location_name
+                        if record.dagster_run.external_pipeline_origin
+                        else None
+                    ),
+                    update_timestamp=record.update_timestamp,
+                )
+                for record in records
+            ],
+            limit=limit,
+            cursor=cursor,
+        )
+
     @abstractmethod
     def get_run_tags(self) -> Sequence[Tuple[str, Set[str]]]:
         """Get a list of tag keys and the values that have been associated with them.
@@ -402,3 +453,22 @@ def kvs_set(self, pairs: Mapping[str, str]) -> None:
     @abstractmethod
     def replace_job_origin(self, run: "DagsterRun", job_origin: "ExternalPipelineOrigin"):
         ...
+
+
+def page_run_queue_entries(
+    entries: Sequence[RunQueueEntry], limit: Optional[int] = None, cursor: Optional[str] = None
+) -> Sequence[RunQueueEntry]:
+    # sorted is stable, so entries that share a priority are kept in storage id (fifo) order
+    sorted_entries = sorted(
+        sorted(entries, key=lambda entry: entry.storage_id),
+        key=lambda entry: entry.priority,
+        reverse=True,
+    )
+    if cursor:
+        cursor_index = next(
+            (index for index, entry in enumerate(sorted_entries) if entry.run_id == cursor), None
+        )
+        sorted_entries = sorted_entries[cursor_index + 1 :] if cursor_index is not None else []
+    if limit is not None:
+        sorted_entries = sorted_entries[:limit]
+    return sorted_entries
@@ -45,6 +45,7 @@
 from dagster._core.storage.tags import (
     PARTITION_NAME_TAG,
     PARTITION_SET_TAG,
+    PRIORITY_TAG,
     REPOSITORY_LABEL_TAG,
     ROOT_RUN_ID_TAG,
 )
@@ -63,6 +64,7 @@
     DagsterRunStatus,
     JobBucket,
     RunPartitionData,
+    RunQueueEntry,
     RunRecord,
     RunsFilter,
     TagBucket,
@@ -80,6 +82,10 @@
     SnapshotsTable,
 )
 
+# number of runs whose tags are read at once when loading run queue entries, which keeps the
+# number of bound parameters of each query well under SQLite's limit
+RUN_QUEUE_TAGS_CHUNK_SIZE = 500
+
 
 class SnapshotType(Enum):
     PIPELINE = "PIPELINE"
@@ -517,6 +523,120 @@ def get_run_records(
             for row in rows
         ]
 
+    def get_run_queue_entries(
+        self,
+        statuses: Optional[Sequence[DagsterRunStatus]] = None,
+        updated_after: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Sequence[RunQueueEntry]:
+        check.opt_sequence_param(statuses, "statuses", of_type=DagsterRunStatus)
+        check.opt_inst_param(updated_after, "updated_after", datetime)
+        check.opt_int_param(limit, "limit")
+        check.opt_str_param(cursor, "cursor")
+
+        # only read the indexed columns and the tags table, so that selecting from a large queue
+        # does not require deserializing any run bodies. Ordering, the cursor and the limit are all
+        # applied in the query, so that paging through a large queue only reads each page.
+        filters = RunsFilter(statuses=statuses, updated_after=updated_after)
+        priority = self._run_queue_priority_expression()
+        runs_with_priority = RunsTable.outerjoin(
+            RunTagsTable,
+            db.and_(
+                RunTagsTable.c.run_id == RunsTable.c.run_id,
+                RunTagsTable.c.key == PRIORITY_TAG,
+            ),
+        )
+        runs_query = self._add_filters_to_query(
+            db.select(
+                [
+                    RunsTable.c.id,
+                    RunsTable.c.run_id,
+                    RunsTable.c.status,
+                    RunsTable.c.update_timestamp,
+                ]
+            ).select_from(runs_with_priority),
+            filters,
+        )
+
+        if cursor:
+            # the cursor run is looked up regardless of the filters, since it may no longer match
+            # them (e.g. a queued run that was canceled since the previous page was read)
+            cursor_row = self.fetchone(
+                db.select([priority, RunsTable.c.id])
+                .select_from(runs_with_priority)
+                .where(RunsTable.c.run_id == cursor)
+            )
+            if not cursor_row:
+                return []
+            cursor_priority, cursor_id = cursor_row
+            runs_query = runs_query.where(
+                db.or_(
+                    priority < cursor_priority,
+                    db.and_(priority == cursor_priority, RunsTable.c.id > cursor_id),
+                )
+            )
+
+        runs_query = runs_query.order_by(priority.desc(), RunsTable.c.id.asc())
+        if limit is not None:
+            runs_query = runs_query.limit(limit)
+
+        rows = self.fetchall(runs_query)
+        if not rows:
+            return []
+
+        tags_by_run_id: Dict[str, Dict[str, str]] = defaultdict(dict)
+        location_name_by_run_id: Dict[str, str] = {}
+        for i in range(0, len(rows), RUN_QUEUE_TAGS_CHUNK_SIZE):
+            tags_query = db.select(
+                [RunTagsTable.c.run_id, RunTagsTable.c.key, RunTagsTable.c.value]
+            ).where(
+                RunTagsTable.c.run_id.in_(
+                    [row[1] for row in rows[i : i + RUN_QUEUE_TAGS_CHUNK_SIZE]]
+                )
+            )
+            for run_id, key, value in self.fetchall(tags_query):
+                if key == REPOSITORY_LABEL_TAG:
+                    # the repository label is only stored in the tags table, in the form
+                    # `repository_name@location_name`
+                    if "@" in value:
+                        location_name_by_run_id[run_id] = value.split("@", 1)[1]
+                else:
+                    tags_by_run_id[run_id][key] = value
+
+        return [
+            RunQueueEntry(
+                storage_id=row[0],
+                run_id=row[1],
+                status=DagsterRunStatus(row[2]),
+                tags=tags_by_run_id.get(row[1], {}),
+                location_name=location_name_by_run_id.get(row[1]),
+                update_timestamp=row[3],
+            )
+            for row in rows
+        ]
+
+    def _run_queue_priority_expression(self):
+        # Priorities are stored as tag values. Rather than casting them in SQL, where invalid
+        # values raise on some databases, the distinct values (read from the tags index) are
+        # parsed the way RunQueueEntry parses them and mapped to their priority in the query.
+        priority_by_value = {
+            value: RunQueueEntry.parse_priority(value)
+            for (value,) in self.fetchall(
+                db.select([RunTagsTable.c.value])
+                .where(RunTagsTable.c.key == PRIORITY_TAG)
+                .distinct()
+            )
+        }
+        whens = [
+            (RunTagsTable.c.value == value, priority)
+            for value, priority in priority_by_value.items()
+            if priority != 0
+        ]
+        if not whens:
+            return db.literal(0)
+        return db.case(whens, else_=0)
+
     def get_run_tags(self) -> Sequence[Tuple[str, Set[str]]]:
         result = defaultdict(set)
         query = db.select([RunTagsTable.c.key, RunTagsTable.c.value]).distinct(
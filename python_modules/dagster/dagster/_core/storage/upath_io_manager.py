@@ -2,7 +2,8 @@
 
 import inspect
 from abc import abstractmethod
-from typing import Any, Dict, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, Mapping, Union
 
 from upath import UPath
 
@@ -15,6 +16,30 @@
 from dagster._core.storage.memoizable_io_manager import MemoizableIOManager
 
 
+class LazyPartitionsMapping(Mapping[str, Any]):
+    """
+    A read-only mapping of partition keys to partition values that loads each value from storage
+    when it is accessed. Values are not retained after being returned, so iterating over the
+    mapping only holds one partition in memory at a time.
+    """
+
+    def __init__(self, paths: Mapping[str, UPath], load_fn: Callable[[UPath], Any]):
+        self._paths = paths
+        self._load_fn = load_fn
+
+    def __getitem__(self, partition_key: str) -> Any:
+        return self._load_fn(self._paths[partition_key])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._paths)
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self._paths)})"
+
+
 class UPathIOManager(MemoizableIOManager):
     """
     Abstract IOManager base class compatible with local and cloud storage via `universal-pathlib` and `fsspec`.
@@ -26,6 +51,14 @@ class UPathIOManager(MemoizableIOManager):
      - the `get_metadata` method can be customized to add additional metadata to the output
      - the `allow_missing_partitions` metadata value can be set to `True` to skip missing partitions
        (the default behavior is to raise an error)
+     - multiple upstream partitions can be loaded concurrently in a thread pool by passing
+       `max_concurrent_partition_loads` to the constructor, or by setting the
+       `max_concurrent_partition_loads` input metadata value. `load_from_path` must then be safe
+       to call from multiple threads, and should not log through the context.
+     - the `lazy_partitions` input metadata value can be set to `True` to load multiple upstream
+       partitions as a mapping that loads each partition when it is accessed, instead of loading
+       all of them up front. The input should then have the `Any` type annotation (or none), since
+       type checking a `Dict` input would load every partition.
 
     """
 
@@ -34,10 +67,18 @@ class UPathIOManager(MemoizableIOManager):
     def __init__(
         self,
         base_path: UPath,
+        max_concurrent_partition_loads: int = 1,
     ):
         assert self.extension == "" or "." in self.extension
 
         self._base_path = base_path
+        self._max_concurrent_partition_loads = check.int_param(
+            max_concurrent_partition_loads, "max_concurrent_partition_loads"
+        )
+        check.invariant(
+            self._max_concurrent_partition_loads > 0,
+            "max_concurrent_partition_loads must be positive",
+        )
 
     @abstractmethod
     def dump_to_path(self, context: OutputContext, obj: Any, path: UPath):
@@ -102,31 +143,80 @@ def _load_single_input(self, path: UPath, context: InputContext) -> Any:
         context.add_input_metadata({"path": MetadataValue.path(str(path))})
         return obj
 
-    def _load_multiple_inputs(self, context: InputContext) -> Dict[str, Any]:
+    def _load_multiple_inputs(self, context: InputContext) -> Mapping[str, Any]:
         # load multiple partitions
-        allow_missing_partitions = (
-            context.metadata.get("allow_missing_partitions", False)
-            if context.metadata is not None
-            else False
+        input_metadata = context.metadata or {}
+        allow_missing_partitions = input_metadata.get("allow_missing_partitions", False)
+        max_concurrent_partition_loads = check.int_param(
+            input_metadata.get(
+                "max_concurrent_partition_loads", self._max_concurrent_partition_loads
+            ),
+            "max_concurrent_partition_loads",
         )
 
-        objs: Dict[str, Any] = {}
         paths = self._get_paths_for_partitions(context)
 
+        if input_metadata.get("lazy_partitions", False):
+            check.invariant(
+                context.dagster_type.typing_type == Any,
+                (
+                    f"Received `{context.dagster_type.typing_type}` type in input of DagsterType"
+                    f" {context.dagster_type}, but lazily loaded partitions can't be type checked"
+                    " without loading all of them. Inputs with lazy_partitions=True in their"
+                    " metadata should have the `Any` type annotation or no type annotation."
+                ),
+            )
+            if allow_missing_partitions:
+                paths = {
+                    partition_key: path for partition_key, path in paths.items() if path.exists()
+                }
+            context.log.debug(f"Lazily loading {len(paths)} partitions...")
+            return LazyPartitionsMapping(
+                paths, lambda path: self.load_from_path(context=context, path=path)
+            )
+
         context.log.debug(f"Loading {len(paths)} partitions...")
 
-        for partition_key, path in paths.items():
-            context.log.debug(f"Loading partition from {path} using {self.__class__.__name__}")
+        # a sentinel distinguishes skipped partitions from partitions whose value is None
+        missing = object()
+
+        def _load(path: UPath) -> Any:
+            # logging is left to the calling thread, since log calls may write to the instance
             try:
-                obj = self.load_from_path(context=context, path=path)
-                objs[partition_key] = obj
+                return self.load_from_path(context=context, path=path)
             except FileNotFoundError as e:
                 if not allow_missing_partitions:
                     raise e
+                return missing
+
+        if max_concurrent_partition_loads > 1 and len(paths) > 1:
+            context.log.debug(
+                f"Loading partitions from {self._get_path_without_extension(context)} using"
+                f" {self.__class__.__name__} with up to {max_concurrent_partition_loads} concurrent"
+                " loads"
+            )
+            # loading partitions is typically I/O bound, so threads allow multiple requests to the
+            # underlying filesystem to be in flight at once
+            with ThreadPoolExecutor(
+                max_workers=min(max_concurrent_partition_loads, len(paths)),
+                thread_name_prefix="upath_io_manager",
+            ) as executor:
+                loaded = list(executor.map(_load, paths.values()))
+        else:
+            loaded = []
+            for path in paths.values():
+                context.log.debug(f"Loading partition from {path} using {self.__class__.__name__}")
+                loaded.append(_load(path))
+
+        objs: Dict[str, Any] = {}
+        for (partition_key, path), obj in zip(paths.items(), loaded):
+            if obj is missing:
                 context.log.debug(
                     f"Couldn't load partition {path} and skipped it "
                     "because the input metadata includes allow_missing_partitions=True"
                 )
+            else:
+                objs[partition_key] = obj
 
         # TODO: context.add_output_metadata fails in the partitioned context. this should be fixed?
         return objs
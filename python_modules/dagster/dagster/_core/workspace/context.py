@@ -59,6 +59,7 @@
         ExternalPartitionSetExecutionParamData,
         ExternalPartitionTagsData,
     )
+    from dagster._grpc.client import GrpcClientMetricsSnapshot
 
 T = TypeVar("T")
 
@@ -166,6 +167,14 @@ def repository_locations(self) -> Sequence[RepositoryLocation]:
     def repository_location_names(self) -> Sequence[str]:
         return list(self.get_workspace_snapshot())
 
+    def get_grpc_client_metrics(self) -> Mapping[str, "GrpcClientMetricsSnapshot"]:
+        """Connection reuse and call latency metrics for each location served over gRPC."""
+        return {
+            location.name: location.client.metrics
+            for location in self.repository_locations
+            if isinstance(location, GrpcServerRepositoryLocation)
+        }
+
     def repository_location_errors(self) -> Sequence[SerializableErrorInfo]:
         return [
             entry.load_error for entry in self.get_workspace_snapshot().values() if entry.load_error
@@ -1,9 +1,10 @@
+import datetime
 import sys
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import ExitStack
-from typing import Dict, Iterable, List, Optional, Sequence
+from typing import Dict, List, Optional, Sequence
 
 from dagster import (
     DagsterEvent,
@@ -22,16 +23,25 @@
     IN_PROGRESS_RUN_STATUSES,
     DagsterRun,
     DagsterRunStatus,
+    RunQueueEntry,
     RunsFilter,
 )
-from dagster._core.storage.tags import PRIORITY_TAG
 from dagster._core.workspace.context import IWorkspaceProcessContext
 from dagster._core.workspace.workspace import IWorkspace
 from dagster._daemon.daemon import IntervalDaemon, TDaemonGenerator
-from dagster._utils import len_iter
 from dagster._utils.error import serializable_error_info_from_exc_info
 from dagster._utils.tags import TagConcurrencyLimitsCounter
 
+# how often the full set of in progress runs is reloaded, rather than updated incrementally
+IN_PROGRESS_RUNS_RESYNC_INTERVAL_SECONDS = 300
+# window of run updates that is re-read on each incremental update, to tolerate updates that are
+# committed out of timestamp order
+RUN_UPDATE_OVERLAP = datetime.timedelta(seconds=30)
+# number of queued runs to read at once when selecting the runs to dequeue
+RUN_QUEUE_PAGE_SIZE = 1000
+# number of runs to load at once when fetching the runs selected for dequeuing
+RUN_FETCH_PAGE_SIZE = 100
+
 
 class QueuedRunCoordinatorDaemon(IntervalDaemon):
     """
@@ -44,6 +54,9 @@ def __init__(self, interval_seconds):
         self._executor = None
         self._location_timeouts_lock = threading.Lock()
         self._location_timeouts: Dict[str, float] = {}
+        self._in_progress_runs: Dict[str, RunQueueEntry] = {}
+        self._in_progress_runs_synced_at: Optional[float] = None
+        self._in_progress_runs_updated_at: Optional[datetime.datetime] = None
         super().__init__(interval_seconds)
 
     def _get_executor(self, max_workers) -> ThreadPoolExecutor:
@@ -195,23 +208,17 @@ def _get_runs_to_dequeue(
         in_progress_runs = self._get_in_progress_runs(instance)
 
         max_concurrent_runs_enabled = max_concurrent_runs != -1  # setting to -1 disables the limit
-        max_runs_to_launch = max_concurrent_runs - len_iter(in_progress_runs)
+        max_runs_to_launch = max_concurrent_runs - len(in_progress_runs)
         if max_concurrent_runs_enabled:
             # Possibly under 0 if runs were launched without queuing
             if max_runs_to_launch <= 0:
                 self._logger.info(
                     "{} runs are currently in progress. Maximum is {}, won't launch more.".format(
-                        len_iter(in_progress_runs), max_concurrent_runs
+                        len(in_progress_runs), max_concurrent_runs
                     )
                 )
                 return []
 
-        queued_runs = self._get_queued_runs(instance)
-
-        if not queued_runs:
-            self._logger.debug("Poll returned no queued runs.")
-            return []
-
         now = fixed_iteration_time or time.time()
 
         with self._location_timeouts_lock:
@@ -221,62 +228,125 @@ def _get_runs_to_dequeue(
                 if self._location_timeouts[location_name] > now
             }
 
-        locations_clause = ""
-        if paused_location_names:
-            locations_clause = (
-                " Temporarily skipping runs from the following locations due to a user code error: "
-                + ",".join(list(paused_location_names))
-            )
-
-        self._logger.info(
-            f"Retrieved %d queued runs, checking limits.{locations_clause}", len(queued_runs)
-        )
-
-        # place in order
-        sorted_runs = self._priority_sort(queued_runs)
         tag_concurrency_limits_counter = TagConcurrencyLimitsCounter(
             tag_concurrency_limits, in_progress_runs
         )
 
-        batch: List[DagsterRun] = []
-        for run in sorted_runs:
-            if max_concurrent_runs_enabled and len(batch) >= max_runs_to_launch:
+        # the queue is read a page at a time, in priority and then fifo order, until enough runs
+        # have been selected to fill the available concurrency
+        batch: List[RunQueueEntry] = []
+        num_checked_runs = 0
+        cursor = None
+        while not (max_concurrent_runs_enabled and len(batch) >= max_runs_to_launch):
+            queued_entries = self._get_queued_run_entries(
+                instance, limit=RUN_QUEUE_PAGE_SIZE, cursor=cursor
+            )
+
+            for entry in queued_entries:
+                if max_concurrent_runs_enabled and len(batch) >= max_runs_to_launch:
+                    break
+
+                num_checked_runs += 1
+
+                if tag_concurrency_limits_counter.is_blocked(entry):
+                    continue
+
+                if entry.location_name and entry.location_name in paused_location_names:
+                    continue
+
+                tag_concurrency_limits_counter.update_counters_with_launched_item(entry)
+                batch.append(entry)
+
+            if len(queued_entries) < RUN_QUEUE_PAGE_SIZE:
                 break
+            cursor = queued_entries[-1].run_id
 
-            if tag_concurrency_limits_counter.is_blocked(run):
-                continue
+        if not num_checked_runs:
+            self._logger.debug("Poll returned no queued runs.")
+            return []
 
-            location_name = (
-                run.external_pipeline_origin.location_name if run.external_pipeline_origin else None
+        locations_clause = ""
+        if paused_location_names:
+            locations_clause = (
+                " Temporarily skipping runs from the following locations due to a user code error: "
+                + ",".join(list(paused_location_names))
             )
-            if location_name and location_name in paused_location_names:
-                continue
-
-            tag_concurrency_limits_counter.update_counters_with_launched_item(run)
-            batch.append(run)
 
-        return batch
+        self._logger.info(
+            f"Checked limits for %d queued runs, selected %d to launch.{locations_clause}",
+            num_checked_runs,
+            len(batch),
+        )
 
-    def _get_queued_runs(self, instance):
-        queued_runs_filter = RunsFilter(statuses=[DagsterRunStatus.QUEUED])
+        return self._get_runs_for_entries(instance, batch)
 
-        # Reversed for fifo ordering
-        runs = instance.get_runs(filters=queued_runs_filter)[::-1]
+    def _get_runs_for_entries(
+        self, instance: DagsterInstance, entries: Sequence[RunQueueEntry]
+    ) -> List[DagsterRun]:
+        # only the runs that are about to be dequeued are fully loaded
+        runs: List[DagsterRun] = []
+        for i in range(0, len(entries), RUN_FETCH_PAGE_SIZE):
+            page = entries[i : i + RUN_FETCH_PAGE_SIZE]
+            runs_by_id = {
+                run.run_id: run
+                for run in instance.get_runs(
+                    filters=RunsFilter(run_ids=[entry.run_id for entry in page])
+                )
+            }
+            runs.extend(runs_by_id[entry.run_id] for entry in page if entry.run_id in runs_by_id)
         return runs
 
-    def _get_in_progress_runs(self, instance: DagsterInstance) -> Iterable[DagsterRun]:
-        return instance.get_runs(filters=RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES))
+    def _get_queued_run_entries(
+        self, instance: DagsterInstance, limit: int, cursor: Optional[str]
+    ) -> Sequence[RunQueueEntry]:
+        return instance.get_run_queue_entries(
+            statuses=[DagsterRunStatus.QUEUED], limit=limit, cursor=cursor
+        )
 
-    def _priority_sort(self, runs: Iterable[DagsterRun]) -> Sequence[DagsterRun]:
-        def get_priority(run):
-            priority_tag_value = run.tags.get(PRIORITY_TAG, "0")
-            try:
-                return int(priority_tag_value)
-            except ValueError:
-                return 0
+    def _get_in_progress_runs(self, instance: DagsterInstance) -> List[RunQueueEntry]:
+        """Returns the in progress runs, which are tracked incrementally between iterations.
+
+        The full set of in progress runs is periodically reloaded. In between, only the runs that
+        were updated since the last observed update are fetched, and are added to or removed from
+        the tracked set based on their new status.
+        """
+        now = time.time()
+        if (
+            self._in_progress_runs_synced_at is None
+            or now - self._in_progress_runs_synced_at > IN_PROGRESS_RUNS_RESYNC_INTERVAL_SECONDS
+        ):
+            # start watching for updates from the most recently updated run, so that the first
+            # incremental update does not have to read every run since the oldest in progress one
+            latest_records = instance.get_run_records(limit=1, order_by="update_timestamp")
+            self._in_progress_runs_updated_at = (
+                latest_records[0].update_timestamp if latest_records else None
+            )
+            entries = instance.get_run_queue_entries(statuses=IN_PROGRESS_RUN_STATUSES)
+            self._in_progress_runs = {entry.run_id: entry for entry in entries}
+            self._in_progress_runs_synced_at = now
+        else:
+            updated_after = (
+                self._in_progress_runs_updated_at - RUN_UPDATE_OVERLAP
+                if self._in_progress_runs_updated_at
+                else None
+            )
+            entries = instance.get_run_queue_entries(updated_after=updated_after)
+            for entry in entries:
+                if entry.status in IN_PROGRESS_RUN_STATUSES:
+                    self._in_progress_runs[entry.run_id] = entry
+                else:
+                    self._in_progress_runs.pop(entry.run_id, None)
+
+        # only advance the watermark with timestamps read from storage, so that it is not affected
+        # by clock differences between the daemon and the processes that update the runs
+        for entry in entries:
+            if (
+                self._in_progress_runs_updated_at is None
+                or entry.update_timestamp > self._in_progress_runs_updated_at
+            ):
+                self._in_progress_runs_updated_at = entry.update_timestamp
 
-        # sorted is stable, so fifo is maintained
-        return sorted(runs, key=get_priority, reverse=True)
+        return list(self._in_progress_runs.values())
 
     def _is_location_pausing_dequeues(self, location_name, now):
         with self._location_timeouts_lock:
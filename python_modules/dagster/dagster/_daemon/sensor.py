@@ -7,7 +7,19 @@
 from collections import defaultdict
 from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import ExitStack
-from typing import Dict, Generator, List, Mapping, NamedTuple, Optional, Sequence, Union
+from typing import (
+    Any,
+    Dict,
+    Generator,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import pendulum
 
@@ -17,10 +29,16 @@
 from dagster._core.definitions.selector import PipelineSelector
 from dagster._core.definitions.sensor_definition import DefaultSensorStatus, SensorExecutionData
 from dagster._core.definitions.utils import validate_tags
-from dagster._core.errors import DagsterError
+from dagster._core.errors import DagsterError, DagsterUserCodeProcessError
 from dagster._core.host_representation.external import ExternalPipeline, ExternalSensor
-from dagster._core.host_representation.external_data import ExternalTargetData
-from dagster._core.host_representation.repository_location import RepositoryLocation
+from dagster._core.host_representation.external_data import (
+    ExternalSensorExecutionErrorData,
+    ExternalTargetData,
+)
+from dagster._core.host_representation.repository_location import (
+    RepositoryLocation,
+    SensorExecutionRequest,
+)
 from dagster._core.instance import DagsterInstance
 from dagster._core.scheduler.instigation import (
     InstigatorState,
@@ -194,6 +212,70 @@ def __exit__(self, exception_type, exception_value, traceback):
             )
 
 
+class SensorTickLatency(
+    NamedTuple(
+        "_SensorTickLatency",
+        [
+            ("sensor_name", str),
+            ("num_ticks", int),
+            ("last_latency", float),
+            ("max_latency", float),
+            ("total_latency", float),
+        ],
+    )
+):
+    """Latency statistics, in seconds, for the ticks evaluated for a single sensor."""
+
+    @property
+    def mean_latency(self) -> float:
+        return self.total_latency / self.num_ticks if self.num_ticks else 0.0
+
+
+class SensorTickMetrics:
+    """Tracks the latency of each sensor tick, from tick creation until the tick is written, keyed
+    by sensor selector id. Safe to update from the daemon worker threads.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._latencies: Dict[str, SensorTickLatency] = {}
+
+    def record_tick(self, external_sensor: ExternalSensor, latency: float) -> None:
+        with self._lock:
+            existing = self._latencies.get(external_sensor.selector_id)
+            if existing:
+                self._latencies[external_sensor.selector_id] = SensorTickLatency(
+                    sensor_name=external_sensor.name,
+                    num_ticks=existing.num_ticks + 1,
+                    last_latency=latency,
+                    max_latency=max(existing.max_latency, latency),
+                    total_latency=existing.total_latency + latency,
+                )
+            else:
+                self._latencies[external_sensor.selector_id] = SensorTickLatency(
+                    sensor_name=external_sensor.name,
+                    num_ticks=1,
+                    last_latency=latency,
+                    max_latency=latency,
+                    total_latency=latency,
+                )
+
+    def get_tick_latencies(self) -> Mapping[str, SensorTickLatency]:
+        with self._lock:
+            return dict(self._latencies)
+
+    def log_summary(self, logger: logging.Logger) -> None:
+        latencies = sorted(
+            self.get_tick_latencies().values(), key=lambda latency: -latency.max_latency
+        )
+        for latency in latencies:
+            logger.info(
+                f"Sensor {latency.sensor_name} tick latency over {latency.num_ticks} ticks: "
+                f"last {latency.last_latency:.2f}s, mean {latency.mean_latency:.2f}s, "
+                f"max {latency.max_latency:.2f}s"
+            )
+
+
 def _check_for_debug_crash(debug_crash_flags, key):
     if not debug_crash_flags:
         return
@@ -224,6 +306,7 @@ def execute_sensor_iteration_loop(
     """
     sensor_state_lock = threading.Lock()
     sensor_tick_futures: Dict[str, Future] = {}
+    sensor_tick_metrics = SensorTickMetrics()
     with ExitStack() as stack:
         settings = workspace_process_context.instance.get_settings("sensors")
         if settings.get("use_threads"):
@@ -254,11 +337,20 @@ def execute_sensor_iteration_loop(
                 sensor_tick_futures=sensor_tick_futures,
                 sensor_state_lock=sensor_state_lock,
                 log_verbose_checks=verbose_logs_iteration,
+                sensor_tick_metrics=sensor_tick_metrics,
             )
             # Yield to check for heartbeats in case there were no yields within
             # execute_sensor_iteration
             yield None
 
+            if verbose_logs_iteration:
+                sensor_tick_metrics.log_summary(logger)
+                request_context = workspace_process_context.create_request_context()
+                for location_name, metrics in request_context.get_grpc_client_metrics().items():
+                    logger.info(
+                        f"gRPC client metrics for location {location_name}: {metrics.summary()}"
+                    )
+
             end_time = pendulum.now("UTC").timestamp()
 
             if verbose_logs_iteration:
@@ -279,12 +371,17 @@ def execute_sensor_iteration(
     sensor_state_lock: Optional[threading.Lock] = None,
     log_verbose_checks: bool = True,
     debug_crash_flags=None,
+    sensor_tick_metrics: Optional[SensorTickMetrics] = None,
 ):
     instance = workspace_process_context.instance
 
     if not sensor_state_lock:
         sensor_state_lock = threading.Lock()
 
+    settings = instance.get_settings("sensors")
+    batch_size = settings.get("batch_size") or 1
+    max_concurrent_batches_per_location = settings.get("max_concurrent_batches_per_location")
+
     workspace_snapshot = {
         location_entry.origin.location_name: location_entry
         for location_entry in workspace_process_context.create_request_context()
@@ -363,6 +460,10 @@ def execute_sensor_iteration(
         yield
         return
 
+    # when batching, sensors are grouped by location so that each location can evaluate several
+    # sensors in a single request
+    sensors_to_batch_by_location: Dict[str, List[_SensorToEvaluate]] = defaultdict(list)
+
     for external_sensor in sensors.values():
         sensor_name = external_sensor.name
         sensor_debug_crash_flags = debug_crash_flags.get(sensor_name) if debug_crash_flags else None
@@ -390,6 +491,13 @@ def execute_sensor_iteration(
             ):
                 continue
 
+        if batch_size > 1:
+            sensors_to_batch_by_location[external_sensor.handle.location_name].append(
+                _SensorToEvaluate(external_sensor, sensor_state, sensor_debug_crash_flags)
+            )
+            continue
+
+        if threadpool_executor:
             future = threadpool_executor.submit(
                 _process_tick,
                 workspace_process_context,
@@ -399,6 +507,7 @@ def execute_sensor_iteration(
                 sensor_state_lock,
                 sensor_debug_crash_flags,
                 tick_retention_settings,
+                sensor_tick_metrics,
             )
             sensor_tick_futures[external_sensor.selector_id] = future
             yield
@@ -414,7 +523,64 @@ def execute_sensor_iteration(
                 sensor_state_lock,
                 sensor_debug_crash_flags,
                 tick_retention_settings,
+                sensor_tick_metrics,
+            )
+
+    for location_name, sensors_to_evaluate in sensors_to_batch_by_location.items():
+        batches = [
+            sensors_to_evaluate[i : i + batch_size]
+            for i in range(0, len(sensors_to_evaluate), batch_size)
+        ]
+
+        if not threadpool_executor:
+            for batch in batches:
+                yield from _process_tick_batch_generator(
+                    workspace_process_context,
+                    logger,
+                    location_name,
+                    batch,
+                    sensor_state_lock,
+                    tick_retention_settings,
+                    sensor_tick_metrics,
+                )
+            continue
+
+        tick_futures = check.not_none(sensor_tick_futures)
+        location_selector_ids = {
+            sensor.selector_id
+            for sensor in sensors.values()
+            if sensor.handle.location_name == location_name
+        }
+        num_batches_in_flight = len(
+            {
+                id(future)
+                for selector_id, future in tick_futures.items()
+                if selector_id in location_selector_ids and not future.done()
+            }
+        )
+        for batch in batches:
+            if (
+                max_concurrent_batches_per_location is not None
+                and num_batches_in_flight >= max_concurrent_batches_per_location
+            ):
+                # the remaining sensors will be picked up on a later iteration, once the
+                # location has capacity again
+                break
+
+            future = threadpool_executor.submit(
+                _process_tick_batch,
+                workspace_process_context,
+                logger,
+                location_name,
+                batch,
+                sensor_state_lock,
+                tick_retention_settings,
+                sensor_tick_metrics,
             )
+            for sensor_to_evaluate in batch:
+                tick_futures[sensor_to_evaluate.external_sensor.selector_id] = future
+            num_batches_in_flight += 1
+            yield
 
 
 def _process_tick(
@@ -425,6 +591,7 @@ def _process_tick(
     sensor_state_lock: threading.Lock,
     sensor_debug_crash_flags,
     tick_retention_settings,
+    sensor_tick_metrics: Optional[SensorTickMetrics] = None,
 ):
     # evaluate the tick immediately, but from within a thread.  The main thread should be able to
     # heartbeat to keep the daemon alive
@@ -437,6 +604,7 @@ def _process_tick(
             sensor_state_lock,
             sensor_debug_crash_flags,
             tick_retention_settings,
+            sensor_tick_metrics,
         )
     )
 
@@ -449,36 +617,18 @@ def _process_tick_generator(
     sensor_state_lock: threading.Lock,
     sensor_debug_crash_flags,
     tick_retention_settings,
+    sensor_tick_metrics: Optional[SensorTickMetrics] = None,
 ):
     instance = workspace_process_context.instance
     error_info = None
-    with sensor_state_lock:
-        # acquire the lock to avoid a race condition where we're updating the recently touched
-        # timestamp on the sensor state, but clobbering it with an older timestamp which might open
-        # us up to a new evaluation being delegated within the minimum interval
-        now = pendulum.now("UTC")
-        sensor_state = check.not_none(
-            instance.get_instigator_state(
-                external_sensor.get_external_origin_id(), external_sensor.selector_id
-            )
-        )
-        if _is_under_min_interval(sensor_state, external_sensor):
-            # check the since we might have been queued before processing
-            return
-        else:
-            _mark_sensor_state_for_tick(instance, external_sensor, sensor_state, now)
+    sensor_state_and_now = _claim_sensor_for_tick(instance, external_sensor, sensor_state_lock)
+    if not sensor_state_and_now:
+        return
+    sensor_state, now = sensor_state_and_now
 
     try:
-        tick = instance.create_tick(
-            TickData(
-                instigator_origin_id=sensor_state.instigator_origin_id,
-                instigator_name=sensor_state.instigator_name,
-                instigator_type=InstigatorType.SENSOR,
-                status=TickStatus.STARTED,
-                timestamp=now.timestamp(),
-                selector_id=external_sensor.selector_id,
-            )
-        )
+        tick = _create_sensor_tick(instance, external_sensor, sensor_state, now)
+        tick_start_time = time.perf_counter()
 
         _check_for_debug_crash(sensor_debug_crash_flags, "TICK_CREATED")
 
@@ -494,6 +644,9 @@ def _process_tick_generator(
                 sensor_debug_crash_flags,
             )
 
+        if sensor_tick_metrics:
+            sensor_tick_metrics.record_tick(external_sensor, time.perf_counter() - tick_start_time)
+
     except Exception:
         error_info = serializable_error_info_from_exc_info(sys.exc_info())
         logger.exception(f"Sensor daemon caught an error for sensor {external_sensor.name}")
@@ -501,6 +654,187 @@ def _process_tick_generator(
     yield error_info
 
 
+class _SensorToEvaluate(NamedTuple):
+    external_sensor: ExternalSensor
+    sensor_state: InstigatorState
+    sensor_debug_crash_flags: Any
+
+
+def _claim_sensor_for_tick(
+    instance: DagsterInstance,
+    external_sensor: ExternalSensor,
+    sensor_state_lock: threading.Lock,
+) -> Optional[Tuple[InstigatorState, datetime.datetime]]:
+    with sensor_state_lock:
+        # acquire the lock to avoid a race condition where we're updating the recently touched
+        # timestamp on the sensor state, but clobbering it with an older timestamp which might open
+        # us up to a new evaluation being delegated within the minimum interval
+        now = pendulum.now("UTC")
+        sensor_state = check.not_none(
+            instance.get_instigator_state(
+                external_sensor.get_external_origin_id(), external_sensor.selector_id
+            )
+        )
+        if _is_under_min_interval(sensor_state, external_sensor):
+            # check the since we might have been queued before processing
+            return None
+
+        _mark_sensor_state_for_tick(instance, external_sensor, sensor_state, now)
+        return sensor_state, now
+
+
+def _create_sensor_tick(
+    instance: DagsterInstance,
+    external_sensor: ExternalSensor,
+    sensor_state: InstigatorState,
+    now: datetime.datetime,
+) -> InstigatorTick:
+    return instance.create_tick(
+        TickData(
+            instigator_origin_id=sensor_state.instigator_origin_id,
+            instigator_name=sensor_state.instigator_name,
+            instigator_type=InstigatorType.SENSOR,
+            status=TickStatus.STARTED,
+            timestamp=now.timestamp(),
+            selector_id=external_sensor.selector_id,
+        )
+    )
+
+
+def _process_tick_batch(
+    workspace_process_context: IWorkspaceProcessContext,
+    logger: logging.Logger,
+    location_name: str,
+    batch: Sequence[_SensorToEvaluate],
+    sensor_state_lock: threading.Lock,
+    tick_retention_settings,
+    sensor_tick_metrics: Optional[SensorTickMetrics] = None,
+):
+    # evaluate the batch from within a thread, so that the main thread can keep heartbeating
+    list(
+        _process_tick_batch_generator(
+            workspace_process_context,
+            logger,
+            location_name,
+            batch,
+            sensor_state_lock,
+            tick_retention_settings,
+            sensor_tick_metrics,
+        )
+    )
+
+
+def _process_tick_batch_generator(
+    workspace_process_context: IWorkspaceProcessContext,
+    logger: logging.Logger,
+    location_name: str,
+    batch: Sequence[_SensorToEvaluate],
+    sensor_state_lock: threading.Lock,
+    tick_retention_settings,
+    sensor_tick_metrics: Optional[SensorTickMetrics] = None,
+):
+    """Evaluates a batch of sensors from the same location with a single request to the location,
+    processing the result of each sensor within its own tick as soon as it is returned.
+    """
+    instance = workspace_process_context.instance
+
+    ticks_to_evaluate = []
+    for sensor_to_evaluate in batch:
+        external_sensor = sensor_to_evaluate.external_sensor
+        sensor_state_and_now = _claim_sensor_for_tick(instance, external_sensor, sensor_state_lock)
+        if not sensor_state_and_now:
+            continue
+        sensor_state, now = sensor_state_and_now
+
+        try:
+            tick = _create_sensor_tick(instance, external_sensor, sensor_state, now)
+            _check_for_debug_crash(sensor_to_evaluate.sensor_debug_crash_flags, "TICK_CREATED")
+        except Exception:
+            logger.exception(f"Sensor daemon caught an error for sensor {external_sensor.name}")
+            yield serializable_error_info_from_exc_info(sys.exc_info())
+            continue
+
+        ticks_to_evaluate.append((sensor_to_evaluate, sensor_state, tick, time.perf_counter()))
+
+    if not ticks_to_evaluate:
+        return
+
+    sensor_execution_requests = []
+    for sensor_to_evaluate, sensor_state, _tick, _start_time in ticks_to_evaluate:
+        instigator_data = _sensor_instigator_data(sensor_state)
+        sensor_execution_requests.append(
+            SensorExecutionRequest(
+                repository_handle=sensor_to_evaluate.external_sensor.handle.repository_handle,
+                name=sensor_to_evaluate.external_sensor.name,
+                last_completion_time=instigator_data.last_tick_timestamp
+                if instigator_data
+                else None,
+                last_run_key=instigator_data.last_run_key if instigator_data else None,
+                cursor=instigator_data.cursor if instigator_data else None,
+            )
+        )
+
+    results: Optional[Iterator[Any]] = None
+    batch_error: Optional[Exception] = None
+    for sensor_to_evaluate, sensor_state, tick, tick_start_time in ticks_to_evaluate:
+        external_sensor = sensor_to_evaluate.external_sensor
+        error_info = None
+        try:
+            with SensorLaunchContext(
+                external_sensor, tick, instance, logger, tick_retention_settings, sensor_state_lock
+            ) as tick_context:
+                _check_for_debug_crash(sensor_to_evaluate.sensor_debug_crash_flags, "TICK_HELD")
+                tick_context.logger.info(
+                    f"Checking for new runs for sensor: {external_sensor.name}"
+                )
+
+                # a failure to evaluate the batch as a whole fails every remaining tick in it
+                if batch_error:
+                    raise batch_error
+
+                try:
+                    if results is None:
+                        repo_location = workspace_process_context.create_request_context().get_repository_location(
+                            location_name
+                        )
+                        results = iter(
+                            repo_location.get_external_sensor_execution_data_batch(
+                                instance, sensor_execution_requests
+                            )
+                        )
+                    result = next(results, None)
+                    if result is None:
+                        raise DagsterSensorDaemonError(
+                            f"Location {location_name} did not return a result for sensor"
+                            f" {external_sensor.name}"
+                        )
+                except Exception as e:
+                    batch_error = e
+                    raise
+
+                if isinstance(result, ExternalSensorExecutionErrorData):
+                    raise DagsterUserCodeProcessError.from_error_info(result.error)
+
+                yield from _evaluate_sensor(
+                    workspace_process_context,
+                    tick_context,
+                    external_sensor,
+                    sensor_state,
+                    sensor_to_evaluate.sensor_debug_crash_flags,
+                    sensor_runtime_data=result,
+                )
+
+            if sensor_tick_metrics:
+                sensor_tick_metrics.record_tick(
+                    external_sensor, time.perf_counter() - tick_start_time
+                )
+        except Exception:
+            error_info = serializable_error_info_from_exc_info(sys.exc_info())
+            logger.exception(f"Sensor daemon caught an error for sensor {external_sensor.name}")
+
+        yield error_info
+
+
 def _sensor_instigator_data(state: InstigatorState) -> Optional[SensorInstigatorData]:
     instigator_data = state.instigator_data
     if instigator_data is None or isinstance(instigator_data, SensorInstigatorData):
@@ -537,9 +871,9 @@ def _evaluate_sensor(
     external_sensor: ExternalSensor,
     state: InstigatorState,
     sensor_debug_crash_flags=None,
+    sensor_runtime_data: Optional[SensorExecutionData] = None,
 ):
     instance = workspace_process_context.instance
-    context.logger.info(f"Checking for new runs for sensor: {external_sensor.name}")
 
     sensor_origin = external_sensor.get_external_origin()
     repository_handle = external_sensor.handle.repository_handle
@@ -547,16 +881,20 @@ def _evaluate_sensor(
         sensor_origin.external_repository_origin.repository_location_origin.location_name
     )
 
-    instigator_data = _sensor_instigator_data(state)
+    # sensors evaluated as part of a batch are passed in with their already-fetched result
+    if sensor_runtime_data is None:
+        context.logger.info(f"Checking for new runs for sensor: {external_sensor.name}")
 
-    sensor_runtime_data = repo_location.get_external_sensor_execution_data(
-        instance,
-        repository_handle,
-        external_sensor.name,
-        instigator_data.last_tick_timestamp if instigator_data else None,
-        instigator_data.last_run_key if instigator_data else None,
-        instigator_data.cursor if instigator_data else None,
-    )
+        instigator_data = _sensor_instigator_data(state)
+
+        sensor_runtime_data = repo_location.get_external_sensor_execution_data(
+            instance,
+            repository_handle,
+            external_sensor.name,
+            instigator_data.last_tick_timestamp if instigator_data else None,
+            instigator_data.last_run_key if instigator_data else None,
+            instigator_data.cursor if instigator_data else None,
+        )
 
     yield
 
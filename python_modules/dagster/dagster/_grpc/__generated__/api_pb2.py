@@ -72,9 +72,12 @@
         b" \x01(\t\x12\x10\n\x08job_name\x18\x02"
         b' \x01(\t"I\n\x10\x45xternalJobReply\x12\x1b\n\x13serialized_job_data\x18\x01'
         b" \x01(\t\x12\x18\n\x10serialized_error\x18\x02"
-        b' \x01(\t2\xd3\x0e\n\nDagsterApi\x12*\n\x04Ping\x12\x10.api.PingRequest\x1a\x0e.api.PingReply"\x00\x12/\n\tHeartbeat\x12\x10.api.PingRequest\x1a\x0e.api.PingReply"\x00\x12G\n\rStreamingPing\x12\x19.api.StreamingPingRequest\x1a\x17.api.StreamingPingEvent"\x00\x30\x01\x12\x32\n\x0bGetServerId\x12\n.api.Empty\x1a\x15.api.GetServerIdReply"\x00\x12]\n\x15\x45xecutionPlanSnapshot\x12!.api.ExecutionPlanSnapshotRequest\x1a\x1f.api.ExecutionPlanSnapshotReply"\x00\x12N\n\x10ListRepositories\x12\x1c.api.ListRepositoriesRequest\x1a\x1a.api.ListRepositoriesReply"\x00\x12`\n\x16\x45xternalPartitionNames\x12".api.ExternalPartitionNamesRequest\x1a'
+        b' \x01(\t"\x81\x01\n#ExternalRepositoryIfModifiedRequest\x12+\n#serialized_repository_python_origin\x18\x01'
+        b" \x01(\t\x12\x17\n\x0f\x64\x65\x66\x65r_snapshots\x18\x02"
+        b" \x01(\x08\x12\x14\n\x0c\x63ontent_hash\x18\x03"
+        b' \x01(\t2\xb4\x10\n\nDagsterApi\x12*\n\x04Ping\x12\x10.api.PingRequest\x1a\x0e.api.PingReply"\x00\x12/\n\tHeartbeat\x12\x10.api.PingRequest\x1a\x0e.api.PingReply"\x00\x12G\n\rStreamingPing\x12\x19.api.StreamingPingRequest\x1a\x17.api.StreamingPingEvent"\x00\x30\x01\x12\x32\n\x0bGetServerId\x12\n.api.Empty\x1a\x15.api.GetServerIdReply"\x00\x12]\n\x15\x45xecutionPlanSnapshot\x12!.api.ExecutionPlanSnapshotRequest\x1a\x1f.api.ExecutionPlanSnapshotReply"\x00\x12N\n\x10ListRepositories\x12\x1c.api.ListRepositoriesRequest\x1a\x1a.api.ListRepositoriesReply"\x00\x12`\n\x16\x45xternalPartitionNames\x12".api.ExternalPartitionNamesRequest\x1a'
         b' .api.ExternalPartitionNamesReply"\x00\x12Z\n\x14\x45xternalNotebookData\x12'
-        b' .api.ExternalNotebookDataRequest\x1a\x1e.api.ExternalNotebookDataReply"\x00\x12\x63\n\x17\x45xternalPartitionConfig\x12#.api.ExternalPartitionConfigRequest\x1a!.api.ExternalPartitionConfigReply"\x00\x12]\n\x15\x45xternalPartitionTags\x12!.api.ExternalPartitionTagsRequest\x1a\x1f.api.ExternalPartitionTagsReply"\x00\x12t\n#ExternalPartitionSetExecutionParams\x12/.api.ExternalPartitionSetExecutionParamsRequest\x1a\x18.api.StreamingChunkEvent"\x00\x30\x01\x12x\n\x1e\x45xternalPipelineSubsetSnapshot\x12*.api.ExternalPipelineSubsetSnapshotRequest\x1a(.api.ExternalPipelineSubsetSnapshotReply"\x00\x12T\n\x12\x45xternalRepository\x12\x1e.api.ExternalRepositoryRequest\x1a\x1c.api.ExternalRepositoryReply"\x00\x12?\n\x0b\x45xternalJob\x12\x17.api.ExternalJobRequest\x1a\x15.api.ExternalJobReply"\x00\x12h\n\x1bStreamingExternalRepository\x12\x1e.api.ExternalRepositoryRequest\x1a%.api.StreamingExternalRepositoryEvent"\x00\x30\x01\x12`\n\x19\x45xternalScheduleExecution\x12%.api.ExternalScheduleExecutionRequest\x1a\x18.api.StreamingChunkEvent"\x00\x30\x01\x12\\\n\x17\x45xternalSensorExecution\x12#.api.ExternalSensorExecutionRequest\x1a\x18.api.StreamingChunkEvent"\x00\x30\x01\x12\x38\n\x0eShutdownServer\x12\n.api.Empty\x1a\x18.api.ShutdownServerReply"\x00\x12K\n\x0f\x43\x61ncelExecution\x12\x1b.api.CancelExecutionRequest\x1a\x19.api.CancelExecutionReply"\x00\x12T\n\x12\x43\x61nCancelExecution\x12\x1e.api.CanCancelExecutionRequest\x1a\x1c.api.CanCancelExecutionReply"\x00\x12\x36\n\x08StartRun\x12\x14.api.StartRunRequest\x1a\x12.api.StartRunReply"\x00\x12:\n\x0fGetCurrentImage\x12\n.api.Empty\x1a\x19.api.GetCurrentImageReply"\x00\x12\x38\n\x0eGetCurrentRuns\x12\n.api.Empty\x1a\x18.api.GetCurrentRunsReply"\x00\x62\x06proto3'
+        b' .api.ExternalNotebookDataRequest\x1a\x1e.api.ExternalNotebookDataReply"\x00\x12\x63\n\x17\x45xternalPartitionConfig\x12#.api.ExternalPartitionConfigRequest\x1a!.api.ExternalPartitionConfigReply"\x00\x12]\n\x15\x45xternalPartitionTags\x12!.api.ExternalPartitionTagsRequest\x1a\x1f.api.ExternalPartitionTagsReply"\x00\x12t\n#ExternalPartitionSetExecutionParams\x12/.api.ExternalPartitionSetExecutionParamsRequest\x1a\x18.api.StreamingChunkEvent"\x00\x30\x01\x12x\n\x1e\x45xternalPipelineSubsetSnapshot\x12*.api.ExternalPipelineSubsetSnapshotRequest\x1a(.api.ExternalPipelineSubsetSnapshotReply"\x00\x12T\n\x12\x45xternalRepository\x12\x1e.api.ExternalRepositoryRequest\x1a\x1c.api.ExternalRepositoryReply"\x00\x12?\n\x0b\x45xternalJob\x12\x17.api.ExternalJobRequest\x1a\x15.api.ExternalJobReply"\x00\x12h\n\x1bStreamingExternalRepository\x12\x1e.api.ExternalRepositoryRequest\x1a%.api.StreamingExternalRepositoryEvent"\x00\x30\x01\x12|\n%StreamingExternalRepositoryIfModified\x12(.api.ExternalRepositoryIfModifiedRequest\x1a%.api.StreamingExternalRepositoryEvent"\x00\x30\x01\x12`\n\x19\x45xternalScheduleExecution\x12%.api.ExternalScheduleExecutionRequest\x1a\x18.api.StreamingChunkEvent"\x00\x30\x01\x12\\\n\x17\x45xternalSensorExecution\x12#.api.ExternalSensorExecutionRequest\x1a\x18.api.StreamingChunkEvent"\x00\x30\x01\x12\x61\n\x1c\x45xternalSensorExecutionBatch\x12#.api.ExternalSensorExecutionRequest\x1a\x18.api.StreamingChunkEvent"\x00\x30\x01\x12\x38\n\x0eShutdownServer\x12\n.api.Empty\x1a\x18.api.ShutdownServerReply"\x00\x12K\n\x0f\x43\x61ncelExecution\x12\x1b.api.CancelExecutionRequest\x1a\x19.api.CancelExecutionReply"\x00\x12T\n\x12\x43\x61nCancelExecution\x12\x1e.api.CanCancelExecutionRequest\x1a\x1c.api.CanCancelExecutionReply"\x00\x12\x36\n\x08StartRun\x12\x14.api.StartRunRequest\x1a\x12.api.StartRunReply"\x00\x12:\n\x0fGetCurrentImage\x12\n.api.Empty\x1a\x19.api.GetCurrentImageReply"\x00\x12\x38\n\x0eGetCurrentRuns\x12\n.api.Empty\x1a\x18.api.GetCurrentRunsReply"\x00\x62\x06proto3'
     ),
 )
 
@@ -1737,6 +1740,85 @@
     serialized_end=2703,
 )
 
+
+_EXTERNALREPOSITORYIFMODIFIEDREQUEST = _descriptor.Descriptor(
+    name="ExternalRepositoryIfModifiedRequest",
+    full_name="api.ExternalRepositoryIfModifiedRequest",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    create_key=_descriptor._internal_create_key,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="serialized_repository_python_origin",
+            full_name="api.ExternalRepositoryIfModifiedRequest.serialized_repository_python_origin",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"".decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="defer_snapshots",
+            full_name="api.ExternalRepositoryIfModifiedRequest.defer_snapshots",
+            index=1,
+            number=2,
+            type=8,
+            cpp_type=7,
+            label=1,
+            has_default_value=False,
+            default_value=False,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="content_hash",
+            full_name="api.ExternalRepositoryIfModifiedRequest.content_hash",
+            index=2,
+            number=3,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"".decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=2706,
+    serialized_end=2835,
+)
+
 DESCRIPTOR.message_types_by_name["Empty"] = _EMPTY
 DESCRIPTOR.message_types_by_name["PingRequest"] = _PINGREQUEST
 DESCRIPTOR.message_types_by_name["PingReply"] = _PINGREPLY
@@ -1785,6 +1867,9 @@
 DESCRIPTOR.message_types_by_name["GetCurrentRunsReply"] = _GETCURRENTRUNSREPLY
 DESCRIPTOR.message_types_by_name["ExternalJobRequest"] = _EXTERNALJOBREQUEST
 DESCRIPTOR.message_types_by_name["ExternalJobReply"] = _EXTERNALJOBREPLY
+DESCRIPTOR.message_types_by_name[
+    "ExternalRepositoryIfModifiedRequest"
+] = _EXTERNALREPOSITORYIFMODIFIEDREQUEST
 _sym_db.RegisterFileDescriptor(DESCRIPTOR)
 
 Empty = _reflection.GeneratedProtocolMessageType(
@@ -2205,6 +2290,17 @@
 )
 _sym_db.RegisterMessage(ExternalJobReply)
 
+ExternalRepositoryIfModifiedRequest = _reflection.GeneratedProtocolMessageType(
+    "ExternalRepositoryIfModifiedRequest",
+    (_message.Message,),
+    {
+        "DESCRIPTOR": _EXTERNALREPOSITORYIFMODIFIEDREQUEST,
+        "__module__": "api_pb2"
+        # @@protoc_insertion_point(class_scope:api.ExternalRepositoryIfModifiedRequest)
+    },
+)
+_sym_db.RegisterMessage(ExternalRepositoryIfModifiedRequest)
+
 
 _DAGSTERAPI = _descriptor.ServiceDescriptor(
     name="DagsterApi",
@@ -2213,8 +2309,8 @@
     index=0,
     serialized_options=None,
     create_key=_descriptor._internal_create_key,
-    serialized_start=2706,
-    serialized_end=4581,
+    serialized_start=2838,
+    serialized_end=4938,
     methods=[
         _descriptor.MethodDescriptor(
             name="Ping",
@@ -2366,10 +2462,20 @@
             serialized_options=None,
             create_key=_descriptor._internal_create_key,
         ),
+        _descriptor.MethodDescriptor(
+            name="StreamingExternalRepositoryIfModified",
+            full_name="api.DagsterApi.StreamingExternalRepositoryIfModified",
+            index=15,
+            containing_service=None,
+            input_type=_EXTERNALREPOSITORYIFMODIFIEDREQUEST,
+            output_type=_STREAMINGEXTERNALREPOSITORYEVENT,
+            serialized_options=None,
+            create_key=_descriptor._internal_create_key,
+        ),
         _descriptor.MethodDescriptor(
             name="ExternalScheduleExecution",
             full_name="api.DagsterApi.ExternalScheduleExecution",
-            index=15,
+            index=16,
             containing_service=None,
             input_type=_EXTERNALSCHEDULEEXECUTIONREQUEST,
             output_type=_STREAMINGCHUNKEVENT,
@@ -2379,7 +2485,17 @@
         _descriptor.MethodDescriptor(
             name="ExternalSensorExecution",
             full_name="api.DagsterApi.ExternalSensorExecution",
-            index=16,
+            index=17,
+            containing_service=None,
+            input_type=_EXTERNALSENSOREXECUTIONREQUEST,
+            output_type=_STREAMINGCHUNKEVENT,
+            serialized_options=None,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.MethodDescriptor(
+            name="ExternalSensorExecutionBatch",
+            full_name="api.DagsterApi.ExternalSensorExecutionBatch",
+            index=18,
             containing_service=None,
             input_type=_EXTERNALSENSOREXECUTIONREQUEST,
             output_type=_STREAMINGCHUNKEVENT,
@@ -2389,7 +2505,7 @@
         _descriptor.MethodDescriptor(
             name="ShutdownServer",
             full_name="api.DagsterApi.ShutdownServer",
-            index=17,
+            index=19,
             containing_service=None,
             input_type=_EMPTY,
             output_type=_SHUTDOWNSERVERREPLY,
@@ -2399,7 +2515,7 @@
         _descriptor.MethodDescriptor(
             name="CancelExecution",
             full_name="api.DagsterApi.CancelExecution",
-            index=18,
+            index=20,
             containing_service=None,
             input_type=_CANCELEXECUTIONREQUEST,
             output_type=_CANCELEXECUTIONREPLY,
@@ -2409,7 +2525,7 @@
         _descriptor.MethodDescriptor(
             name="CanCancelExecution",
             full_name="api.DagsterApi.CanCancelExecution",
-            index=19,
+            index=21,
             containing_service=None,
             input_type=_CANCANCELEXECUTIONREQUEST,
             output_type=_CANCANCELEXECUTIONREPLY,
@@ -2419,7 +2535,7 @@
         _descriptor.MethodDescriptor(
             name="StartRun",
             full_name="api.DagsterApi.StartRun",
-            index=20,
+            index=22,
             containing_service=None,
             input_type=_STARTRUNREQUEST,
             output_type=_STARTRUNREPLY,
@@ -2429,7 +2545,7 @@
         _descriptor.MethodDescriptor(
             name="GetCurrentImage",
             full_name="api.DagsterApi.GetCurrentImage",
-            index=21,
+            index=23,
             containing_service=None,
             input_type=_EMPTY,
             output_type=_GETCURRENTIMAGEREPLY,
@@ -2439,7 +2555,7 @@
         _descriptor.MethodDescriptor(
             name="GetCurrentRuns",
             full_name="api.DagsterApi.GetCurrentRuns",
-            index=22,
+            index=24,
             containing_service=None,
             input_type=_EMPTY,
             output_type=_GETCURRENTRUNSREPLY,
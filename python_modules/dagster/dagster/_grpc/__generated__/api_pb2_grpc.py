@@ -97,6 +97,11 @@ def __init__(self, channel):
             request_serializer=api__pb2.ExternalRepositoryRequest.SerializeToString,
             response_deserializer=api__pb2.StreamingExternalRepositoryEvent.FromString,
         )
+        self.StreamingExternalRepositoryIfModified = channel.unary_stream(
+            "/api.DagsterApi/StreamingExternalRepositoryIfModified",
+            request_serializer=api__pb2.ExternalRepositoryIfModifiedRequest.SerializeToString,
+            response_deserializer=api__pb2.StreamingExternalRepositoryEvent.FromString,
+        )
         self.ExternalScheduleExecution = channel.unary_stream(
             "/api.DagsterApi/ExternalScheduleExecution",
             request_serializer=api__pb2.ExternalScheduleExecutionRequest.SerializeToString,
@@ -107,6 +112,11 @@ def __init__(self, channel):
             request_serializer=api__pb2.ExternalSensorExecutionRequest.SerializeToString,
             response_deserializer=api__pb2.StreamingChunkEvent.FromString,
         )
+        self.ExternalSensorExecutionBatch = channel.unary_stream(
+            "/api.DagsterApi/ExternalSensorExecutionBatch",
+            request_serializer=api__pb2.ExternalSensorExecutionRequest.SerializeToString,
+            response_deserializer=api__pb2.StreamingChunkEvent.FromString,
+        )
         self.ShutdownServer = channel.unary_unary(
             "/api.DagsterApi/ShutdownServer",
             request_serializer=api__pb2.Empty.SerializeToString,
@@ -232,6 +242,12 @@ def StreamingExternalRepository(self, request, context):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def StreamingExternalRepositoryIfModified(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
     def ExternalScheduleExecution(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -244,6 +260,12 @@ def ExternalSensorExecution(self, request, context):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def ExternalSensorExecutionBatch(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
     def ShutdownServer(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -358,6 +380,11 @@ def add_DagsterApiServicer_to_server(servicer, server):
             request_deserializer=api__pb2.ExternalRepositoryRequest.FromString,
             response_serializer=api__pb2.StreamingExternalRepositoryEvent.SerializeToString,
         ),
+        "StreamingExternalRepositoryIfModified": grpc.unary_stream_rpc_method_handler(
+            servicer.StreamingExternalRepositoryIfModified,
+            request_deserializer=api__pb2.ExternalRepositoryIfModifiedRequest.FromString,
+            response_serializer=api__pb2.StreamingExternalRepositoryEvent.SerializeToString,
+        ),
         "ExternalScheduleExecution": grpc.unary_stream_rpc_method_handler(
             servicer.ExternalScheduleExecution,
             request_deserializer=api__pb2.ExternalScheduleExecutionRequest.FromString,
@@ -368,6 +395,11 @@ def add_DagsterApiServicer_to_server(servicer, server):
             request_deserializer=api__pb2.ExternalSensorExecutionRequest.FromString,
             response_serializer=api__pb2.StreamingChunkEvent.SerializeToString,
         ),
+        "ExternalSensorExecutionBatch": grpc.unary_stream_rpc_method_handler(
+            servicer.ExternalSensorExecutionBatch,
+            request_deserializer=api__pb2.ExternalSensorExecutionRequest.FromString,
+            response_serializer=api__pb2.StreamingChunkEvent.SerializeToString,
+        ),
         "ShutdownServer": grpc.unary_unary_rpc_method_handler(
             servicer.ShutdownServer,
             request_deserializer=api__pb2.Empty.FromString,
@@ -842,6 +874,35 @@ def StreamingExternalRepository(
             metadata,
         )
 
+    @staticmethod
+    def StreamingExternalRepositoryIfModified(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/api.DagsterApi/StreamingExternalRepositoryIfModified",
+            api__pb2.ExternalRepositoryIfModifiedRequest.SerializeToString,
+            api__pb2.StreamingExternalRepositoryIfModifiedEvent.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )
+
     @staticmethod
     def ExternalScheduleExecution(
         request,
@@ -900,6 +961,35 @@ def ExternalSensorExecution(
             metadata,
         )
 
+    @staticmethod
+    def ExternalSensorExecutionBatch(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/api.DagsterApi/ExternalSensorExecutionBatch",
+            api__pb2.ExternalSensorExecutionRequest.SerializeToString,
+            api__pb2.StreamingChunkEvent.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )
+
     @staticmethod
     def ShutdownServer(
         request,
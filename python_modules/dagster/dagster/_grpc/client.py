@@ -1,10 +1,12 @@
 import os
 import subprocess
 import sys
+import threading
+import time
 import warnings
 from contextlib import contextmanager
 from threading import Event
-from typing import Any, Iterator, Optional, Sequence, Tuple
+from typing import Any, Dict, Iterator, List, Mapping, NamedTuple, Optional, Sequence, Tuple
 
 import grpc
 from google.protobuf.reflection import GeneratedProtocolMessageType
@@ -34,8 +36,15 @@
     PartitionSetExecutionParamArgs,
     PipelineSubsetSnapshotArgs,
     SensorExecutionArgs,
+    SensorExecutionBatchArgs,
+)
+from .utils import (
+    default_grpc_timeout,
+    keepalive_time_ms,
+    max_reconnect_backoff_ms,
+    max_rx_bytes,
+    max_send_bytes,
 )
-from .utils import default_grpc_timeout, max_rx_bytes, max_send_bytes
 
 CLIENT_HEARTBEAT_INTERVAL = 1
 
@@ -54,6 +63,87 @@ def client_heartbeat_thread(client: "DagsterGrpcClient", shutdown_event: Event)
             continue
 
 
+class GrpcCallLatency(
+    NamedTuple(
+        "_GrpcCallLatency",
+        [
+            ("num_calls", int),
+            ("num_failures", int),
+            ("total_latency", float),
+            ("max_latency", float),
+        ],
+    )
+):
+    """Latency statistics, in seconds, for the calls made to a single gRPC method."""
+
+    @property
+    def mean_latency(self) -> float:
+        return self.total_latency / self.num_calls if self.num_calls else 0.0
+
+
+class GrpcClientMetricsSnapshot(
+    NamedTuple(
+        "_GrpcClientMetricsSnapshot",
+        [
+            ("channels_created", int),
+            ("channel_reuses", int),
+            ("call_latencies", Mapping[str, GrpcCallLatency]),
+        ],
+    )
+):
+    """A point-in-time view of the metrics collected by a DagsterGrpcClient."""
+
+    @property
+    def num_calls(self) -> int:
+        return sum(latency.num_calls for latency in self.call_latencies.values())
+
+    def summary(self) -> str:
+        return (
+            f"{self.num_calls} calls over {self.channels_created} channel(s), "
+            f"{self.channel_reuses} channel reuses"
+            + "".join(
+                f"; {method}: {latency.num_calls} calls, mean {latency.mean_latency:.3f}s, "
+                f"max {latency.max_latency:.3f}s"
+                for method, latency in sorted(self.call_latencies.items())
+            )
+        )
+
+
+class GrpcClientMetrics:
+    """Tracks connection reuse and per-method call latency for a DagsterGrpcClient."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._channels_created = 0
+        self._channel_reuses = 0
+        self._call_latencies: Dict[str, GrpcCallLatency] = {}
+
+    def record_channel(self, created: bool) -> None:
+        with self._lock:
+            if created:
+                self._channels_created += 1
+            else:
+                self._channel_reuses += 1
+
+    def record_call(self, method: str, latency: float, failed: bool) -> None:
+        with self._lock:
+            existing = self._call_latencies.get(method, GrpcCallLatency(0, 0, 0.0, 0.0))
+            self._call_latencies[method] = GrpcCallLatency(
+                num_calls=existing.num_calls + 1,
+                num_failures=existing.num_failures + (1 if failed else 0),
+                total_latency=existing.total_latency + latency,
+                max_latency=max(existing.max_latency, latency),
+            )
+
+    def snapshot(self) -> GrpcClientMetricsSnapshot:
+        with self._lock:
+            return GrpcClientMetricsSnapshot(
+                channels_created=self._channels_created,
+                channel_reuses=self._channel_reuses,
+                call_latencies=dict(self._call_latencies),
+            )
+
+
 class DagsterGrpcClient:
     def __init__(
         self,
@@ -91,6 +181,17 @@ def __init__(
             socket = check.not_none(socket)
             self._server_address = "unix:" + os.path.abspath(socket)
 
+        # A single channel is kept open for the lifetime of the client and shared by every call,
+        # so that calls multiplex over one HTTP/2 connection rather than each paying for a new
+        # connection (and TLS handshake)
+        self._channel_lock = threading.Lock()
+        self._persistent_channel: Optional[grpc.Channel] = None
+        self._persistent_channel_pid: Optional[int] = None
+        # number of in-flight calls on each channel, so that a channel that is dropped while other
+        # calls are still using it is only closed once they complete
+        self._channel_active_calls: Dict[grpc.Channel, int] = {}
+        self._metrics = GrpcClientMetrics()
+
     @property
     def metadata(self) -> Sequence[Tuple[str, str]]:
         return self._metadata
@@ -99,27 +200,94 @@ def metadata(self) -> Sequence[Tuple[str, str]]:
     def use_ssl(self) -> bool:
         return self._use_ssl
 
-    @contextmanager
-    def _channel(self) -> Iterator[grpc.Channel]:
+    @property
+    def metrics(self) -> GrpcClientMetricsSnapshot:
+        return self._metrics.snapshot()
+
+    def _create_channel(self) -> grpc.Channel:
         options = [
             ("grpc.max_receive_message_length", max_rx_bytes()),
             ("grpc.max_send_message_length", max_send_bytes()),
+            # keep long-lived connections healthy while calls are in flight, without pinging
+            # idle connections often enough for the server to reject the pings
+            ("grpc.keepalive_time_ms", keepalive_time_ms()),
+            ("grpc.keepalive_permit_without_calls", 0),
+            ("grpc.max_reconnect_backoff_ms", max_reconnect_backoff_ms()),
         ]
-        with (
-            grpc.secure_channel(
+        if self._use_ssl:
+            return grpc.secure_channel(
                 self._server_address,
                 self._ssl_creds,
                 options=options,
                 compression=grpc.Compression.Gzip,
             )
-            if self._use_ssl
-            else grpc.insecure_channel(
-                self._server_address,
-                options=options,
-                compression=grpc.Compression.Gzip,
-            )
-        ) as channel:
+        return grpc.insecure_channel(
+            self._server_address,
+            options=options,
+            compression=grpc.Compression.Gzip,
+        )
+
+    def _get_channel(self) -> grpc.Channel:
+        with self._channel_lock:
+            # gRPC channels can't be used across a fork, so a forked process opens its own channel
+            if self._persistent_channel is None or self._persistent_channel_pid != os.getpid():
+                self._persistent_channel = self._create_channel()
+                self._persistent_channel_pid = os.getpid()
+                self._metrics.record_channel(created=True)
+            else:
+                self._metrics.record_channel(created=False)
+            channel = self._persistent_channel
+            self._channel_active_calls[channel] = self._channel_active_calls.get(channel, 0) + 1
+            return channel
+
+    def _release_channel(self, channel: grpc.Channel) -> None:
+        with self._channel_lock:
+            active_calls = self._channel_active_calls[channel] - 1
+            if active_calls:
+                self._channel_active_calls[channel] = active_calls
+            else:
+                del self._channel_active_calls[channel]
+            should_close = not active_calls and channel is not self._persistent_channel
+        if should_close:
+            # the last call on a channel that was dropped while it was in flight
+            channel.close()
+
+    def _reset_channel(self, channel: grpc.Channel) -> None:
+        # Drop a channel whose connection failed so that the next call reconnects from scratch
+        # rather than waiting out the channel's reconnect backoff. The failed call still holds the
+        # channel, so it is closed once that call (and any other in-flight call) releases it.
+        with self._channel_lock:
+            if self._persistent_channel is not channel:
+                return
+            self._persistent_channel = None
+            self._persistent_channel_pid = None
+
+    def close(self) -> None:
+        """Close the channel held by this client. Later calls will open a new channel.
+
+        Calls that are still in flight on the channel are not cancelled; the channel is closed once
+        they complete.
+        """
+        with self._channel_lock:
+            channel = self._persistent_channel
+            owned = self._persistent_channel_pid == os.getpid()
+            self._persistent_channel = None
+            self._persistent_channel_pid = None
+            should_close = owned and channel not in self._channel_active_calls
+        if channel and should_close:
+            channel.close()
+
+    @contextmanager
+    def _channel(self) -> Iterator[grpc.Channel]:
+        channel = self._get_channel()
+        try:
             yield channel
+        except grpc.RpcError as e:
+            if e.code() == grpc.StatusCode.UNAVAILABLE:  # type: ignore  # (bad stubs)
+                self._reset_channel(channel)
+            raise
+        finally:
+            self._release_channel(channel)
 
     def _get_response(
         self,
@@ -127,9 +295,16 @@ def _get_response(
         request: str,
         timeout: int = DEFAULT_GRPC_TIMEOUT,
     ):
-        with self._channel() as channel:
-            stub = DagsterApiStub(channel)
-            return getattr(stub, method)(request, metadata=self._metadata, timeout=timeout)
+        start_time = time.perf_counter()
+        failed = True
+        try:
+            with self._channel() as channel:
+                stub = DagsterApiStub(channel)
+                response = getattr(stub, method)(request, metadata=self._metadata, timeout=timeout)
+            failed = False
+            return response
+        finally:
+            self._metrics.record_call(method, time.perf_counter() - start_time, failed)
 
     def _raise_grpc_exception(self, e: Exception, timeout, custom_timeout_message=None):
         if isinstance(e, grpc.RpcError):
@@ -166,9 +341,19 @@ def _get_streaming_response(
         request: str,
         timeout: int = DEFAULT_GRPC_TIMEOUT,
     ) -> Iterator[Any]:
-        with self._channel() as channel:
-            stub = DagsterApiStub(channel)
-            yield from getattr(stub, method)(request, metadata=self._metadata, timeout=timeout)
+        start_time = time.perf_counter()
+        failed = True
+        try:
+            with self._channel() as channel:
+                stub = DagsterApiStub(channel)
+                yield from getattr(stub, method)(request, metadata=self._metadata, timeout=timeout)
+            failed = False
+        except GeneratorExit:
+            # the caller stopped consuming the stream early
+            failed = False
+            raise
+        finally:
+            self._metrics.record_call(method, time.perf_counter() - start_time, failed)
 
     def _streaming_query(
         self,
@@ -362,6 +547,51 @@ def streaming_external_repository(
                 "serialized_external_repository_chunk": res.serialized_external_repository_chunk,
             }
 
+    def streaming_external_repository_if_modified(
+        self,
+        external_repository_origin: ExternalRepositoryOrigin,
+        content_hash: str,
+        defer_snapshots: bool = False,
+    ):
+        """Like streaming_external_repository, but yields no chunks at all if the serialized
+        repository data on the server still has the given content hash. Falls back to fetching the
+        full repository data from servers that don't support the comparison.
+        """
+        check.inst_param(
+            external_repository_origin,
+            "external_repository_origin",
+            ExternalRepositoryOrigin,
+        )
+        check.str_param(content_hash, "content_hash")
+
+        try:
+            for res in self._streaming_query(
+                "StreamingExternalRepositoryIfModified",
+                api_pb2.ExternalRepositoryIfModifiedRequest,
+                serialized_repository_python_origin=serialize_dagster_namedtuple(
+                    external_repository_origin
+                ),
+                defer_snapshots=defer_snapshots,
+                content_hash=content_hash,
+            ):
+                yield {
+                    "sequence_number": res.sequence_number,
+                    "serialized_external_repository_chunk": (
+                        res.serialized_external_repository_chunk
+                    ),
+                }
+        except DagsterUserCodeUnreachableError as e:
+            if not (
+                isinstance(e.__cause__, grpc.RpcError)
+                and e.__cause__.code() == grpc.StatusCode.UNIMPLEMENTED  # type: ignore  # (bad stubs)
+            ):
+                raise
+
+            # servers from older versions of dagster don't implement this method
+            yield from self.streaming_external_repository(
+                external_repository_origin, defer_snapshots=defer_snapshots
+            )
+
     def external_schedule_execution(self, external_schedule_execution_args):
         check.inst_param(
             external_schedule_execution_args,
@@ -409,6 +639,43 @@ def external_sensor_execution(self, sensor_execution_args, timeout=DEFAULT_GRPC_
 
         return "".join([chunk.serialized_chunk for chunk in chunks])
 
+    def external_sensor_execution_batch(
+        self, sensor_execution_batch_args, timeout=DEFAULT_GRPC_TIMEOUT
+    ) -> Iterator[str]:
+        """Evaluates several sensors in one request, yielding the serialized result of each sensor
+        in the order of sensor_execution_batch_args.sensor_execution_args as soon as it arrives.
+        """
+        check.inst_param(
+            sensor_execution_batch_args,
+            "sensor_execution_batch_args",
+            SensorExecutionBatchArgs,
+        )
+
+        custom_timeout_message = (
+            f"The sensor batch timed out due to taking longer than {timeout} seconds to execute the"
+            " sensor functions. One way to avoid this error is to evaluate fewer sensors in each"
+            " batch."
+        )
+
+        chunks: List[str] = []
+        for chunk in self._streaming_query(
+            "ExternalSensorExecutionBatch",
+            api_pb2.ExternalSensorExecutionRequest,
+            timeout=timeout,
+            serialized_external_sensor_execution_args=serialize_dagster_namedtuple(
+                sensor_execution_batch_args
+            ),
+            custom_timeout_message=custom_timeout_message,
+        ):
+            # the chunks of each sensor are numbered from 0
+            if chunk.sequence_number == 0 and chunks:
+                yield "".join(chunks)
+                chunks = []
+            chunks.append(chunk.serialized_chunk)
+
+        if chunks:
+            yield "".join(chunks)
+
     def external_notebook_data(self, notebook_path: str):
         check.str_param(notebook_path, "notebook_path")
         res = self._query(
@@ -526,6 +793,7 @@ def cleanup_server(self) -> None:
                 except DagsterUserCodeUnreachableError:
                     pass
             self._server_process = None
+        self.close()
 
     def __enter__(self):
         return self
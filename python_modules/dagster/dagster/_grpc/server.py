@@ -27,6 +27,7 @@
 from dagster._core.errors import DagsterUserCodeUnreachableError
 from dagster._core.host_representation.external_data import (
     ExternalRepositoryErrorData,
+    ExternalSensorExecutionErrorData,
     external_pipeline_data_from_def,
     external_repository_data_from_def,
 )
@@ -78,10 +79,16 @@
     PartitionSetExecutionParamArgs,
     PipelineSubsetSnapshotArgs,
     SensorExecutionArgs,
+    SensorExecutionBatchArgs,
     ShutdownServerResult,
     StartRunResult,
 )
-from .utils import get_loadable_targets, max_rx_bytes, max_send_bytes
+from .utils import (
+    get_external_repository_data_content_hash,
+    get_loadable_targets,
+    max_rx_bytes,
+    max_send_bytes,
+)
 
 EVENT_QUEUE_POLL_INTERVAL = 0.1
 
@@ -236,6 +243,14 @@ def __init__(
 
         self._serializable_load_error = None
 
+        # serialized ExternalRepositoryData and its content hash by repository name and whether
+        # snapshots are deferred, for the repositories whose definitions can not change while the
+        # server is running
+        self._serialized_external_repository_data_cache: Dict[
+            Tuple[str, bool], Tuple[str, str]
+        ] = {}
+        self._serialized_external_repository_data_cache_lock = threading.Lock()
+
         self._entry_point = (
             frozenlist(check.sequence_param(entry_point, "entry_point", of_type=str))
             if entry_point is not None
@@ -522,26 +537,59 @@ def ExternalPipelineSubsetSnapshot(
             )
         )
 
-    def _get_serialized_external_repository_data(self, request):
+    def _get_serialized_external_repository_data(self, request) -> Tuple[str, Optional[str]]:
+        """Returns the serialized ExternalRepositoryData for the request, along with its content
+        hash. If the data could not be loaded, the serialized ExternalRepositoryErrorData is
+        returned without a hash instead.
+
+        The data is computed once per server for repositories whose definitions are fixed once
+        loaded, and recomputed on every request for repositories backed by a user-supplied
+        RepositoryData, whose definitions may change without the server restarting.
+        """
         try:
             repository_origin = deserialize_as(
                 request.serialized_repository_python_origin,
                 ExternalRepositoryOrigin,
             )
+            repository_def = self._get_repo_for_origin(repository_origin)
+
+            # the data only depends on the repository, which the server identifies by name
+            cache_key = (repository_origin.repository_name, request.defer_snapshots)
+            if repository_def.has_static_definitions:
+                with self._serialized_external_repository_data_cache_lock:
+                    cached = self._serialized_external_repository_data_cache.get(cache_key)
+                if cached:
+                    return cached
 
-            return serialize_dagster_namedtuple(
+            serialized_external_repository_data = serialize_dagster_namedtuple(
                 external_repository_data_from_def(
-                    self._get_repo_for_origin(repository_origin),
+                    repository_def,
                     defer_snapshots=request.defer_snapshots,
                 )
             )
         except Exception:
-            return serialize_dagster_namedtuple(
-                ExternalRepositoryErrorData(serializable_error_info_from_exc_info(sys.exc_info()))
+            return (
+                serialize_dagster_namedtuple(
+                    ExternalRepositoryErrorData(
+                        serializable_error_info_from_exc_info(sys.exc_info())
+                    )
+                ),
+                None,
             )
 
+        result = (
+            serialized_external_repository_data,
+            get_external_repository_data_content_hash(serialized_external_repository_data),
+        )
+        if repository_def.has_static_definitions:
+            with self._serialized_external_repository_data_cache_lock:
+                self._serialized_external_repository_data_cache[cache_key] = result
+        return result
+
     def ExternalRepository(self, request, _context):
-        serialized_external_repository_data = self._get_serialized_external_repository_data(request)
+        serialized_external_repository_data, _ = self._get_serialized_external_repository_data(
+            request
+        )
         return api_pb2.ExternalRepositoryReply(
             serialized_external_repository_data=serialized_external_repository_data,
         )
@@ -564,8 +612,30 @@ def ExternalJob(self, request, _context) -> api_pb2.ExternalJobReply:
             )
 
     def StreamingExternalRepository(self, request, _context):
-        serialized_external_repository_data = self._get_serialized_external_repository_data(request)
+        serialized_external_repository_data, _ = self._get_serialized_external_repository_data(
+            request
+        )
+        yield from self._split_serialized_external_repository_data_into_events(
+            serialized_external_repository_data
+        )
+
+    def StreamingExternalRepositoryIfModified(self, request, _context):
+        (
+            serialized_external_repository_data,
+            content_hash,
+        ) = self._get_serialized_external_repository_data(request)
 
+        # the client already holds this exact snapshot, so there is nothing to send
+        if content_hash is not None and content_hash == request.content_hash:
+            return
+
+        yield from self._split_serialized_external_repository_data_into_events(
+            serialized_external_repository_data
+        )
+
+    def _split_serialized_external_repository_data_into_events(
+        self, serialized_external_repository_data: str
+    ):
         num_chunks = int(
             math.ceil(float(len(serialized_external_repository_data)) / STREAMING_CHUNK_SIZE)
         )
@@ -634,6 +704,34 @@ def ExternalSensorExecution(self, request, _context):
 
         yield from self._split_serialized_data_into_chunk_events(serialized_sensor_data)
 
+    def ExternalSensorExecutionBatch(self, request, _context):
+        args = deserialize_as(
+            request.serialized_external_sensor_execution_args,
+            SensorExecutionBatchArgs,
+        )
+
+        # Each sensor is streamed back as soon as it has been evaluated, as its own sequence of
+        # chunks starting from sequence number 0, in the order of the requested sensors
+        for sensor_args in args.sensor_execution_args:
+            try:
+                sensor_data = get_external_sensor_execution(
+                    self._get_repo_for_origin(sensor_args.repository_origin),
+                    sensor_args.instance_ref,
+                    sensor_args.sensor_name,
+                    sensor_args.last_completion_time,
+                    sensor_args.last_run_key,
+                    sensor_args.cursor,
+                )
+            except Exception:
+                # don't fail the other sensors in the batch, e.g. if this sensor no longer exists
+                sensor_data = ExternalSensorExecutionErrorData(
+                    serializable_error_info_from_exc_info(sys.exc_info())
+                )
+
+            yield from self._split_serialized_data_into_chunk_events(
+                serialize_dagster_namedtuple(sensor_data)
+            )
+
     def ShutdownServer(self, request, _context) -> api_pb2.ShutdownServerReply:
         try:
             self._shutdown_once_executions_finish_event.set()
@@ -1134,6 +1232,8 @@ def open_server_process(
         if server_process.poll() is None:
             server_process.terminate()
         raise
+    finally:
+        client.close()
 
     return server_process
 
@@ -563,6 +563,24 @@ def __new__(
         )
 
 
+@whitelist_for_serdes
+class SensorExecutionBatchArgs(
+    NamedTuple(
+        "_SensorExecutionBatchArgs",
+        [("sensor_execution_args", Sequence[SensorExecutionArgs])],
+    )
+):
+    """Arguments for evaluating several sensors in the same code location in one request."""
+
+    def __new__(cls, sensor_execution_args: Sequence[SensorExecutionArgs]):
+        return super(SensorExecutionBatchArgs, cls).__new__(
+            cls,
+            sensor_execution_args=check.sequence_param(
+                sensor_execution_args, "sensor_execution_args", of_type=SensorExecutionArgs
+            ),
+        )
+
+
 @whitelist_for_serdes
 class ExternalJobArgs(
     NamedTuple(
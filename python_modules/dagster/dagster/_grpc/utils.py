@@ -1,3 +1,4 @@
+import hashlib
 import os
 from typing import TYPE_CHECKING, Optional, Sequence
 
@@ -60,6 +61,13 @@ def get_loadable_targets(
         check.failed("invalid")
 
 
+def get_external_repository_data_content_hash(serialized_external_repository_data: str) -> str:
+    """A hash of serialized ExternalRepositoryData, computed the same way by servers and clients so
+    that a client can tell a server which snapshot it already holds.
+    """
+    return hashlib.sha256(serialized_external_repository_data.encode("utf-8")).hexdigest()
+
+
 def max_rx_bytes() -> int:
     env_set = os.getenv("DAGSTER_GRPC_MAX_RX_BYTES")
     if env_set:
@@ -78,6 +86,38 @@ def max_send_bytes() -> int:
     return 50 * (10**6)
 
 
+def keepalive_time_ms() -> int:
+    env_set = os.getenv("DAGSTER_GRPC_KEEPALIVE_TIME_MS")
+    if env_set:
+        return int(env_set)
+
+    # default 5 minutes, the minimum interval that servers accept pings at by default
+    return 5 * 60 * 1000
+
+
+def max_reconnect_backoff_ms() -> int:
+    env_set = os.getenv("DAGSTER_GRPC_MAX_RECONNECT_BACKOFF_MS")
+    if env_set:
+        return int(env_set)
+
+    # default 5 seconds
+    return 5 * 1000
+
+
+def defer_job_snapshots() -> bool:
+    return os.getenv("DAGSTER_DEFER_JOB_SNAPSHOTS", "").lower() in ("1", "true")
+
+
+def max_cached_external_jobs() -> int:
+    from dagster._core.host_representation.external import DEFAULT_MAX_CACHED_EXTERNAL_JOBS
+
+    env_set = os.getenv("DAGSTER_MAX_CACHED_EXTERNAL_JOBS")
+    if env_set:
+        return int(env_set)
+
+    return DEFAULT_MAX_CACHED_EXTERNAL_JOBS
+
+
 def default_grpc_timeout() -> int:
     env_set = os.getenv("DAGSTER_GRPC_TIMEOUT_SECONDS")
     if env_set:
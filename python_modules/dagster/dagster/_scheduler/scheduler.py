@@ -156,6 +156,11 @@ def execute_scheduler_iteration_loop(
 
             if verbose_logs_iteration:
                 last_verbose_time = end_time
+                request_context = workspace_process_context.create_request_context()
+                for location_name, metrics in request_context.get_grpc_client_metrics().items():
+                    logger.info(
+                        f"gRPC client metrics for location {location_name}: {metrics.summary()}"
+                    )
 
             next_minute_time = _get_next_scheduler_iteration_time(start_time)
 
@@ -14,6 +14,7 @@
     register_serdes_tuple_fallbacks as register_serdes_tuple_fallbacks,
     serialize_dagster_namedtuple as serialize_dagster_namedtuple,
     serialize_value as serialize_value,
+    serialize_value_to_binary as serialize_value_to_binary,
     unpack_inner_value as unpack_inner_value,
     unpack_value as unpack_value,
     whitelist_for_serdes as whitelist_for_serdes,
@@ -0,0 +1,276 @@
+"""
+A compact binary encoding for packed serdes values, as an alternative to JSON.
+
+The encoding is the subset of MessagePack (https://msgpack.org) needed for JSON-compatible values:
+nil, booleans, integers, 64-bit floats, strings, arrays and maps. Integers outside of the 64-bit
+range, which JSON supports but MessagePack does not, are stored as an extension type holding their
+decimal representation. Map keys are converted to strings the way the json module converts them,
+so that decoding a value gives the same result whichever format it was encoded with.
+
+Encoded values start with BINARY_FORMAT_PREFIX, whose first byte can begin neither a MessagePack
+value nor a UTF-8 encoded JSON document, so the two formats can be told apart when read.
+"""
+
+import struct
+from typing import Any, List, Tuple
+
+from .errors import DeserializationError, SerializationError
+
+# 0xc1 is never used by MessagePack and is not valid UTF-8, followed by a format version
+BINARY_FORMAT_PREFIX = b"\xc1\x01"
+
+_BIG_INT_EXT_TYPE = 1
+
+_pack_uint8 = struct.Struct(">B").pack
+_pack_uint16 = struct.Struct(">H").pack
+_pack_uint32 = struct.Struct(">I").pack
+_pack_uint64 = struct.Struct(">Q").pack
+_pack_int8 = struct.Struct(">b").pack
+_pack_int16 = struct.Struct(">h").pack
+_pack_int32 = struct.Struct(">i").pack
+_pack_int64 = struct.Struct(">q").pack
+_pack_float64 = struct.Struct(">d").pack
+
+
+def is_binary_encoded(data: bytes) -> bool:
+    return data[: len(BINARY_FORMAT_PREFIX)] == BINARY_FORMAT_PREFIX
+
+
+def encode_binary(value: Any) -> bytes:
+    """Encode a packed value, i.e. a tree of JSON-compatible values, in the binary format."""
+    chunks: List[bytes] = [BINARY_FORMAT_PREFIX]
+    _encode(value, chunks)
+    return b"".join(chunks)
+
+
+def decode_binary(data: bytes) -> Any:
+    """Decode a value encoded with encode_binary."""
+    if not is_binary_encoded(data):
+        raise DeserializationError("Value is not in the serdes binary format.")
+
+    try:
+        value, offset = _decode(memoryview(data), len(BINARY_FORMAT_PREFIX))
+    except (IndexError, struct.error, UnicodeDecodeError) as e:
+        raise DeserializationError(
+            f"Value in the serdes binary format is truncated or corrupt: {e}"
+        )
+
+    if offset != len(data):
+        raise DeserializationError("Value in the serdes binary format has trailing data.")
+    return value
+
+
+def _encode(value: Any, chunks: List[bytes]) -> None:
+    if value is None:
+        chunks.append(b"\xc0")
+    elif value is True:
+        chunks.append(b"\xc3")
+    elif value is False:
+        chunks.append(b"\xc2")
+    elif isinstance(value, str):
+        _encode_str(value, chunks)
+    elif isinstance(value, int):
+        _encode_int(value, chunks)
+    elif isinstance(value, float):
+        chunks.append(b"\xcb" + _pack_float64(value))
+    elif isinstance(value, (list, tuple)):
+        length = len(value)
+        if length < 16:
+            chunks.append(_pack_uint8(0x90 | length))
+        elif length <= 0xFFFF:
+            chunks.append(b"\xdc" + _pack_uint16(length))
+        else:
+            chunks.append(b"\xdd" + _pack_uint32(length))
+        for item in value:
+            _encode(item, chunks)
+    elif isinstance(value, dict):
+        length = len(value)
+        if length < 16:
+            chunks.append(_pack_uint8(0x80 | length))
+        elif length <= 0xFFFF:
+            chunks.append(b"\xde" + _pack_uint16(length))
+        else:
+            chunks.append(b"\xdf" + _pack_uint32(length))
+        for key, item in value.items():
+            _encode_str(key if isinstance(key, str) else _key_to_str(key), chunks)
+            _encode(item, chunks)
+    else:
+        raise SerializationError(
+            f"Can not encode value of type {type(value).__name__} in the serdes binary format."
+        )
+
+
+def _encode_str(value: str, chunks: List[bytes]) -> None:
+    encoded = value.encode("utf-8")
+    length = len(encoded)
+    if length < 32:
+        chunks.append(_pack_uint8(0xA0 | length))
+    elif length <= 0xFF:
+        chunks.append(b"\xd9" + _pack_uint8(length))
+    elif length <= 0xFFFF:
+        chunks.append(b"\xda" + _pack_uint16(length))
+    else:
+        chunks.append(b"\xdb" + _pack_uint32(length))
+    chunks.append(encoded)
+
+
+def _encode_int(value: int, chunks: List[bytes]) -> None:
+    if 0 <= value < 0x80:
+        chunks.append(_pack_uint8(value))
+    elif -32 <= value < 0:
+        chunks.append(_pack_uint8(value & 0xFF))
+    elif 0 <= value <= 0xFF:
+        chunks.append(b"\xcc" + _pack_uint8(value))
+    elif 0 <= value <= 0xFFFF:
+        chunks.append(b"\xcd" + _pack_uint16(value))
+    elif 0 <= value <= 0xFFFFFFFF:
+        chunks.append(b"\xce" + _pack_uint32(value))
+    elif 0 <= value <= 0xFFFFFFFFFFFFFFFF:
+        chunks.append(b"\xcf" + _pack_uint64(value))
+    elif -0x80 <= value < 0:
+        chunks.append(b"\xd0" + _pack_int8(value))
+    elif -0x8000 <= value < 0:
+        chunks.append(b"\xd1" + _pack_int16(value))
+    elif -0x80000000 <= value < 0:
+        chunks.append(b"\xd2" + _pack_int32(value))
+    elif -0x8000000000000000 <= value < 0:
+        chunks.append(b"\xd3" + _pack_int64(value))
+    else:
+        digits = str(int(value)).encode("ascii")
+        if len(digits) <= 0xFF:
+            chunks.append(b"\xc7" + _pack_uint8(len(digits)) + _pack_int8(_BIG_INT_EXT_TYPE))
+        else:
+            chunks.append(b"\xc8" + _pack_uint16(len(digits)) + _pack_int8(_BIG_INT_EXT_TYPE))
+        chunks.append(digits)
+
+
+def _key_to_str(key: Any) -> str:
+    # mirrors the conversion of non-string keys in json.dumps
+    if key is True:
+        return "true"
+    elif key is False:
+        return "false"
+    elif key is None:
+        return "null"
+    elif isinstance(key, int):
+        return int.__repr__(key)
+    elif isinstance(key, float):
+        if key != key:
+            return "NaN"
+        elif key == float("inf"):
+            return "Infinity"
+        elif key == float("-inf"):
+            return "-Infinity"
+        return float.__repr__(key)
+
+    raise SerializationError(
+        f"Can not encode map key of type {type(key).__name__} in the serdes binary format."
+    )
+
+
+_unpack_uint16 = struct.Struct(">H").unpack_from
+_unpack_uint32 = struct.Struct(">I").unpack_from
+_unpack_uint64 = struct.Struct(">Q").unpack_from
+_unpack_int8 = struct.Struct(">b").unpack_from
+_unpack_int16 = struct.Struct(">h").unpack_from
+_unpack_int32 = struct.Struct(">i").unpack_from
+_unpack_int64 = struct.Struct(">q").unpack_from
+_unpack_float64 = struct.Struct(">d").unpack_from
+
+
+def _decode(data: memoryview, offset: int) -> Tuple[Any, int]:
+    head = data[offset]
+    offset += 1
+
+    if head < 0x80:
+        return head, offset
+    elif head >= 0xE0:
+        return head - 0x100, offset
+    elif 0xA0 <= head <= 0xBF:
+        return _decode_str(data, offset, head & 0x1F)
+    elif 0x90 <= head <= 0x9F:
+        return _decode_array(data, offset, head & 0x0F)
+    elif 0x80 <= head <= 0x8F:
+        return _decode_map(data, offset, head & 0x0F)
+    elif head == 0xC0:
+        return None, offset
+    elif head == 0xC2:
+        return False, offset
+    elif head == 0xC3:
+        return True, offset
+    elif head == 0xCB:
+        return _unpack_float64(data, offset)[0], offset + 8
+    elif head == 0xCC:
+        return data[offset], offset + 1
+    elif head == 0xCD:
+        return _unpack_uint16(data, offset)[0], offset + 2
+    elif head == 0xCE:
+        return _unpack_uint32(data, offset)[0], offset + 4
+    elif head == 0xCF:
+        return _unpack_uint64(data, offset)[0], offset + 8
+    elif head == 0xD0:
+        return _unpack_int8(data, offset)[0], offset + 1
+    elif head == 0xD1:
+        return _unpack_int16(data, offset)[0], offset + 2
+    elif head == 0xD2:
+        return _unpack_int32(data, offset)[0], offset + 4
+    elif head == 0xD3:
+        return _unpack_int64(data, offset)[0], offset + 8
+    elif head == 0xD9:
+        return _decode_str(data, offset + 1, data[offset])
+    elif head == 0xDA:
+        return _decode_str(data, offset + 2, _unpack_uint16(data, offset)[0])
+    elif head == 0xDB:
+        return _decode_str(data, offset + 4, _unpack_uint32(data, offset)[0])
+    elif head == 0xDC:
+        return _decode_array(data, offset + 2, _unpack_uint16(data, offset)[0])
+    elif head == 0xDD:
+        return _decode_array(data, offset + 4, _unpack_uint32(data, offset)[0])
+    elif head == 0xDE:
+        return _decode_map(data, offset + 2, _unpack_uint16(data, offset)[0])
+    elif head == 0xDF:
+        return _decode_map(data, offset + 4, _unpack_uint32(data, offset)[0])
+    elif head == 0xC7:
+        return _decode_big_int(data, offset + 1, data[offset])
+    elif head == 0xC8:
+        return _decode_big_int(data, offset + 2, _unpack_uint16(data, offset)[0])
+
+    raise DeserializationError(f"Unsupported type byte {head:#x} in the serdes binary format.")
+
+
+def _decode_str(data: memoryview, offset: int, length: int) -> Tuple[str, int]:
+    end = offset + length
+    if end > len(data):
+        raise IndexError("string extends past the end of the value")
+    return str(data[offset:end], "utf-8"), end
+
+
+def _decode_array(data: memoryview, offset: int, length: int) -> Tuple[List[Any], int]:
+    items = []
+    for _ in range(length):
+        item, offset = _decode(data, offset)
+        items.append(item)
+    return items, offset
+
+
+def _decode_map(data: memoryview, offset: int, length: int) -> Tuple[dict, int]:
+    items = {}
+    for _ in range(length):
+        key, offset = _decode(data, offset)
+        if not isinstance(key, str):
+            raise DeserializationError("Map keys in the serdes binary format must be strings.")
+        items[key], offset = _decode(data, offset)
+    return items, offset
+
+
+def _decode_big_int(data: memoryview, offset: int, length: int) -> Tuple[int, int]:
+    ext_type = _unpack_int8(data, offset)[0]
+    if ext_type != _BIG_INT_EXT_TYPE:
+        raise DeserializationError(
+            f"Unsupported extension type {ext_type} in the serdes binary format."
+        )
+    offset += 1
+    end = offset + length
+    if end > len(data):
+        raise IndexError("integer extends past the end of the value")
+    return int(str(data[offset:end], "ascii")), end
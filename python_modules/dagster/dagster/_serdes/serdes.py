@@ -8,6 +8,9 @@
 * Explicit whitelisting should help ensure we are only persisting or communicating across a
   serialization boundary the types we expect to.
 
+Values are packed in to a tree of JSON-compatible values, which is encoded as JSON or, opt-in, in
+the compact binary format from binary.py. Deserialization accepts either encoding.
+
 Why not pickle?
 
 * This isn't meant to replace pickle in the conditions that pickle is reasonable to use
@@ -38,8 +41,14 @@
 import dagster._check as check
 import dagster._seven as seven
 
+from .binary import decode_binary, encode_binary, is_binary_encoded
 from .errors import DeserializationError, SerdesUsageError, SerializationError
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 ###################################################################################################
 # Whitelisting
 ###################################################################################################
@@ -48,6 +57,8 @@
     Optional[Type[NamedTuple]], Type["NamedTupleSerializer"], Mapping[str, Parameter]
 ]
 EnumEntry = Tuple[Type[Enum], Type["EnumSerializer"]]
+TuplePacker = Callable[[Any], Dict[str, Any]]
+TupleUnpacker = Callable[[Dict[str, Any]], Any]
 
 
 class WhitelistMap(NamedTuple):
@@ -55,6 +66,10 @@ class WhitelistMap(NamedTuple):
     enums: Dict[str, EnumEntry]
     serialized_names: Dict[str, str]
     deserialized_names: Dict[str, str]
+    # functions packing and unpacking each whitelisted tuple, compiled on first use from the
+    # registrations above, and cleared whenever those change
+    tuple_packers: Dict[str, TuplePacker]
+    tuple_unpackers: Dict[str, TupleUnpacker]
 
     def register_tuple(
         self,
@@ -73,6 +88,7 @@ def register_tuple(
             args_for_class: the inspect.signature paramaters for __new__
         """
         self.tuples[name] = (nt, serializer or DefaultNamedTupleSerializer, args_for_class)
+        self._clear_compiled()
 
     def has_tuple_entry(self, name: str) -> bool:
         return name in self.tuples
@@ -96,6 +112,7 @@ def get_enum_entry(self, name: str) -> EnumEntry:
 
     def register_serialized_name(self, name: str, serialized_name: str):
         self.serialized_names[name] = serialized_name
+        self._clear_compiled()
 
     def has_serialized_name(self, name: str) -> bool:
         return name in self.serialized_names
@@ -105,6 +122,7 @@ def get_serialized_name(self, name: str) -> str:
 
     def register_deserialized_name(self, name: str, deserialized_name: str):
         self.deserialized_names[name] = deserialized_name
+        self._clear_compiled()
 
     def has_deserialized_name(self, name: str) -> bool:
         return name in self.deserialized_names
@@ -112,9 +130,34 @@ def has_deserialized_name(self, name: str) -> bool:
     def get_deserialized_name(self, name: str) -> str:
         return self.deserialized_names[name]
 
+    def get_tuple_packer(self, name: str) -> TuplePacker:
+        packer = self.tuple_packers.get(name)
+        if packer is None:
+            packer = _compile_tuple_packer(self, name)
+            self.tuple_packers[name] = packer
+        return packer
+
+    def get_tuple_unpacker(self, storage_name: str) -> TupleUnpacker:
+        unpacker = self.tuple_unpackers.get(storage_name)
+        if unpacker is None:
+            unpacker = _compile_tuple_unpacker(self, storage_name)
+            self.tuple_unpackers[storage_name] = unpacker
+        return unpacker
+
+    def _clear_compiled(self):
+        self.tuple_packers.clear()
+        self.tuple_unpackers.clear()
+
     @staticmethod
     def create():
-        return WhitelistMap(tuples={}, enums={}, serialized_names={}, deserialized_names={})
+        return WhitelistMap(
+            tuples={},
+            enums={},
+            serialized_names={},
+            deserialized_names={},
+            tuple_packers={},
+            tuple_unpackers={},
+        )
 
 
 _WHITELIST_MAP = WhitelistMap.create()
@@ -349,14 +392,19 @@ def serialize_dagster_namedtuple(nt: tuple, **json_kwargs) -> str:
 def _serialize_dagster_namedtuple(
     nt: Tuple[Any, ...], whitelist_map: WhitelistMap, **json_kwargs
 ) -> str:
-    return seven.json.dumps(pack_inner_value(nt, whitelist_map, _root(nt)), **json_kwargs)
+    return seven.json.dumps(_pack_root_value(nt, whitelist_map), **json_kwargs)
 
 
 def serialize_value(val: Any, whitelist_map: WhitelistMap = _WHITELIST_MAP) -> str:
     """Serialize a value to a json encoded string."""
-    return seven.json.dumps(
-        pack_inner_value(val, whitelist_map=whitelist_map, descent_path=_root(val))
-    )
+    return seven.json.dumps(_pack_root_value(val, whitelist_map))
+
+
+def serialize_value_to_binary(val: Any, whitelist_map: WhitelistMap = _WHITELIST_MAP) -> bytes:
+    """Serialize a value to bytes in the compact binary format. The result can be deserialized
+    with the same functions as json encoded strings.
+    """
+    return encode_binary(_pack_root_value(val, whitelist_map))
 
 
 def pack_value(val: Any) -> Any:
@@ -369,13 +417,59 @@ def pack_value(val: Any) -> Any:
         * set
         * frozenset
     """
-    return pack_inner_value(val, whitelist_map=_WHITELIST_MAP, descent_path=_root(val))
+    return _pack_root_value(val, _WHITELIST_MAP)
+
+
+def _pack_root_value(val: Any, whitelist_map: WhitelistMap) -> Any:
+    try:
+        return _pack_value(val, whitelist_map)
+    except SerializationError:
+        return _pack_value_with_descent_path(val, whitelist_map, _root(val))
 
 
 def pack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str) -> Any:
+    try:
+        return _pack_value(val, whitelist_map)
+    except SerializationError:
+        # _pack_value does not track where in the value it failed, so retrace the value with
+        # descent paths to raise an error that includes one
+        return _pack_value_with_descent_path(val, whitelist_map, descent_path)
+
+
+def _pack_value(val: Any, whitelist_map: WhitelistMap) -> Any:
+    if isinstance(val, list):
+        return [_pack_value(item, whitelist_map) for item in val]
+    if isinstance(val, tuple):
+        klass_name = val.__class__.__name__
+        if not whitelist_map.has_tuple_entry(klass_name):
+            raise SerializationError()
+        return whitelist_map.get_tuple_packer(klass_name)(val)
+    if isinstance(val, Enum):
+        klass_name = val.__class__.__name__
+        if not whitelist_map.has_enum_entry(klass_name):
+            raise SerializationError()
+        _, enum_serializer = whitelist_map.get_enum_entry(klass_name)
+        return {"__enum__": enum_serializer.value_to_storage_str(val, whitelist_map, "")}
+    if isinstance(val, set):
+        return {
+            "__set__": [_pack_value(item, whitelist_map) for item in sorted(list(val), key=str)]
+        }
+    if isinstance(val, frozenset):
+        return {
+            "__frozenset__": [
+                _pack_value(item, whitelist_map) for item in sorted(list(val), key=str)
+            ]
+        }
+    if isinstance(val, dict):
+        return {key: _pack_value(value, whitelist_map) for key, value in val.items()}
+
+    return val
+
+
+def _pack_value_with_descent_path(val: Any, whitelist_map: WhitelistMap, descent_path: str) -> Any:
     if isinstance(val, list):
         return [
-            pack_inner_value(item, whitelist_map, f"{descent_path}[{idx}]")
+            _pack_value_with_descent_path(item, whitelist_map, f"{descent_path}[{idx}]")
             for idx, item in enumerate(val)
         ]
     if isinstance(val, tuple):
@@ -405,7 +499,7 @@ def pack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str) -
         set_path = descent_path + "{}"
         return {
             "__set__": [
-                pack_inner_value(item, whitelist_map, set_path)
+                _pack_value_with_descent_path(item, whitelist_map, set_path)
                 for item in sorted(list(val), key=str)
             ]
         }
@@ -413,33 +507,77 @@ def pack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str) -
         frz_set_path = descent_path + "{}"
         return {
             "__frozenset__": [
-                pack_inner_value(item, whitelist_map, frz_set_path)
+                _pack_value_with_descent_path(item, whitelist_map, frz_set_path)
                 for item in sorted(list(val), key=str)
             ]
         }
     if isinstance(val, dict):
         return {
-            key: pack_inner_value(value, whitelist_map, f"{descent_path}.{key}")
+            key: _pack_value_with_descent_path(value, whitelist_map, f"{descent_path}.{key}")
             for key, value in val.items()
         }
 
     return val
 
 
+def _compile_tuple_packer(whitelist_map: WhitelistMap, klass_name: str) -> TuplePacker:
+    klass, serializer, _ = whitelist_map.get_tuple_entry(klass_name)
+
+    def _pack_with_serializer(value: Any) -> Dict[str, Any]:
+        return cast(Dict[str, Any], serializer.value_to_storage_dict(value, whitelist_map, ""))
+
+    if klass is None or not _uses_default_method(serializer, "value_to_storage_dict"):
+        return _pack_with_serializer
+
+    # equivalent to DefaultNamedTupleSerializer.value_to_storage_dict, with the per-class lookups
+    # done ahead of time
+    fields = klass._fields
+    skip_when_empty_fields = cast(Type[DefaultNamedTupleSerializer], serializer).skip_when_empty()
+    storage_name = (
+        whitelist_map.get_serialized_name(klass_name)
+        if whitelist_map.has_serialized_name(klass_name)
+        else klass_name
+    )
+
+    def _pack_tuple(value: Any) -> Dict[str, Any]:
+        # instances of other classes with the same name, e.g. subclasses, may have other fields
+        if type(value) is not klass:  # pylint: disable=unidiomatic-typecheck
+            return _pack_with_serializer(value)
+
+        storage_dict = {}
+        for key, inner_value in zip(fields, value):
+            if key in skip_when_empty_fields and inner_value in EMPTY_VALUES_TO_SKIP:
+                continue
+            storage_dict[key] = _pack_value(inner_value, whitelist_map)
+        storage_dict["__class__"] = storage_name
+        return storage_dict
+
+    return _pack_tuple
+
+
+def _uses_default_method(serializer: Type["NamedTupleSerializer"], method_name: str) -> bool:
+    return (
+        getattr(serializer, method_name).__func__
+        is getattr(DefaultNamedTupleSerializer, method_name).__func__
+    )
+
+
 ###################################################################################################
 # Deserialize
 ###################################################################################################
 
 
 def deserialize_json_to_dagster_namedtuple(
-    json_str: str,
+    json_str: Union[str, bytes],
 ) -> tuple:
-    """Deserialize a json encoded string in to a whitelisted named tuple."""
+    """Deserialize a json encoded string, or bytes in the binary format, in to a whitelisted named
+    tuple.
+    """
     with warnings.catch_warnings():
         warnings.simplefilter("ignore", DeprecationWarning)
 
         dagster_namedtuple = _deserialize_json(
-            check.str_param(json_str, "json_str"), whitelist_map=_WHITELIST_MAP
+            check.inst_param(json_str, "json_str", (str, bytes)), whitelist_map=_WHITELIST_MAP
         )
 
     if not isinstance(dagster_namedtuple, tuple):
@@ -456,37 +594,75 @@ def deserialize_json_to_dagster_namedtuple(
 
 
 @overload
-def deserialize_as(json_str: str, cls: Tuple[Type[T], Type[U]]) -> Union[T, U]:
+def deserialize_as(json_str: Union[str, bytes], cls: Tuple[Type[T], Type[U]]) -> Union[T, U]:
     pass
 
 
 @overload
-def deserialize_as(json_str: str, cls: Type[T]) -> T:
+def deserialize_as(json_str: Union[str, bytes], cls: Type[T]) -> T:
     pass
 
 
-def deserialize_as(json_str: str, cls: Union[Type[T], Tuple[Type[T], Type[U]]]) -> Union[T, U]:
-    """Deserialize a json encoded string to a specific namedtuple class."""
+def deserialize_as(
+    json_str: Union[str, bytes], cls: Union[Type[T], Tuple[Type[T], Type[U]]]
+) -> Union[T, U]:
+    """Deserialize a json encoded string, or bytes in the binary format, to a specific namedtuple
+    class.
+    """
     val = deserialize_json_to_dagster_namedtuple(json_str)
     if not isinstance(val, cls):
         check.failed(f"Deserialized object was not expected target type {cls}, got {type(val)}")
     return cast(Union[T, U], val)
 
 
-def opt_deserialize_as(json_str: Optional[str], cls: Type[T]) -> Optional[T]:
+def opt_deserialize_as(json_str: Optional[Union[str, bytes]], cls: Type[T]) -> Optional[T]:
     """Optionally deserialize a json encoded string to a specific namedtuple class."""
     return deserialize_as(json_str, cls) if json_str else None
 
 
-def _deserialize_json(json_str: str, whitelist_map: WhitelistMap):
-    value = seven.json.loads(json_str)
-    return unpack_inner_value(value, whitelist_map=whitelist_map, descent_path=_root(value))
+def _deserialize_json(json_str: Union[str, bytes], whitelist_map: WhitelistMap):
+    value = _loads(json_str)
+    try:
+        return _unpack_value(value, whitelist_map)
+    except DeserializationError:
+        return _unpack_value_with_descent_path(value, whitelist_map, _root(value))
+
+
+# maps digits to "0" and everything else to ".", to find runs of digits at C speed
+_DIGIT_TRANSLATION = bytes(ord("0") if ord("0") <= i <= ord("9") else ord(".") for i in range(256))
+# the shortest run of digits that can be an integer outside of the 64-bit range, which is 19 digits
+# for integers below -(2**63)
+_LONG_DIGIT_RUN = b"0" * 19
+
+
+def _may_contain_long_integer(serialized: Union[str, bytes]) -> bool:
+    encoded = serialized.encode("utf-8") if isinstance(serialized, str) else serialized
+    return _LONG_DIGIT_RUN in encoded.translate(_DIGIT_TRANSLATION)
+
+
+def _loads(serialized: Union[str, bytes]) -> Any:
+    if isinstance(serialized, bytes) and is_binary_encoded(serialized):
+        return decode_binary(serialized)
+
+    # orjson parses integers outside of the 64-bit range as floats, so leave any value that might
+    # contain one to the json module
+    if orjson is not None and not _may_contain_long_integer(serialized):
+        try:
+            return orjson.loads(serialized)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than the json module, e.g. about control characters in strings
+            # and NaN
+            pass
 
+    return seven.json.loads(serialized)
 
-def deserialize_value(val: str, whitelist_map: WhitelistMap = _WHITELIST_MAP) -> Any:
-    """Deserialize a json encoded string in to its original value."""
+
+def deserialize_value(val: Union[str, bytes], whitelist_map: WhitelistMap = _WHITELIST_MAP) -> Any:
+    """Deserialize a json encoded string, or bytes in the binary format, in to its original
+    value.
+    """
     return unpack_inner_value(
-        seven.json.loads(check.str_param(val, "val")),
+        _loads(check.inst_param(val, "val", (str, bytes))),
         whitelist_map=whitelist_map,
         descent_path="",
     )
@@ -502,18 +678,99 @@ def unpack_value(val: Any) -> Any:
 
 
 def unpack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str) -> Any:
+    try:
+        return _unpack_value(val, whitelist_map)
+    except DeserializationError:
+        # _unpack_value does not track where in the value it failed, so retrace the value with
+        # descent paths to raise an error that includes one
+        return _unpack_value_with_descent_path(val, whitelist_map, descent_path)
+
+
+def _unpack_value(val: Any, whitelist_map: WhitelistMap) -> Any:
+    if isinstance(val, list):
+        return [_unpack_value(item, whitelist_map) for item in val]
+    if isinstance(val, dict):
+        klass_name = val.get("__class__")
+        if klass_name:
+            return whitelist_map.get_tuple_unpacker(klass_name)(val)
+        if val.get("__enum__"):
+            name, member = val["__enum__"].split(".")
+            if not whitelist_map.has_enum_entry(name):
+                raise DeserializationError()
+            enum_class, enum_serializer = whitelist_map.get_enum_entry(name)
+            return enum_serializer.value_from_storage_str(member, enum_class)
+        if val.get("__set__") is not None:
+            return set([_unpack_value(item, whitelist_map) for item in val["__set__"]])
+        if val.get("__frozenset__") is not None:
+            return frozenset([_unpack_value(item, whitelist_map) for item in val["__frozenset__"]])
+        return {key: _unpack_value(value, whitelist_map) for key, value in val.items()}
+
+    return val
+
+
+def _compile_tuple_unpacker(whitelist_map: WhitelistMap, klass_name: str) -> TupleUnpacker:
+    lookup_name = (
+        whitelist_map.get_deserialized_name(klass_name)
+        if whitelist_map.has_deserialized_name(klass_name)
+        else klass_name
+    )
+    if not whitelist_map.has_tuple_entry(lookup_name):
+
+        def _unpack_not_whitelisted(storage_dict: Dict[str, Any]) -> Any:
+            raise DeserializationError()
+
+        return _unpack_not_whitelisted
+
+    klass, serializer, args_for_class = whitelist_map.get_tuple_entry(lookup_name)
+
+    if klass is None:
+        return lambda storage_dict: None
+
+    if not _uses_default_method(serializer, "value_from_storage_dict"):
+        return lambda storage_dict: serializer.value_from_storage_dict(
+            _without_class_key(storage_dict), klass, args_for_class, whitelist_map, ""
+        )
+
+    # equivalent to DefaultNamedTupleSerializer.value_from_storage_dict, which skips "__class__"
+    # since it is never an argument of the class
+    default_serializer = cast(Type[DefaultNamedTupleSerializer], serializer)
+
+    def _unpack_tuple(storage_dict: Dict[str, Any]) -> Any:
+        return default_serializer.value_from_unpacked(
+            {
+                key: _unpack_value(value, whitelist_map)
+                for key, value in storage_dict.items()
+                if key in args_for_class
+            },
+            klass,
+        )
+
+    return _unpack_tuple
+
+
+def _without_class_key(storage_dict: Dict[str, Any]) -> Dict[str, Any]:
+    # serializers may modify the dict they are given, so copy it rather than popping the key, which
+    # keeps the packed value intact in case it needs to be retraced
+    return {key: value for key, value in storage_dict.items() if key != "__class__"}
+
+
+def _unpack_value_with_descent_path(
+    val: Any, whitelist_map: WhitelistMap, descent_path: str
+) -> Any:
     if isinstance(val, list):
         return [
-            unpack_inner_value(item, whitelist_map, f"{descent_path}[{idx}]")
+            _unpack_value_with_descent_path(item, whitelist_map, f"{descent_path}[{idx}]")
             for idx, item in enumerate(val)
         ]
     if isinstance(val, dict) and val.get("__class__"):
-        klass_name = cast(str, val.pop("__class__"))
+        klass_name = cast(str, val["__class__"])
         lookup_name = (
             whitelist_map.get_deserialized_name(klass_name)
             if whitelist_map.has_deserialized_name(klass_name)
             else klass_name
         )
+        if not whitelist_map.has_tuple_entry(lookup_name):
+            _load_public_api(whitelist_map)
         if not whitelist_map.has_tuple_entry(lookup_name):
             name_str = (
                 f'"{klass_name}"'
@@ -533,10 +790,12 @@ def unpack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str)
             return None
 
         return serializer.value_from_storage_dict(
-            val, klass, args_for_class, whitelist_map, descent_path
+            _without_class_key(val), klass, args_for_class, whitelist_map, descent_path
         )
     if isinstance(val, dict) and val.get("__enum__"):
         name, member = val["__enum__"].split(".")
+        if not whitelist_map.has_enum_entry(name):
+            _load_public_api(whitelist_map)
         if not whitelist_map.has_enum_entry(name):
             raise DeserializationError(
                 f"Attempted to deserialize enum {name} which was not in the whitelist.\n"
@@ -547,15 +806,23 @@ def unpack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str)
         return enum_serializer.value_from_storage_str(member, enum_class)
     if isinstance(val, dict) and val.get("__set__") is not None:
         set_path = descent_path + "{}"
-        return set([unpack_inner_value(item, whitelist_map, set_path) for item in val["__set__"]])
+        return set(
+            [
+                _unpack_value_with_descent_path(item, whitelist_map, set_path)
+                for item in val["__set__"]
+            ]
+        )
     if isinstance(val, dict) and val.get("__frozenset__") is not None:
         frz_set_path = descent_path + "{}"
         return frozenset(
-            [unpack_inner_value(item, whitelist_map, frz_set_path) for item in val["__frozenset__"]]
+            [
+                _unpack_value_with_descent_path(item, whitelist_map, frz_set_path)
+                for item in val["__frozenset__"]
+            ]
         )
     if isinstance(val, dict):
         return {
-            key: unpack_inner_value(value, whitelist_map, f"{descent_path}.{key}")
+            key: _unpack_value_with_descent_path(value, whitelist_map, f"{descent_path}.{key}")
             for key, value in val.items()
         }
 
@@ -670,6 +937,15 @@ def _with_header(msg):
                 raise SerdesUsageError(_with_header(error_msg))
 
 
+def _load_public_api(whitelist_map: WhitelistMap) -> None:
+    # classes register themselves when the module defining them is imported, and the modules of the
+    # public API are only imported on first use, so import them all before giving up on a class
+    if whitelist_map is _WHITELIST_MAP:
+        import dagster
+
+        dagster._load_public_api()  # pylint: disable=protected-access
+
+
 def _path_msg(descent_path: str) -> str:
     if not descent_path:
         return ""
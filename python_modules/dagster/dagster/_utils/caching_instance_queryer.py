@@ -1,11 +1,16 @@
 import datetime
 import json
+import weakref
 from collections import defaultdict
 from typing import (
+    TYPE_CHECKING,
     AbstractSet,
+    Any,
     Dict,
+    Hashable,
     Iterable,
     Mapping,
+    MutableMapping,
     Optional,
     Sequence,
     Tuple,
@@ -18,6 +23,7 @@
 from dagster._core.definitions.asset_selection import AssetSelection
 from dagster._core.definitions.events import AssetKey, AssetKeyPartitionKey
 from dagster._core.definitions.logical_version import get_input_event_pointer_tag_key
+from dagster._core.definitions.partition import PartitionsDefinition
 from dagster._core.definitions.time_window_partitions import (
     TimeWindowPartitionsDefinition,
     TimeWindowPartitionsSubset,
@@ -41,6 +47,9 @@
 from dagster._utils.cached_method import cached_method
 from dagster._utils.merger import merge_dicts
 
+if TYPE_CHECKING:
+    from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
+
 USED_DATA_TAG = ".dagster/used_data"
 
 
@@ -64,11 +73,22 @@ def __init__(self, instance: "DagsterInstance"):
         ] = defaultdict(dict)
 
         self._dynamic_partitions_cache: Dict[str, Sequence[str]] = {}
+        self._asset_status_cache_value_cache: Dict[AssetKey, Optional["AssetStatusCacheValue"]] = {}
+
+        # results of mapping partitions between assets, memoized by the AssetGraph. Keyed weakly by
+        # graph, so that a graph created after another is collected cannot see its results
+        self._partition_mapping_cache: MutableMapping[
+            AssetGraph, Dict[Hashable, Any]
+        ] = weakref.WeakKeyDictionary()
 
     @property
     def instance(self) -> "DagsterInstance":
         return self._instance
 
+    @property
+    def partition_mapping_cache(self) -> MutableMapping[AssetGraph, Dict[Hashable, Any]]:
+        return self._partition_mapping_cache
+
     def prefetch_for_keys(self, asset_keys: Sequence[AssetKey], after_cursor: Optional[int]):
         """For performance, batches together queries for selected assets"""
         asset_records = self.instance.get_asset_records(asset_keys)
@@ -115,6 +135,21 @@ def prefetch_for_keys(self, asset_keys: Sequence[AssetKey], after_cursor: Option
             )
         )
 
+    def prefetch_asset_status_cache_values(
+        self, partitions_defs_by_asset_key: Mapping[AssetKey, Optional[PartitionsDefinition]]
+    ):
+        """For performance, refreshes the asset status cache of many assets at once"""
+        from dagster._core.storage.partition_status_cache import (
+            get_and_update_asset_status_cache_values,
+        )
+
+        if not self.instance.can_cache_asset_status_data():
+            return
+
+        self._asset_status_cache_value_cache.update(
+            get_and_update_asset_status_cache_values(self.instance, partitions_defs_by_asset_key)
+        )
+
     def get_asset_record(self, asset_key: AssetKey) -> Optional[AssetRecord]:
         if asset_key not in self._asset_record_cache:
             self._asset_record_cache[asset_key] = next(
@@ -440,11 +475,15 @@ def _calculate_time_partitioned_asset_data_time(
 
         if self.instance.can_cache_asset_status_data():
             # this is the current state of the asset, not the state of the asset at the time of record_id
-            status_cache_value = get_and_update_asset_status_cache_value(
-                instance=self._instance,
-                asset_key=asset_key,
-                partitions_def=partitions_def,
-            )
+            if asset_key not in self._asset_status_cache_value_cache:
+                self._asset_status_cache_value_cache[
+                    asset_key
+                ] = get_and_update_asset_status_cache_value(
+                    instance=self._instance,
+                    asset_key=asset_key,
+                    partitions_def=partitions_def,
+                )
+            status_cache_value = self._asset_status_cache_value_cache[asset_key]
             partition_subset = (
                 status_cache_value.deserialize_materialized_partition_subsets(
                     partitions_def=partitions_def
@@ -1,22 +1,33 @@
 import sys
+import threading
 from contextlib import contextmanager
+from unittest import mock
 
 import pytest
-from dagster import repository
-from dagster._api.snapshot_repository import sync_get_streaming_external_repositories_data_grpc
+from dagster import file_relative_path, repository
+from dagster._api.snapshot_repository import (
+    evict_cached_external_repository_data,
+    sync_get_streaming_external_repositories_data_grpc,
+)
 from dagster._core.errors import DagsterUserCodeProcessError
 from dagster._core.host_representation import (
     ExternalRepositoryData,
     ManagedGrpcPythonEnvRepositoryLocationOrigin,
 )
 from dagster._core.host_representation.external import ExternalRepository
-from dagster._core.host_representation.external_data import ExternalPipelineData
+from dagster._core.host_representation.external_data import (
+    ExternalPipelineData,
+    external_repository_data_from_def,
+)
 from dagster._core.host_representation.handle import RepositoryHandle
 from dagster._core.host_representation.origin import ExternalRepositoryOrigin
-from dagster._core.test_utils import instance_for_test
+from dagster._core.test_utils import environ, instance_for_test
 from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
+from dagster._grpc.__generated__ import api_pb2
+from dagster._grpc.server import DagsterApiServer
+from dagster._grpc.utils import get_external_repository_data_content_hash
 from dagster._legacy import lambda_solid, pipeline
-from dagster._serdes.serdes import deserialize_as
+from dagster._serdes.serdes import deserialize_as, serialize_value
 
 from .utils import get_bar_repo_repository_location
 
@@ -49,6 +60,96 @@ def test_streaming_external_repositories_error(instance):
             )
 
 
+def test_streaming_external_repository_if_modified(instance):
+    with get_bar_repo_repository_location(instance) as repository_location:
+        repo_origin = ExternalRepositoryOrigin(repository_location.origin, "bar_repo")
+
+        serialized_repository_data = "".join(
+            chunk["serialized_external_repository_chunk"]
+            for chunk in repository_location.client.streaming_external_repository_if_modified(
+                repo_origin, content_hash=""
+            )
+        )
+        assert deserialize_as(serialized_repository_data, ExternalRepositoryData).name == "bar_repo"
+        content_hash = get_external_repository_data_content_hash(serialized_repository_data)
+
+        # the server holds the same snapshot, so nothing is sent
+        assert (
+            list(
+                repository_location.client.streaming_external_repository_if_modified(
+                    repo_origin, content_hash=content_hash
+                )
+            )
+            == []
+        )
+
+        # a stale hash gets the full snapshot, which is serialized identically every time
+        assert (
+            "".join(
+                chunk["serialized_external_repository_chunk"]
+                for chunk in repository_location.client.streaming_external_repository_if_modified(
+                    repo_origin, content_hash="stale"
+                )
+            )
+            == serialized_repository_data
+        )
+
+
+def test_streaming_external_repositories_reuses_unchanged_data(instance):
+    with get_bar_repo_repository_location(instance) as repository_location:
+        owner = object()
+        first_repo_datas = sync_get_streaming_external_repositories_data_grpc(
+            repository_location.client, repository_location, cache_owner=owner
+        )
+        second_repo_datas = sync_get_streaming_external_repositories_data_grpc(
+            repository_location.client, repository_location, cache_owner=owner
+        )
+        assert second_repo_datas["bar_repo"] is first_repo_datas["bar_repo"]
+
+        # the cached data goes away with its owner
+        evict_cached_external_repository_data(owner)
+        third_repo_datas = sync_get_streaming_external_repositories_data_grpc(
+            repository_location.client, repository_location, cache_owner=object()
+        )
+        assert third_repo_datas["bar_repo"] is not first_repo_datas["bar_repo"]
+
+
+def test_server_serializes_static_repository_once():
+    loadable_target_origin = LoadableTargetOrigin(
+        executable_path=sys.executable,
+        python_file=file_relative_path(__file__, "api_tests_repo.py"),
+        attribute="bar_repo",
+    )
+    repo_origin = ExternalRepositoryOrigin(
+        ManagedGrpcPythonEnvRepositoryLocationOrigin(loadable_target_origin, "bar_repo_location"),
+        "bar_repo",
+    )
+    request = api_pb2.ExternalRepositoryIfModifiedRequest(
+        serialized_repository_python_origin=serialize_value(repo_origin),
+        defer_snapshots=False,
+        content_hash="",
+    )
+
+    server_termination_event = threading.Event()
+    api_server = DagsterApiServer(
+        server_termination_event=server_termination_event,
+        loadable_target_origin=loadable_target_origin,
+    )
+    try:
+        with mock.patch(
+            "dagster._grpc.server.external_repository_data_from_def",
+            wraps=external_repository_data_from_def,
+        ) as external_repository_data_from_def_mock:
+            first_chunks = list(api_server.StreamingExternalRepositoryIfModified(request, None))
+            second_chunks = list(api_server.StreamingExternalRepositoryIfModified(request, None))
+
+        assert first_chunks == second_chunks
+        assert external_repository_data_from_def_mock.call_count == 1
+    finally:
+        server_termination_event.set()
+        api_server.cleanup()
+
+
 @lambda_solid
 def do_something():
     return 1
@@ -160,3 +261,34 @@ def _ref_to_data(ref):
         job = repo.get_all_external_jobs()[0]
         _ = job.pipeline_snapshot
         assert _state.get("cnt", 0) == 1
+
+
+def test_deferred_snapshots_bounded_job_cache(instance):
+    with environ({"DAGSTER_DEFER_JOB_SNAPSHOTS": "1", "DAGSTER_MAX_CACHED_EXTERNAL_JOBS": "2"}):
+        with get_bar_repo_repository_location(instance) as repository_location:
+            repo = repository_location.get_repository("bar_repo")
+            assert repo.deferred_snapshots
+            assert repo.external_repository_data.external_pipeline_datas is None
+
+            job_names = sorted(
+                job_ref.name for job_ref in repo.external_repository_data.external_job_refs
+            )
+            assert len(job_names) == 5
+
+            first_job = repo.get_full_external_job(job_names[0])
+            # snapshots are fetched from the server on first access
+            assert first_job.pipeline_snapshot.name == job_names[0]
+
+            for job_name in job_names[1:]:
+                repo.get_full_external_job(job_name)
+
+            # evicted jobs are shared for as long as they are still referenced
+            assert repo.get_full_external_job(job_names[0]) is first_job
+            assert len(repo._cached_jobs) == 2  # pylint: disable=protected-access
+
+            repo.clear_cached_jobs()
+            assert len(repo._cached_jobs) == 0  # pylint: disable=protected-access
+            assert repo.get_full_external_job(job_names[0]) is first_job
+
+            second_job = repo.get_full_external_job(job_names[1])
+            assert second_job.pipeline_snapshot.name == job_names[1]
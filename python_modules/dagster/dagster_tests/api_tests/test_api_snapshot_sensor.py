@@ -2,8 +2,10 @@
 from dagster._api.snapshot_sensor import sync_get_external_sensor_execution_data_ephemeral_grpc
 from dagster._core.definitions.sensor_definition import SensorExecutionData
 from dagster._core.errors import DagsterUserCodeProcessError, DagsterUserCodeUnreachableError
+from dagster._core.host_representation.external_data import ExternalSensorExecutionErrorData
+from dagster._core.host_representation.repository_location import SensorExecutionRequest
 
-from .utils import get_bar_repo_handle
+from .utils import get_bar_repo_handle, get_bar_repo_repository_location
 
 
 def test_external_sensor_grpc(instance):
@@ -46,3 +48,29 @@ def test_external_sensor_timeout(instance):
             sync_get_external_sensor_execution_data_ephemeral_grpc(
                 instance, repository_handle, "sensor_foo", None, None, None, timeout=0
             )
+
+
+def test_external_sensor_batch_grpc(instance):
+    with get_bar_repo_repository_location(instance) as repository_location:
+        repository_handle = repository_location.get_repository("bar_repo").handle
+        results = list(
+            repository_location.get_external_sensor_execution_data_batch(
+                instance,
+                [
+                    SensorExecutionRequest(repository_handle, sensor_name, None, None, None)
+                    for sensor_name in ["sensor_foo", "sensor_error", "sensor_foo"]
+                ],
+            )
+        )
+        assert len(results) == 3
+
+        assert isinstance(results[0], SensorExecutionData)
+        assert len(results[0].run_requests) == 2
+        assert results[0].run_requests[0].run_config == {"foo": "FOO"}
+
+        # an error in one sensor does not fail the rest of the batch
+        assert isinstance(results[1], ExternalSensorExecutionErrorData)
+        assert "womp womp" in str(results[1].error)
+
+        assert isinstance(results[2], SensorExecutionData)
+        assert len(results[2].run_requests) == 2
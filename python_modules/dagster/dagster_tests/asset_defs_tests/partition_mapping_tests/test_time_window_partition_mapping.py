@@ -221,3 +221,49 @@ def test_daily_to_daily_lag_different_start_date():
     assert mapping.get_downstream_partitions_for_partitions(
         subset_with_key(upstream_partitions_def, "2021-05-05"), downstream_partitions_def
     ).get_partition_keys() == ["2021-05-06"]
+
+
+def test_partition_key_ranges_map_like_partitions():
+    daily_partitions_def = DailyPartitionsDefinition(start_date="2021-05-05")
+    hourly_partitions_def = HourlyPartitionsDefinition(start_date="2021-05-05-00:00")
+
+    for partition_mapping, upstream_partitions_def, downstream_partitions_def, key_range in [
+        (
+            TimeWindowPartitionMapping(),
+            daily_partitions_def,
+            hourly_partitions_def,
+            PartitionKeyRange("2021-05-07-05:00", "2021-05-09-09:00"),
+        ),
+        (
+            TimeWindowPartitionMapping(),
+            hourly_partitions_def,
+            daily_partitions_def,
+            PartitionKeyRange("2021-05-07", "2021-05-09"),
+        ),
+        (
+            TimeWindowPartitionMapping(start_offset=-1, end_offset=-1),
+            daily_partitions_def,
+            daily_partitions_def,
+            PartitionKeyRange("2021-05-07", "2021-05-09"),
+        ),
+    ]:
+        downstream_subset = subset_with_key_range(
+            downstream_partitions_def, key_range.start, key_range.end
+        )
+        upstream_key_range = partition_mapping.get_upstream_partitions_for_partition_range(
+            key_range, downstream_partitions_def, upstream_partitions_def
+        )
+        assert [upstream_key_range] == partition_mapping.get_upstream_partitions_for_partitions(
+            downstream_subset, upstream_partitions_def
+        ).get_partition_key_ranges()
+
+        assert [
+            partition_mapping.get_downstream_partitions_for_partition_range(
+                upstream_key_range, downstream_partitions_def, upstream_partitions_def
+            )
+        ] == partition_mapping.get_downstream_partitions_for_partitions(
+            subset_with_key_range(
+                upstream_partitions_def, upstream_key_range.start, upstream_key_range.end
+            ),
+            downstream_partitions_def,
+        ).get_partition_key_ranges()
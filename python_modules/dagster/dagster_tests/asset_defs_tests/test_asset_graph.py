@@ -1,4 +1,6 @@
 # pylint: disable=unused-argument
+import gc
+from unittest import mock
 from unittest.mock import MagicMock
 
 import pendulum
@@ -15,6 +17,7 @@
     Out,
     PartitionMapping,
     StaticPartitionsDefinition,
+    TimeWindowPartitionMapping,
     asset,
     graph,
     multi_asset,
@@ -29,6 +32,7 @@
 from dagster._core.host_representation.external_data import external_asset_graph_from_defs
 from dagster._core.test_utils import instance_for_test
 from dagster._seven.compat.pendulum import create_pendulum_time
+from dagster._utils.caching_instance_queryer import CachingInstanceQueryer
 
 
 def to_external_asset_graph(assets) -> AssetGraph:
@@ -360,3 +364,91 @@ def downstream_of_partitioned_source():
 
     assert asset_graph.is_partitioned(AssetKey("partitioned_source"))
     assert asset_graph.is_partitioned(AssetKey("downstream_of_partitioned_source"))
+
+
+def test_get_partition_key_ranges():
+    @asset(partitions_def=DailyPartitionsDefinition(start_date="2022-01-01"))
+    def parent():
+        ...
+
+    @asset(partitions_def=HourlyPartitionsDefinition(start_date="2022-01-01-00:00"))
+    def child(parent):
+        ...
+
+    @asset(partitions_def=StaticPartitionsDefinition(["a", "b", "c"]))
+    def static_parent():
+        ...
+
+    @asset(partitions_def=StaticPartitionsDefinition(["a", "b", "c"]))
+    def static_child(static_parent):
+        ...
+
+    for asset_graph in [
+        AssetGraph.from_assets([parent, child, static_parent, static_child]),
+        to_external_asset_graph([parent, child, static_parent, static_child]),
+    ]:
+        with instance_for_test() as instance:
+            assert asset_graph.get_child_partition_key_ranges_of_parent(
+                instance, PartitionKeyRange("2022-01-03", "2022-01-05"), parent.key, child.key
+            ) == [PartitionKeyRange("2022-01-03-00:00", "2022-01-05-23:00")]
+            assert asset_graph.get_parent_partition_key_ranges_for_child(
+                instance,
+                PartitionKeyRange("2022-01-03-05:00", "2022-01-05-00:00"),
+                parent.key,
+                child.key,
+            ) == [PartitionKeyRange("2022-01-03", "2022-01-05")]
+            assert asset_graph.get_child_partition_key_ranges_of_parent(
+                instance, PartitionKeyRange("b", "c"), static_parent.key, static_child.key
+            ) == [PartitionKeyRange("b", "c")]
+
+
+def test_partition_mappings_memoized_per_instance_queryer():
+    @asset(partitions_def=DailyPartitionsDefinition(start_date="2022-01-01"))
+    def parent():
+        ...
+
+    @asset(partitions_def=HourlyPartitionsDefinition(start_date="2022-01-01-00:00"))
+    def child(parent):
+        ...
+
+    asset_graph = AssetGraph.from_assets([parent, child])
+    expected_children = {
+        AssetKeyPartitionKey(child.key, f"2022-01-03-{str(hour).zfill(2)}:00") for hour in range(24)
+    }
+
+    with instance_for_test() as instance, mock.patch.object(
+        TimeWindowPartitionMapping,
+        "get_downstream_partitions_for_partitions",
+        autospec=True,
+        side_effect=TimeWindowPartitionMapping.get_downstream_partitions_for_partitions,
+    ) as mapping_mock:
+        instance_queryer = CachingInstanceQueryer(instance)
+        for _ in range(3):
+            assert (
+                asset_graph.get_children_partitions(instance_queryer, parent.key, "2022-01-03")
+                == expected_children
+            )
+        assert mapping_mock.call_count == 1
+
+        # a new queryer, e.g. for the next sensor tick, maps the partitions again
+        assert (
+            asset_graph.get_children_partitions(
+                CachingInstanceQueryer(instance), parent.key, "2022-01-03"
+            )
+            == expected_children
+        )
+        assert mapping_mock.call_count == 2
+
+        # other dynamic partitions stores are not memoized
+        for _ in range(2):
+            asset_graph.get_children_partitions(instance, parent.key, "2022-01-03")
+        assert mapping_mock.call_count == 4
+
+        # results are dropped along with the graph they were mapped for
+        other_asset_graph = AssetGraph.from_assets([parent, child])
+        other_asset_graph.get_children_partitions(instance_queryer, parent.key, "2022-01-03")
+        assert mapping_mock.call_count == 5
+        assert len(instance_queryer.partition_mapping_cache) == 2
+        del other_asset_graph
+        gc.collect()
+        assert list(instance_queryer.partition_mapping_cache) == [asset_graph]
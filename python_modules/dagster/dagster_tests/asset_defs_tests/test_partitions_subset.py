@@ -1,5 +1,11 @@
+import json
+
 import pytest
-from dagster import DailyPartitionsDefinition, StaticPartitionsDefinition
+from dagster import (
+    DailyPartitionsDefinition,
+    DynamicPartitionsDefinition,
+    StaticPartitionsDefinition,
+)
 from dagster._core.definitions.partition import DefaultPartitionsSubset
 from dagster._core.definitions.time_window_partitions import TimeWindowPartitionsSubset
 from dagster._core.errors import DagsterInvalidDeserializationVersionError
@@ -58,3 +64,34 @@ class NewSerializationVersionSubset(TimeWindowPartitionsSubset):
 
     with pytest.raises(DagsterInvalidDeserializationVersionError, match="version -2"):
         NewSerializationVersionSubset.from_serialized(daily_partitions_def, serialized_subset)
+
+
+def test_default_subset_legacy_version_deserialization():
+    partitions = StaticPartitionsDefinition(["foo", "bar", "baz", "qux"])
+    serialization = '{"version": 1, "subset": ["foo", "baz"]}'
+    deserialized = partitions.deserialize_subset(serialization)
+    assert deserialized.get_partition_keys() == {"baz", "foo"}
+
+
+def test_dynamic_partitions_subset_serialization_is_compact():
+    partitions_def = DynamicPartitionsDefinition(lambda _current_time: [])
+    partition_keys = {f"customer_{i:06d}" for i in range(100_000)}
+    subset = partitions_def.empty_subset().with_partition_keys(partition_keys)
+
+    serialization = subset.serialize()
+    assert len(serialization) < len(json.dumps(list(partition_keys))) / 4
+
+    deserialized = partitions_def.deserialize_subset(serialization)
+    assert deserialized.get_partition_keys() == partition_keys
+    assert deserialized == subset
+
+
+def test_default_subset_set_operations():
+    partitions_def = StaticPartitionsDefinition(["a", "b", "c", "d"])
+    left = partitions_def.empty_subset().with_partition_keys(["a", "b", "c"])
+    right = partitions_def.empty_subset().with_partition_keys(["b", "c", "d"])
+
+    assert (left | right).get_partition_keys() == {"a", "b", "c", "d"}
+    assert (left & right).get_partition_keys() == {"b", "c"}
+    assert (left - right).get_partition_keys() == {"a"}
+    assert (left - left) == partitions_def.empty_subset()
@@ -0,0 +1,223 @@
+import os
+import time
+from enum import Enum as PythonEnum
+
+import pytest
+from dagster import (
+    Any,
+    Array,
+    BoolSource,
+    Enum,
+    EnumValue,
+    Field,
+    IntSource,
+    Map,
+    Noneable,
+    Permissive,
+    Selector,
+    Shape,
+    StringSource,
+    job,
+    op,
+)
+from dagster._config import ConfigTypeKind, post_process_config, process_config, validate_config
+from dagster._config.compiled import compile_config_processor
+from dagster._config.field import resolve_to_config_type
+from dagster._core.test_utils import environ
+
+
+class Color(PythonEnum):
+    RED = 1
+    GREEN = 2
+
+
+def _interpreted_process_config(config_type, config_value):
+    validate_evr = validate_config(config_type, config_value)
+    if not validate_evr.success:
+        return validate_evr
+    return post_process_config(config_type, validate_evr.value)
+
+
+def _assert_processes_like_evaluator(config_schema, config_value):
+    config_type = resolve_to_config_type(config_schema)
+    expected = _interpreted_process_config(config_type, config_value)
+    result = process_config(config_type, config_value)
+
+    assert result.success == expected.success
+    assert result.value == expected.value
+    assert type(result.value) == type(expected.value)  # pylint: disable=unidiomatic-typecheck
+    assert result.errors == expected.errors
+    return result
+
+
+def _op_config_schema():
+    return {
+        "name": str,
+        "count": Field(int, is_required=False, default_value=3),
+        "ratio": Field(float, is_required=False),
+        "enabled": Field(BoolSource, is_required=False, default_value=True),
+        "color": Field(Enum.from_python_enum(Color), is_required=False, default_value="RED"),
+        "tags": Field(Map(str, str), is_required=False, default_value={}),
+        "paths": Field([str], is_required=False),
+        "limit": Field(Noneable(IntSource), is_required=False, default_value=None),
+        "storage": Field(
+            Noneable(
+                Selector(
+                    {
+                        "filesystem": {"base_dir": Field(StringSource, is_required=False)},
+                        "in_memory": Field(Shape({}), is_required=False),
+                    }
+                )
+            ),
+            is_required=False,
+            default_value={"in_memory": {}},
+        ),
+        "extra": Field(Permissive({"known": Field(int, is_required=False)}), is_required=False),
+        "anything": Field(Any, is_required=False),
+    }
+
+
+def _build_large_job(num_ops):
+    def _make_op(i):
+        @op(name=f"op_{i}", config_schema=_op_config_schema())
+        def _op(_):
+            pass
+
+        return _op
+
+    ops = [_make_op(i) for i in range(num_ops)]
+
+    @job
+    def large_job():
+        for op_def in ops:
+            op_def()
+
+    return large_job
+
+
+def _large_run_config(num_ops):
+    return {
+        "ops": {
+            f"op_{i}": {
+                "config": {
+                    "name": f"op_{i}",
+                    "count": i,
+                    "ratio": i / 2,
+                    "enabled": {"env": "DAGSTER_TEST_COMPILED_ENABLED"} if i % 2 else False,
+                    "color": "GREEN",
+                    "tags": {"index": str(i)},
+                    "paths": [f"/tmp/{i}/a", f"/tmp/{i}/b"],
+                    "limit": {"env": "DAGSTER_TEST_COMPILED_LIMIT"} if i % 3 else None,
+                    "storage": {"filesystem": {"base_dir": f"/tmp/{i}"}} if i % 5 else None,
+                    "extra": {"known": i, "unknown": [i]},
+                    "anything": {"nested": [i, None]},
+                }
+            }
+            for i in range(num_ops)
+        },
+        "execution": {"config": {"multiprocess": {"max_concurrent": 4}}},
+        "loggers": {"console": {"config": {"log_level": "INFO"}}},
+    }
+
+
+@pytest.mark.parametrize(
+    "config_schema,config_value",
+    [
+        (int, 1),
+        (int, True),
+        (float, 1),
+        (str, None),
+        (Noneable(int), None),
+        (Any, {"a": [1, None]}),
+        ([int], []),
+        ([int], [1, None]),
+        ([Noneable(int)], [1, None]),
+        (Map(str, int), {}),
+        (Map(str, int), {"a": 1}),
+        (Map(str, int), {1: 1}),
+        (Map(str, Noneable(int)), {"a": None}),
+        (Enum.from_python_enum(Color), "GREEN"),
+        (Enum.from_python_enum(Color), "BLUE"),
+        ({"a": Field(int, default_value=2)}, {}),
+        ({"a": int}, {}),
+        ({"a": int}, {"a": 1, "b": 2}),
+        (Permissive({"a": Field(int, default_value=2)}), {"b": [1]}),
+        (Shape({"a": int}, field_aliases={"a": "alias_a"}), {"alias_a": 1}),
+        (Shape({"a": int}, field_aliases={"a": "alias_a"}), {"b": 1}),
+        (Selector({"a": Field(int, default_value=1)}), {}),
+        (Selector({"a": int, "b": int}), {}),
+        (Selector({"a": int, "b": int}), {"a": 1, "b": 2}),
+        (Selector({"a": {"b": Field(int, default_value=1)}}), {"a": None}),
+        (StringSource, "value"),
+        (StringSource, {"env": "DAGSTER_TEST_COMPILED_STRING"}),
+        (StringSource, {"env": "DAGSTER_TEST_COMPILED_MISSING"}),
+        (IntSource, {"env": "DAGSTER_TEST_COMPILED_STRING"}),
+        (Array(Shape({"a": Field(int, default_value=1)})), [{}, {"a": 2}]),
+    ],
+)
+def test_compiled_matches_evaluator(config_schema, config_value):
+    with environ({"DAGSTER_TEST_COMPILED_STRING": "foo"}):
+        _assert_processes_like_evaluator(config_schema, config_value)
+
+
+def test_compiled_processor_cached_per_config_type():
+    config_type = resolve_to_config_type({"a": Field(int, default_value=1)})
+    processor = config_type.get_compiled_processor()
+    assert config_type.get_compiled_processor() is processor
+    assert processor({}) == {"a": 1}
+
+    # each enum instance keeps its own post-processing, even when keys collide
+    first = Enum("SameName", [EnumValue("A", python_value=1)])
+    second = Enum("SameName", [EnumValue("A", python_value=2)])
+    assert first.key == second.key
+    assert compile_config_processor(first)("A") == 1
+    assert compile_config_processor(second)("A") == 2
+
+
+def test_compiled_large_run_config():
+    large_job = _build_large_job(200)
+    config_type = large_job.get_run_config_schema("default").run_config_schema_type
+    assert config_type.kind == ConfigTypeKind.STRICT_SHAPE
+
+    run_config = _large_run_config(200)
+    with environ({"DAGSTER_TEST_COMPILED_ENABLED": "true", "DAGSTER_TEST_COMPILED_LIMIT": "10"}):
+        result = _assert_processes_like_evaluator(config_type, run_config)
+        assert result.success
+        assert result.value["ops"]["op_1"]["config"]["limit"] == 10
+        assert result.value["ops"]["op_1"]["config"]["color"] == Color.GREEN
+
+        invalid_run_config = _large_run_config(200)
+        invalid_run_config["ops"]["op_7"]["config"]["count"] = "seven"
+        del invalid_run_config["ops"]["op_9"]["config"]["name"]
+        result = _assert_processes_like_evaluator(config_type, invalid_run_config)
+        assert not result.success
+        assert len(result.errors) == 2
+
+
+def _benchmark(num_ops=200, iterations=20):
+    large_job = _build_large_job(num_ops)
+    config_type = large_job.get_run_config_schema("default").run_config_schema_type
+    run_config = _large_run_config(num_ops)
+
+    os.environ["DAGSTER_TEST_COMPILED_ENABLED"] = "true"
+    os.environ["DAGSTER_TEST_COMPILED_LIMIT"] = "10"
+
+    start = time.perf_counter()
+    config_type.get_compiled_processor()
+    print(f"compile: {(time.perf_counter() - start) * 1000:.1f}ms")  # noqa: T201
+
+    for name, fn in [
+        ("evaluator", _interpreted_process_config),
+        ("compiled", process_config),
+    ]:
+        start = time.perf_counter()
+        for _ in range(iterations):
+            assert fn(config_type, run_config).success
+        elapsed = (time.perf_counter() - start) / iterations
+        print(f"{name}: {elapsed * 1000:.1f}ms per run config")  # noqa: T201
+
+
+if __name__ == "__main__":
+    # python test_compiled_config.py: compare processing a large run config with the evaluator and
+    # with the compiled processor
+    _benchmark()
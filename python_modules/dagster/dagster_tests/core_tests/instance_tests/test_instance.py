@@ -1,4 +1,6 @@
 import re
+import time
+from unittest import mock
 
 import pytest
 import yaml
@@ -17,8 +19,11 @@
     DagsterInvalidConfigError,
     DagsterInvariantViolationError,
 )
+from dagster._core.events.log import EventLogEntry
 from dagster._core.execution.api import create_execution_plan
 from dagster._core.instance import DagsterInstance, InstanceRef
+from dagster._core.snap.execution_plan_snapshot import ExecutionPlanSnapshot
+from dagster._core.snap.pipeline_snapshot import PipelineSnapshot
 from dagster._core.instance.config import DEFAULT_LOCAL_CODE_SERVER_STARTUP_TIMEOUT
 from dagster._core.launcher import LaunchRunContext, RunLauncher
 from dagster._core.run_coordinator.queued_run_coordinator import QueuedRunCoordinator
@@ -28,6 +33,7 @@
     create_pipeline_snapshot_id,
     snapshot_from_execution_plan,
 )
+from dagster._core.storage.pipeline_run import DagsterRunStatus
 from dagster._core.storage.sqlite_storage import (
     _event_logs_directory,
     _runs_directory,
@@ -40,7 +46,7 @@
     instance_for_test,
 )
 from dagster._legacy import PipelineDefinition
-from dagster._serdes import ConfigurableClass
+from dagster._serdes import ConfigurableClass, create_snapshot_id
 from dagster._serdes.config_class import ConfigurableClassData
 
 from dagster_tests.api_tests.utils import get_bar_workspace
@@ -198,6 +204,68 @@ def test_create_execution_plan_snapshot():
         assert run.execution_plan_snapshot_id == create_execution_plan_snapshot_id(ep_snapshot)
 
 
+def test_create_runs_with_same_snapshots():
+    pipeline_snapshot = noop_job.get_pipeline_snapshot()
+    ep_snapshot = snapshot_from_execution_plan(
+        create_execution_plan(noop_job), noop_job.get_pipeline_snapshot_id()
+    )
+
+    with instance_for_test() as instance:
+        run_storage = instance.run_storage
+        with mock.patch(
+            "dagster._core.snap.pipeline_snapshot.create_snapshot_id",
+            wraps=create_snapshot_id,
+        ) as pipeline_snapshot_hashes, mock.patch(
+            "dagster._core.snap.execution_plan_snapshot.create_snapshot_id",
+            wraps=create_snapshot_id,
+        ) as ep_snapshot_hashes, mock.patch.object(
+            run_storage, "has_pipeline_snapshot", wraps=run_storage.has_pipeline_snapshot
+        ) as has_pipeline_snapshot, mock.patch.object(
+            run_storage,
+            "has_execution_plan_snapshot",
+            wraps=run_storage.has_execution_plan_snapshot,
+        ) as has_execution_plan_snapshot:
+            # snapshot ids are only computed once per snapshot object
+            fresh_pipeline_snapshot = PipelineSnapshot(*pipeline_snapshot)
+            fresh_ep_snapshot = ExecutionPlanSnapshot(*ep_snapshot)
+
+            runs = [
+                create_run_for_test(
+                    instance,
+                    pipeline_name="noop_job",
+                    pipeline_snapshot=fresh_pipeline_snapshot,
+                    execution_plan_snapshot=fresh_ep_snapshot,
+                )
+                for _ in range(5)
+            ]
+
+            assert pipeline_snapshot_hashes.call_count == 1
+            assert ep_snapshot_hashes.call_count == 1
+
+            # run storage is only checked for the snapshots by the first run, apart from the check
+            # for the pipeline snapshot made by run storage itself when adding each run
+            assert has_pipeline_snapshot.call_count == 1 + len(runs)
+            assert has_execution_plan_snapshot.call_count == 1
+
+        for run in runs:
+            assert run.pipeline_snapshot_id == create_pipeline_snapshot_id(pipeline_snapshot)
+            assert run.execution_plan_snapshot_id == create_execution_plan_snapshot_id(ep_snapshot)
+            assert instance.get_pipeline_snapshot(run.pipeline_snapshot_id) == pipeline_snapshot
+            assert (
+                instance.get_execution_plan_snapshot(run.execution_plan_snapshot_id) == ep_snapshot
+            )
+
+        # a wiped instance persists the snapshots again
+        instance.wipe()
+        run = create_run_for_test(
+            instance,
+            pipeline_name="noop_job",
+            pipeline_snapshot=pipeline_snapshot,
+            execution_plan_snapshot=ep_snapshot,
+        )
+        assert instance.get_pipeline_snapshot(run.pipeline_snapshot_id) == pipeline_snapshot
+
+
 def test_submit_run():
     with instance_for_test(
         overrides={
@@ -304,6 +372,90 @@ def test_grpc_override_settings():
         assert instance.code_server_process_startup_timeout == 60
 
 
+def _log_entry(run_id, message):
+    return EventLogEntry(
+        error_info=None,
+        level="debug",
+        user_message=message,
+        run_id=run_id,
+        timestamp=time.time(),
+    )
+
+
+def test_event_log_buffer():
+    with instance_for_test(
+        overrides={
+            "event_log_buffer": {"enabled": True, "max_events": 3, "max_interval_seconds": 60.0}
+        }
+    ) as instance:
+        assert instance.event_log_buffer_enabled
+        run = create_run_for_test(instance, pipeline_name="foo_pipeline")
+        received = []
+        instance.add_event_listener(run.run_id, received.append)
+
+        instance.handle_new_event(_log_entry(run.run_id, "one"))
+        instance.handle_new_event(_log_entry(run.run_id, "two"))
+        assert instance.all_logs(run.run_id) == []
+        assert received == []
+
+        # flushed when the buffer is full
+        instance.handle_new_event(_log_entry(run.run_id, "three"))
+        assert [event.user_message for event in instance.all_logs(run.run_id)] == [
+            "one",
+            "two",
+            "three",
+        ]
+        assert [event.user_message for event in received] == ["one", "two", "three"]
+
+        # flushed on run boundary events
+        instance.handle_new_event(_log_entry(run.run_id, "four"))
+        instance.report_run_failed(run)
+        assert len(instance.all_logs(run.run_id)) == 5
+        assert instance.get_run_by_id(run.run_id).status == DagsterRunStatus.FAILURE
+
+        # flushed explicitly, or when the instance is disposed
+        instance.handle_new_event(_log_entry(run.run_id, "five"))
+        instance.flush_buffered_events()
+        assert len(instance.all_logs(run.run_id)) == 6
+
+
+def test_event_log_buffer_max_interval():
+    with instance_for_test(
+        overrides={"event_log_buffer": {"enabled": True, "max_interval_seconds": 0.1}}
+    ) as instance:
+        run = create_run_for_test(instance, pipeline_name="foo_pipeline")
+        instance.handle_new_event(_log_entry(run.run_id, "one"))
+
+        # flushed once the oldest buffered event is old enough, without waiting for another event
+        start_time = time.time()
+        while not instance.all_logs(run.run_id):
+            assert time.time() - start_time < 10
+            time.sleep(0.05)
+        assert [event.user_message for event in instance.all_logs(run.run_id)] == ["one"]
+
+        instance.handle_new_event(_log_entry(run.run_id, "two"))
+        instance.flush_buffered_events()
+        time.sleep(0.2)
+        assert len(instance.all_logs(run.run_id)) == 2
+
+
+def test_event_log_buffer_run():
+    @op
+    def log_op(context):
+        for i in range(10):
+            context.log.info(f"message {i}")
+
+    @job
+    def log_job():
+        log_op()
+
+    with instance_for_test(overrides={"event_log_buffer": {"enabled": True}}) as instance:
+        result = log_job.execute_in_process(instance=instance)
+        assert result.success
+        messages = [event.user_message for event in instance.all_logs(result.run_id)]
+        assert all(f"message {i}" in messages for i in range(10))
+
+
 def test_run_monitoring(capsys):  # pylint: disable=unused-argument
     with instance_for_test(
         overrides={
@@ -53,7 +53,11 @@
     wait_for_futures,
 )
 from dagster._daemon import get_default_daemon_logger
-from dagster._daemon.sensor import execute_sensor_iteration, execute_sensor_iteration_loop
+from dagster._daemon.sensor import (
+    SensorTickMetrics,
+    execute_sensor_iteration,
+    execute_sensor_iteration_loop,
+)
 from dagster._legacy import pipeline, solid
 from dagster._seven.compat.pendulum import create_pendulum_time, to_timezone
 
@@ -2824,6 +2828,96 @@ def test_settings():
         assert thread_inst.get_settings("sensors") == settings
 
 
+@pytest.mark.parametrize("executor", get_sensor_executors())
+def test_batched_sensors(executor, workspace_context, external_repo):
+    freeze_datetime = to_timezone(
+        create_pendulum_time(year=2019, month=2, day=27, hour=23, minute=59, second=59, tz="UTC"),
+        "US/Central",
+    )
+    with instance_for_test(
+        overrides={
+            "run_launcher": {"module": "dagster._core.test_utils", "class": "MockedRunLauncher"},
+            "sensors": {"batch_size": 2, "max_concurrent_batches_per_location": 1},
+        },
+    ) as instance:
+        batch_workspace_context = workspace_context.copy_for_test_instance(instance)
+        external_sensors = [
+            external_repo.get_external_sensor(sensor_name)
+            for sensor_name in ["simple_sensor", "error_sensor", "always_on_sensor"]
+        ]
+
+        with pendulum.test(freeze_datetime):
+            for external_sensor in external_sensors:
+                instance.add_instigator_state(
+                    InstigatorState(
+                        external_sensor.get_external_origin(),
+                        InstigatorType.SENSOR,
+                        InstigatorStatus.RUNNING,
+                    )
+                )
+
+            sensor_tick_metrics = SensorTickMetrics()
+            futures = {}
+            list(
+                execute_sensor_iteration(
+                    batch_workspace_context,
+                    get_default_daemon_logger("SensorDaemon"),
+                    threadpool_executor=executor,
+                    sensor_tick_futures=futures,
+                    sensor_tick_metrics=sensor_tick_metrics,
+                )
+            )
+            wait_for_futures(futures)
+
+            def _get_ticks_by_sensor_name():
+                return {
+                    external_sensor.name: instance.get_ticks(
+                        external_sensor.get_external_origin_id(), external_sensor.selector_id
+                    )
+                    for external_sensor in external_sensors
+                }
+
+            ticks_by_sensor_name = _get_ticks_by_sensor_name()
+
+            if executor:
+                # with a single batch in flight per location, the sensor in the second batch has
+                # to wait for the next iteration
+                assert len([ticks for ticks in ticks_by_sensor_name.values() if ticks]) == 2
+                list(
+                    execute_sensor_iteration(
+                        batch_workspace_context,
+                        get_default_daemon_logger("SensorDaemon"),
+                        threadpool_executor=executor,
+                        sensor_tick_futures=futures,
+                        sensor_tick_metrics=sensor_tick_metrics,
+                    )
+                )
+                wait_for_futures(futures)
+                ticks_by_sensor_name = _get_ticks_by_sensor_name()
+
+            assert len(ticks_by_sensor_name["simple_sensor"]) == 1
+            assert ticks_by_sensor_name["simple_sensor"][0].status == TickStatus.SKIPPED
+
+            assert len(ticks_by_sensor_name["error_sensor"]) == 1
+            validate_tick(
+                ticks_by_sensor_name["error_sensor"][0],
+                external_sensors[1],
+                freeze_datetime,
+                TickStatus.FAILURE,
+                [],
+                "Error occurred during the execution of evaluation_fn for sensor error_sensor",
+            )
+
+            assert len(ticks_by_sensor_name["always_on_sensor"]) == 1
+            assert ticks_by_sensor_name["always_on_sensor"][0].status == TickStatus.SUCCESS
+            assert instance.get_runs_count() == 1
+
+            latencies = sensor_tick_metrics.get_tick_latencies()
+            for external_sensor in [external_sensors[0], external_sensors[2]]:
+                assert latencies[external_sensor.selector_id].num_ticks == 1
+                assert latencies[external_sensor.selector_id].sensor_name == external_sensor.name
+
+
 @pytest.mark.parametrize("executor", get_sensor_executors())
 def test_sensor_logging(executor, instance, workspace_context, external_repo):
     external_sensor = external_repo.get_external_sensor("logging_sensor")
@@ -14,6 +14,7 @@
     instance_for_test,
 )
 from dagster._core.workspace.load_target import EmptyWorkspaceTarget
+from dagster._daemon.run_coordinator import queued_run_coordinator_daemon
 from dagster._daemon.run_coordinator.queued_run_coordinator_daemon import QueuedRunCoordinatorDaemon
 
 from dagster_tests.api_tests.utils import get_foo_job_handle
@@ -837,3 +838,61 @@ def test_key_limit_with_extra_tags(use_threads, workspace_context, daemon, pipel
 
         list(daemon.run_iteration(bounded_ctx))
         assert get_run_ids(instance.run_launcher.queue()) == ["run-1"]
+
+
+def test_in_progress_runs_tracked_incrementally(workspace_context, daemon, pipeline_handle):
+    with instance_for_queued_run_coordinator(max_concurrent_runs=1) as instance:
+        bounded_ctx = workspace_context.copy_for_test_instance(instance)
+
+        create_run(
+            instance, pipeline_handle, run_id="in-progress-run", status=DagsterRunStatus.STARTED
+        )
+        create_queued_run(instance, pipeline_handle, run_id="queued-run")
+
+        list(daemon.run_iteration(bounded_ctx))
+        assert get_run_ids(instance.run_launcher.queue()) == []
+
+        # the in progress run finishing frees up a slot on the next iteration
+        instance.report_run_failed(instance.get_run_by_id("in-progress-run"))
+        list(daemon.run_iteration(bounded_ctx))
+        assert get_run_ids(instance.run_launcher.queue()) == ["queued-run"]
+
+        # the launched run now counts against the limit
+        create_queued_run(instance, pipeline_handle, run_id="other-queued-run")
+        list(daemon.run_iteration(bounded_ctx))
+        assert get_run_ids(instance.run_launcher.queue()) == ["queued-run"]
+
+
+def test_queued_runs_read_in_pages(monkeypatch, workspace_context, daemon, pipeline_handle):
+    monkeypatch.setattr(queued_run_coordinator_daemon, "RUN_QUEUE_PAGE_SIZE", 2)
+    with instance_for_queued_run_coordinator(
+        max_concurrent_runs=2,
+        tag_concurrency_limits=[{"key": "database", "value": "tiny", "limit": 1}],
+    ) as instance:
+        bounded_ctx = workspace_context.copy_for_test_instance(instance)
+
+        for i in range(3):
+            create_queued_run(
+                instance, pipeline_handle, run_id=f"tiny-{i}", tags={"database": "tiny"}
+            )
+        for i in range(3):
+            create_queued_run(
+                instance, pipeline_handle, run_id=f"large-{i}", tags={"database": "large"}
+            )
+
+        pages = []
+        get_queued_run_entries = daemon._get_queued_run_entries
+
+        def _get_queued_run_entries(instance, limit, cursor):
+            entries = get_queued_run_entries(instance, limit, cursor)
+            pages.append([entry.run_id for entry in entries])
+            return entries
+
+        monkeypatch.setattr(daemon, "_get_queued_run_entries", _get_queued_run_entries)
+
+        list(daemon.run_iteration(bounded_ctx))
+
+        # the runs blocked by the tag limit span the first page, and no pages are read once the
+        # concurrency limit is reached
+        assert pages == [["tiny-0", "tiny-1"], ["tiny-2", "large-0"]]
+        assert get_run_ids(instance.run_launcher.queue()) == ["tiny-0", "large-0"]
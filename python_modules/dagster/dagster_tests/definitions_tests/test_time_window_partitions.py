@@ -1,5 +1,6 @@
 from datetime import datetime
 from typing import cast
+from unittest import mock
 
 import pendulum.parser
 import pytest
@@ -19,8 +20,10 @@
     ScheduleType,
     TimeWindow,
     TimeWindowPartitionsSubset,
+    _has_whole_hour_utc_offset_changes,
 )
 from dagster._utils.partitions import DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE
+from dagster._utils.schedules import cron_string_iterator
 
 DATE_FORMAT = "%Y-%m-%d"
 
@@ -545,6 +548,102 @@ def test_time_window_partitions_subset_non_utc_timezone():
     assert set(subset.get_partition_keys()) == set(with_keys)
 
 
+@pytest.mark.parametrize(
+    "partitions_def",
+    [
+        DailyPartitionsDefinition(start_date="2015-01-01", timezone="America/Los_Angeles"),
+        # ticks on weekdays only, so set operations work on timestamps rather than indexes
+        TimeWindowPartitionsDefinition(
+            start="2015-01-01", cron_schedule="0 0 * * 1-5", fmt=DATE_FORMAT
+        ),
+    ],
+)
+@pytest.mark.parametrize(
+    "left, right",
+    [
+        ("++--++--+-", "-++--+++-+"),
+        ("++++++++++", "---++-----"),
+        ("----------", "+-+-+-+-+-"),
+        ("+---------", "---------+"),
+    ],
+)
+@pytest.mark.parametrize("as_time_windows", [(True, True), (True, False), (False, True)])
+def test_time_window_partitions_subset_set_operations(
+    partitions_def: TimeWindowPartitionsDefinition, left: str, right: str, as_time_windows
+):
+    all_keys = partitions_def.get_partition_keys(current_time=datetime(year=2015, month=2, day=1))[
+        : len(left)
+    ]
+
+    def _subset(subset_str: str, as_time_windows: bool) -> TimeWindowPartitionsSubset:
+        subset = partitions_def.empty_subset().with_partition_keys(
+            key for key, included in zip(all_keys, subset_str) if included == "+"
+        )
+        if as_time_windows:
+            subset = partitions_def.deserialize_subset(subset.serialize())
+        return cast(TimeWindowPartitionsSubset, subset)
+
+    left_subset = _subset(left, as_time_windows[0])
+    right_subset = _subset(right, as_time_windows[1])
+    left_keys = set(left_subset.get_partition_keys())
+    right_keys = set(right_subset.get_partition_keys())
+
+    for subset, expected_keys in [
+        (left_subset | right_subset, left_keys | right_keys),
+        (left_subset & right_subset, left_keys & right_keys),
+        (left_subset - right_subset, left_keys - right_keys),
+    ]:
+        assert sorted(subset.get_partition_keys()) == sorted(expected_keys)
+        assert len(subset) == len(expected_keys)
+        assert all((key in subset) == (key in expected_keys) for key in all_keys)
+        assert partitions_def.deserialize_subset(subset.serialize()) == subset
+
+
+def test_large_time_window_partitions_subset_set_operations():
+    partitions_def = HourlyPartitionsDefinition(start_date="2015-01-01-00:00")
+    current_time = pendulum.datetime(2021, 1, 1, tz="UTC")
+    partition_keys = partitions_def.get_partition_keys(current_time)
+    assert len(partition_keys) > 50000
+
+    backfill_subset = partitions_def.deserialize_subset(
+        partitions_def.empty_subset().with_partition_keys(partition_keys).serialize()
+    )
+    materialized_subset = partitions_def.deserialize_subset(
+        partitions_def.empty_subset()
+        .with_partition_keys(partition_keys[1000:20000] + partition_keys[30000:-5])
+        .serialize()
+    )
+
+    # Set operations merge ranges of partition indexes, so they never generate partition keys
+    with mock.patch.object(
+        TimeWindowPartitionsDefinition,
+        "get_partition_keys_in_time_window",
+        side_effect=Exception("should not generate partition keys"),
+    ), mock.patch.object(
+        TimeWindowPartitionsSubset,
+        "_partition_keys_in_ranges",
+        side_effect=Exception("should not generate partition keys"),
+    ):
+        unmaterialized_subset = backfill_subset - materialized_subset
+        assert len(unmaterialized_subset) == 1000 + 10000 + 5
+        assert len(backfill_subset & materialized_subset) == len(partition_keys) - 11005
+        assert (unmaterialized_subset | materialized_subset) == backfill_subset
+        assert (
+            len(materialized_subset.with_partition_keys(partition_keys[-10:]))
+            == len(partition_keys) - 11000
+        )
+        assert partition_keys[500] in unmaterialized_subset
+        assert partition_keys[5000] not in unmaterialized_subset
+
+    assert list(unmaterialized_subset.get_partition_keys()) == (
+        partition_keys[:1000] + partition_keys[20000:30000] + partition_keys[-5:]
+    )
+    assert (
+        list(materialized_subset.get_partition_keys_not_in_subset(current_time))
+        == partition_keys[:1000] + partition_keys[20000:30000] + partition_keys[-5:]
+    )
+
+
 def test_time_window_partiitons_deserialize_backwards_compatible():
     serialized = "[[1420156800.0, 1420243200.0], [1420329600.0, 1420416000.0]]"
     partitions_def = DailyPartitionsDefinition(start_date="2015-01-01")
@@ -650,3 +749,67 @@ def my_partitioned_config_2(_start, _end):
         partitions_def.get_partition_keys_between_indexes(50, 53, current_time=current_time)
         == partitions_def.get_partition_keys(current_time=current_time)[50:53]
     )
+
+
+@pytest.mark.parametrize(
+    "partitions_def",
+    [
+        HourlyPartitionsDefinition(start_date="2015-01-01-00:00", timezone="America/Los_Angeles"),
+        HourlyPartitionsDefinition(start_date="2015-01-01-00:00", minute_offset=15, end_offset=2),
+        DailyPartitionsDefinition(start_date="2015-01-01", hour_offset=1, timezone="Europe/Berlin"),
+        WeeklyPartitionsDefinition(start_date="2015-01-01", day_offset=3, end_offset=-1),
+        MonthlyPartitionsDefinition(start_date="2015-01-01", day_offset=5, timezone="US/Central"),
+    ],
+)
+def test_multi_year_partitions_index_perf(partitions_def: TimeWindowPartitionsDefinition):
+    current_time = pendulum.datetime(2023, 3, 20, 12, 30, tz=partitions_def.timezone)
+    partition_keys = partitions_def.get_partition_keys(current_time)
+
+    # Index arithmetic for fixed-interval schedules is closed-form, rather than iterating
+    # through every cron tick since the start of the partitions definition
+    with mock.patch(
+        "dagster._core.definitions.time_window_partitions.cron_string_iterator",
+        side_effect=cron_string_iterator,
+    ) as iterator_mock:
+        assert partitions_def.get_num_partitions(current_time) == len(partition_keys)
+        assert (
+            partitions_def.get_partition_keys_between_indexes(
+                len(partition_keys) - 30, len(partition_keys) - 10, current_time
+            )
+            == partition_keys[-30:-10]
+        )
+        assert partitions_def.get_last_partition_key(current_time) == partition_keys[-1]
+
+        sample_keys = partition_keys[:: max(len(partition_keys) // 50, 1)]
+        assert [
+            partitions_def.get_partition_key_for_timestamp(
+                partitions_def.start_time_for_partition_key(key).timestamp()
+            )
+            for key in sample_keys
+        ] == sample_keys
+        assert [
+            time_window.start.strftime(partitions_def.fmt)
+            for time_window in partitions_def.time_windows_for_partition_keys(sample_keys)
+        ] == sample_keys
+
+    # iterators are only created to find the first partition of the definition
+    assert iterator_mock.call_count <= 10
+
+
+@pytest.mark.parametrize(
+    "timezone, start, expected",
+    [
+        ("America/Los_Angeles", datetime(2015, 1, 1), True),
+        ("Asia/Kolkata", datetime(2015, 1, 1), True),
+        # half-hour DST transitions every year
+        ("Australia/Lord_Howe", datetime(2015, 1, 1), False),
+        # moved from UTC-4:30 to UTC-4 in 2016
+        ("America/Caracas", datetime(2015, 1, 1), False),
+        ("America/Caracas", datetime(2017, 1, 1), True),
+        # offsets before the epoch are not probed
+        ("America/Los_Angeles", datetime(1960, 1, 1), False),
+    ],
+)
+def test_has_whole_hour_utc_offset_changes(timezone: str, start: datetime, expected: bool):
+    start_timestamp = pendulum.instance(start, tz="UTC").timestamp()
+    assert _has_whole_hour_utc_offset_changes(timezone, start_timestamp) == expected
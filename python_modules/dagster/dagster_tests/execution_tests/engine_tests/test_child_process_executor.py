@@ -3,6 +3,7 @@
 import time
 
 import pytest
+from dagster._core.errors import raise_execution_interrupts
 from dagster._core.executor.child_process_executor import (
     ChildProcessCommand,
     ChildProcessCrashException,
@@ -10,7 +11,9 @@
     ChildProcessEvent,
     ChildProcessStartEvent,
     ChildProcessSystemErrorEvent,
+    ChildProcessWorkerPool,
     execute_child_process_command,
+    execute_child_process_command_in_worker,
 )
 from dagster._utils import segfault
 
@@ -50,6 +53,20 @@ def execute(self):
         yield 1
 
 
+class SlowSecondEventCommand(ChildProcessCommand):  # pylint: disable=no-init
+    def execute(self):
+        yield 1
+        # like step execution, only allow interrupts while running user code
+        with raise_execution_interrupts():
+            time.sleep(30)
+        yield 2
+
+
+def _execute_in_pool(pool, command):
+    with pool.worker() as worker:
+        yield from execute_child_process_command_in_worker(worker, command)
+
+
 def test_basic_child_process_command():
     events = list(
         filter(
@@ -105,3 +122,24 @@ def test_child_process_segfault():
 @pytest.mark.skip("too long")
 def test_long_running_command():
     list(execute_child_process_command(multiprocessing, LongRunningCommand()))
+
+
+def test_worker_pool_command_abandoned():
+    with ChildProcessWorkerPool(multiprocessing) as pool:
+        events = _execute_in_pool(pool, SlowSecondEventCommand())
+        assert (
+            next(e for e in events if e is not None and not isinstance(e, ChildProcessEvent)) == 1
+        )
+
+        # the worker still executing the abandoned command is terminated rather than waited for
+        start_time = time.time()
+        events.close()
+        assert time.time() - start_time < 10
+
+        # the next command runs in a new worker, and only receives its own events
+        results = [
+            e
+            for e in _execute_in_pool(pool, DoubleAStringChildProcessCommand("aa"))
+            if e is not None and not isinstance(e, ChildProcessEvent)
+        ]
+        assert results == ["aaaa"]
@@ -5,15 +5,25 @@
 
 import pytest
 from dagster import (
+    AssetKey,
+    AssetsDefinition,
+    DagsterInstance,
     Failure,
     Field,
     MetadataEntry,
     Nothing,
     Output,
     String,
+    asset,
+    define_asset_job,
     multiprocess_executor,
+    op,
     reconstructable,
+    repository,
 )
+from dagster._core.definitions.cacheable_assets import CacheableAssetsDefinition
+from dagster._core.definitions.reconstruct import ReconstructablePipeline, ReconstructableRepository
+from dagster._core.definitions.repository_definition import AssetsDefinitionCacheableData
 from dagster._core.errors import DagsterUnmetExecutorRequirementsError
 from dagster._core.events import DagsterEvent, DagsterEventType
 from dagster._core.execution.results import OpExecutionResult, PipelineExecutionResult
@@ -116,6 +126,129 @@ def test_forkserver_preload():
         assert result.result_for_node("adder").output_value() == 11
 
 
+def _step_worker_pids(result: PipelineExecutionResult):
+    return {
+        event.step_key: event.pid
+        for event in result.event_list
+        if event.event_type == DagsterEventType.STEP_WORKER_STARTED
+    }
+
+
+def test_pool_execution():
+    with instance_for_test() as instance:
+        pipe = reconstructable(define_diamond_pipeline)
+        result = execute_pipeline(
+            pipe,
+            run_config={
+                "execution": {"multiprocess": {"config": {"max_concurrent": 1, "pool": {}}}},
+            },
+            instance=instance,
+        )
+        assert result.success
+        assert result.result_for_node("adder").output_value() == 11
+
+        # every step ran in the same worker process
+        pids = _step_worker_pids(result)
+        assert len(pids) == 4
+        assert len(set(pids.values())) == 1
+        assert os.getpid() not in pids.values()
+
+
+def test_pool_execution_recycles_workers():
+    with instance_for_test() as instance:
+        pipe = reconstructable(define_diamond_pipeline)
+        result = execute_pipeline(
+            pipe,
+            run_config={
+                "execution": {
+                    "multiprocess": {
+                        "config": {"max_concurrent": 1, "pool": {"max_steps_per_worker": 2}}
+                    }
+                },
+            },
+            instance=instance,
+        )
+        assert result.success
+        assert result.result_for_node("adder").output_value() == 11
+
+        pids = _step_worker_pids(result)
+        assert len(pids) == 4
+        assert len(set(pids.values())) == 2
+
+
+def _increment_process_call_count(name):
+    # used for tracking how many times each process loads the definitions
+    instance = DagsterInstance.get()
+    kvs_key = f"{name}:{os.getpid()}"
+    num_called = int(instance.run_storage.kvs_get({kvs_key}).get(kvs_key, "0"))
+    instance.run_storage.kvs_set({kvs_key: str(num_called + 1)})
+
+
+class CountingCacheableAssetsDefinition(CacheableAssetsDefinition):
+    _cacheable_data = AssetsDefinitionCacheableData(keys_by_output_name={"result": AssetKey("foo")})
+
+    def compute_cacheable_data(self):
+        _increment_process_call_count("compute_cacheable_data_called")
+        return [self._cacheable_data]
+
+    def build_definitions(self, data):
+        _increment_process_call_count("build_definitions_called")
+
+        @op
+        def _op():
+            return 1
+
+        return [
+            AssetsDefinition.from_op(_op, keys_by_output_name=cd.keys_by_output_name) for cd in data
+        ]
+
+
+@asset
+def bar(foo):
+    return foo + 1
+
+
+@asset
+def baz(bar):
+    return bar + 1
+
+
+@repository(default_executor_def=multiprocess_executor)
+def pending_repo():
+    return [bar, baz, CountingCacheableAssetsDefinition("xyz"), define_asset_job("all_asset_job")]
+
+
+def test_pool_execution_loads_definition_once_per_worker():
+    with instance_for_test() as instance:
+        recon_repo = ReconstructableRepository.for_module(
+            "dagster_tests.execution_tests.engine_tests.test_multiprocessing",
+            fn_name="pending_repo",
+        )
+        recon_pipeline = ReconstructablePipeline(
+            repository=recon_repo, pipeline_name="all_asset_job"
+        )
+        result = execute_pipeline(
+            recon_pipeline,
+            run_config={
+                "execution": {"config": {"max_concurrent": 1, "pool": {}}},
+            },
+            instance=instance,
+        )
+        assert result.success
+
+        pids = _step_worker_pids(result)
+        assert len(pids) == 3
+        assert len(set(pids.values())) == 1
+
+        # the worker preloads the definition with the repository load data of the plan, and the
+        # steps reuse it
+        (pid,) = set(pids.values())
+        call_counts = instance.run_storage.kvs_get(
+            {f"compute_cacheable_data_called:{pid}", f"build_definitions_called:{pid}"}
+        )
+        assert call_counts == {f"build_definitions_called:{pid}": "1"}
+
+
 def define_diamond_pipeline():
     @lambda_solid
     def return_two():
@@ -533,6 +666,23 @@ def test_crash_hard_multiprocessing():
         # )
 
 
+@pytest.mark.skipif(os.name == "nt", reason="Different exception on Windows: See issue #2791")
+def test_crash_hard_pool():
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            reconstructable(segfault_pipeline),
+            run_config={
+                "execution": {"multiprocess": {"config": {"pool": {}}}},
+            },
+            instance=instance,
+            raise_on_error=False,
+        )
+        assert not result.success
+        failure_data = result.result_for_node("segfault_solid").failure_data
+        assert failure_data
+        assert failure_data.error.cls_name == "ChildProcessCrashException"
+
+
 def get_dynamic_resource_init_failure_job():
     return get_dynamic_job_resource_init_failure(multiprocess_executor)[0]
 
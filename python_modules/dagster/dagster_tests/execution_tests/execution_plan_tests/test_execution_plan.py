@@ -171,6 +171,84 @@ def test_failing_execution_plan():
         assert active_execution.is_complete
 
 
+def define_wide_job(width):
+    @op
+    def emit():
+        return 1
+
+    ops = []
+    for i in range(width):
+
+        @op(name=f"add_{i}")
+        def add(num):
+            return num + 1
+
+        ops.append(add)
+
+    @op
+    def collect(nums):
+        return sum(nums)
+
+    @job
+    def wide_job():
+        one = emit()
+        collect([add(one) for add in ops])
+
+    return wide_job
+
+
+def test_wide_active_execution_plan():
+    width = 200
+    plan = create_execution_plan(define_wide_job(width))
+
+    with plan.start(retry_mode=(RetryMode.DISABLED)) as active_execution:
+        steps = active_execution.get_steps_to_execute()
+        assert [step.key for step in steps] == ["emit"]
+        active_execution.mark_step_produced_output(StepOutputHandle("emit", "result"))
+        active_execution.mark_success("emit")
+
+        steps = active_execution.get_steps_to_execute(limit=10)
+        assert len(steps) == 10
+        steps += active_execution.get_steps_to_execute()
+        assert len(steps) == width
+        assert {step.key for step in steps} == {f"add_{i}" for i in range(width)}
+
+        for step in steps[:-1]:
+            active_execution.mark_step_produced_output(StepOutputHandle(step.key, "result"))
+            active_execution.mark_success(step.key)
+            assert active_execution.get_steps_to_execute() == []
+
+        active_execution.mark_step_produced_output(StepOutputHandle(steps[-1].key, "result"))
+        active_execution.mark_success(steps[-1].key)
+        assert [step.key for step in active_execution.get_steps_to_execute()] == ["collect"]
+        active_execution.mark_success("collect")
+
+        assert active_execution.is_complete
+
+
+def test_wide_failing_execution_plan():
+    plan = create_execution_plan(define_wide_job(3))
+
+    with plan.start(retry_mode=(RetryMode.DISABLED)) as active_execution:
+        active_execution.get_steps_to_execute()
+        active_execution.mark_step_produced_output(StepOutputHandle("emit", "result"))
+        active_execution.mark_success("emit")
+
+        steps = active_execution.get_steps_to_execute()
+        assert len(steps) == 3
+
+        # a single failed upstream step abandons the downstream step, even while other upstream
+        # steps are still in flight
+        active_execution.mark_failed("add_0")
+        assert [step.key for step in active_execution.get_steps_to_abandon()] == ["collect"]
+        active_execution.mark_abandoned("collect")
+
+        active_execution.mark_success("add_1")
+        active_execution.mark_success("add_2")
+        assert active_execution.get_steps_to_execute() == []
+        assert active_execution.is_complete
+
+
 def test_retries_active_execution():
     job_def = define_diamond_job()
     plan = create_execution_plan(job_def)
@@ -99,7 +99,12 @@ def write_a_file_pipeline():
 
 
 @pytest.mark.skipif(_seven.IS_WINDOWS, reason="Interrupts handled differently on windows")
-def test_interrupt_multiproc():
+@pytest.mark.parametrize(
+    "executor_config",
+    [{"max_concurrent": 4}, {"max_concurrent": 4, "pool": {}}],
+    ids=["process_per_step", "pool"],
+)
+def test_interrupt_multiproc(executor_config):
     with tempfile.TemporaryDirectory() as tempdir:
         with instance_for_test(temp_dir=tempdir) as instance:
             file_1 = os.path.join(tempdir, "file_1")
@@ -124,7 +129,7 @@ def test_interrupt_multiproc():
                         "write_3": {"config": {"tempfile": file_3}},
                         "write_4": {"config": {"tempfile": file_4}},
                     },
-                    "execution": {"multiprocess": {"config": {"max_concurrent": 4}}},
+                    "execution": {"multiprocess": {"config": executor_config}},
                 },
                 instance=instance,
             ):
@@ -207,3 +207,63 @@ def test_detect_server_restart():
         server_process.wait()
 
     assert server_id_one != server_id_two
+
+
+def test_client_reuses_channel():
+    with ephemeral_grpc_api_client() as api_client:
+        for _ in range(3):
+            assert api_client.ping("foo") == "foo"
+        assert len(list(api_client.streaming_ping(sequence_length=2, echo="foo"))) == 2
+
+        metrics = api_client.metrics
+        assert metrics.channels_created == 1
+        assert metrics.channel_reuses == 3
+        assert metrics.num_calls == 4
+        assert metrics.call_latencies["Ping"].num_calls == 3
+        assert metrics.call_latencies["Ping"].num_failures == 0
+        assert metrics.call_latencies["StreamingPing"].num_calls == 1
+
+        # closing the client drops the channel, but later calls open a new one
+        api_client.close()
+        assert api_client.ping("foo") == "foo"
+        assert api_client.metrics.channels_created == 2
+
+
+def test_client_reconnects_after_server_restart():
+    port = find_free_port()
+    with instance_for_test() as instance:
+        api_client = DagsterGrpcClient(port=port)
+
+        server_process = open_server_process(instance.get_ref(), port=port, socket=None)
+        try:
+            assert api_client.ping("foo") == "foo"
+        finally:
+            interrupt_ipc_subprocess_pid(server_process.pid)
+            server_process.terminate()
+            server_process.wait()
+
+        with pytest.raises(DagsterUserCodeUnreachableError):
+            api_client.ping("foo")
+
+        server_process = open_server_process(instance.get_ref(), port=port, socket=None)
+        try:
+            assert api_client.ping("foo") == "foo"
+        finally:
+            interrupt_ipc_subprocess_pid(server_process.pid)
+            server_process.terminate()
+            server_process.wait()
+
+        assert api_client.metrics.call_latencies["Ping"].num_failures == 1
+        api_client.close()
+
+
+def test_client_close_does_not_cancel_in_flight_calls():
+    with ephemeral_grpc_api_client() as api_client:
+        events = api_client.streaming_ping(sequence_length=1000, echo="foo")
+        assert next(events)["sequence_number"] == 0
+
+        # the streaming call keeps the closed channel open until it completes
+        api_client.close()
+        assert api_client.ping("foo") == "foo"
+        assert [event["sequence_number"] for event in events] == list(range(1, 1000))
+        assert api_client.metrics.channels_created == 2
@@ -1,5 +1,9 @@
+import ast
 import subprocess
+import sys
+import time
 
+import dagster
 import pytest
 from dagster._seven import IS_WINDOWS
 from dagster._utils import file_relative_path
@@ -28,3 +32,80 @@ def test_import_perf():
 
     # one way to debug imports is to `pip install tuna` then run
     # python -X importtime python_modules/dagster/dagster_tests/general_tests/simple.py &> /tmp/import.txt && tuna /tmp/import.txt
+
+
+def _imported_modules(code):
+    result = subprocess.run(
+        [sys.executable, "-c", f"import sys; {code}; print(' '.join(sys.modules))"],
+        check=True,
+        capture_output=True,
+    )
+    return set(result.stdout.decode("utf-8").split())
+
+
+def test_public_api_imported_lazily():
+    # modules only needed by parts of the public API are not imported until they are used
+    lazy_modules = {
+        "dagster._core.definitions.asset_reconciliation_sensor",
+        "dagster._core.storage.upath_io_manager",
+        "dagster._utils.alert",
+    }
+    assert not lazy_modules & _imported_modules("import dagster")
+    assert lazy_modules <= _imported_modules(
+        "from dagster import build_asset_reconciliation_sensor, UPathIOManager,"
+        " make_email_on_run_failure_sensor"
+    )
+
+
+def test_cli_commands_imported_lazily():
+    imported_modules = _imported_modules(
+        "from dagster._cli import cli; cli.get_command(None, 'api')"
+    )
+    assert "dagster._cli.api" in imported_modules
+    assert "dagster._cli.job" not in imported_modules
+    assert "dagster._cli.dev" not in imported_modules
+
+
+def test_public_api_type_checking_imports():
+    # the imports that static analyzers see must match the symbols that are loaded lazily
+    with open(dagster.__file__, encoding="utf8") as f:
+        module = ast.parse(f.read())
+
+    type_checking_imports = {}
+    for node in module.body:
+        if isinstance(node, ast.If) and getattr(node.test, "id", None) == "TYPE_CHECKING":
+            for import_node in node.body:
+                assert isinstance(import_node, ast.ImportFrom)
+                for alias in import_node.names:
+                    assert alias.asname == alias.name
+                    type_checking_imports[alias.name] = import_node.module
+
+    public_api = dagster._PUBLIC_API  # pylint: disable=protected-access
+    deprecated = {
+        **dagster._DEPRECATED,  # pylint: disable=protected-access
+        **dagster._DEPRECATED_RENAMED,  # pylint: disable=protected-access
+    }
+    assert {
+        name: module for name, module in type_checking_imports.items() if name not in deprecated
+    } == dict(public_api)
+
+    for name in public_api:
+        assert getattr(dagster, name) is not None or name == "Nothing"
+        assert name in dir(dagster)
+        assert name in dagster.__all__
+
+
+def _benchmark(modules=("dagster", "dagster._cli", "dagster._cli.api"), iterations=5):
+    for module in modules:
+        elapsed = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, "-c", f"import {module}"], check=True)
+            elapsed.append(time.perf_counter() - start)
+        print(f"import {module}: {min(elapsed) * 1000:.0f}ms")  # noqa: T201
+
+
+if __name__ == "__main__":
+    # python test_import.py: time importing dagster and the modules of the CLI entry points, each
+    # in a new interpreter
+    _benchmark()
@@ -22,7 +22,9 @@
     register_serdes_enum_fallbacks,
     register_serdes_tuple_fallbacks,
     serialize_value,
+    serialize_value_to_binary,
     unpack_inner_value,
+    unpack_value,
 )
 from dagster._serdes.utils import hash_str
 
@@ -566,6 +568,13 @@ class NumHolder(NamedTuple):
     assert x.num == roundtrip_x.num
 
 
+@pytest.mark.parametrize("num", [-(2**63) - 1, -(2**63), 2**63 - 1, 2**63, 2**64])
+def test_int64_boundaries(num):
+    roundtrip = deserialize_value(serialize_value(num))
+    assert isinstance(roundtrip, int)
+    assert roundtrip == num
+
+
 def test_enum_backcompat():
     test_env = WhitelistMap.create()
 
@@ -718,3 +727,126 @@ class Thing(NamedTuple):  # pylint: disable=unused-variable
 
     assert wmap.get_serialized_name("Thing") == "SerializedThing"
     assert wmap.get_deserialized_name("SerializedThing") == "Thing"
+
+
+def test_nested_descent_path_with_custom_serializer():
+    test_map = WhitelistMap.create()
+
+    class Unknown(NamedTuple):
+        value: int
+
+    class ContainerSerializer(DefaultNamedTupleSerializer):
+        @classmethod
+        def value_to_storage_dict(cls, value, whitelist_map, descent_path):
+            return {
+                "__class__": "Container",
+                "items": pack_inner_value(value.items, whitelist_map, f"{descent_path}.items"),
+            }
+
+    @_whitelist_for_serdes(whitelist_map=test_map, serializer=ContainerSerializer)
+    class Container(NamedTuple):
+        items: list
+
+    with pytest.raises(
+        SerializationError, match=re.escape("Descent path: <root:dict>.a[1].items[0]")
+    ):
+        serialize_value({"a": [1, Container([Unknown(1)])]}, whitelist_map=test_map)
+
+
+def test_unpack_does_not_modify_packed_value():
+    test_map = WhitelistMap.create()
+
+    @_whitelist_for_serdes(whitelist_map=test_map)
+    class Inner(NamedTuple):
+        value: int
+
+    class OuterSerializer(DefaultNamedTupleSerializer):
+        @classmethod
+        def value_from_storage_dict(
+            cls, storage_dict, klass, args_for_class, whitelist_map, descent_path
+        ):
+            storage_dict["inner"] = storage_dict.pop("old_inner")
+            return super().value_from_storage_dict(
+                storage_dict, klass, args_for_class, whitelist_map, descent_path
+            )
+
+    @_whitelist_for_serdes(whitelist_map=test_map, serializer=OuterSerializer)
+    class Outer(NamedTuple):
+        inner: Inner
+
+    packed = {
+        "__class__": "Outer",
+        "old_inner": {"__class__": "Inner", "value": 1},
+    }
+    assert unpack_inner_value(packed, test_map, "") == Outer(Inner(1))
+    assert unpack_inner_value(packed, test_map, "") == Outer(Inner(1))
+    assert packed == {
+        "__class__": "Outer",
+        "old_inner": {"__class__": "Inner", "value": 1},
+    }
+
+
+def test_binary_format():
+    test_map = WhitelistMap.create()
+
+    @_whitelist_for_serdes(whitelist_map=test_map)
+    class Color(Enum):
+        RED = 1
+
+    @_whitelist_for_serdes(whitelist_map=test_map)
+    class Values(NamedTuple):
+        ints: list
+        floats: list
+        strings: list
+        collections: dict
+
+    value = Values(
+        ints=[0, 1, 127, 128, 255, 256, 2**16, 2**32, 2**64 - 1, 2**64, -(10**40)]
+        + [-1, -32, -33, -128, -129, -(2**15) - 1, -(2**31) - 1, -(2**63)],
+        floats=[0.0, -1.5, 1e300, float("inf")],
+        strings=["", "a" * 31, "b" * 32, "c" * 256, "d" * 2**16, "\u00e9\u4e2d"],
+        collections={
+            "empty": {},
+            "enum": Color.RED,
+            "set": {1, 2},
+            "frozenset": frozenset(["x"]),
+            "list": list(range(20)),
+            "large_list": list(range(2**16)),
+            "nested": {str(i): [None, True, False] for i in range(20)},
+        },
+    )
+
+    serialized = serialize_value_to_binary(value, whitelist_map=test_map)
+    assert isinstance(serialized, bytes)
+    assert deserialize_value(serialized, whitelist_map=test_map) == value
+    assert len(serialized) < len(serialize_value(value, whitelist_map=test_map))
+
+    # non string keys are converted as they are in json
+    keys = {1: "a", 2.5: "b", None: "c", False: "d"}
+    assert deserialize_value(serialize_value_to_binary(keys)) == {
+        "1": "a",
+        "2.5": "b",
+        "null": "c",
+        "false": "d",
+    }
+
+    with pytest.raises(DeserializationError):
+        deserialize_value(serialized[:-1], whitelist_map=test_map)
+
+
+def test_deserialize_json_and_binary_side_by_side():
+    test_map = WhitelistMap.create()
+
+    @_whitelist_for_serdes(whitelist_map=test_map)
+    class Thing(NamedTuple):
+        name: str
+        count: int
+
+    thing = Thing("foo", 98765432109876543210)
+    as_json = _serialize_dagster_namedtuple(thing, test_map)
+    as_bytes = serialize_value_to_binary(thing, test_map)
+
+    assert _deserialize_json(as_json, test_map) == thing
+    assert _deserialize_json(as_json.encode("utf-8"), test_map) == thing
+    assert _deserialize_json(as_bytes, test_map) == thing
+    assert unpack_value(_seven.json.loads(serialize_value(set(["a"])))) == {"a"}
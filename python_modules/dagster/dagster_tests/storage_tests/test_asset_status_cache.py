@@ -12,8 +12,10 @@
 )
 from dagster._core.definitions.asset_graph import AssetGraph
 from dagster._core.definitions.time_window_partitions import HourlyPartitionsDefinition
+from dagster._core.storage import partition_status_cache
 from dagster._core.storage.partition_status_cache import (
     get_and_update_asset_status_cache_value,
+    get_and_update_asset_status_cache_values,
 )
 from dagster._core.test_utils import instance_for_test
 from dagster._utils import Counter, traced_counter
@@ -105,7 +107,7 @@ def _swap_partitions_def(new_partitions_def, asset, asset_graph, asset_job):
         )
         assert set(materialized_keys) == {"2022-02-02"}
         counts = traced_counter.get().counts()
-        assert counts.get("DagsterInstance.get_materialization_count_by_partition") == 1
+        assert counts.get("DagsterInstance.get_materialization_partitions") == 1
 
 
 def test_get_cached_partition_status_by_asset():
@@ -148,7 +150,9 @@ def _swap_partitions_def(new_partitions_def, asset, asset_graph, asset_job):
         assert len(materialized_keys) == 1
         assert "2022-02-01" in materialized_keys
         counts = traced_counter.get().counts()
-        assert counts.get("DagsterInstance.get_materialization_count_by_partition") == 1
+        assert counts.get("DagsterInstance.get_materialization_partitions") == 1
+        # the latest materialization is only looked up when the cache is built from scratch
+        assert counts.get("DagsterInstance.get_event_records") == 1
 
         asset_job.execute_in_process(instance=created_instance, partition_key="2022-02-02")
 
@@ -169,8 +173,9 @@ def _swap_partitions_def(new_partitions_def, asset, asset_graph, asset_job):
             partition_key in materialized_keys for partition_key in ["2022-02-01", "2022-02-02"]
         )
         counts = traced_counter.get().counts()
-        # Assert that get_materialization_count_by_partition is not called again via cache rebuild
-        assert counts.get("DagsterInstance.get_materialization_count_by_partition") == 1
+        # Assert that the cache is updated incrementally rather than rebuilt
+        assert counts.get("DagsterInstance.get_materialization_partitions") == 2
+        assert counts.get("DagsterInstance.get_event_records") == 1
 
         static_partitions_def = StaticPartitionsDefinition(["a", "b", "c"])
         asset1, asset_job, asset_graph = _swap_partitions_def(
@@ -191,8 +196,9 @@ def _swap_partitions_def(new_partitions_def, asset, asset_graph, asset_job):
             for partition in ["b", "c"]
         )
         counts = traced_counter.get().counts()
-        # Assert that get_materialization_count_by_partition is called again when partitions_def changes
-        assert counts.get("DagsterInstance.get_materialization_count_by_partition") == 2
+        # Assert that the cache is rebuilt when partitions_def changes
+        assert counts.get("DagsterInstance.get_materialization_partitions") == 3
+        assert counts.get("DagsterInstance.get_event_records") == 2
 
 
 def test_multipartition_get_cached_partition_status():
@@ -235,7 +241,7 @@ def asset1():
         assert MultiPartitionKey({"ab": "a", "12": "1"}) in materialized_keys
 
         counts = traced_counter.get().counts()
-        assert counts.get("DagsterInstance.get_event_tags_for_asset") == 1
+        assert counts.get("DagsterInstance.get_materialization_partitions") == 1
 
         asset_job.execute_in_process(
             instance=created_instance, partition_key=MultiPartitionKey({"ab": "a", "12": "2"})
@@ -258,8 +264,9 @@ def asset1():
             ]
         )
         counts = traced_counter.get().counts()
-        # Assert that get_event_tags_for_asset is not called again when partitions_def remains the same
-        assert counts.get("DagsterInstance.get_event_tags_for_asset") == 1
+        # Assert that the cache is updated incrementally when partitions_def remains the same
+        assert counts.get("DagsterInstance.get_materialization_partitions") == 2
+        assert counts.get("DagsterInstance.get_event_records") == 1
 
 
 def test_cached_status_on_wipe():
@@ -316,3 +323,141 @@ def asset1():
         )
         assert cached_status
         assert cached_status.serialized_materialized_partition_subset is None
+
+
+def test_cached_status_paginates_materializations(monkeypatch):
+    partitions_def = StaticPartitionsDefinition(["a", "b", "c"])
+
+    @asset(partitions_def=partitions_def)
+    def asset1():
+        return 1
+
+    asset_key = AssetKey("asset1")
+    asset_graph = AssetGraph.from_assets([asset1])
+    asset_job = define_asset_job("asset_job").resolve([asset1], [])
+
+    monkeypatch.setattr(partition_status_cache, "MATERIALIZATION_PARTITIONS_PAGE_SIZE", 2)
+
+    with instance_for_test() as created_instance:
+        traced_counter.set(Counter())
+
+        for partition_key in ["a", "b", "a"]:
+            asset_job.execute_in_process(instance=created_instance, partition_key=partition_key)
+
+        cached_status = get_and_update_asset_status_cache_value(
+            created_instance, asset_key, asset_graph.get_partitions_def(asset_key)
+        )
+        # three materializations are fetched in pages of two
+        counts = traced_counter.get().counts()
+        assert counts.get("DagsterInstance.get_materialization_partitions") == 2
+        assert cached_status
+        assert cached_status.serialized_materialized_partition_subset
+        assert set(
+            partitions_def.deserialize_subset(
+                cached_status.serialized_materialized_partition_subset
+            ).get_partition_keys()
+        ) == {"a", "b"}
+        assert cached_status.latest_storage_id == max(
+            storage_id
+            for storage_id, _ in created_instance.get_materialization_partitions(asset_key)
+        )
+
+        asset_job.execute_in_process(instance=created_instance, partition_key="c")
+        cached_status = get_and_update_asset_status_cache_value(
+            created_instance, asset_key, asset_graph.get_partitions_def(asset_key)
+        )
+        assert cached_status
+        assert cached_status.serialized_materialized_partition_subset
+        assert set(
+            partitions_def.deserialize_subset(
+                cached_status.serialized_materialized_partition_subset
+            ).get_partition_keys()
+        ) == {"a", "b", "c"}
+
+
+def test_get_and_update_asset_status_cache_values():
+    daily_partitions_def = DailyPartitionsDefinition(start_date="2022-01-01")
+    static_partitions_def = StaticPartitionsDefinition(["a", "b", "c"])
+
+    @asset(partitions_def=daily_partitions_def)
+    def daily_asset():
+        return 1
+
+    @asset(partitions_def=static_partitions_def)
+    def static_asset():
+        return 1
+
+    @asset
+    def unpartitioned_asset():
+        return 1
+
+    daily_job = define_asset_job("daily_job", selection=[daily_asset]).resolve(
+        [daily_asset, static_asset, unpartitioned_asset], []
+    )
+    static_job = define_asset_job("static_job", selection=[static_asset]).resolve(
+        [daily_asset, static_asset, unpartitioned_asset], []
+    )
+    unpartitioned_job = define_asset_job(
+        "unpartitioned_job", selection=[unpartitioned_asset]
+    ).resolve([daily_asset, static_asset, unpartitioned_asset], [])
+    partitions_defs_by_asset_key = {
+        AssetKey("daily_asset"): daily_partitions_def,
+        AssetKey("static_asset"): static_partitions_def,
+        AssetKey("unpartitioned_asset"): None,
+        AssetKey("never_materialized"): static_partitions_def,
+    }
+
+    with instance_for_test() as created_instance:
+        daily_job.execute_in_process(instance=created_instance, partition_key="2022-02-01")
+        static_job.execute_in_process(instance=created_instance, partition_key="a")
+        unpartitioned_job.execute_in_process(instance=created_instance)
+
+        traced_counter.set(Counter())
+        cache_values = get_and_update_asset_status_cache_values(
+            created_instance, partitions_defs_by_asset_key
+        )
+        counts = traced_counter.get().counts()
+        assert counts.get("DagsterInstance.get_asset_records") == 1
+        assert counts.get("DagsterInstance.get_materialization_partitions_for_asset_keys") == 1
+        assert counts.get("DagsterInstance.update_asset_cached_status_data_by_asset_key") == 1
+        assert counts.get("DagsterInstance.update_asset_cached_status_data") is None
+
+        assert cache_values[AssetKey("never_materialized")] is None
+        assert cache_values[AssetKey("unpartitioned_asset")]
+        assert cache_values[AssetKey("unpartitioned_asset")].partitions_def_id is None
+
+        # the stored values match those computed one asset at a time
+        for asset_key in ["daily_asset", "static_asset", "unpartitioned_asset"]:
+            asset_key = AssetKey(asset_key)
+            assert cache_values[asset_key] == get_and_update_asset_status_cache_value(
+                created_instance, asset_key, partitions_defs_by_asset_key[asset_key]
+            )
+
+        daily_job.execute_in_process(instance=created_instance, partition_key="2022-02-02")
+
+        traced_counter.set(Counter())
+        cache_values = get_and_update_asset_status_cache_values(
+            created_instance, partitions_defs_by_asset_key
+        )
+        counts = traced_counter.get().counts()
+        assert counts.get("DagsterInstance.get_materialization_partitions_for_asset_keys") == 1
+        assert counts.get("DagsterInstance.update_asset_cached_status_data_by_asset_key") == 1
+
+        daily_cache_value = cache_values[AssetKey("daily_asset")]
+        assert daily_cache_value
+        assert daily_cache_value.serialized_materialized_partition_subset
+        assert set(
+            daily_partitions_def.deserialize_subset(
+                daily_cache_value.serialized_materialized_partition_subset
+            ).get_partition_keys()
+        ) == {"2022-02-01", "2022-02-02"}
+
+        # nothing new was materialized, so nothing needs to be scanned or written
+        traced_counter.set(Counter())
+        assert (
+            get_and_update_asset_status_cache_values(created_instance, partitions_defs_by_asset_key)
+            == cache_values
+        )
+        counts = traced_counter.get().counts()
+        assert counts.get("DagsterInstance.get_materialization_partitions_for_asset_keys") is None
+        assert counts.get("DagsterInstance.update_asset_cached_status_data_by_asset_key") is None
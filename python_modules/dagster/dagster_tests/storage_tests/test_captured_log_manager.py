@@ -1,7 +1,17 @@
+import os
 import tempfile
+import time
+from collections import defaultdict
 
 import pytest
-from dagster._core.storage.local_compute_log_manager import LocalComputeLogManager
+from dagster._utils import ensure_file
+from dagster._core.storage import cloud_storage_compute_log_manager
+from dagster._core.storage.cloud_storage_compute_log_manager import CloudStorageComputeLogManager
+from dagster._core.storage.compute_log_manager import ComputeIOType
+from dagster._core.storage.local_compute_log_manager import (
+    IO_TYPE_EXTENSION,
+    LocalComputeLogManager,
+)
 from dagster._core.test_utils import instance_for_test
 
 from .utils.captured_log_manager import TestCapturedLogManager
@@ -20,3 +30,132 @@ class TestLocalCapturedLogManager(TestCapturedLogManager):
     def captured_log_manager(self):
         with tempfile.TemporaryDirectory() as tmpdir_path:
             return LocalComputeLogManager(tmpdir_path)
+
+
+class InMemoryCloudStorageComputeLogManager(CloudStorageComputeLogManager):
+    """Stores uploaded logs in memory, and records each ranged read from storage."""
+
+    def __init__(self, local_dir):
+        self._local_manager = LocalComputeLogManager(local_dir)
+        self.storage = {}
+        self.range_reads = []
+
+    @property
+    def local_manager(self):
+        return self._local_manager
+
+    @property
+    def upload_interval(self):
+        return None
+
+    def _storage_key(self, log_key, io_type, partial):
+        return (tuple(log_key), io_type, partial)
+
+    def delete_logs(self, log_key=None, prefix=None):
+        self.local_manager.delete_logs(log_key=log_key, prefix=prefix)
+
+    def download_url_for_type(self, log_key, io_type):
+        return None
+
+    def display_path_for_type(self, log_key, io_type):
+        return None
+
+    def cloud_storage_has_logs(self, log_key, io_type, partial=False):
+        return self._storage_key(log_key, io_type, partial) in self.storage
+
+    def upload_to_cloud_storage(self, log_key, io_type, partial=False):
+        path = self.local_manager.get_captured_local_path(log_key, IO_TYPE_EXTENSION[io_type])
+        ensure_file(path)
+        with open(path, "rb") as f:
+            self.storage[self._storage_key(log_key, io_type, partial)] = f.read()
+
+    @property
+    def supports_ranged_reads(self):
+        return True
+
+    def read_cloud_storage_range(self, log_key, io_type, start, end, partial=False):
+        self.range_reads.append((io_type, start, end))
+        return self.storage[self._storage_key(log_key, io_type, partial)][start:end]
+
+
+def test_cloud_storage_ranged_reads(monkeypatch):
+    monkeypatch.setattr(cloud_storage_compute_log_manager, "LOG_CHUNK_SIZE", 4)
+
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        manager = InMemoryCloudStorageComputeLogManager(tmpdir_path)
+        log_key = ["some", "log", "key"]
+        with manager.open_log_stream(log_key, ComputeIOType.STDOUT) as write_stream:
+            write_stream.write("hello world")
+        # remove the local copy, so that logs are read from storage
+        manager.local_manager.delete_logs(log_key=log_key)
+
+        log_data = manager.get_log_data(log_key, max_bytes=6)
+        assert log_data.stdout == b"hello "
+        assert log_data.cursor == "6:0"
+        # only the chunks covering the requested bytes are read
+        assert [read for read in manager.range_reads if read[0] == ComputeIOType.STDOUT] == [
+            (ComputeIOType.STDOUT, 0, 4),
+            (ComputeIOType.STDOUT, 4, 8),
+        ]
+        # nothing is downloaded to local disk
+        assert not os.path.exists(
+            manager.local_manager.get_captured_local_path(
+                log_key, IO_TYPE_EXTENSION[ComputeIOType.STDOUT]
+            )
+        )
+
+        manager.range_reads.clear()
+        log_data = manager.get_log_data(log_key, cursor=log_data.cursor)
+        assert log_data.stdout == b"world"
+        assert log_data.cursor == "11:0"
+        # the full chunk read earlier is cached, but the last chunk is read until it is full
+        assert [read for read in manager.range_reads if read[0] == ComputeIOType.STDOUT] == [
+            (ComputeIOType.STDOUT, 8, 12),
+        ]
+
+        assert manager.get_log_data(log_key).stdout == b"hello world"
+
+
+def test_local_subscriptions_share_watcher():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        manager = LocalComputeLogManager(tmpdir_path, polling_timeout=0.1)
+        subscription_manager = manager._subscription_manager  # pylint: disable=protected-access
+        log_keys = [["run_id", "step_a"], ["run_id", "step_b"]]
+        received = defaultdict(bytes)
+
+        subscriptions = []
+        for log_key in log_keys:
+            with manager.open_log_stream(log_key, ComputeIOType.STDOUT):
+                pass
+
+            def _on_data(log_data, step=log_key[-1]):
+                received[step] += log_data.stdout or b""
+
+            subscriptions.append(manager.subscribe(log_key)(_on_data))
+
+        # both log keys are in the same directory, which is only observed once
+        assert len(subscription_manager._observed_watches) == 1
+        assert len(subscription_manager._observer.emitters) == 1
+
+        for log_key in log_keys:
+            with manager.open_log_stream(log_key, ComputeIOType.STDOUT) as write_stream:
+                write_stream.write(f"hello {log_key[-1]}")
+
+        start_time = time.time()
+        while not all(received[log_key[-1]] for log_key in log_keys):
+            if time.time() - start_time > 10:
+                break
+            time.sleep(0.1)
+        assert received == {"step_a": b"hello step_a", "step_b": b"hello step_b"}
+
+        # a log key that gained a subscription after its last one was removed stays watched
+        subscription_manager.unwatch(log_keys[0])
+        assert len(subscription_manager._watchers) == 2
+
+        subscriptions[0].dispose()
+        assert len(subscription_manager._observed_watches) == 1
+        subscriptions[1].dispose()
+        assert not subscription_manager._observed_watches
+        assert not subscription_manager._observer.emitters
+
+        manager.dispose()
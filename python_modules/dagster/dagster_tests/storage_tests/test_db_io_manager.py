@@ -2,7 +2,13 @@
 from unittest.mock import MagicMock
 
 import pytest
-from dagster import AssetKey, InputContext, OutputContext, build_output_context
+from dagster import (
+    AssetKey,
+    DailyPartitionsDefinition,
+    InputContext,
+    OutputContext,
+    build_output_context,
+)
 from dagster._check import CheckError
 from dagster._core.definitions.time_window_partitions import TimeWindow
 from dagster._core.errors import DagsterInvalidDefinitionError
@@ -340,3 +346,78 @@ def test_non_supported_type():
         CheckError, match="DbIOManager does not have a handler for type '<class 'str'>'"
     ):
         manager.handle_output(output_context, "a_string")
+
+
+class ListHandler(DbTypeHandler[list]):
+    def __init__(self):
+        self.handle_input_calls = []
+        self.handle_output_calls = []
+
+    def handle_output(self, context: OutputContext, table_slice: TableSlice, obj: list):
+        self.handle_output_calls.append((context, table_slice, obj))
+
+    def load_input(self, context: InputContext, table_slice: TableSlice) -> list:
+        self.handle_input_calls.append((context, table_slice))
+        return [table_slice.partition.partition.start.day]
+
+    def concat(self, context: InputContext, objs):
+        return [item for obj in objs for item in obj]
+
+    @property
+    def supported_types(self):
+        return [list]
+
+
+@pytest.mark.parametrize("max_concurrent_loads", [1, 2])
+def test_asset_in_partitioned_chunks(max_concurrent_loads):
+    handler = ListHandler()
+    db_client = MagicMock(spec=DbClient, get_select_statement=MagicMock(return_value=""))
+    manager = DbIOManager(
+        type_handlers=[handler],
+        db_client=db_client,
+        database=resource_config["database"],
+        max_partitions_per_load=2,
+        max_concurrent_loads=max_concurrent_loads,
+    )
+    asset_key = AssetKey(["schema1", "table1"])
+    partitions_def = DailyPartitionsDefinition(start_date="2020-01-01")
+    input_context = MagicMock(
+        asset_key=asset_key,
+        upstream_output=MagicMock(metadata={"partition_expr": "abc"}),
+        resource_config=resource_config,
+        dagster_type=MagicMock(typing_type=list),
+        asset_partitions_def=partitions_def,
+        asset_partition_keys=["2020-01-05", "2020-01-02", "2020-01-03", "2020-01-04", "2020-01-06"],
+        asset_partitions_time_window=TimeWindow(datetime(2020, 1, 2), datetime(2020, 1, 7)),
+        metadata=None,
+    )
+    assert manager.load_input(input_context) == [2, 4, 6]
+
+    assert sorted(call[1].partition.partition for call in handler.handle_input_calls) == [
+        TimeWindow(datetime(2020, 1, 2), datetime(2020, 1, 4)),
+        TimeWindow(datetime(2020, 1, 4), datetime(2020, 1, 6)),
+        TimeWindow(datetime(2020, 1, 6), datetime(2020, 1, 7)),
+    ]
+
+
+def test_asset_in_partitioned_chunks_not_needed():
+    handler = ListHandler()
+    db_client = MagicMock(spec=DbClient, get_select_statement=MagicMock(return_value=""))
+    manager = DbIOManager(
+        type_handlers=[handler],
+        db_client=db_client,
+        database=resource_config["database"],
+        max_partitions_per_load=2,
+    )
+    input_context = MagicMock(
+        asset_key=AssetKey(["schema1", "table1"]),
+        upstream_output=MagicMock(metadata={"partition_expr": "abc"}),
+        resource_config=resource_config,
+        dagster_type=MagicMock(typing_type=list),
+        asset_partitions_def=DailyPartitionsDefinition(start_date="2020-01-01"),
+        asset_partition_keys=["2020-01-02", "2020-01-03"],
+        asset_partitions_time_window=TimeWindow(datetime(2020, 1, 2), datetime(2020, 1, 4)),
+        metadata=None,
+    )
+    assert manager.load_input(input_context) == [2]
+    assert len(handler.handle_input_calls) == 1
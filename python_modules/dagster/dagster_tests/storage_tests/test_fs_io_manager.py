@@ -1,3 +1,4 @@
+import mmap
 import os
 import pickle
 import tempfile
@@ -30,8 +31,9 @@
 from dagster._core.errors import DagsterInvariantViolationError
 from dagster._core.execution.api import create_execution_plan
 from dagster._core.instance import DynamicPartitionsStore
-from dagster._core.storage.fs_io_manager import fs_io_manager
+from dagster._core.storage.fs_io_manager import PickledObjectFilesystemIOManager, fs_io_manager
 from dagster._core.test_utils import instance_for_test
+from upath import UPath
 
 
 def define_pipeline(io_manager):
@@ -508,3 +510,72 @@ def job1():
 
         for event in handled_output_events:
             assert len(event.event_specific_data.metadata_entries) == 0
+
+
+class OutOfBandBuffer:
+    """Wraps a buffer that is pickled out-of-band with protocol 5, like a NumPy array."""
+
+    def __init__(self, data):
+        self.data = data
+
+    @classmethod
+    def _from_buffer(cls, data):
+        return cls(memoryview(data))
+
+    def __reduce_ex__(self, protocol):
+        if protocol >= 5:
+            return self._from_buffer, (pickle.PickleBuffer(self.data),)
+        return self._from_buffer, (bytes(self.data),)
+
+
+def test_fs_io_manager_memory_map():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        io_manager_def = fs_io_manager.configured({"base_dir": tmpdir_path, "memory_map": True})
+
+        @asset
+        def asset1():
+            return {"small": [1, 2, 3], "large": OutOfBandBuffer(bytearray(b"x" * 100_000))}
+
+        @asset
+        def asset2(asset1):
+            large = asset1["large"].data
+            # the buffer is memory-mapped from the stored file rather than copied into a new object
+            assert isinstance(large.obj, mmap.mmap)
+            assert bytes(large) == b"x" * 100_000
+            # the mapping is copy-on-write
+            large[0] = ord("y")
+            return asset1["small"]
+
+        result = materialize(
+            with_resources([asset1, asset2], resource_defs={"io_manager": io_manager_def})
+        )
+        assert result.success
+        assert result.output_for_node("asset2") == [1, 2, 3]
+
+        with open(os.path.join(tmpdir_path, "asset1"), "rb") as read_obj:
+            contents = read_obj.read()
+        assert b"y" not in contents
+
+        # files written with memory_map are loaded regardless of the setting, and vice versa
+        assert materialize(
+            with_resources(
+                [asset1.to_source_assets()[0], asset2],
+                resource_defs={"io_manager": fs_io_manager.configured({"base_dir": tmpdir_path})},
+            )
+        ).output_for_node("asset2") == [1, 2, 3]
+
+
+def test_fs_io_manager_memory_map_redump_keeps_loaded_values():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        io_manager = PickledObjectFilesystemIOManager(base_dir=tmpdir_path, memory_map=True)
+        path = UPath(tmpdir_path) / "asset1"
+
+        io_manager.dump_to_path(None, OutOfBandBuffer(bytearray(b"x" * 100_000)), path)
+        loaded = io_manager.load_from_path(None, path)
+        assert isinstance(loaded.data.obj, mmap.mmap)
+
+        # rematerializing the asset, here with a smaller value, does not change the loaded value
+        io_manager.dump_to_path(None, OutOfBandBuffer(bytearray(b"y" * 10)), path)
+        assert bytes(loaded.data) == b"x" * 100_000
+        assert bytes(io_manager.load_from_path(None, path).data) == b"y" * 10
+        assert os.listdir(tmpdir_path) == ["asset1"]
@@ -1,13 +1,22 @@
+import asyncio
 import tempfile
+import threading
 import time
+from collections import defaultdict
 from contextlib import contextmanager
 from typing import Callable, Union
+from unittest import mock
 
 import dagster._check as check
 from dagster._core.events import DagsterEvent, DagsterEventType, EngineEventData
 from dagster._core.events.log import EventLogEntry
-from dagster._core.storage.event_log import SqliteEventLogStorage, SqlPollingEventWatcher
+from dagster._core.storage.event_log import (
+    ConsolidatedSqliteEventLogStorage,
+    SqliteEventLogStorage,
+    SqlPollingEventWatcher,
+)
 from dagster._core.storage.event_log.base import EventLogCursor
+from dagster._core.storage.event_log.polling_event_watcher import MAX_POLLING_CADENCE
 
 
 class SqlitePollingEventLogStorage(SqliteEventLogStorage):
@@ -129,3 +138,146 @@ def watch_two(event, _cursor):
 
         assert [int(evt.message) for evt in watched_1] == [2, 3, 4]
         assert [int(evt.message) for evt in watched_2] == [4, 5]
+
+
+class ConsolidatedSqlitePollingEventLogStorage(ConsolidatedSqliteEventLogStorage):
+    """Non-sharded SQLite-backed event log storage that uses SqlPollingEventWatcher for watching
+    runs, so that multiple runs are polled with a single query.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(ConsolidatedSqlitePollingEventLogStorage, self).__init__(*args, **kwargs)
+        self._watcher = SqlPollingEventWatcher(self)
+
+    def watch(self, run_id, cursor, callback):
+        self._watcher.watch_run(run_id, cursor, callback)
+
+    def end_watch(self, run_id, handler):
+        self._watcher.unwatch_run(run_id, handler)
+
+    def dispose(self):
+        self._watcher.close()
+        super(ConsolidatedSqlitePollingEventLogStorage, self).dispose()
+
+
+def _wait_for(condition, attempts=20):
+    while not condition() and attempts > 0:
+        time.sleep(0.1)
+        attempts -= 1
+
+
+def test_multiple_runs_single_query():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        num_threads = len(threading.enumerate())
+        storage = ConsolidatedSqlitePollingEventLogStorage(tmpdir_path)
+        try:
+            watched = defaultdict(list)
+            run_ids = [f"run_{i}" for i in range(5)]
+            for run_id in run_ids:
+                storage.store_event(create_event(0, run_id))
+                storage.watch(
+                    run_id, None, lambda event, _cursor: watched[event.run_id].append(event)
+                )
+
+            _wait_for(lambda: all(len(watched[run_id]) == 1 for run_id in run_ids))
+            assert all(len(watched[run_id]) == 1 for run_id in run_ids)
+
+            with mock.patch.object(
+                storage, "get_records_for_runs", wraps=storage.get_records_for_runs
+            ) as get_records_for_runs, mock.patch.object(
+                storage, "get_records_for_run", wraps=storage.get_records_for_run
+            ) as get_records_for_run:
+                for run_id in run_ids:
+                    storage.store_event(create_event(1, run_id))
+
+                _wait_for(lambda: all(len(watched[run_id]) == 2 for run_id in run_ids))
+                assert all(
+                    [int(event.message) for event in watched[run_id]] == [0, 1]
+                    for run_id in run_ids
+                )
+
+                # runs that are already caught up are polled together
+                assert get_records_for_run.call_count == 0
+                assert get_records_for_runs.call_count >= 1
+                assert set(get_records_for_runs.call_args[0][0]) <= set(run_ids)
+
+            # a single thread polls every watched run
+            assert len(threading.enumerate()) == num_threads + 1
+        finally:
+            storage.dispose()
+
+
+def test_empty_run_does_not_widen_query():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        storage = ConsolidatedSqlitePollingEventLogStorage(tmpdir_path)
+        try:
+            for i in range(10):
+                storage.store_event(create_event(i, "busy_run"))
+            busy_cursor = storage.get_records_for_run("busy_run").cursor
+
+            watched = defaultdict(list)
+            storage.watch(
+                "busy_run", busy_cursor, lambda event, _: watched[event.run_id].append(event)
+            )
+            storage.watch("empty_run", None, lambda event, _: watched[event.run_id].append(event))
+            time.sleep(0.5)
+
+            fetched = []
+
+            def _get_records_for_runs(*args, **kwargs):
+                records = get_records_for_runs(*args, **kwargs)
+                fetched.extend(records)
+                return records
+
+            get_records_for_runs = storage.get_records_for_runs
+            with mock.patch.object(storage, "get_records_for_runs", _get_records_for_runs):
+                storage.store_event(create_event(10, "busy_run"))
+                _wait_for(lambda: len(watched["busy_run"]) == 1)
+
+            assert [int(event.message) for event in watched["busy_run"]] == [10]
+            # the empty run is polled from the start of its own history, which does not make the
+            # query return the events of the busy run that were already seen
+            assert [int(record.event_log_entry.user_message) for record in fetched] == [10]
+        finally:
+            storage.dispose()
+
+
+def test_idle_runs_back_off():
+    with create_sqlite_run_event_logstorage() as storage:
+        watched = []
+        storage.watch(RUN_ID, None, lambda event, _cursor: watched.append(event))
+        time.sleep(2.5)
+        with storage._watcher._lock:  # pylint: disable=protected-access
+            watched_run = storage._watcher._watched_runs[RUN_ID]  # pylint: disable=protected-access
+            assert watched_run.interval == MAX_POLLING_CADENCE
+
+        storage.store_event(create_event(1))
+        _wait_for(lambda: len(watched) == 1)
+        assert len(watched) == 1
+        with storage._watcher._lock:  # pylint: disable=protected-access
+            watched_run = storage._watcher._watched_runs[RUN_ID]  # pylint: disable=protected-access
+            assert watched_run.interval < MAX_POLLING_CADENCE
+        storage.dispose()
+
+
+def test_watch_run_async():
+    with create_sqlite_run_event_logstorage() as storage:
+        storage.store_event(create_event(1))
+
+        async def _collect():
+            received = []
+            events = storage._watcher.watch_run_async(  # pylint: disable=protected-access
+                RUN_ID, str(EventLogCursor.from_storage_id(1))
+            )
+            storage.store_event(create_event(2))
+            storage.store_event(create_event(3))
+            async for event, _cursor in events:
+                received.append(int(event.message))
+                if len(received) == 2:
+                    break
+            await events.aclose()
+            return received
+
+        assert asyncio.run(asyncio.wait_for(_collect(), timeout=5)) == [2, 3]
+        assert not storage._watcher.has_run_id(RUN_ID)  # pylint: disable=protected-access
+        storage.dispose()
@@ -1,5 +1,6 @@
 import json
 import pickle
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, cast
@@ -8,6 +9,7 @@
 from dagster import (
     AllPartitionMapping,
     AssetIn,
+    AssetKey,
     DagsterType,
     DailyPartitionsDefinition,
     Field,
@@ -17,6 +19,7 @@
     MetadataValue,
     OpExecutionContext,
     OutputContext,
+    PartitionKeyRange,
     StaticPartitionsDefinition,
     asset,
     build_init_resource_context,
@@ -28,7 +31,7 @@
 from dagster._check import CheckError
 from dagster._core.definitions import build_assets_job
 from dagster._core.storage.io_manager import IOManagerDefinition
-from dagster._core.storage.upath_io_manager import UPathIOManager
+from dagster._core.storage.upath_io_manager import LazyPartitionsMapping, UPathIOManager
 from upath import UPath
 
 
@@ -347,3 +350,144 @@ def my_asset() -> Any:
     ].entry_data.value == get_length(
         json_data
     )
+
+
+def test_upath_io_manager_concurrent_partition_loads(tmp_path: Path):
+    # every load waits for a second load to be in flight at the same time, so partitions that are
+    # loaded one after another would time out
+    barrier = threading.Barrier(2, timeout=10)
+
+    class ConcurrentIOManager(DummyIOManager):
+        def load_from_path(self, context: InputContext, path: UPath) -> str:
+            barrier.wait()
+            return str(path)
+
+    @io_manager
+    def concurrent_io_manager():
+        return ConcurrentIOManager(base_path=UPath(tmp_path), max_concurrent_partition_loads=2)
+
+    upstream_partitions_def = StaticPartitionsDefinition(["A", "B", "C", "D"])
+
+    @asset(partitions_def=upstream_partitions_def)
+    def upstream_asset(context: OpExecutionContext) -> str:
+        return context.partition_key
+
+    @asset(ins={"upstream_asset": AssetIn(partition_mapping=AllPartitionMapping())})
+    def downstream_asset(upstream_asset: Dict[str, str]) -> Dict[str, str]:
+        return upstream_asset
+
+    result = materialize(
+        [*upstream_asset.to_source_assets(), downstream_asset],
+        resources={"io_manager": concurrent_io_manager},
+    )
+    downstream_asset_data = result.output_for_node("downstream_asset", "result")
+    assert sorted(downstream_asset_data.keys()) == ["A", "B", "C", "D"]
+    assert downstream_asset_data["A"] == str(tmp_path / "upstream_asset" / "A")
+
+
+def test_upath_io_manager_concurrent_partition_loads_allow_missing(tmp_path: Path):
+    class PickleIOManager(UPathIOManager):
+        extension: str = ".pkl"
+
+        def dump_to_path(self, context: OutputContext, obj: Any, path: UPath):
+            with path.open("wb") as file:
+                pickle.dump(obj, file)
+
+        def load_from_path(self, context: InputContext, path: UPath) -> Any:
+            with path.open("rb") as file:
+                return pickle.load(file)
+
+    manager = PickleIOManager(base_path=UPath(tmp_path), max_concurrent_partition_loads=4)
+    upstream_partitions_def = StaticPartitionsDefinition(["A", "B", "C"])
+
+    (tmp_path / "upstream_asset").mkdir()
+    for partition_key in ["A", "C"]:
+        with open(tmp_path / "upstream_asset" / f"{partition_key}.pkl", "wb") as file:
+            pickle.dump(partition_key.lower(), file)
+
+    def _load(metadata):
+        return manager.load_input(
+            build_input_context(
+                asset_key=AssetKey("upstream_asset"),
+                asset_partitions_def=upstream_partitions_def,
+                asset_partition_key_range=PartitionKeyRange("A", "C"),
+                dagster_type=DagsterType(lambda _, __: True, "any", typing_type=Any),
+                metadata=metadata,
+            )
+        )
+
+    with pytest.raises(FileNotFoundError):
+        _load({})
+
+    assert _load({"allow_missing_partitions": True}) == {"A": "a", "C": "c"}
+
+    lazy_partitions = _load({"allow_missing_partitions": True, "lazy_partitions": True})
+    assert isinstance(lazy_partitions, LazyPartitionsMapping)
+    assert dict(lazy_partitions) == {"A": "a", "C": "c"}
+
+
+def test_upath_io_manager_lazy_partitions(tmp_path: Path):
+    loaded_paths = []
+
+    class TrackingIOManager(DummyIOManager):
+        def load_from_path(self, context: InputContext, path: UPath) -> str:
+            loaded_paths.append(path)
+            return str(path)
+
+    @io_manager
+    def tracking_io_manager():
+        return TrackingIOManager(base_path=UPath(tmp_path))
+
+    upstream_partitions_def = StaticPartitionsDefinition(["A", "B", "C"])
+
+    @asset(partitions_def=upstream_partitions_def)
+    def upstream_asset(context: OpExecutionContext) -> str:
+        return context.partition_key
+
+    @asset(
+        ins={
+            "upstream_asset": AssetIn(
+                partition_mapping=AllPartitionMapping(), metadata={"lazy_partitions": True}
+            )
+        }
+    )
+    def downstream_asset(upstream_asset) -> int:
+        assert isinstance(upstream_asset, LazyPartitionsMapping)
+        assert sorted(upstream_asset.keys()) == ["A", "B", "C"]
+        # nothing is loaded until it is accessed
+        assert loaded_paths == []
+
+        assert upstream_asset["B"] == str(tmp_path / "upstream_asset" / "B")
+        assert len(loaded_paths) == 1
+        return len(list(upstream_asset.values()))
+
+    result = materialize(
+        [*upstream_asset.to_source_assets(), downstream_asset],
+        resources={"io_manager": tracking_io_manager},
+    )
+    assert result.output_for_node("downstream_asset", "result") == 3
+    assert len(loaded_paths) == 4
+
+
+def test_upath_io_manager_lazy_partitions_requires_any_type(dummy_io_manager: DummyIOManager):
+    upstream_partitions_def = StaticPartitionsDefinition(["A", "B"])
+
+    @asset(partitions_def=upstream_partitions_def)
+    def upstream_asset(context: OpExecutionContext) -> str:
+        return context.partition_key
+
+    @asset(
+        ins={
+            "upstream_asset": AssetIn(
+                partition_mapping=AllPartitionMapping(), metadata={"lazy_partitions": True}
+            )
+        }
+    )
+    def downstream_asset(upstream_asset: Dict[str, str]) -> Dict[str, str]:
+        return upstream_asset
+
+    with pytest.raises(CheckError, match="lazy_partitions=True"):
+        materialize(
+            [*upstream_asset.to_source_assets(), downstream_asset],
+            resources={"io_manager": dummy_io_manager},
+        )
@@ -9,6 +9,7 @@
 import mock
 import pendulum
 import pytest
+import sqlalchemy as db
 from dagster import (
     AssetKey,
     AssetMaterialization,
@@ -2000,6 +2001,108 @@ def _fetch_counts(storage, after_cursor=None):
                     )
                     assert _fetch_counts(storage, after_cursor=9999999999) == {c: {}, d: {}}
 
+    def test_get_materialization_partitions(self, storage, instance):
+        a = AssetKey("no_partitions_asset")
+        b = AssetKey("partitioned_asset")
+
+        @op
+        def materialize():
+            yield AssetMaterialization(a)
+            yield AssetMaterialization(b, partition="x")
+            yield AssetObservation(b, partition="y")
+            yield AssetMaterialization(b, partition="y")
+            yield AssetMaterialization(b, partition="x")
+            yield Output(None)
+
+        with instance_for_test() as created_instance:
+            if not storage._instance:  # pylint: disable=protected-access
+                storage.register_instance(created_instance)
+
+            run_id_1 = make_new_run_id()
+            run_id_2 = make_new_run_id()
+
+            with create_and_delete_test_runs(instance, [run_id_1, run_id_2]):
+                events, _ = _synthesize_events(
+                    lambda: materialize(), instance=created_instance, run_id=run_id_1
+                )
+                for event in events:
+                    storage.store_event(event)
+
+                records = storage.get_event_records(
+                    EventRecordsFilter(
+                        event_type=DagsterEventType.ASSET_MATERIALIZATION, asset_key=b
+                    ),
+                    ascending=True,
+                )
+                storage_ids = [record.storage_id for record in records]
+                assert len(storage_ids) == 3
+
+                assert storage.get_materialization_partitions(a)[0][1] is None
+                assert storage.get_materialization_partitions(b) == list(
+                    zip(storage_ids, ["x", "y", "x"])
+                )
+                assert storage.get_materialization_partitions(
+                    b, after_cursor=storage_ids[0]
+                ) == list(zip(storage_ids[1:], ["y", "x"]))
+                assert storage.get_materialization_partitions(
+                    b, after_cursor=storage_ids[0], limit=1
+                ) == [(storage_ids[1], "y")]
+                assert storage.get_materialization_partitions(b, after_cursor=storage_ids[2]) == []
+
+                if self.can_wipe():
+                    storage.wipe_asset(b)
+                    assert storage.get_materialization_partitions(b) == []
+
+                    events, _ = _synthesize_events(
+                        lambda: materialize(), instance=created_instance, run_id=run_id_2
+                    )
+                    for event in events:
+                        storage.store_event(event)
+
+                    assert [
+                        partition for _, partition in storage.get_materialization_partitions(b)
+                    ] == ["x", "y", "x"]
+
+    def test_get_materialization_partitions_for_asset_keys(self, storage, instance):
+        a = AssetKey("asset_a")
+        b = AssetKey("asset_b")
+        c = AssetKey("asset_c")
+
+        @op
+        def materialize():
+            yield AssetMaterialization(a, partition="x")
+            yield AssetMaterialization(b)
+            yield AssetMaterialization(c, partition="z")
+            yield AssetMaterialization(a, partition="y")
+            yield Output(None)
+
+        with instance_for_test() as created_instance:
+            if not storage._instance:  # pylint: disable=protected-access
+                storage.register_instance(created_instance)
+
+            run_id = make_new_run_id()
+            with create_and_delete_test_runs(instance, [run_id]):
+                events, _ = _synthesize_events(
+                    lambda: materialize(), instance=created_instance, run_id=run_id
+                )
+                for event in events:
+                    storage.store_event(event)
+
+                assert storage.get_materialization_partitions_for_asset_keys([]) == []
+
+                materialization_partitions = storage.get_materialization_partitions_for_asset_keys(
+                    [a, b]
+                )
+                assert [
+                    (asset_key, partition) for asset_key, _, partition in materialization_partitions
+                ] == [(a, "x"), (b, None), (a, "y")]
+                storage_ids = [storage_id for _, storage_id, _ in materialization_partitions]
+                assert storage_ids == sorted(storage_ids)
+
+                assert storage.get_materialization_partitions_for_asset_keys(
+                    [a, b], after_cursor=storage_ids[0], limit=1
+                ) == [materialization_partitions[1]]
+
     def test_get_observation(self, storage, test_run_id):
         a = AssetKey(["key_a"])
 
@@ -2436,6 +2539,85 @@ def my_op():
                 {"dagster/partition/country": "US", "dagster/partition/date": "2022-10-13"}
             ]
 
+    def test_store_events_batch(self, storage, instance):
+        key = AssetKey("hello")
+
+        @op
+        def my_op(context):
+            context.log.info("before")
+            yield AssetMaterialization(
+                asset_key=key,
+                partition="a",
+                tags={"dagster/foo": "bar"},
+            )
+            context.log.info("between")
+            yield AssetMaterialization(asset_key=key, partition="b")
+            yield Output(5)
+
+        run_id = make_new_run_id()
+        with create_and_delete_test_runs(instance, [run_id]):
+            events, _ = _synthesize_events(lambda: my_op(), run_id)
+            storage.store_events(events)
+
+            out_events = storage.get_logs_for_run(run_id)
+            assert [event.message for event in out_events] == [event.message for event in events]
+
+            materializations = storage.get_event_records(
+                EventRecordsFilter(DagsterEventType.ASSET_MATERIALIZATION), ascending=True
+            )
+            assert len(materializations) == 2
+            assert [record.partition_key for record in materializations] == ["a", "b"]
+
+            asset_records = list(storage.get_asset_records([key]))
+            assert len(asset_records) == 1
+            last_materialization_record = asset_records[0].asset_entry.last_materialization_record
+            assert last_materialization_record.storage_id == materializations[1].storage_id
+            assert asset_records[0].asset_entry.last_run_id == run_id
+
+            assert storage.get_event_tags_for_asset(key) == [{"dagster/foo": "bar"}]
+
+            # storing an empty batch is a no-op
+            storage.store_events([])
+            assert len(storage.get_logs_for_run(run_id)) == len(events)
+
+    def test_store_events_batch_conflict(self, storage, instance):
+        if not isinstance(storage, SqlEventLogStorage) or storage.is_run_sharded:
+            pytest.skip("storage does not write batches of events in one transaction")
+
+        key = AssetKey("hello")
+
+        @op
+        def my_op(context):
+            context.log.info("before")
+            yield AssetMaterialization(asset_key=key, partition="a")
+            yield Output(5)
+
+        run_id = make_new_run_id()
+        with create_and_delete_test_runs(instance, [run_id]):
+            events, _ = _synthesize_events(lambda: my_op(), run_id)
+
+            # a concurrent writer inserting one of the asset keys first fails the batch after its
+            # event rows were inserted, which are rolled back before the events are stored one at
+            # a time
+            with mock.patch.object(
+                type(storage),
+                "_store_asset_event_batch",
+                side_effect=db.exc.IntegrityError("INSERT", {}, Exception("conflict")),
+            ):
+                storage.store_events(events)
+
+            out_events = storage.get_logs_for_run(run_id)
+            assert [event.message for event in out_events] == [event.message for event in events]
+            assert (
+                len(
+                    storage.get_event_records(
+                        EventRecordsFilter(DagsterEventType.ASSET_MATERIALIZATION)
+                    )
+                )
+                == 1
+            )
+            assert len(list(storage.get_asset_records([key]))) == 1
+
     def test_add_asset_event_tags(self, storage, instance):
         if not storage.supports_add_asset_event_tags():
             pytest.skip("storage does not support adding asset event tags")
@@ -2893,6 +3075,38 @@ def yields_materialization():
 
                 assert _get_cached_status_for_asset(storage, asset_key) is None
 
+    def test_update_cached_status_by_asset_key(self, storage, instance):
+        if not self.can_write_to_asset_key_table_or_partition_table():
+            return
+
+        a = AssetKey("a")
+        b = AssetKey("b")
+
+        @op
+        def yields_materializations():
+            yield AssetMaterialization(asset_key=a)
+            yield AssetMaterialization(asset_key=b)
+            yield Output(1)
+
+        run_id = make_new_run_id()
+        with create_and_delete_test_runs(instance, [run_id]):
+            events, _ = _synthesize_events(lambda: yields_materializations(), run_id=run_id)
+            for event in events:
+                storage.store_event(event)
+
+            cache_values = {
+                a: AssetStatusCacheValue(latest_storage_id=1),
+                b: AssetStatusCacheValue(
+                    latest_storage_id=2,
+                    partitions_def_id="foo",
+                    serialized_materialized_partition_subset="bar",
+                ),
+            }
+            storage.update_asset_cached_status_data_by_asset_key(cache_values)
+
+            assert _get_cached_status_for_asset(storage, a) == cache_values[a]
+            assert _get_cached_status_for_asset(storage, b) == cache_values[b]
+
     def test_add_dynamic_partitions(self, storage):
         if not self.can_write_to_asset_key_table_or_partition_table():
             return
@@ -33,11 +33,13 @@
 )
 from dagster._core.storage.root import LocalArtifactStorage
 from dagster._core.storage.runs.migration import REQUIRED_DATA_MIGRATIONS
+from dagster._core.storage.runs import sql_run_storage
 from dagster._core.storage.runs.sql_run_storage import SqlRunStorage
 from dagster._core.storage.tags import (
     PARENT_RUN_ID_TAG,
     PARTITION_NAME_TAG,
     PARTITION_SET_TAG,
+    PRIORITY_TAG,
     REPOSITORY_LABEL_TAG,
     ROOT_RUN_ID_TAG,
 )
@@ -636,6 +638,141 @@ def test_fetch_by_status(self, storage):
             run.run_id for run in storage.get_runs(RunsFilter(statuses=[DagsterRunStatus.SUCCESS]))
         } == set()
 
+    def test_get_run_queue_entries(self, storage):
+        assert storage
+        one = make_new_run_id()
+        two = make_new_run_id()
+        three = make_new_run_id()
+        four = make_new_run_id()
+        five = make_new_run_id()
+        origin = self.fake_job_origin("some_pipeline")
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=one,
+                pipeline_name="some_pipeline",
+                status=DagsterRunStatus.QUEUED,
+                external_pipeline_origin=origin,
+            )
+        )
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=two,
+                pipeline_name="some_pipeline",
+                status=DagsterRunStatus.QUEUED,
+                external_pipeline_origin=origin,
+                tags={PRIORITY_TAG: "5", "foo": "bar"},
+            )
+        )
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=three,
+                pipeline_name="some_pipeline",
+                status=DagsterRunStatus.QUEUED,
+                external_pipeline_origin=origin,
+                tags={PRIORITY_TAG: "not-a-number"},
+            )
+        )
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=four,
+                pipeline_name="some_pipeline",
+                status=DagsterRunStatus.QUEUED,
+                external_pipeline_origin=origin,
+                tags={PRIORITY_TAG: "5"},
+            )
+        )
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=five, pipeline_name="some_pipeline", status=DagsterRunStatus.STARTED
+            )
+        )
+
+        entries = storage.get_run_queue_entries(statuses=[DagsterRunStatus.QUEUED])
+        # ordered by priority, then fifo
+        assert [entry.run_id for entry in entries] == [two, four, one, three]
+        assert entries[0].tags == {PRIORITY_TAG: "5", "foo": "bar"}
+        assert entries[0].priority == 5
+        assert (
+            entries[0].location_name
+            == origin.external_repository_origin.repository_location_origin.location_name
+        )
+        assert entries[0].status == DagsterRunStatus.QUEUED
+        assert entries[3].priority == 0
+
+        first_page = storage.get_run_queue_entries(statuses=[DagsterRunStatus.QUEUED], limit=3)
+        assert [entry.run_id for entry in first_page] == [two, four, one]
+        second_page = storage.get_run_queue_entries(
+            statuses=[DagsterRunStatus.QUEUED], limit=3, cursor=first_page[-1].run_id
+        )
+        assert [entry.run_id for entry in second_page] == [three]
+        # pages can end between runs that share a priority
+        assert [
+            entry.run_id
+            for entry in storage.get_run_queue_entries(
+                statuses=[DagsterRunStatus.QUEUED], limit=1, cursor=two
+            )
+        ] == [four]
+        assert storage.get_run_queue_entries(statuses=[DagsterRunStatus.QUEUED], cursor=five) == []
+
+        assert [
+            entry.run_id
+            for entry in storage.get_run_queue_entries(statuses=[DagsterRunStatus.STARTED])
+        ] == [five]
+        assert (
+            storage.get_run_queue_entries(statuses=[DagsterRunStatus.STARTED])[0].location_name
+            is None
+        )
+
+        updated_after = max(entry.update_timestamp for entry in entries) - timedelta(hours=1)
+        assert {
+            entry.run_id for entry in storage.get_run_queue_entries(updated_after=updated_after)
+        } == {one, two, three, four, five}
+        assert (
+            storage.get_run_queue_entries(
+                updated_after=max(entry.update_timestamp for entry in entries) + timedelta(hours=1)
+            )
+            == []
+        )
+
+        # a cursor run that no longer matches the filters still marks where the next page starts
+        storage.handle_run_event(
+            four,
+            DagsterEvent(
+                message="a message",
+                event_type_value=DagsterEventType.PIPELINE_CANCELED.value,
+                pipeline_name="some_pipeline",
+            ),
+        )
+        assert [
+            entry.run_id
+            for entry in storage.get_run_queue_entries(
+                statuses=[DagsterRunStatus.QUEUED], limit=1, cursor=four
+            )
+        ] == [one]
+
+    def test_get_run_queue_entries_tags_chunked(self, storage, monkeypatch):
+        assert storage
+        monkeypatch.setattr(sql_run_storage, "RUN_QUEUE_TAGS_CHUNK_SIZE", 2)
+        origin = self.fake_job_origin("some_pipeline")
+        run_ids = [make_new_run_id() for _ in range(5)]
+        for i, run_id in enumerate(run_ids):
+            storage.add_run(
+                TestRunStorage.build_run(
+                    run_id=run_id,
+                    pipeline_name="some_pipeline",
+                    status=DagsterRunStatus.QUEUED,
+                    external_pipeline_origin=origin,
+                    tags={"index": str(i)},
+                )
+            )
+
+        entries = storage.get_run_queue_entries(statuses=[DagsterRunStatus.QUEUED])
+        assert [entry.run_id for entry in entries] == run_ids
+        assert [entry.tags for entry in entries] == [{"index": str(i)} for i in range(5)]
+        assert {entry.location_name for entry in entries} == {
+            origin.external_repository_origin.repository_location_origin.location_name
+        }
+
     def test_fetch_records_by_update_timestamp(self, storage):
         assert storage
         self._skip_in_memory(storage)
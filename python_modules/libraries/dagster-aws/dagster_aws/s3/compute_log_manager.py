@@ -148,6 +148,7 @@ def delete_logs(
         self, log_key: Optional[Sequence[str]] = None, prefix: Optional[Sequence[str]] = None
     ):
         self.local_manager.delete_logs(log_key=log_key, prefix=prefix)
+        self.log_chunk_cache.clear()
 
         s3_keys_to_remove = None
         if log_key:
@@ -220,6 +221,25 @@ def download_from_cloud_storage(
         with open(path, "wb") as fileobj:
             self._s3_session.download_fileobj(self._s3_bucket, s3_key, fileobj)
 
+    @property
+    def supports_ranged_reads(self) -> bool:
+        return True
+
+    def read_cloud_storage_range(
+        self, log_key: Sequence[str], io_type: ComputeIOType, start: int, end: int, partial=False
+    ) -> bytes:
+        s3_key = self._s3_key(log_key, io_type, partial=partial)
+        try:
+            response = self._s3_session.get_object(
+                Bucket=self._s3_bucket, Key=s3_key, Range=f"bytes={start}-{end - 1}"
+            )
+        except ClientError as e:
+            # the range starts after the end of the object
+            if e.response.get("Error", {}).get("Code") == "InvalidRange":
+                return b""
+            raise
+        return response["Body"].read()
+
     def on_subscribe(self, subscription):
         self._subscription_manager.add_subscription(subscription)
 
@@ -1,8 +1,10 @@
 import io
 import pickle
-from typing import Sequence, Union
+from typing import Optional, Sequence, Union
 
 from dagster import (
+    Enum,
+    EnumValue,
     Field,
     InputContext,
     MemoizableIOManager,
@@ -14,6 +16,17 @@
 )
 from dagster._utils import PICKLE_PROTOCOL
 
+from .streaming import (
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_PART_SIZE,
+    MIN_PART_SIZE,
+    S3MultipartWriter,
+    S3RangedReader,
+    check_compression_available,
+    compressing_writer,
+    decompressing_reader,
+)
+
 
 class PickledObjectS3IOManager(MemoizableIOManager):
     def __init__(
@@ -21,9 +34,23 @@ def __init__(
         s3_bucket,
         s3_session,
         s3_prefix=None,
+        streaming: bool = False,
+        compression: Optional[str] = None,
+        part_size: int = DEFAULT_PART_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
     ):
         self.bucket = check.str_param(s3_bucket, "s3_bucket")
         self.s3_prefix = check.opt_str_param(s3_prefix, "s3_prefix")
+        self.streaming = check.bool_param(streaming, "streaming")
+        self.compression = check.opt_str_param(compression, "compression")
+        if self.compression is not None:
+            check_compression_available(self.compression)
+        self.part_size = check.int_param(part_size, "part_size")
+        check.param_invariant(
+            part_size >= MIN_PART_SIZE, "part_size", f"Must be at least {MIN_PART_SIZE} bytes"
+        )
+        self.max_concurrency = check.int_param(max_concurrency, "max_concurrency")
+        check.param_invariant(max_concurrency > 0, "max_concurrency")
         self.s3 = s3_session
         self.s3.list_objects(Bucket=self.bucket, Prefix=self.s3_prefix, MaxKeys=1)
 
@@ -71,10 +98,28 @@ def load_input(self, context):
 
         key = self._get_path(context)
         context.log.debug(f"Loading S3 object from: {self._uri_for_key(key)}")
-        obj = pickle.loads(self.s3.get_object(Bucket=self.bucket, Key=key)["Body"].read())
+        if self.streaming:
+            raw = S3RangedReader(self.s3, self.bucket, key, self.part_size, self.max_concurrency)
+            fileobj = io.BufferedReader(raw)
+        else:
+            body = self.s3.get_object(Bucket=self.bucket, Key=key)["Body"].read()
+            fileobj = io.BufferedReader(io.BytesIO(body))
+
+        # objects are decompressed according to how they were written, so that changing the
+        # compression setting does not break loading outputs written before the change
+        with fileobj, decompressing_reader(fileobj) as reader:
+            obj = pickle.load(reader)
 
         return obj
 
+    def _dump(self, obj, fileobj) -> None:
+        if self.compression is None:
+            pickle.dump(obj, fileobj, PICKLE_PROTOCOL)
+        else:
+            writer = compressing_writer(fileobj, self.compression)
+            pickle.dump(obj, writer, PICKLE_PROTOCOL)
+            writer.close()
+
     def handle_output(self, context, obj):
         if context.dagster_type.typing_type == type(None):
             check.invariant(
@@ -90,13 +135,18 @@ def handle_output(self, context, obj):
         path = self._uri_for_key(key)
         context.log.debug(f"Writing S3 object at: {path}")
 
-        if self._has_object(key):
-            context.log.warning(f"Removing existing S3 key: {key}")
-            self._rm_object(key)
-
-        pickled_obj = pickle.dumps(obj, PICKLE_PROTOCOL)
-        pickled_obj_bytes = io.BytesIO(pickled_obj)
-        self.s3.upload_fileobj(pickled_obj_bytes, self.bucket, key)
+        # S3 replaces an existing object atomically once the new one is written, so there is no
+        # need to check for and delete it first
+        if self.streaming:
+            with S3MultipartWriter(
+                self.s3, self.bucket, key, self.part_size, self.max_concurrency
+            ) as writer:
+                self._dump(obj, writer)
+        else:
+            pickled_obj_bytes = io.BytesIO()
+            self._dump(obj, pickled_obj_bytes)
+            pickled_obj_bytes.seek(0)
+            self.s3.upload_fileobj(pickled_obj_bytes, self.bucket, key)
         context.add_output_metadata({"uri": MetadataValue.path(path)})
 
 
@@ -104,6 +154,39 @@ def handle_output(self, context, obj):
     config_schema={
         "s3_bucket": Field(StringSource),
         "s3_prefix": Field(StringSource, is_required=False, default_value="dagster"),
+        "streaming": Field(
+            bool,
+            is_required=False,
+            default_value=False,
+            description=(
+                "Pickle outputs directly into a multipart upload and unpickle inputs from ranged"
+                " gets, instead of holding each pickled object in memory whole."
+            ),
+        ),
+        "compression": Field(
+            Enum("S3PickleCompression", [EnumValue("zstd"), EnumValue("lz4")]),
+            is_required=False,
+            description=(
+                "Compress pickled outputs with zstd or lz4, which require the zstandard or lz4"
+                " package respectively. Inputs are decompressed according to how they were"
+                " written, whatever this is set to."
+            ),
+        ),
+        "part_size": Field(
+            int,
+            is_required=False,
+            default_value=DEFAULT_PART_SIZE,
+            description=(
+                "Size in bytes of the parts uploaded and the ranges downloaded when streaming. Must"
+                " be at least 5 MiB."
+            ),
+        ),
+        "max_concurrency": Field(
+            int,
+            is_required=False,
+            default_value=DEFAULT_MAX_CONCURRENCY,
+            description="Number of parts or ranges transferred at a time when streaming.",
+        ),
     },
     required_resource_keys={"s3"},
 )
@@ -123,6 +206,11 @@ def s3_pickle_io_manager(init_context):
     `AssetKey(["one", "two", "three"])` would be stored in a file called "three" in a directory
     with path "/my/base/path/one/two/".
 
+    Large objects can be transferred with ``streaming`` enabled, which pickles each output directly
+    into a multipart upload and unpickles each input from ranged gets, uploading and downloading
+    up to ``max_concurrency`` parts at a time, so that no object is held in memory whole. Outputs
+    can also be compressed with zstd or lz4 by setting ``compression``.
+
     Example usage:
 
     1. Attach this IO manager to a set of assets.
@@ -177,5 +265,13 @@ def my_job():
     s3_session = init_context.resources.s3
     s3_bucket = init_context.resource_config["s3_bucket"]
     s3_prefix = init_context.resource_config.get("s3_prefix")  # s3_prefix is optional
-    pickled_io_manager = PickledObjectS3IOManager(s3_bucket, s3_session, s3_prefix=s3_prefix)
+    pickled_io_manager = PickledObjectS3IOManager(
+        s3_bucket,
+        s3_session,
+        s3_prefix=s3_prefix,
+        streaming=init_context.resource_config["streaming"],
+        compression=init_context.resource_config.get("compression"),
+        part_size=init_context.resource_config["part_size"],
+        max_concurrency=init_context.resource_config["max_concurrency"],
+    )
     return pickled_io_manager
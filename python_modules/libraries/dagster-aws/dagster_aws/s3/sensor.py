@@ -1,35 +1,68 @@
+import heapq
+import json
+from typing import Any, Iterator, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
 import boto3
 import dagster._check as check
 
 MAX_KEYS = 1000
 
 
-def get_s3_keys(bucket, prefix="", since_key=None, s3_session=None):
+def _get_s3_session(s3_session):
+    if not s3_session:
+        s3_session = boto3.resource("s3", use_ssl=True, verify=True).meta.client
+    return s3_session
+
+
+def iter_s3_objects(
+    bucket: str,
+    prefix: str = "",
+    start_after: Optional[str] = None,
+    s3_session=None,
+    page_size: int = MAX_KEYS,
+) -> Iterator[Mapping[str, Any]]:
+    """Yields the objects under a prefix in lexicographic order of their keys, as returned by
+    list_objects_v2. Pages are only listed as the objects in them are consumed, so that only one
+    page is held in memory, and listing stops once the caller stops consuming.
+
+    Args:
+        bucket (str): The bucket to list.
+        prefix (str): Only list the objects whose keys start with this prefix.
+        start_after (Optional[str]): Only list the objects whose keys come after this key.
+        s3_session (Optional[Any]): The S3 client to list with. Defaults to a new client.
+        page_size (int): The number of objects to list with each request.
+    """
     check.str_param(bucket, "bucket")
     check.str_param(prefix, "prefix")
-    check.opt_str_param(since_key, "since_key")
+    check.opt_str_param(start_after, "start_after")
+    check.int_param(page_size, "page_size")
 
-    if not s3_session:
-        s3_session = boto3.resource("s3", use_ssl=True, verify=True).meta.client
+    s3_session = _get_s3_session(s3_session)
 
-    cursor = ""
-    contents = []
+    kwargs = {"Bucket": bucket, "Prefix": prefix, "MaxKeys": page_size}
+    if start_after:
+        kwargs["StartAfter"] = start_after
 
     while True:
-        response = s3_session.list_objects_v2(
-            Bucket=bucket,
-            Delimiter="",
-            MaxKeys=MAX_KEYS,
-            Prefix=prefix,
-            StartAfter=cursor,
-        )
-        contents.extend(response.get("Contents", []))
-        if response["KeyCount"] < MAX_KEYS:
+        response = s3_session.list_objects_v2(**kwargs)
+        yield from response.get("Contents", [])
+
+        if not response.get("IsTruncated") or not response.get("NextContinuationToken"):
             break
 
-        cursor = response["Contents"][-1]["Key"]
+        kwargs["ContinuationToken"] = response["NextContinuationToken"]
+
 
-    sorted_keys = [obj["Key"] for obj in sorted(contents, key=lambda x: x["LastModified"])]
+def get_s3_keys(bucket, prefix="", since_key=None, s3_session=None):
+    check.str_param(bucket, "bucket")
+    check.str_param(prefix, "prefix")
+    check.opt_str_param(since_key, "since_key")
+
+    contents = [
+        (obj["LastModified"], obj["Key"])
+        for obj in iter_s3_objects(bucket, prefix=prefix, s3_session=s3_session)
+    ]
+    sorted_keys = [key for _, key in sorted(contents, key=lambda x: x[0])]
 
     if not since_key or since_key not in sorted_keys:
         return sorted_keys
@@ -39,3 +72,148 @@ def get_s3_keys(bucket, prefix="", since_key=None, s3_session=None):
             return sorted_keys[idx + 1 :]
 
     return []
+
+
+class S3KeysCursor(
+    NamedTuple(
+        "_S3KeysCursor",
+        [
+            ("last_key", Optional[str]),
+            ("last_modified", Optional[float]),
+            ("last_modified_keys", Sequence[str]),
+        ],
+    )
+):
+    """The position of a sensor in the objects under an S3 prefix: the key of the last object it
+    has seen, and that object's last modified time, as a POSIX timestamp. Since S3 lists last
+    modified times to the second, the keys of all the objects seen with that last modified time are
+    kept too, so that objects written in the same second are not missed.
+    """
+
+    def __new__(
+        cls,
+        last_key: Optional[str] = None,
+        last_modified: Optional[float] = None,
+        last_modified_keys: Optional[Sequence[str]] = None,
+    ):
+        return super(S3KeysCursor, cls).__new__(
+            cls,
+            last_key=check.opt_str_param(last_key, "last_key"),
+            last_modified=check.opt_float_param(last_modified, "last_modified"),
+            last_modified_keys=check.opt_sequence_param(
+                last_modified_keys, "last_modified_keys", of_type=str
+            ),
+        )
+
+    def is_new(self, last_modified: float, key: str) -> bool:
+        if self.last_modified is None or last_modified > self.last_modified:
+            return True
+        return last_modified == self.last_modified and key not in self.last_modified_keys
+
+    def advance(self, new_objects: Sequence[Tuple[float, str]]) -> "S3KeysCursor":
+        """Returns the cursor after the given objects, which are in the order they were added."""
+        if not new_objects:
+            return self
+
+        last_modified, last_key = new_objects[-1]
+        last_modified_keys = [key for modified, key in new_objects if modified == last_modified]
+        if last_modified == self.last_modified:
+            last_modified_keys = [*self.last_modified_keys, *last_modified_keys]
+        return S3KeysCursor(last_key, last_modified, last_modified_keys)
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "last_key": self.last_key,
+                "last_modified": self.last_modified,
+                "last_modified_keys": list(self.last_modified_keys),
+            }
+        )
+
+    @staticmethod
+    def from_json(cursor: Optional[str]) -> "S3KeysCursor":
+        if not cursor:
+            return S3KeysCursor()
+
+        loaded = json.loads(cursor)
+        return S3KeysCursor(
+            last_key=loaded.get("last_key"),
+            last_modified=loaded.get("last_modified"),
+            last_modified_keys=loaded.get("last_modified_keys"),
+        )
+
+
+def get_new_s3_keys(
+    bucket: str,
+    cursor: Optional[str] = None,
+    prefix: str = "",
+    s3_session=None,
+    max_keys: Optional[int] = MAX_KEYS,
+    lexicographic: bool = False,
+) -> Tuple[List[str], str]:
+    """Returns the keys of the objects under an S3 prefix that are new since the given cursor, in
+    the order they were added, along with the cursor to pass the next time. Cursors are strings,
+    so that they can be stored as the cursor of a sensor.
+
+    By default, objects are new when they were last modified after the object the cursor was
+    created at. Finding them requires listing the whole prefix, but only up to max_keys objects are
+    held in memory while doing so. If the keys of the objects are written in lexicographic order,
+    e.g. because they start with the time they were written at, set lexicographic so that objects
+    are new when their keys come after the cursor's instead, and only those are listed.
+
+    Args:
+        bucket (str): The bucket to list.
+        cursor (Optional[str]): The cursor returned by the last call, or None to list all keys.
+        prefix (str): Only consider the objects whose keys start with this prefix.
+        s3_session (Optional[Any]): The S3 client to list with. Defaults to a new client.
+        max_keys (Optional[int]): The maximum number of keys to return. If there are more new
+            keys, the oldest ones are returned, and the rest are returned by the next calls.
+            Defaults to 1000. Set to None or 0 to return all the new keys.
+        lexicographic (bool): Whether the keys of the objects are written in lexicographic order.
+
+    Examples:
+
+    .. code-block:: python
+
+        @sensor(job=my_job)
+        def my_s3_sensor(context):
+            new_s3_keys, cursor = get_new_s3_keys("my_s3_bucket", cursor=context.cursor)
+            for s3_key in new_s3_keys:
+                yield RunRequest(run_key=s3_key, run_config={})
+            context.update_cursor(cursor)
+    """
+    check.str_param(bucket, "bucket")
+    check.opt_str_param(cursor, "cursor")
+    check.str_param(prefix, "prefix")
+    check.opt_int_param(max_keys, "max_keys")
+    check.param_invariant(max_keys is None or max_keys >= 0, "max_keys")
+    check.bool_param(lexicographic, "lexicographic")
+
+    # 0 does not limit the number of keys either, whichever order the keys are listed in
+    max_keys = max_keys or None
+    s3_cursor = S3KeysCursor.from_json(cursor)
+
+    if lexicographic:
+        new_objects = []
+        for obj in iter_s3_objects(
+            bucket,
+            prefix=prefix,
+            start_after=s3_cursor.last_key,
+            s3_session=s3_session,
+            page_size=min(max_keys, MAX_KEYS) if max_keys is not None else MAX_KEYS,
+        ):
+            new_objects.append((obj["LastModified"].timestamp(), obj["Key"]))
+            if max_keys is not None and len(new_objects) >= max_keys:
+                break
+    else:
+        objects = (
+            (obj["LastModified"].timestamp(), obj["Key"])
+            for obj in iter_s3_objects(bucket, prefix=prefix, s3_session=s3_session)
+        )
+        objects = (obj for obj in objects if s3_cursor.is_new(*obj))
+        # keep only the oldest max_keys objects in memory while listing
+        new_objects = (
+            heapq.nsmallest(max_keys, objects) if max_keys is not None else sorted(objects)
+        )
+
+    return [key for _, key in new_objects], s3_cursor.advance(new_objects).to_json()
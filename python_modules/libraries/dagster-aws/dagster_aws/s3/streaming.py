@@ -0,0 +1,290 @@
+"""File-like objects that stream an S3 object, so that large objects do not need to be held in
+memory whole while they are written or read. Writes go to a multipart upload, and reads are made
+of ranged gets, both spread over a pool of threads.
+"""
+
+import importlib
+import io
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+import dagster._check as check
+from dagster import DagsterInvariantViolationError
+
+# S3 requires every part of a multipart upload except the last to be at least 5 MiB
+MIN_PART_SIZE = 5 * 1024 * 1024
+
+DEFAULT_PART_SIZE = 8 * 1024 * 1024
+DEFAULT_MAX_CONCURRENCY = 8
+
+# the magic numbers that the frames of each supported compression format start with
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+_LZ4_MAGIC = b"\x04\x22\x4d\x18"
+
+
+class S3MultipartWriter(io.RawIOBase):
+    """Writes an S3 object, uploading it in parts of part_size bytes as they are written.
+
+    At most max_concurrency parts are uploaded at a time, and writes block while they are, so at
+    most about max_concurrency + 1 parts are held in memory. Objects smaller than one part are
+    uploaded with a single put instead. Since S3 replaces objects atomically when an upload
+    completes, any existing object at the key is only replaced once the object is fully written.
+
+    Closing the writer completes the upload. When used as a context manager, the upload is
+    aborted instead if the block raises.
+    """
+
+    def __init__(
+        self,
+        s3: Any,
+        bucket: str,
+        key: str,
+        part_size: int = DEFAULT_PART_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ):
+        super().__init__()
+        self._s3 = s3
+        self._bucket = check.str_param(bucket, "bucket")
+        self._key = check.str_param(key, "key")
+        self._part_size = check.int_param(part_size, "part_size")
+        check.param_invariant(part_size >= MIN_PART_SIZE, "part_size")
+        self._max_concurrency = check.int_param(max_concurrency, "max_concurrency")
+        check.param_invariant(max_concurrency > 0, "max_concurrency")
+
+        self._buffer = bytearray()
+        self._upload_id: Optional[str] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: Deque[Future] = deque()
+        self._parts: List[Dict[str, Any]] = []
+        self._part_number = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:  # type: ignore  # (bytes-like)
+        if self.closed:
+            raise ValueError("write to closed file")
+
+        self._buffer += b
+        while len(self._buffer) >= self._part_size:
+            part = bytes(self._buffer[: self._part_size])
+            del self._buffer[: self._part_size]
+            self._upload_part(part)
+        return len(b)
+
+    def _upload_part(self, part: bytes) -> None:
+        if self._upload_id is None:
+            self._upload_id = self._s3.create_multipart_upload(Bucket=self._bucket, Key=self._key)[
+                "UploadId"
+            ]
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_concurrency, thread_name_prefix="dagster_s3_upload"
+            )
+
+        while len(self._pending) >= self._max_concurrency:
+            self._parts.append(self._pending.popleft().result())
+
+        self._part_number += 1
+        self._pending.append(
+            check.not_none(self._executor).submit(self._put_part, self._part_number, part)
+        )
+
+    def _put_part(self, part_number: int, part: bytes) -> Dict[str, Any]:
+        response = self._s3.upload_part(
+            Bucket=self._bucket,
+            Key=self._key,
+            UploadId=self._upload_id,
+            PartNumber=part_number,
+            Body=part,
+        )
+        return {"PartNumber": part_number, "ETag": response["ETag"]}
+
+    def close(self) -> None:
+        if self.closed:
+            return
+
+        try:
+            if self._upload_id is None:
+                self._s3.put_object(Bucket=self._bucket, Key=self._key, Body=bytes(self._buffer))
+            else:
+                if self._buffer:
+                    self._upload_part(bytes(self._buffer))
+                while self._pending:
+                    self._parts.append(self._pending.popleft().result())
+                self._s3.complete_multipart_upload(
+                    Bucket=self._bucket,
+                    Key=self._key,
+                    UploadId=self._upload_id,
+                    MultipartUpload={"Parts": self._parts},
+                )
+        except BaseException:
+            self.abort()
+            raise
+        finally:
+            self._buffer = bytearray()
+            self._shutdown()
+            super().close()
+
+    def abort(self) -> None:
+        """Discards the object written so far, leaving any existing object at the key in place."""
+        if self.closed:
+            return
+
+        try:
+            for future in self._pending:
+                future.cancel()
+            self._shutdown()
+            if self._upload_id is not None:
+                self._s3.abort_multipart_upload(
+                    Bucket=self._bucket, Key=self._key, UploadId=self._upload_id
+                )
+        finally:
+            self._buffer = bytearray()
+            super().close()
+
+    def _shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
+
+
+class S3RangedReader(io.RawIOBase):
+    """Reads an S3 object as a sequence of ranged gets of part_size bytes.
+
+    Up to max_concurrency ranges beyond the one being read are fetched ahead of the reader.
+    """
+
+    def __init__(
+        self,
+        s3: Any,
+        bucket: str,
+        key: str,
+        part_size: int = DEFAULT_PART_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ):
+        super().__init__()
+        self._s3 = s3
+        self._bucket = check.str_param(bucket, "bucket")
+        self._key = check.str_param(key, "key")
+        self._part_size = check.int_param(part_size, "part_size")
+        check.param_invariant(part_size > 0, "part_size")
+        self._max_concurrency = check.int_param(max_concurrency, "max_concurrency")
+        check.param_invariant(max_concurrency > 0, "max_concurrency")
+
+        # the first range also tells us the size of the object
+        first_range, self._size = self._get_range(0)
+        self._current = memoryview(first_range)
+        self._next_offset = len(first_range)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: Deque[Future] = deque()
+        self._schedule_ranges()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def readable(self) -> bool:
+        return True
+
+    def _get_range(self, start: int) -> Tuple[bytes, int]:
+        response = self._s3.get_object(
+            Bucket=self._bucket,
+            Key=self._key,
+            Range=f"bytes={start}-{start + self._part_size - 1}",
+        )
+        data = response["Body"].read()
+        content_range = response.get("ContentRange")
+        # e.g. "bytes 0-8388607/21474836480"
+        size = int(content_range.rsplit("/", 1)[1]) if content_range else start + len(data)
+        return data, size
+
+    def _schedule_ranges(self) -> None:
+        while len(self._pending) < self._max_concurrency and self._next_offset < self._size:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_concurrency, thread_name_prefix="dagster_s3_download"
+                )
+            self._pending.append(self._executor.submit(self._get_range, self._next_offset))
+            self._next_offset += self._part_size
+
+    def readinto(self, b) -> int:  # type: ignore  # (writable bytes-like)
+        if self.closed:
+            raise ValueError("read from closed file")
+
+        while not self._current:
+            if not self._pending:
+                return 0
+            data, _ = self._pending.popleft().result()
+            self._current = memoryview(data)
+            self._schedule_ranges()
+
+        size = min(len(b), len(self._current))
+        b[:size] = self._current[:size]
+        self._current = self._current[size:]
+        return size
+
+    def close(self) -> None:
+        if self.closed:
+            return
+
+        for future in self._pending:
+            future.cancel()
+        self._pending.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self._current = memoryview(b"")
+        super().close()
+
+
+def check_compression_available(compression: str) -> None:
+    """Raises if the package needed for the given compression format is not installed."""
+    package_name = {"zstd": "zstandard", "lz4": "lz4"}.get(compression)
+    check.param_invariant(package_name is not None, "compression", f"Unsupported: {compression}")
+    try:
+        importlib.import_module("zstandard" if compression == "zstd" else "lz4.frame")
+    except ImportError as e:
+        raise DagsterInvariantViolationError(
+            f"The {package_name} package must be installed to use {compression} compression. If"
+            f' you\'re using pip, you can install it by running "pip install {package_name}".'
+        ) from e
+
+
+def compressing_writer(fileobj: Any, compression: str) -> Any:
+    """Wraps a writable file object so that what is written to it is compressed in the given
+    format. Closing the returned object ends the compressed stream, without closing fileobj.
+    """
+    if compression == "zstd":
+        import zstandard
+
+        return zstandard.ZstdCompressor().stream_writer(fileobj, closefd=False)
+    elif compression == "lz4":
+        import lz4.frame
+
+        return lz4.frame.LZ4FrameFile(fileobj, mode="wb")
+
+    check.failed(f"Unsupported compression format {compression}")
+
+
+def decompressing_reader(fileobj: io.BufferedReader) -> Any:
+    """Wraps a readable file object, decompressing what is read from it if it starts with a
+    compressed frame in one of the supported formats, whatever the format it was written with.
+    """
+    magic = fileobj.peek(4)[:4]
+    if magic == _ZSTD_MAGIC:
+        import zstandard
+
+        return io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(fileobj))
+    elif magic == _LZ4_MAGIC:
+        import lz4.frame
+
+        return lz4.frame.LZ4FrameFile(fileobj, mode="rb")
+
+    return fileobj
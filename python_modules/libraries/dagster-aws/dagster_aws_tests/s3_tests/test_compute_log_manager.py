@@ -204,6 +204,31 @@ def test_prefix_filter(mock_s3_bucket):
         assert logs == "hello hello"
 
 
+def test_ranged_reads(mock_s3_bucket):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = S3ComputeLogManager(
+            bucket=mock_s3_bucket.name, prefix="my_prefix", local_dir=temp_dir
+        )
+        log_key = ["arbitrary", "log", "key"]
+        with manager.open_log_stream(log_key, ComputeIOType.STDOUT) as write_stream:
+            write_stream.write("hello hello")
+
+        assert manager.read_cloud_storage_range(log_key, ComputeIOType.STDOUT, 2, 8) == b"llo he"
+        assert manager.read_cloud_storage_range(log_key, ComputeIOType.STDOUT, 6, 20) == b"hello"
+        assert manager.read_cloud_storage_range(log_key, ComputeIOType.STDOUT, 20, 30) == b""
+
+        # read from the bucket without downloading the logs
+        manager.local_manager.delete_logs(log_key=log_key)
+        log_data = manager.get_log_data(log_key, max_bytes=5)
+        assert log_data.stdout == b"hello"
+        assert manager.get_log_data(log_key, cursor=log_data.cursor).stdout == b" hello"
+        assert not os.path.exists(
+            manager.local_manager.get_captured_local_path(
+                log_key, IO_TYPE_EXTENSION[ComputeIOType.STDOUT]
+            )
+        )
+
+
 class TestS3ComputeLogManager(TestCapturedLogManager):
     __test__ = True
 
@@ -1,4 +1,9 @@
+import os
+from typing import Any
+
+import pytest
 from dagster import (
+    AssetKey,
     GraphIn,
     GraphOut,
     In,
@@ -8,6 +13,8 @@
     StaticPartitionsDefinition,
     VersionStrategy,
     asset,
+    build_input_context,
+    build_output_context,
     graph,
     job,
     materialize,
@@ -17,8 +24,10 @@
 )
 from dagster._core.definitions.assets import AssetsDefinition
 from dagster._core.test_utils import instance_for_test
+from dagster._core.types.dagster_type import resolve_dagster_type
 from dagster._legacy import build_assets_job
-from dagster_aws.s3.io_manager import s3_pickle_io_manager
+from dagster_aws.s3.io_manager import PickledObjectS3IOManager, s3_pickle_io_manager
+from dagster_aws.s3.streaming import MIN_PART_SIZE
 from dagster_aws.s3.utils import construct_s3_client
 
 
@@ -212,3 +221,99 @@ def asset2() -> None:
 
     for event in handled_output_events:
         assert len(event.event_specific_data.metadata_entries) == 0
+
+
+@pytest.mark.parametrize("compression", [None, "zstd", "lz4"])
+def test_s3_pickle_io_manager_streaming(mock_s3_bucket, compression):
+    # spans two parts, so that the output is written with a multipart upload
+    data = os.urandom(MIN_PART_SIZE + 1024)
+
+    @asset
+    def asset1():
+        return data
+
+    @asset
+    def asset2(asset1):
+        return asset1 == data
+
+    io_manager_config = {
+        "s3_bucket": mock_s3_bucket.name,
+        "streaming": True,
+        "part_size": MIN_PART_SIZE,
+        "max_concurrency": 2,
+    }
+    if compression:
+        io_manager_config["compression"] = compression
+
+    result = materialize(
+        with_resources(
+            [asset1, asset2],
+            resource_defs={
+                "io_manager": s3_pickle_io_manager.configured(io_manager_config),
+                "s3": s3_test_resource,
+            },
+        )
+    )
+    assert result.success
+    assert result.output_for_node("asset2") is True
+
+    s3 = construct_s3_client(max_attempts=5)
+    assert not s3.list_multipart_uploads(Bucket=mock_s3_bucket.name).get("Uploads")
+
+
+def test_s3_pickle_io_manager_reads_any_format(mock_s3_bucket):
+    s3 = construct_s3_client(max_attempts=5)
+    writers = [
+        PickledObjectS3IOManager(mock_s3_bucket.name, s3, "dagster"),
+        PickledObjectS3IOManager(mock_s3_bucket.name, s3, "dagster", compression="lz4"),
+        PickledObjectS3IOManager(
+            mock_s3_bucket.name, s3, "dagster", streaming=True, compression="zstd"
+        ),
+    ]
+    readers = [
+        PickledObjectS3IOManager(mock_s3_bucket.name, s3, "dagster"),
+        PickledObjectS3IOManager(mock_s3_bucket.name, s3, "dagster", streaming=True),
+    ]
+
+    for i, writer in enumerate(writers):
+        # each write overwrites the object written before it
+        output_context = build_output_context(
+            asset_key=AssetKey("asset1"), dagster_type=resolve_dagster_type(Any)
+        )
+        writer.handle_output(output_context, {"value": i})
+
+        for reader in readers:
+            input_context = build_input_context(
+                asset_key=AssetKey("asset1"),
+                upstream_output=output_context,
+                dagster_type=resolve_dagster_type(Any),
+            )
+            assert reader.load_input(input_context) == {"value": i}
+
+
+class _Unpicklable:
+    def __reduce__(self):
+        raise Exception("can not be pickled")
+
+
+def test_s3_pickle_io_manager_streaming_failure(mock_s3_bucket):
+    s3 = construct_s3_client(max_attempts=5)
+    io_manager = PickledObjectS3IOManager(
+        mock_s3_bucket.name, s3, "dagster", streaming=True, part_size=MIN_PART_SIZE
+    )
+    output_context = build_output_context(
+        asset_key=AssetKey("asset1"), dagster_type=resolve_dagster_type(Any)
+    )
+    io_manager.handle_output(output_context, "existing")
+
+    # fails after a part has been uploaded
+    with pytest.raises(Exception, match="can not be pickled"):
+        io_manager.handle_output(output_context, [os.urandom(MIN_PART_SIZE + 1024), _Unpicklable()])
+
+    assert not s3.list_multipart_uploads(Bucket=mock_s3_bucket.name).get("Uploads")
+    input_context = build_input_context(
+        asset_key=AssetKey("asset1"),
+        upstream_output=output_context,
+        dagster_type=resolve_dagster_type(Any),
+    )
+    assert io_manager.load_input(input_context) == "existing"
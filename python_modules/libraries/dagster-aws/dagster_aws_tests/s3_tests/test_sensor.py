@@ -0,0 +1,121 @@
+import itertools
+
+import boto3
+import dagster._check as check
+import pytest
+from dagster import RunRequest, build_sensor_context, sensor
+from dagster_aws.s3.sensor import get_new_s3_keys, get_s3_keys, iter_s3_objects
+
+
+def _put_objects(bucket, keys):
+    for key in keys:
+        bucket.put_object(Key=key, Body=b"data")
+
+
+def _get_all_new_keys(bucket_name, s3, cursor=None, **kwargs):
+    batches = []
+    while True:
+        keys, cursor = get_new_s3_keys(bucket_name, cursor=cursor, s3_session=s3, **kwargs)
+        if not keys:
+            return batches, cursor
+        batches.append(keys)
+
+
+def test_iter_s3_objects(mock_s3_bucket):
+    s3 = boto3.client("s3", region_name="us-east-1")
+    keys = [f"foo/{i}" for i in range(5)]
+    _put_objects(mock_s3_bucket, [*keys, "bar/0"])
+
+    objects = iter_s3_objects(mock_s3_bucket.name, prefix="foo/", s3_session=s3, page_size=2)
+    assert [obj["Key"] for obj in objects] == keys
+
+    objects = iter_s3_objects(
+        mock_s3_bucket.name, prefix="foo/", start_after="foo/2", s3_session=s3, page_size=2
+    )
+    assert [obj["Key"] for obj in itertools.islice(objects, 1)] == ["foo/3"]
+
+
+def test_get_s3_keys(mock_s3_bucket):
+    s3 = boto3.client("s3", region_name="us-east-1")
+    _put_objects(mock_s3_bucket, ["foo/0", "foo/1", "foo/2"])
+
+    assert get_s3_keys(mock_s3_bucket.name, prefix="foo/", s3_session=s3) == [
+        "foo/0",
+        "foo/1",
+        "foo/2",
+    ]
+    assert get_s3_keys(mock_s3_bucket.name, since_key="foo/0", s3_session=s3) == [
+        "foo/1",
+        "foo/2",
+    ]
+
+
+def test_get_new_s3_keys(mock_s3_bucket):
+    s3 = boto3.client("s3", region_name="us-east-1")
+    _put_objects(mock_s3_bucket, ["b", "c", "d", "e", "f"])
+
+    batches, cursor = _get_all_new_keys(mock_s3_bucket.name, s3, max_keys=2)
+    assert batches == [["b", "c"], ["d", "e"], ["f"]]
+
+    # objects written in the same second as the last object seen are found too, whatever their key
+    _put_objects(mock_s3_bucket, ["a", "g"])
+    batches, cursor = _get_all_new_keys(mock_s3_bucket.name, s3, cursor=cursor)
+    assert sorted(itertools.chain(*batches)) == ["a", "g"]
+
+    assert get_new_s3_keys(mock_s3_bucket.name, cursor=cursor, s3_session=s3)[0] == []
+
+
+def test_get_new_s3_keys_lexicographic(mock_s3_bucket):
+    s3 = boto3.client("s3", region_name="us-east-1")
+    _put_objects(mock_s3_bucket, [f"events/2022-01-0{i}" for i in range(1, 6)])
+
+    batches, cursor = _get_all_new_keys(
+        mock_s3_bucket.name, s3, prefix="events/", max_keys=3, lexicographic=True
+    )
+    assert batches == [
+        ["events/2022-01-01", "events/2022-01-02", "events/2022-01-03"],
+        ["events/2022-01-04", "events/2022-01-05"],
+    ]
+
+    _put_objects(mock_s3_bucket, ["events/2022-01-06"])
+    keys, _ = get_new_s3_keys(
+        mock_s3_bucket.name, cursor=cursor, prefix="events/", s3_session=s3, lexicographic=True
+    )
+    assert keys == ["events/2022-01-06"]
+
+
+@pytest.mark.parametrize("lexicographic", [False, True])
+def test_get_new_s3_keys_unlimited(mock_s3_bucket, lexicographic):
+    s3 = boto3.client("s3", region_name="us-east-1")
+    keys = [f"events/2022-01-0{i}" for i in range(1, 6)]
+    _put_objects(mock_s3_bucket, keys)
+
+    for max_keys in [None, 0]:
+        new_keys, _ = get_new_s3_keys(
+            mock_s3_bucket.name, s3_session=s3, max_keys=max_keys, lexicographic=lexicographic
+        )
+        assert sorted(new_keys) == keys
+
+    with pytest.raises(check.ParameterCheckError):
+        get_new_s3_keys(mock_s3_bucket.name, s3_session=s3, max_keys=-1)
+
+
+def test_get_new_s3_keys_sensor(mock_s3_bucket):
+    s3 = boto3.client("s3", region_name="us-east-1")
+
+    @sensor(job_name="process_s3_object")
+    def s3_sensor(context):
+        new_s3_keys, cursor = get_new_s3_keys(
+            mock_s3_bucket.name, cursor=context.cursor, s3_session=s3, max_keys=2
+        )
+        for s3_key in new_s3_keys:
+            yield RunRequest(run_key=s3_key, run_config={})
+        context.update_cursor(cursor)
+
+    _put_objects(mock_s3_bucket, ["a", "b", "c"])
+
+    context = build_sensor_context()
+    run_keys = []
+    for _ in range(3):
+        run_keys.extend(run_request.run_key for run_request in s3_sensor(context))
+    assert run_keys == ["a", "b", "c"]
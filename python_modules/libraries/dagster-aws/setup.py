@@ -42,9 +42,13 @@ def get_version() -> str:
     extras_require={
         "redshift": ["psycopg2-binary"],
         "pyspark": ["dagster-pyspark"],
+        "zstd": ["zstandard"],
+        "lz4": ["lz4"],
         "test": [
             "moto>=2.2.8",
             "requests-mock",
+            "zstandard",
+            "lz4",
             "xmltodict==0.12.0",  # pinned until moto>=3.1.9 (https://github.com/spulec/moto/issues/5112)
         ],
     },
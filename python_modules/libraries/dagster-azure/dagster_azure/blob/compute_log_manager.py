@@ -3,6 +3,7 @@
 from typing import Optional, Sequence
 
 import dagster._seven as seven
+from azure.core.exceptions import HttpResponseError
 from azure.identity import DefaultAzureCredential
 from dagster import (
     Field,
@@ -163,6 +164,7 @@ def delete_logs(
         self, log_key: Optional[Sequence[str]] = None, prefix: Optional[Sequence[str]] = None
     ):
         self.local_manager.delete_logs(log_key=log_key, prefix=prefix)
+        self.log_chunk_cache.clear()
         if log_key:
             prefix_path = "/".join([self._blob_prefix, "storage", *log_key])
         elif prefix:
@@ -248,6 +250,23 @@ def download_from_cloud_storage(
             blob = self._container_client.get_blob_client(blob_key)
             blob.download_blob().readinto(fileobj)
 
+    @property
+    def supports_ranged_reads(self) -> bool:
+        return True
+
+    def read_cloud_storage_range(
+        self, log_key: Sequence[str], io_type: ComputeIOType, start: int, end: int, partial=False
+    ) -> bytes:
+        blob_key = self._blob_key(log_key, io_type, partial=partial)
+        blob = self._container_client.get_blob_client(blob_key)
+        try:
+            return blob.download_blob(offset=start, length=end - start).readall()
+        except HttpResponseError as e:
+            # the range starts after the end of the blob
+            if e.status_code == 416:
+                return b""
+            raise
+
     def on_subscribe(self, subscription):
         self._subscription_manager.add_subscription(subscription)
 
@@ -1,3 +1,5 @@
+from typing import Sequence
+
 import pandas as pd
 from dagster import InputContext, MetadataValue, OutputContext, TableColumn, TableSchema
 from dagster._core.storage.db_io_manager import DbTypeHandler, TableSlice
@@ -62,6 +64,9 @@ def load_input(self, context: InputContext, table_slice: TableSlice) -> pd.DataF
         conn = _connect_duckdb(context).cursor()
         return conn.execute(DuckDbClient.get_select_statement(table_slice)).fetchdf()
 
+    def concat(self, context: InputContext, objs: Sequence[pd.DataFrame]) -> pd.DataFrame:
+        return pd.concat(objs, ignore_index=True)
+
     @property
     def supported_types(self):
         return [pd.DataFrame]
@@ -1,3 +1,6 @@
+from functools import reduce
+from typing import Sequence
+
 import pyspark
 import pyspark.sql
 from dagster import InputContext, MetadataValue, OutputContext, TableColumn, TableSchema
@@ -72,6 +75,11 @@ def load_input(self, context: InputContext, table_slice: TableSlice) -> pyspark.
         spark = SparkSession.builder.getOrCreate()
         return spark.createDataFrame(pd_df)
 
+    def concat(
+        self, context: InputContext, objs: Sequence[pyspark.sql.DataFrame]
+    ) -> pyspark.sql.DataFrame:
+        return reduce(pyspark.sql.DataFrame.unionByName, objs)
+
     @property
     def supported_types(self):
         return [pyspark.sql.DataFrame]
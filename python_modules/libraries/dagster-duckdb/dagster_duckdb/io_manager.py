@@ -1,7 +1,14 @@
 from typing import Sequence, cast
 
 import duckdb
-from dagster import Field, IOManagerDefinition, OutputContext, StringSource, io_manager
+from dagster import (
+    Field,
+    IntSource,
+    IOManagerDefinition,
+    OutputContext,
+    StringSource,
+    io_manager,
+)
 from dagster._core.definitions.time_window_partitions import TimeWindow
 from dagster._core.storage.db_io_manager import (
     DbClient,
@@ -80,6 +87,22 @@ def my_table_a(my_table: pd.DataFrame):
             "schema": Field(
                 StringSource, description="Name of the schema to use.", is_required=False
             ),
+            "max_partitions_per_load": Field(
+                IntSource,
+                description=(
+                    "If set, inputs that span more time window partitions than this are loaded in"
+                    " multiple queries of at most this many partitions each."
+                ),
+                is_required=False,
+            ),
+            "max_concurrent_loads": Field(
+                IntSource,
+                description=(
+                    "The number of queries that can run at the same time when an input is loaded"
+                    " in multiple queries."
+                ),
+                default_value=1,
+            ),
         }
     )
     def duckdb_io_manager(init_context):
@@ -96,6 +119,8 @@ def duckdb_io_manager(init_context):
             io_manager_name="DuckDBIOManager",
             database=init_context.resource_config["database"],
             schema=init_context.resource_config.get("schema"),
+            max_partitions_per_load=init_context.resource_config.get("max_partitions_per_load"),
+            max_concurrent_loads=init_context.resource_config["max_concurrent_loads"],
         )
 
     return duckdb_io_manager
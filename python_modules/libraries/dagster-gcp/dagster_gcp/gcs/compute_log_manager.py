@@ -20,6 +20,7 @@
 )
 from dagster._serdes import ConfigurableClass, ConfigurableClassData
 from dagster._utils import ensure_dir, ensure_file
+from google.api_core.exceptions import RequestRangeNotSatisfiable
 from google.cloud import storage
 
 
@@ -132,6 +133,7 @@ def delete_logs(
         self, log_key: Optional[Sequence[str]] = None, prefix: Optional[Sequence[str]] = None
     ):
         self._local_manager.delete_logs(log_key, prefix)
+        self.log_chunk_cache.clear()
         if log_key:
             gcs_keys_to_remove = [
                 self._gcs_key(log_key, ComputeIOType.STDOUT),
@@ -195,6 +197,21 @@ def download_from_cloud_storage(
         with open(path, "wb") as fileobj:
             self._bucket.blob(gcs_key).download_to_file(fileobj)
 
+    @property
+    def supports_ranged_reads(self) -> bool:
+        return True
+
+    def read_cloud_storage_range(
+        self, log_key: Sequence[str], io_type: ComputeIOType, start: int, end: int, partial=False
+    ) -> bytes:
+        gcs_key = self._gcs_key(log_key, io_type, partial=partial)
+        try:
+            # the end of the range is inclusive
+            return self._bucket.blob(gcs_key).download_as_bytes(start=start, end=end - 1)
+        except RequestRangeNotSatisfiable:
+            # the range starts after the end of the object
+            return b""
+
     def on_subscribe(self, subscription):
         self._subscription_manager.add_subscription(subscription)
 
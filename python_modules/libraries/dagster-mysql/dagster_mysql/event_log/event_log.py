@@ -1,3 +1,6 @@
+from contextlib import contextmanager
+from typing import Any, Mapping
+
 import dagster._check as check
 import sqlalchemy as db
 from dagster._core.storage.config import mysql_config
@@ -163,6 +166,23 @@ def store_asset_event(self, event, event_id):
                 except db.exc.IntegrityError:
                     pass
 
+    def _upsert_asset_entries(
+        self, conn: Any, asset_entry_values: Mapping[str, Mapping[str, Any]]
+    ) -> None:
+        for asset_key_str, values in asset_entry_values.items():
+            if values:
+                conn.execute(
+                    db.dialects.mysql.insert(AssetKeyTable)
+                    .values(asset_key=asset_key_str, **values)
+                    .on_duplicate_key_update(**values)
+                )
+            else:
+                conn.execute(
+                    db.dialects.mysql.insert(AssetKeyTable)
+                    .values(asset_key=asset_key_str)
+                    .prefix_with("IGNORE")
+                )
+
     def _connect(self):
         return create_mysql_connection(self._engine, __file__, "event log")
 
@@ -172,6 +192,13 @@ def run_connection(self, run_id=None):
     def index_connection(self):
         return self._connect()
 
+    @contextmanager
+    def batch_index_connection(self):
+        with self._connect() as conn:
+            # the engine autocommits every statement, which would let a failed batch be partially
+            # written, so run the batch in a real transaction
+            yield conn.execution_options(isolation_level="READ COMMITTED")
+
     def has_table(self, table_name: str) -> bool:
         return bool(self._engine.dialect.has_table(self._engine.connect(), table_name))
 
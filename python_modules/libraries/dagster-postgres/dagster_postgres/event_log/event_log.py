@@ -1,4 +1,5 @@
-from typing import Optional
+from contextlib import contextmanager
+from typing import Any, Mapping, Optional, Sequence
 
 import dagster._check as check
 import sqlalchemy as db
@@ -238,6 +239,53 @@ def store_asset_event(self, event: EventLogEntry, event_id: int):
                 query = query.on_conflict_do_nothing()
             conn.execute(query)
 
+    def _insert_event_batch(
+        self, conn: Any, events: Sequence[EventLogEntry]
+    ) -> Sequence[Optional[int]]:
+        # Postgres can return the storage ids of a multi-row insert, so the whole batch is written
+        # in one statement.
+        result = conn.execute(
+            SqlEventLogStorageTable.insert()  # pylint: disable=no-value-for-parameter
+            .values([self._get_event_insert_values(event) for event in events])
+            .returning(SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.id)
+        )
+        # storage ids are allocated in insertion order
+        rows = sorted(result.fetchall(), key=lambda row: row[1])
+        result.close()
+        check.invariant(len(rows) == len(events), "Expected a storage id for every event")
+
+        # notifications are delivered when the enclosing transaction commits
+        conn.execute(
+            "SELECT pg_notify(%s, payload) FROM unnest(%s) AS payload",
+            (CHANNEL_NAME, [run_id + "_" + str(event_id) for run_id, event_id in rows]),
+        )
+
+        return [
+            event_id
+            if event.is_dagster_event
+            and event.dagster_event_type in ASSET_EVENTS
+            and event.dagster_event.asset_key
+            else None
+            for event, (_, event_id) in zip(events, rows)
+        ]
+
+    def _upsert_asset_entries(
+        self, conn: Any, asset_entry_values: Mapping[str, Mapping[str, Any]]
+    ) -> None:
+        for asset_key_str, values in asset_entry_values.items():
+            query = db_dialects_postgresql.insert(AssetKeyTable).values(
+                asset_key=asset_key_str,
+                **values,
+            )
+            if values:
+                query = query.on_conflict_do_update(
+                    index_elements=[AssetKeyTable.c.asset_key],
+                    set_=dict(**values),
+                )
+            else:
+                query = query.on_conflict_do_nothing()
+            conn.execute(query)
+
     def _connect(self):
         return create_pg_connection(self._engine)
 
@@ -247,6 +295,13 @@ def run_connection(self, run_id=None):
     def index_connection(self):
         return self._connect()
 
+    @contextmanager
+    def batch_index_connection(self):
+        with self._connect() as conn:
+            # the engine autocommits every statement, which would let a failed batch be partially
+            # written, so run the batch in a real transaction
+            yield conn.execution_options(isolation_level="READ COMMITTED")
+
     def has_table(self, table_name: str) -> bool:
         return bool(self._engine.dialect.has_table(self._engine.connect(), table_name))
 
@@ -1,4 +1,4 @@
-from typing import Mapping, Union, cast
+from typing import Mapping, Sequence, Union, cast
 
 import pandas as pd
 import pandas.core.dtypes.common as pd_core_dtypes_common
@@ -116,6 +116,9 @@ def load_input(self, context: InputContext, table_slice: TableSlice) -> pd.DataF
             result.columns = map(str.lower, result.columns)  # type: ignore  # (bad stubs)
             return result
 
+    def concat(self, context: InputContext, objs: Sequence[pd.DataFrame]) -> pd.DataFrame:
+        return pd.concat(objs, ignore_index=True)
+
     @property
     def supported_types(self):
         return [pd.DataFrame]
@@ -1,4 +1,5 @@
-from typing import Mapping
+from functools import reduce
+from typing import Mapping, Sequence
 
 import dagster._check as check
 from dagster import InputContext, MetadataValue, OutputContext, TableColumn, TableSchema
@@ -97,6 +98,9 @@ def load_input(self, context: InputContext, table_slice: TableSlice) -> DataFram
 
         return df.toDF(*[c.lower() for c in df.columns])
 
+    def concat(self, context: InputContext, objs: Sequence[DataFrame]) -> DataFrame:
+        return reduce(DataFrame.unionByName, objs)
+
     @property
     def supported_types(self):
         return [DataFrame]